@@ -1,18 +1,20 @@
 from hashlib import md5
+import inspect
 # import logging
-import pymatgen.core.structure
-from pymatgen.core.structure import Structure
-from typing import Callable, Union
+from typing import Callable, Union, TYPE_CHECKING
 from networkx import MultiDiGraph
 from kgcnn.graph.base import GraphDict
 
+if TYPE_CHECKING:
+    from pymatgen.core.structure import Structure
+
 # A separate module logger is not need for the base class.
 # logging.basicConfig()  # Module logger
 # module_logger = logging.getLogger(__name__)
 # module_logger.setLevel(logging.INFO)
 
 
-class CrystalPreprocessor(Callable[[Structure], MultiDiGraph]):
+class CrystalPreprocessor(Callable[["Structure"], MultiDiGraph]):
     """Base class for crystal preprocessors.
 
     Concrete CrystalPreprocessors must be implemented as subclasses.
@@ -29,7 +31,7 @@ class CrystalPreprocessor(Callable[[Structure], MultiDiGraph]):
         self._input_config = {
             "lattice": lattice, "species": species, "charge": charge, "coords": coords}
 
-    def call(self, structure: Structure) -> MultiDiGraph:
+    def call(self, structure: "Structure") -> MultiDiGraph:
         r"""Should be implemented in a subclass.
 
         Args:
@@ -43,7 +45,7 @@ class CrystalPreprocessor(Callable[[Structure], MultiDiGraph]):
         """
         raise NotImplementedError("Must be implemented in sub-classes.")
 
-    def __call__(self, structure: Union[Structure, GraphDict]) -> Union[MultiDiGraph, GraphDict]:
+    def __call__(self, structure: Union["Structure", GraphDict]) -> Union[MultiDiGraph, GraphDict]:
         r"""Function to process crystal structures. Executes :obj:`call` .
 
         Args:
@@ -56,6 +58,7 @@ class CrystalPreprocessor(Callable[[Structure], MultiDiGraph]):
             MultiDiGraph: Graph representation of the crystal.
         """
         if isinstance(structure, GraphDict):
+            import pymatgen.core.structure
             structure = pymatgen.core.structure.Structure(
                 lattice=structure.get(self._input_config["lattice"]),
                 species=structure.get(self._input_config["species"]),
@@ -63,6 +66,12 @@ class CrystalPreprocessor(Callable[[Structure], MultiDiGraph]):
                 charge=structure.get(self._input_config["charge"]),
                 coords_are_cartesian=True
             )
+        if self.output_graph_as_dict and not isinstance(structure, MultiDiGraph) and self._supports_builder():
+            # Build graph directly from arrays, which gives the same tensors as the networkx graph below.
+            from kgcnn.crystal import graph_arrays
+            graph = self.call(structure, builder=graph_arrays)
+            return graph.to_graph_dict(node_attributes=self.node_attributes, edge_attributes=self.edge_attributes,
+                                       graph_attributes=self.graph_attributes)
         nxg = self.call(structure)
         if self.output_graph_as_dict:
             g = GraphDict()
@@ -72,6 +81,9 @@ class CrystalPreprocessor(Callable[[Structure], MultiDiGraph]):
             return g
         return nxg
 
+    def _supports_builder(self) -> bool:
+        return "builder" in inspect.signature(self.call).parameters
+
     def get_config(self) -> dict:
         """Returns a dictionary uniquely identifying the CrystalPreprocessor and its configuration.
 
@@ -84,6 +96,22 @@ class CrystalPreprocessor(Callable[[Structure], MultiDiGraph]):
         config.update(self._input_config)
         return config
 
+    @classmethod
+    def from_config(cls, config: dict):
+        """Rebuild the CrystalPreprocessor from the output of :obj:`get_config` .
+
+        Args:
+            config (dict): Config of the preprocessor, as returned by :obj:`get_config` .
+
+        Returns:
+            CrystalPreprocessor: A new preprocessor with the same configuration.
+        """
+        config = dict(config)
+        name = config.pop("preprocessor", cls.__name__)
+        if name != cls.__name__:
+            raise ValueError("Config of preprocessor '%s' does not match '%s'." % (name, cls.__name__))
+        return cls(**config)
+
     def hash(self) -> str:
         """Generates a unique hash for the CrystalPreprocessor and its configuration.
 
@@ -0,0 +1,503 @@
+import warnings
+import numpy as np
+from pyxtal import pyxtal
+from pymatgen.core.structure import Structure
+from pymatgen.optimization.neighbors import find_points_in_spheres
+from typing import Union, Optional
+from kgcnn.graph.base import GraphDict
+from kgcnn.crystal.graph_builder import _get_symmetrized_node_data, _to_unit_cell, _estimate_nn_radius_from_density, \
+    _get_knn_neighbours, _get_voronoi_edges
+
+
+class CrystalGraphArrays:
+    r"""Array-based crystal graph, which replaces :obj:`networkx.MultiDiGraph` in :obj:`kgcnn.crystal.graph_builder` .
+
+    Node attributes are stored as arrays of shape `(N, ...)` and edges as arrays of sources, targets and attributes of
+    shape `(M, ...)` . The functions of this module have the same name and arguments as in
+    :obj:`kgcnn.crystal.graph_builder` , but operate on whole arrays.
+    Edges are always kept in the iteration order of the corresponding :obj:`networkx.MultiDiGraph` , i.e. grouped by
+    source node, then by the first insertion of the (source, target) pair and then by insertion.
+    Therefore, :obj:`to_graph_dict` returns the same :obj:`GraphDict` as :obj:`GraphDict.from_networkx` .
+
+    .. code-block:: python
+
+        from pymatgen.core import Structure, Lattice
+        from kgcnn.crystal import graph_arrays
+        structure = Structure(Lattice.cubic(3.9), ["Sr", "Ti"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+        g = graph_arrays.structure_to_empty_graph(structure)
+        g = graph_arrays.add_radius_bonds(g, radius=4.0)
+        print(g.to_graph_dict(["atomic_number"], ["distance"], ["lattice_matrix"]))
+
+    """
+
+    def __init__(self, node_data: dict = None, graph_data: dict = None):
+        """Initialize graph without edges.
+
+        Args:
+            node_data (dict): Dictionary of node attributes with arrays of shape `(N, ...)` .
+            graph_data (dict): Dictionary of graph attributes like `lattice_matrix` .
+        """
+        self.node_data = node_data if node_data is not None else {}
+        self.graph_data = graph_data if graph_data is not None else {}
+        self.edge_sources = np.zeros(0, dtype="int64")
+        self.edge_targets = np.zeros(0, dtype="int64")
+        self.edge_data = {}
+        # Time of insertion of each edge and of its (source, target) pair, to reproduce networkx edge order.
+        self._edge_time = np.zeros(0, dtype="int64")
+        self._edge_pair_time = np.zeros(0, dtype="int64")
+        self._time = 0
+
+    def number_of_nodes(self) -> int:
+        if len(self.node_data) == 0:
+            return 0
+        return len(next(iter(self.node_data.values())))
+
+    def number_of_edges(self) -> int:
+        return len(self.edge_sources)
+
+    def copy(self):
+        """Copy of the graph with copied arrays.
+
+        Returns:
+            CrystalGraphArrays: Copy of the graph.
+        """
+        new_graph = CrystalGraphArrays({key: np.array(value) for key, value in self.node_data.items()},
+                                       dict(self.graph_data))
+        new_graph.edge_sources = np.array(self.edge_sources)
+        new_graph.edge_targets = np.array(self.edge_targets)
+        new_graph.edge_data = {key: np.array(value) for key, value in self.edge_data.items()}
+        new_graph._edge_time = np.array(self._edge_time)
+        new_graph._edge_pair_time = np.array(self._edge_pair_time)
+        new_graph._time = self._time
+        return new_graph
+
+    def add_nodes(self, node_data: dict) -> np.ndarray:
+        """Append nodes to the graph. Must have the same attributes as existing nodes.
+
+        Args:
+            node_data (dict): Dictionary of node attributes with arrays of shape `(K, ...)` .
+
+        Returns:
+            np.ndarray: Indices of the new nodes.
+        """
+        num_nodes = self.number_of_nodes()
+        if num_nodes == 0:
+            self.node_data = {key: np.asarray(value) for key, value in node_data.items()}
+        else:
+            if set(node_data.keys()) != set(self.node_data.keys()):
+                raise ValueError("Attributes of new nodes %s do not match %s." % (
+                    list(node_data.keys()), list(self.node_data.keys())))
+            self.node_data = {key: np.concatenate([value, np.asarray(node_data[key], dtype=value.dtype)], axis=0)
+                              for key, value in self.node_data.items()}
+        return np.arange(num_nodes, self.number_of_nodes())
+
+    def add_edges(self, sources: np.ndarray, targets: np.ndarray, edge_data: dict):
+        """Add edges in the order of the arrays, like repeated calls of :obj:`MultiDiGraph.add_edge` .
+
+        Args:
+            sources (np.ndarray): Source node indices of shape `(K, )` .
+            targets (np.ndarray): Target node indices of shape `(K, )` .
+            edge_data (dict): Dictionary of edge attributes with arrays of shape `(K, ...)` .
+
+        Returns:
+            None.
+        """
+        sources = np.asarray(sources, dtype="int64")
+        targets = np.asarray(targets, dtype="int64")
+        num_new = len(sources)
+        if num_new == 0:
+            return
+        if self.number_of_edges() == 0:
+            self.edge_data = {}
+        elif set(edge_data.keys()) != set(self.edge_data.keys()):
+            raise ValueError("Attributes of new edges %s do not match %s." % (
+                list(edge_data.keys()), list(self.edge_data.keys())))
+        times = self._time + np.arange(num_new, dtype="int64")
+        self._time += num_new
+        # A pair keeps its position in the adjacency, if it already exists. Otherwise, it is placed by its first edge.
+        num_nodes = max(self.number_of_nodes(), int(np.amax(sources)) + 1, int(np.amax(targets)) + 1)
+        new_keys = sources * num_nodes + targets
+        unique_keys, first_index, inverse = np.unique(new_keys, return_index=True, return_inverse=True)
+        pair_times = times[first_index]
+        if self.number_of_edges() > 0:
+            old_keys, old_index = np.unique(self.edge_sources * num_nodes + self.edge_targets, return_index=True)
+            pos = np.minimum(np.searchsorted(old_keys, unique_keys), len(old_keys) - 1)
+            exists = old_keys[pos] == unique_keys
+            pair_times[exists] = self._edge_pair_time[old_index[pos[exists]]]
+        self.edge_sources = np.concatenate([self.edge_sources, sources])
+        self.edge_targets = np.concatenate([self.edge_targets, targets])
+        self._edge_time = np.concatenate([self._edge_time, times])
+        self._edge_pair_time = np.concatenate([self._edge_pair_time, pair_times[inverse.reshape(-1)]])
+        for key, value in edge_data.items():
+            value = np.asarray(value)
+            if key in self.edge_data:
+                value = np.concatenate([self.edge_data[key], value], axis=0)
+            self.edge_data[key] = value
+        order = np.lexsort((self._edge_time, self._edge_pair_time, self.edge_sources))
+        self._take_edges(order)
+
+    def remove_edges(self, mask: np.ndarray):
+        """Remove edges by boolean mask.
+
+        Args:
+            mask (np.ndarray): Boolean mask of shape `(M, )` for edges to remove.
+
+        Returns:
+            None.
+        """
+        self._take_edges(np.logical_not(mask))
+
+    def _take_edges(self, index: np.ndarray):
+        self.edge_sources = self.edge_sources[index]
+        self.edge_targets = self.edge_targets[index]
+        self._edge_time = self._edge_time[index]
+        self._edge_pair_time = self._edge_pair_time[index]
+        self.edge_data = {key: value[index] for key, value in self.edge_data.items()}
+
+    def in_edges(self, nodes: np.ndarray) -> np.ndarray:
+        """Indices of incoming edges of nodes in the order of :obj:`MultiDiGraph.in_edges` .
+
+        Args:
+            nodes (np.ndarray): Unique node indices.
+
+        Returns:
+            np.ndarray: Indices of edges.
+        """
+        rank = np.full(self.number_of_nodes(), -1, dtype="int64")
+        rank[np.asarray(nodes)] = np.arange(len(nodes))
+        edge_rank = rank[self.edge_targets]
+        edge_index = np.arange(self.number_of_edges())[edge_rank >= 0]
+        order = np.lexsort((self._edge_time[edge_index], self._edge_pair_time[edge_index], edge_rank[edge_index]))
+        return edge_index[order]
+
+    def to_graph_dict(self, node_attributes: list = None, edge_attributes: list = None,
+                      graph_attributes: list = None) -> GraphDict:
+        """Convert to :obj:`GraphDict` with reversed edge indices, like :obj:`GraphDict.from_networkx` .
+
+        Args:
+            node_attributes (list): Names of node attributes.
+            edge_attributes (list): Names of edge attributes.
+            graph_attributes (list): Names of graph attributes.
+
+        Returns:
+            GraphDict: Graph in tensor-form.
+        """
+        num_nodes, num_edges = self.number_of_nodes(), self.number_of_edges()
+        g = GraphDict()
+        g.assign_property("node_number", np.arange(num_nodes))
+        if num_edges > 0:
+            g.assign_property("edge_indices", np.stack([self.edge_targets, self.edge_sources], axis=-1))
+        else:
+            g.assign_property("edge_indices", [])
+        for attributes, data, num in [(node_attributes, self.node_data, num_nodes),
+                                      (edge_attributes, self.edge_data, num_edges)]:
+            for key in attributes if attributes is not None else []:
+                if num == 0:
+                    g.assign_property(key, [])
+                    continue
+                if key not in data:
+                    raise KeyError("%s does not have property '%s'." % (
+                        "Node" if data is self.node_data else "Edge", key))
+                g.assign_property(key, data[key])
+        for key in graph_attributes if graph_attributes is not None else []:
+            g.assign_property(key, self.graph_data.get(key))
+        return g
+
+
+def _stack_values(values: list) -> np.ndarray:
+    try:
+        return np.array(values)
+    except ValueError:
+        out = np.empty(len(values), dtype="object")
+        out[:] = values
+        return out
+
+
+def _get_lattice(graph: CrystalGraphArrays, attr_name: str = "lattice_matrix"):
+    if attr_name not in graph.graph_data:
+        raise AttributeError("Must attach attribute '%s' of crystal information to crystal graph." % attr_name)
+    return graph.graph_data[attr_name]
+
+
+def structure_to_empty_graph(structure: Union[Structure, pyxtal], symmetrize: bool = False) -> CrystalGraphArrays:
+    """Builds an unit graph without any edges. See :obj:`kgcnn.crystal.graph_builder.structure_to_empty_graph` .
+
+    Args:
+        structure (Union[Structure, pyxtal]): Crystal structure to convert to a graph.
+        symmetrize (bool): Whether to include symmetry information attributes. Defaults to False.
+
+    Returns:
+        CrystalGraphArrays: Unit graph without any edges for the crystal.
+    """
+    if symmetrize:
+        node_data, lattice, spacegroup = _get_symmetrized_node_data(structure)
+        return CrystalGraphArrays({key: _stack_values(value) for key, value in node_data.items()},
+                                  {"lattice_matrix": lattice, "spacegroup": spacegroup})
+    if isinstance(structure, pyxtal):
+        structure = structure.to_pymatgen()
+    sites = structure.sites
+    node_data = {
+        "atomic_number": np.array([site.specie.number for site in sites]),
+        "frac_coords": _to_unit_cell(np.array([site.frac_coords for site in sites])),
+        "coords": np.array([site.coords for site in sites])
+    }
+    # Site properties are only kept if they are defined for all sites.
+    for key in set().union(*[site.properties.keys() for site in sites]) if len(sites) > 0 else []:
+        if all([key in site.properties for site in sites]) and key not in node_data:
+            node_data[key] = _stack_values([site.properties[key] for site in sites])
+    return CrystalGraphArrays(node_data, {"lattice_matrix": structure.lattice.matrix})
+
+
+def _find_neighbours(graph: CrystalGraphArrays, radius: float):
+    lattice = np.array(_get_lattice(graph))
+    coords = graph.node_data["frac_coords"] @ lattice
+    index1, index2, offset_vectors, distances = find_points_in_spheres(
+        coords, coords, r=radius, pbc=np.array([True] * 3, dtype=int), lattice=lattice, tol=1e-8)
+    offset_vectors = offset_vectors.astype('i2')
+    # Remove self_loops:
+    no_self_loops = np.argwhere(~np.isclose(distances, 0)).reshape(-1)
+    return index1[no_self_loops], index2[no_self_loops], offset_vectors[no_self_loops], distances[no_self_loops]
+
+
+def add_radius_bonds(graph: CrystalGraphArrays, radius: float = 5., inplace: bool = False) -> CrystalGraphArrays:
+    """Adds radius-based edges to a unit cell graph. See :obj:`kgcnn.crystal.graph_builder.add_radius_bonds` .
+
+    Args:
+        graph (CrystalGraphArrays): The unit cell graph to add radius-based edges to.
+        radius (float, optional): Cutoff radius for each atom in Angstrom units. Defaults to 5.
+        inplace (bool, optional): Whether to add the edges to the given graph or create a copy with added edges.
+            Defaults to False.
+
+    Returns:
+        CrystalGraphArrays: Graph with added edges.
+    """
+    new_graph = graph if inplace else graph.copy()
+    index1, index2, offset_vectors, distances = _find_neighbours(graph, radius)
+    if len(index1) == 0:
+        warnings.warn(
+            'No edges added to the graph, consider increasing the radius and check your graph input instance.')
+    new_graph.add_edges(index2, index1, {"cell_translation": offset_vectors, "distance": distances})
+    return new_graph
+
+
+def add_knn_bonds(graph: CrystalGraphArrays, k: int = 12, max_radius: float = 10.,
+                  tolerance: Optional[float] = None, inplace: bool = False) -> CrystalGraphArrays:
+    """Adds kNN-based edges to a unit cell graph. See :obj:`kgcnn.crystal.graph_builder.add_knn_bonds` .
+
+    Args:
+        graph (CrystalGraphArrays): The unit cell graph to add kNN-based edges to.
+        k (int, optional): How many neighbors to add for each node. Defaults to 12.
+        max_radius (float, optional): Initial radius of the neighbour search. Defaults to 10.
+        tolerance (Optional[float], optional): If tolerance is not None,
+            edges with distances of the k-th nearest neighbor plus the tolerance value are included in the graph.
+            Defaults to None.
+        inplace (bool, optional): Whether to add the edges to the given graph or create a copy with added edges.
+            Defaults to False.
+
+    Returns:
+        CrystalGraphArrays: Graph with added edges.
+    """
+    new_graph = graph if inplace else graph.copy()
+    lattice = np.array(_get_lattice(graph))
+    coords = graph.node_data["frac_coords"] @ lattice
+    if max_radius is None:
+        max_radius = _estimate_nn_radius_from_density(k, coords, lattice, 0.1)
+    index1, index2, offset_vectors, distances = _get_knn_neighbours(
+        coords, lattice, k=k, max_radius=max_radius, tolerance=tolerance)
+    new_graph.add_edges(index2, index1, {"cell_translation": offset_vectors, "distance": distances})
+    return new_graph
+
+
+def add_voronoi_bonds(graph: CrystalGraphArrays, min_ridge_area: Optional[float] = None,
+                      inplace: bool = False) -> CrystalGraphArrays:
+    """Adds Voronoi-based edges to a unit cell graph. See :obj:`kgcnn.crystal.graph_builder.add_voronoi_bonds` .
+
+    Args:
+        graph (CrystalGraphArrays): The unit cell graph to add radius-based edges to.
+        min_ridge_area (Optional[float], optional): Threshold value for ridge area between two Voronoi cells.
+            If a ridge area between two voronoi cells is smaller than this value the corresponding edge between
+            the atoms of the cells is excluded from the graph. Defaults to None.
+        inplace (bool, optional): Whether to add the edges to the given graph or create a copy with added edges.
+            Defaults to False.
+
+    Returns:
+        CrystalGraphArrays: Graph with added edges.
+    """
+    new_graph = graph if inplace else graph.copy()
+    edge_indices, cell_translations, distances, ridge_areas = _get_voronoi_edges(
+        _get_lattice(graph), graph.node_data["frac_coords"], ridge_area=min_ridge_area is not None)
+    edge_data = {"cell_translation": cell_translations, "distance": distances}
+    if min_ridge_area is not None:
+        keep = ridge_areas > min_ridge_area
+        edge_indices = edge_indices[keep]
+        edge_data = {"cell_translation": cell_translations[keep], "distance": distances[keep],
+                     "voronoi_ridge_area": ridge_areas[keep]}
+    new_graph.add_edges(edge_indices[:, 0], edge_indices[:, 1], edge_data)
+    return new_graph
+
+
+def add_edge_information(graph: CrystalGraphArrays, inplace=False,
+                         frac_offset=False, offset=True, distance=True) -> CrystalGraphArrays:
+    """Adds edge information, such as offset ( `frac_offset`, `offset` ) and distances ( `distance` ) to edges.
+    See :obj:`kgcnn.crystal.graph_builder.add_edge_information` .
+
+    Args:
+        graph (CrystalGraphArrays): Graph for which to add edge information.
+        inplace (bool, optional): Whether to add the edge information to the given graph
+            or create a copy with added edges. Defaults to False.
+        frac_offset (bool, optional): Whether to add fractional offsets (`frac_offset` attribute) to edges.
+            Defaults to False.
+        offset (bool, optional): Whether to add offsets (`offset` attribute) to edges. Defaults to True.
+        distance (bool, optional): Whether to add distances (`distance` attribute) to edges. Defaults to True.
+
+    Returns:
+        CrystalGraphArrays: The graph with added edge information.
+    """
+    new_graph = graph if inplace else graph.copy()
+    if graph.number_of_edges() == 0:
+        return new_graph
+    frac_coords = new_graph.node_data["frac_coords"]
+    frac_offset_values = frac_coords[new_graph.edge_targets] - (
+            frac_coords[new_graph.edge_sources] + new_graph.edge_data["cell_translation"])
+    offset_values = frac_offset_values @ _get_lattice(new_graph)
+    if frac_offset:
+        new_graph.edge_data["frac_offset"] = frac_offset_values
+    if offset:
+        new_graph.edge_data["offset"] = offset_values
+    if distance:
+        new_graph.edge_data["distance"] = np.linalg.norm(offset_values, axis=-1)
+    return new_graph
+
+
+def to_non_periodic_unit_cell(graph: CrystalGraphArrays, add_reverse_edges: bool = True,
+                              inplace: bool = False) -> CrystalGraphArrays:
+    """Generates non-periodic graph representation from unit cell graph representation.
+    See :obj:`kgcnn.crystal.graph_builder.to_non_periodic_unit_cell` .
+
+    Args:
+        graph (CrystalGraphArrays): Unit cell graph to generate non-periodic graph for.
+        add_reverse_edges (bool, optional): Whether to add incoming edges to atoms
+            that lie outside the central unit cell. Defaults to True.
+        inplace (bool, optional): Whether to modify the given graph. Defaults to False.
+
+    Returns:
+        CrystalGraphArrays: Corresponding non-periodic graph for the given unit cell graph.
+    """
+    new_graph = graph if inplace else graph.copy()
+    cell_translation = new_graph.edge_data.get("cell_translation")
+    if cell_translation is None or new_graph.number_of_edges() == 0:
+        return new_graph
+    is_periodic = np.any(cell_translation != 0, axis=-1)
+    periodic_index = np.argwhere(is_periodic)[:, 0]
+    sources = new_graph.edge_sources[periodic_index]
+    targets = new_graph.edge_targets[periodic_index]
+    translations = cell_translation[periodic_index]
+    edge_data = {key: value[periodic_index] for key, value in new_graph.edge_data.items()}
+    # New nodes for each pair of source and cell translation in order of appearance.
+    node_keys = np.concatenate([sources[:, None], translations.astype("int64")], axis=-1)
+    _, first_index, inverse = np.unique(node_keys, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    appearance = np.argsort(first_index, kind="stable")
+    rank = np.empty_like(appearance)
+    rank[appearance] = np.arange(len(appearance))
+    new_node_sources = sources[np.sort(first_index)]
+    new_node_translations = translations[np.sort(first_index)]
+    new_node_data = {key: value[new_node_sources] for key, value in new_graph.node_data.items()}
+    new_node_data["frac_coords"] = new_graph.node_data["frac_coords"][new_node_sources] + new_node_translations
+    new_node_data["coords"] = new_node_data["frac_coords"] @ _get_lattice(new_graph)
+    new_graph.remove_edges(is_periodic)
+    node_numbers = new_graph.add_nodes(new_node_data)[rank[inverse]]
+    if add_reverse_edges:
+        # Forward and reverse edges alternate.
+        new_sources = np.stack([node_numbers, targets], axis=-1).reshape(-1)
+        new_targets = np.stack([targets, node_numbers], axis=-1).reshape(-1)
+        reverse_data = dict(edge_data)
+        for key in ["frac_offset", "offset"]:
+            if key in reverse_data:
+                reverse_data[key] = -reverse_data[key]
+        edge_data = {key: np.stack([value, reverse_data[key]], axis=1).reshape((-1,) + value.shape[1:])
+                     for key, value in edge_data.items()}
+        new_graph.add_edges(new_sources, new_targets, edge_data)
+    else:
+        new_graph.add_edges(node_numbers, targets, edge_data)
+    return new_graph
+
+
+def to_supercell_graph(graph: CrystalGraphArrays, size) -> CrystalGraphArrays:
+    """Generates super-cell graph representation from unit cell graph representation.
+    See :obj:`kgcnn.crystal.graph_builder.to_supercell_graph` .
+
+    Args:
+        graph (CrystalGraphArrays): Unit cell graph to generate super cell graph for.
+        size (list): How many cells the crystal will get expanded into each dimension.
+
+    Returns:
+        CrystalGraphArrays: Corresponding super cell graph for the given unit cell graph.
+    """
+    lattice = _get_lattice(graph)
+    num_nodes = graph.number_of_nodes()
+    size_ = list(size) + [num_nodes]
+    num_cells = int(np.prod(size))
+    node_cell, node_num = np.divmod(np.arange(num_cells * num_nodes), num_nodes)
+    node_translation = np.stack(np.unravel_index(node_cell, size), axis=-1)
+    node_data = {key: value[node_num] for key, value in graph.node_data.items()}
+    node_data["frac_coords"] = node_data["frac_coords"] + node_translation
+    node_data["coords"] = node_data["frac_coords"] @ lattice
+    graph_data = {"lattice_matrix": lattice}
+    if "spacegroup" in graph.graph_data:
+        graph_data["spacegroup"] = graph.graph_data["spacegroup"]
+    supercell_graph = CrystalGraphArrays(node_data, graph_data)
+    if graph.number_of_edges() == 0:
+        return supercell_graph
+
+    cell_translation1 = np.stack(np.unravel_index(np.arange(num_cells), size), axis=-1)
+    # Edges first, then cells, as in `graph_builder.to_supercell_graph` .
+    cell_translation2 = (np.expand_dims(graph.edge_data["cell_translation"], axis=1) + cell_translation1).astype(int)
+    is_valid = np.all(cell_translation2 >= 0, axis=-1) & np.all(cell_translation2 < np.array(size), axis=-1)
+    edge_idx, cell_idx = np.nonzero(is_valid)
+    new_sources = np.ravel_multi_index(
+        tuple(cell_translation2[edge_idx, cell_idx].T) + (graph.edge_sources[edge_idx],), size_)
+    new_targets = np.ravel_multi_index(
+        tuple(cell_translation1[cell_idx].T) + (graph.edge_targets[edge_idx],), size_)
+    supercell_graph.add_edges(new_sources, new_targets,
+                              {key: value[edge_idx] for key, value in graph.edge_data.items()})
+    return supercell_graph
+
+
+def to_asymmetric_unit_graph(graph: CrystalGraphArrays) -> CrystalGraphArrays:
+    """Generates asymmetric unit graph representation from unit cell graph representation.
+    See :obj:`kgcnn.crystal.graph_builder.to_asymmetric_unit_graph` .
+
+    Args:
+        graph (CrystalGraphArrays): Unit cell graph to generate asymmetric unit graph for.
+
+    Returns:
+        CrystalGraphArrays: Corresponding asymmetric unit graph for the given unit cell graph.
+    """
+    if "asymmetric_mapping" not in graph.node_data:
+        raise ValueError(
+            "".join([
+                "Graph does not contain symmetry information. ",
+                "Make sure to create the graph with `structure_to_empty_graph` ",
+                "with the `symmetrize` argument set to `True` ."
+            ])
+        )
+    asymmetric_mapping = graph.node_data["asymmetric_mapping"]
+    asu_node_indice, inv_asymmetric_mapping = np.unique(asymmetric_mapping, return_inverse=True)
+    inv_asymmetric_mapping = inv_asymmetric_mapping.reshape(-1)
+    node_data = {key: value[asu_node_indice] for key, value in graph.node_data.items()
+                 if key not in ["asymmetric_mapping", "symmop"]}
+    node_data["unit_cell_index"] = asymmetric_mapping[asu_node_indice]
+    asu_graph = CrystalGraphArrays(node_data, {"lattice_matrix": _get_lattice(graph, "lattice_matrix"),
+                                               "spacegroup": _get_lattice(graph, "spacegroup")})
+    if graph.number_of_edges() == 0:
+        return asu_graph
+
+    new_nodes_idx = np.zeros(graph.number_of_nodes(), dtype="int64")
+    new_nodes_idx[asu_node_indice] = np.arange(len(asu_node_indice))
+    edge_index = graph.in_edges(asu_node_indice)
+    edge_data = {key: value[edge_index] for key, value in graph.edge_data.items()}
+    edge_data["symmop"] = graph.node_data["symmop"][graph.edge_sources[edge_index]]
+    asu_graph.add_edges(inv_asymmetric_mapping[graph.edge_sources[edge_index]],
+                        new_nodes_idx[graph.edge_targets[edge_index]], edge_data)
+    return asu_graph
@@ -1,5 +1,6 @@
 import warnings
 from copy import deepcopy, copy
+from collections import OrderedDict
 import numpy as np
 from scipy.spatial import Voronoi, ConvexHull
 from networkx import MultiDiGraph
@@ -31,7 +32,27 @@ def get_symmetrized_graph(structure: Union[Structure, pyxtal]) -> MultiDiGraph:
     Returns:
         MultiDiGraph: Unit graph with symmetry information, but without any edges for the crystal.
     """
+    node_data, lattice, spacegroup = _get_symmetrized_node_data(structure)
     graph = MultiDiGraph()
+    for node_idx in range(len(node_data["atomic_number"])):
+        graph.add_node(node_idx, **{key: value[node_idx] for key, value in node_data.items()})
+    setattr(graph, 'lattice_matrix', lattice)
+    setattr(graph, 'spacegroup', spacegroup)
+    return graph
+
+
+def _get_symmetrized_node_data(structure: Union[Structure, pyxtal]) -> tuple:
+    """Symmetry information of the atoms in the unit cell as used by :obj:`get_symmetrized_graph` .
+
+    Args:
+        structure (Union[Structure, pyxtal]): Crystal structure.
+
+    Raises:
+        ValueError: If the argument is not a pymatgen Structure or pyxtal object.
+
+    Returns:
+        tuple: Dictionary of node attributes with a list of values for each node, lattice matrix and spacegroup.
+    """
     if isinstance(structure, pyxtal):
         pyxtal_cell = structure
     elif isinstance(structure, Structure):
@@ -43,16 +64,15 @@ def get_symmetrized_graph(structure: Union[Structure, pyxtal]) -> MultiDiGraph:
             # if spglib isn't able to calculate symmetries
             frac_coords = np.array([site.frac_coords for site in structure.sites])
             frac_coords = _to_unit_cell(frac_coords)
-            for node_idx, site in enumerate(structure.sites):
-                graph.add_node(node_idx, atomic_number=site.specie.number,
-                               asymmetric_mapping=node_idx,
-                               frac_coords=frac_coords[node_idx],
-                               coords=site.coords,
-                               symmop=np.eye(4),
-                               multiplicity=1)
-            setattr(graph, 'lattice_matrix', structure.lattice.matrix)
-            setattr(graph, 'spacegroup', 1)
-            return graph
+            node_data = {
+                "atomic_number": [site.specie.number for site in structure.sites],
+                "asymmetric_mapping": list(range(len(structure.sites))),
+                "frac_coords": [x for x in frac_coords],
+                "coords": [site.coords for site in structure.sites],
+                "symmop": [np.eye(4) for _ in structure.sites],
+                "multiplicity": [1 for _ in structure.sites]
+            }
+            return node_data, structure.lattice.matrix, 1
     else:
         raise ValueError("This method takes either a pymatgen.core.structure.Structure or a pyxtal object.")
 
@@ -66,17 +86,15 @@ def get_symmetrized_graph(structure: Union[Structure, pyxtal]) -> MultiDiGraph:
     frac_coords = _to_unit_cell(np.vstack(frac_coords))
     lattice = pyxtal_cell.lattice.matrix
     coords = frac_coords @ lattice
-    for node_idx in range(len(atomic_numbers)):
-        graph.add_node(node_idx, atomic_number=atomic_numbers[node_idx],
-                       asymmetric_mapping=asymmetric_mapping[node_idx],
-                       frac_coords=frac_coords[node_idx],
-                       coords=coords[node_idx],
-                       symmop=symmops[node_idx],
-                       multiplicity=multiplicities[node_idx])
-    setattr(graph, 'lattice_matrix', lattice)
-    setattr(graph, 'spacegroup', pyxtal_cell.group.number)
-
-    return graph
+    node_data = {
+        "atomic_number": atomic_numbers,
+        "asymmetric_mapping": asymmetric_mapping,
+        "frac_coords": [x for x in frac_coords],
+        "coords": [x for x in coords],
+        "symmop": symmops,
+        "multiplicity": multiplicities
+    }
+    return node_data, lattice, pyxtal_cell.group.number
 
 
 def structure_to_empty_graph(structure: Union[Structure, pyxtal], symmetrize: bool = False) -> MultiDiGraph:
@@ -123,7 +141,8 @@ def add_knn_bonds(graph: MultiDiGraph, k: int = 12, max_radius: float = 10.,
         max_radius (float, optional): This parameter has no effect on the outcome of the graph.
             It may only on the runtime.
             The algorithm starts the kNN search in the environment the radius of max_radius.
-            If the kth neighbor is not within this radius the algorithm is called again with twice the initial radius.
+            If the kth neighbor is not within this radius the search is repeated with twice the radius,
+            but only for the nodes with too few neighbours.
             Defaults to 10.
         tolerance (Optional[float], optional): If tolerance is not None,
             edges with distances of the k-th nearest neighbor plus the tolerance value are included in the graph.
@@ -139,43 +158,74 @@ def add_knn_bonds(graph: MultiDiGraph, k: int = 12, max_radius: float = 10.,
     coords = frac_coords @ lattice
     if max_radius is None:
         max_radius = _estimate_nn_radius_from_density(k, coords, lattice, 0.1)
-    # return coords, lattice
-    index1, index2, offset_vectors, distances = find_points_in_spheres(
-        coords,
-        coords,
-        r=max_radius,
-        pbc=np.array([True] * 3, dtype=int),
-        lattice=lattice,
-        tol=1e-8
-    )
-    offset_vectors = offset_vectors.astype('i2')
-    # Remove self_loops:
-    no_self_loops = np.argwhere(~np.isclose(distances, 0)).reshape(-1)
-    index1 = index1[no_self_loops]
-    index2 = index2[no_self_loops]
-    offset_vectors = offset_vectors[no_self_loops]
-    distances = distances[no_self_loops]
-
+    index1, index2, offset_vectors, distances = _get_knn_neighbours(
+        coords, lattice, k=k, max_radius=max_radius, tolerance=tolerance)
     new_graph = graph if inplace else deepcopy(graph)
+    for source, target, cell_translation, dist in zip(index2, index1, offset_vectors, distances):
+        new_graph.add_edge(source, target, cell_translation=cell_translation, distance=dist)
+    return new_graph
+
 
-    for node_idx in range(new_graph.number_of_nodes()):
-        idxs = np.argwhere(index1 == node_idx)[:, 0]
-        sorted_idxs = idxs[np.argsort(distances[idxs])]
-        if len(sorted_idxs) < k:
-            return add_knn_bonds(new_graph, k=k, max_radius=max_radius * 2, inplace=True)
+def _get_knn_neighbours(coords: np.ndarray, lattice: np.ndarray, k: int = 12, max_radius: float = 10.,
+                        tolerance: Optional[float] = None) -> tuple:
+    r"""Find the k nearest periodic neighbours of each atom.
+
+    Neighbours are sorted once by atom and distance and the k-th neighbour is found for all atoms at once.
+    Atoms with fewer than k neighbours within :obj:`max_radius` , or whose k-th distance plus :obj:`tolerance`
+    exceeds :obj:`max_radius` , are searched again with twice the radius, while the neighbours of all other atoms
+    are kept.
+
+    Args:
+        coords (np.ndarray): Cartesian coordinates of shape `(N, 3)` .
+        lattice (np.ndarray): Lattice matrix of shape `(3, 3)` .
+        k (int): How many neighbors to find for each atom. Defaults to 12.
+        max_radius (float): Initial radius of the neighbour search. Defaults to 10.
+        tolerance (Optional[float], optional): If tolerance is not None,
+            neighbours with distances of the k-th nearest neighbor plus the tolerance value are included.
+            Defaults to None.
 
+    Returns:
+        tuple: Arrays `index1`, `index2`, `offset_vectors`, `distances` of neighbours of atom `index1` ,
+            grouped by `index1` . Neighbours of each atom are sorted by distance if :obj:`tolerance` is None.
+    """
+    num_nodes = len(coords)
+    centers = np.arange(num_nodes)
+    found = []
+    while len(centers) > 0:
+        index1, index2, offset_vectors, distances = find_points_in_spheres(
+            coords, np.ascontiguousarray(coords[centers]), r=max_radius, pbc=np.array([True] * 3, dtype=int),
+            lattice=lattice, tol=1e-8)
+        offset_vectors = offset_vectors.astype('i2')
+        # Remove self_loops:
+        no_self_loops = np.argwhere(~np.isclose(distances, 0)).reshape(-1)
+        index1 = centers[index1[no_self_loops]]
+        index2, offset_vectors, distances = index2[no_self_loops], offset_vectors[no_self_loops], distances[
+            no_self_loops]
+        counts = np.bincount(index1, minlength=num_nodes)
+        is_complete = counts >= k
+        # Sort by (atom, distance) and segment by atom.
+        sorted_idxs = np.lexsort((distances, index1))
+        splits = np.concatenate([[0], np.cumsum(counts)[:-1]])
         if tolerance is not None:
-            cutoff = distances[sorted_idxs[k - 1]] + tolerance
-            edge_idxs = idxs[np.argwhere(distances[idxs] <= cutoff)][:, 0]
+            kth_distance = np.full(num_nodes, -np.inf)
+            kth_distance[is_complete] = distances[sorted_idxs[splits[is_complete] + k - 1]]
+            # Neighbours up to the k-th distance plus tolerance must all lie within the radius of the search.
+            is_complete = is_complete & (kth_distance + tolerance < max_radius)
+            kth_distance[~is_complete] = -np.inf
+            is_edge = distances <= kth_distance[index1] + tolerance
+            edge_idxs = np.argwhere(is_edge).reshape(-1)
+            edge_idxs = edge_idxs[np.argsort(index1[edge_idxs], kind="stable")]
         else:
-            edge_idxs = sorted_idxs[:k]
-        # If the max_radius doesn't capture k neighbors, try again with double the max_radius
-        for edge_idx in edge_idxs:
-            new_graph.add_edge(
-                index2[edge_idx], index1[edge_idx],
-                cell_translation=offset_vectors[edge_idx], distance=distances[edge_idx])
-
-    return new_graph
+            rank = np.arange(len(sorted_idxs)) - splits[index1[sorted_idxs]]
+            edge_idxs = sorted_idxs[(rank < k) & is_complete[index1[sorted_idxs]]]
+        found.append((index1[edge_idxs], index2[edge_idxs], offset_vectors[edge_idxs], distances[edge_idxs]))
+        centers = centers[~is_complete[centers]]
+        max_radius = max_radius * 2
+    if len(found) == 0:
+        return np.zeros(0, dtype="int"), np.zeros(0, dtype="int"), np.zeros((0, 3), dtype="i2"), np.zeros(0)
+    index1, index2, offset_vectors, distances = [np.concatenate(x, axis=0) for x in zip(*found)]
+    order = np.argsort(index1, kind="stable")
+    return index1[order], index2[order], offset_vectors[order], distances[order]
 
 
 def add_radius_bonds(graph: MultiDiGraph, radius: float = 5., inplace: bool = False) -> MultiDiGraph:
@@ -219,6 +269,9 @@ def add_voronoi_bonds(graph: MultiDiGraph, min_ridge_area: Optional[float] = Non
                       inplace: bool = False) -> MultiDiGraph:
     """Adds Voronoi-based edges to a unit cell graph.
 
+    The Voronoi diagram of the 3x3x3 super-cell is cached for each crystal, so that calling this function again
+    with a different :obj:`min_ridge_area` does not have to recompute it. See :obj:`clear_voronoi_cache` .
+
     Args:
         graph (MultiDiGraph): The unit cell graph to add radius-based edges to.
         min_ridge_area (Optional[float], optional): Threshold value for ridge area between two Voronoi cells.
@@ -234,6 +287,67 @@ def add_voronoi_bonds(graph: MultiDiGraph, min_ridge_area: Optional[float] = Non
 
     lattice = _get_attr_from_graph(graph, "lattice_matrix")
     frac_coords = np.array([data[1] for data in graph.nodes(data='frac_coords')])
+    edge_indices, cell_translations, distances, ridge_areas = _get_voronoi_edges(
+        lattice, frac_coords, ridge_area=min_ridge_area is not None)
+
+    if min_ridge_area is not None:
+        for nodes, cell_translation, dist, ridge_area in zip(edge_indices, cell_translations, distances, ridge_areas):
+            source, target = nodes[0], nodes[1]
+            if ridge_area > min_ridge_area:
+                new_graph.add_edge(source, target, cell_translation=cell_translation, distance=dist,
+                                   voronoi_ridge_area=ridge_area)
+    else:
+        for nodes, cell_translation, dist in zip(edge_indices, cell_translations, distances):
+            source, target = nodes[0], nodes[1]
+            new_graph.add_edge(source, target, cell_translation=cell_translation, distance=dist)
+
+    return new_graph
+
+
+# Voronoi edges of recently processed crystals, with the crystal's lattice and fractional coordinates as key.
+_voronoi_cache = OrderedDict()
+_voronoi_cache_size = 256
+
+
+def clear_voronoi_cache():
+    """Clears the cache of Voronoi edges of :obj:`add_voronoi_bonds` .
+
+    Returns:
+        None.
+    """
+    _voronoi_cache.clear()
+
+
+def _get_voronoi_edges(lattice: np.ndarray, frac_coords: np.ndarray, ridge_area: bool = False) -> tuple:
+    r"""Compute Voronoi edges of the unit cell from the 3x3x3 super-cell.
+
+    Args:
+        lattice (np.ndarray): Lattice matrix of shape `(3, 3)` .
+        frac_coords (np.ndarray): Fractional coordinates of shape `(N, 3)` .
+        ridge_area (bool): Whether to compute ridge areas. Default is False.
+
+    Returns:
+        tuple: Arrays `edge_indices` , `cell_translations` , `distances` and `ridge_areas` , which is None if
+            :obj:`ridge_area` is False.
+    """
+    lattice, frac_coords = np.asarray(lattice), np.asarray(frac_coords)
+    key = (lattice.tobytes(), frac_coords.tobytes(), frac_coords.shape, frac_coords.dtype.str)
+    if key in _voronoi_cache:
+        edges = _voronoi_cache[key]
+        _voronoi_cache.move_to_end(key)
+    else:
+        edges = _compute_voronoi_edges(lattice, frac_coords)
+        _voronoi_cache[key] = edges
+        while len(_voronoi_cache) > _voronoi_cache_size:
+            _voronoi_cache.popitem(last=False)
+    if ridge_area and edges["ridge_areas"] is None:
+        edges["ridge_areas"] = get_ridge_areas(edges["ridge_vertices"], edges["ridge_normals"])
+    ridge_areas = np.array(edges["ridge_areas"]) if ridge_area else None
+    return (np.array(edges["edge_indices"]), np.array(edges["cell_translations"]), np.array(edges["distances"]),
+            ridge_areas)
+
+
+def _compute_voronoi_edges(lattice: np.ndarray, frac_coords: np.ndarray) -> dict:
     dim = lattice.shape[0]
     assert dim == 3
     size = np.array([1, 1, 1])
@@ -253,30 +367,18 @@ def add_voronoi_bonds(graph: MultiDiGraph, min_ridge_area: Optional[float] = Non
 
     edge_info = np.vstack(
         [ridge_points_unraveled[source_in_center_cell][:, [1, 0]], ridge_points_unraveled[target_in_center_cell]])
-
     cell_translations = (edge_info[:, 0, :-1] - size).astype(float)
     edge_indices = edge_info[:, :, -1]
+    diff = expanded_coords[tuple(edge_info[:, 0].T)] - expanded_coords[tuple(edge_info[:, 1].T)]
+    # Same summation as `np.linalg.norm` of each single vector.
+    distances = np.sqrt(np.matmul(diff[:, None, :], diff[:, :, None])[:, 0, 0])
 
-    distances = []
-    for i in range(len(edge_indices)):
-        d = np.linalg.norm(expanded_coords[tuple(edge_info[i][0])] - expanded_coords[tuple(edge_info[i][1])])
-        distances.append(d)
-
-    if min_ridge_area is not None:
-        ridge_vertices = [voronoi.ridge_vertices[i] for i in
-                          np.concatenate([source_in_center_cell, target_in_center_cell])]
-        ridge_areas = [get_ridge_area(voronoi.vertices[idxs]) for idxs in ridge_vertices]
-        for nodes, cell_translation, dist, ridge_area in zip(edge_indices, cell_translations, distances, ridge_areas):
-            source, target = nodes[0], nodes[1]
-            if ridge_area > min_ridge_area:
-                new_graph.add_edge(source, target, cell_translation=cell_translation, distance=dist,
-                                   voronoi_ridge_area=ridge_area)
-    else:
-        for nodes, cell_translation, dist in zip(edge_indices, cell_translations, distances):
-            source, target = nodes[0], nodes[1]
-            new_graph.add_edge(source, target, cell_translation=cell_translation, distance=dist)
-
-    return new_graph
+    # Keep vertices of ridges to compute ridge areas on demand.
+    ridges = np.concatenate([source_in_center_cell, target_in_center_cell])
+    ridge_vertices = [voronoi.vertices[voronoi.ridge_vertices[i]] for i in ridges]
+    ridge_normals = diff
+    return {"edge_indices": edge_indices, "cell_translations": cell_translations, "distances": distances,
+            "ridge_vertices": ridge_vertices, "ridge_normals": ridge_normals, "ridge_areas": None}
 
 
 def remove_duplicate_edges(graph: MultiDiGraph, inplace=False) -> MultiDiGraph:
@@ -619,6 +721,52 @@ def get_ridge_area(ridge_points):
     return area
 
 
+def get_ridge_areas(ridge_points: list, normals: np.ndarray = None) -> np.ndarray:
+    """Computes the areas of many ridges at once.
+
+    The vertices of each ridge are sorted by angle around their center and the polygon area is computed by a
+    fan triangulation from the center, for all ridges padded to the same number of vertices.
+    Like :obj:`get_ridge_area` , this assumes that the ridge points are (roughly) within a flat subspace plane.
+    Degenerate ridges with (nearly) zero area are computed with :obj:`get_ridge_area` .
+
+    Args:
+        ridge_points (list): List of ridge points of shape `(K_i, 3)` for each ridge.
+        normals (np.ndarray): Normal vectors of the ridge planes of shape `(M, 3)` . If None, the normal is computed
+            from the ridge points. Default is None.
+
+    Returns:
+        np.ndarray: Ridge areas of shape `(M, )` .
+    """
+    num_ridges = len(ridge_points)
+    if num_ridges == 0:
+        return np.zeros(0)
+    lengths = np.array([len(x) for x in ridge_points])
+    max_length = max(int(np.amax(lengths)), 1)
+    is_valid = np.arange(max_length) < lengths[:, None]
+    points = np.zeros((num_ridges, max_length, 3))
+    points[is_valid] = np.concatenate([np.reshape(x, (-1, 3)) for x in ridge_points], axis=0)
+    center = np.sum(points, axis=1) / np.maximum(lengths, 1)[:, None]
+    rel_points = np.where(is_valid[..., None], points - center[:, None, :], 0.0)
+    if normals is None:
+        normals = np.linalg.svd(rel_points)[2][:, -1]
+    normals = normals / np.maximum(np.linalg.norm(normals, axis=-1, keepdims=True), np.finfo(float).tiny)
+    # Sort vertices by angle in the ridge plane.
+    e1 = rel_points[np.arange(num_ridges), np.argmax(np.linalg.norm(rel_points, axis=-1), axis=-1)]
+    e1 = e1 / np.maximum(np.linalg.norm(e1, axis=-1, keepdims=True), np.finfo(float).tiny)
+    e2 = np.cross(normals, e1)
+    angles = np.arctan2(np.sum(rel_points * e2[:, None, :], axis=-1), np.sum(rel_points * e1[:, None, :], axis=-1))
+    angles = np.where(is_valid, angles, np.inf)
+    sorted_points = np.take_along_axis(rel_points, np.argsort(angles, axis=-1)[..., None], axis=1)
+    # Padding repeats the first vertex, which closes the polygon and adds empty triangles.
+    sorted_points = np.where(is_valid[..., None], sorted_points, sorted_points[:, :1])
+    next_points = np.roll(sorted_points, -1, axis=1)
+    areas = np.abs(np.sum(np.cross(sorted_points, next_points) * normals[:, None, :], axis=(1, 2))) / 2
+    # Areas of degenerate ridges are kept as before.
+    for i in np.argwhere((areas < 1e-6) | (lengths < 3)).reshape(-1):
+        areas[i] = get_ridge_area(np.reshape(ridge_points[i], (-1, 3)))
+    return areas
+
+
 def pairwise_diff(coords1: np.ndarray, coords2: np.ndarray) -> np.ndarray:
     """Get the pairwise offset difference between two vector sets.
 
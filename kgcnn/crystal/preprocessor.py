@@ -3,6 +3,7 @@ from typing import Optional
 from networkx import MultiDiGraph
 from .base import CrystalPreprocessor
 from . import graph_builder
+from .graph_arrays import CrystalGraphArrays
 
 
 class RadiusAsymmetricUnitCell(CrystalPreprocessor):
@@ -21,22 +22,24 @@ class RadiusAsymmetricUnitCell(CrystalPreprocessor):
         super(RadiusAsymmetricUnitCell, self).__init__(**kwargs)
         self.radius = radius
 
-    def call(self, structure: Structure) -> MultiDiGraph:
+    def call(self, structure: Structure, builder=graph_builder) -> MultiDiGraph:
         """Builds the crystal graph (networkx.MultiDiGraph) for the pymatgen structure.
 
         Args:
             structure (Structure): Structure to convert to a crystal graph.
+            builder: Module with graph building functions. Either :obj:`graph_builder` or :obj:`graph_arrays` .
+                Defaults to :obj:`graph_builder` .
 
         Returns:
             MultiDiGraph: Crystal graph for the provided crystal.
         """
-        if isinstance(structure, MultiDiGraph):
+        if isinstance(structure, (MultiDiGraph, CrystalGraphArrays)):
             g = structure
         else:
-            g = graph_builder.structure_to_empty_graph(structure, symmetrize=True)
-        g = graph_builder.add_radius_bonds(g, radius=self.radius, inplace=True)
-        g = graph_builder.add_edge_information(g, inplace=True)
-        g = graph_builder.to_asymmetric_unit_graph(g)
+            g = builder.structure_to_empty_graph(structure, symmetrize=True)
+        g = builder.add_radius_bonds(g, radius=self.radius, inplace=True)
+        g = builder.add_edge_information(g, inplace=True)
+        g = builder.to_asymmetric_unit_graph(g)
         return g
 
 
@@ -60,22 +63,24 @@ class KNNAsymmetricUnitCell(CrystalPreprocessor):
         self.k = k
         self.tolerance = tolerance
 
-    def call(self, structure: Structure) -> MultiDiGraph:
+    def call(self, structure: Structure, builder=graph_builder) -> MultiDiGraph:
         """Builds the crystal graph (networkx.MultiDiGraph) for the pymatgen structure.
 
         Args:
             structure (Structure): Structure to convert to a crystal graph.
+            builder: Module with graph building functions. Either :obj:`graph_builder` or :obj:`graph_arrays` .
+                Defaults to :obj:`graph_builder` .
 
         Returns:
             MultiDiGraph: Crystal graph for the provided crystal.
         """
-        if isinstance(structure, MultiDiGraph):
+        if isinstance(structure, (MultiDiGraph, CrystalGraphArrays)):
             g = structure
         else:
-            g = graph_builder.structure_to_empty_graph(structure, symmetrize=True)
-        g = graph_builder.add_knn_bonds(g, k=self.k, tolerance=self.tolerance, inplace=True)
-        g = graph_builder.add_edge_information(g, inplace=True)
-        g = graph_builder.to_asymmetric_unit_graph(g)
+            g = builder.structure_to_empty_graph(structure, symmetrize=True)
+        g = builder.add_knn_bonds(g, k=self.k, tolerance=self.tolerance, inplace=True)
+        g = builder.add_edge_information(g, inplace=True)
+        g = builder.to_asymmetric_unit_graph(g)
         return g
 
 
@@ -97,22 +102,24 @@ class VoronoiAsymmetricUnitCell(CrystalPreprocessor):
         super(VoronoiAsymmetricUnitCell, self).__init__(**kwargs)
         self.min_ridge_area = min_ridge_area
 
-    def call(self, structure: Structure) -> MultiDiGraph:
+    def call(self, structure: Structure, builder=graph_builder) -> MultiDiGraph:
         """Builds the crystal graph (networkx.MultiDiGraph) for the pymatgen structure.
 
         Args:
             structure (Structure): Structure to convert to a crystal graph.
+            builder: Module with graph building functions. Either :obj:`graph_builder` or :obj:`graph_arrays` .
+                Defaults to :obj:`graph_builder` .
 
         Returns:
             MultiDiGraph: Crystal graph for the provided crystal.
         """
-        if isinstance(structure, MultiDiGraph):
+        if isinstance(structure, (MultiDiGraph, CrystalGraphArrays)):
             g = structure
         else:
-            g = graph_builder.structure_to_empty_graph(structure, symmetrize=True)
-        g = graph_builder.add_voronoi_bonds(g, min_ridge_area=self.min_ridge_area, inplace=True)
-        g = graph_builder.add_edge_information(g, inplace=True)
-        g = graph_builder.to_asymmetric_unit_graph(g)
+            g = builder.structure_to_empty_graph(structure, symmetrize=True)
+        g = builder.add_voronoi_bonds(g, min_ridge_area=self.min_ridge_area, inplace=True)
+        g = builder.add_edge_information(g, inplace=True)
+        g = builder.to_asymmetric_unit_graph(g)
         return g
 
 
@@ -132,21 +139,23 @@ class RadiusUnitCell(CrystalPreprocessor):
         super(RadiusUnitCell, self).__init__(**kwargs)
         self.radius = radius
 
-    def call(self, structure: Structure) -> MultiDiGraph:
+    def call(self, structure: Structure, builder=graph_builder) -> MultiDiGraph:
         """Builds the crystal graph (networkx.MultiDiGraph) for the pymatgen structure.
 
         Args:
             structure (Structure): Structure to convert to a crystal graph.
+            builder: Module with graph building functions. Either :obj:`graph_builder` or :obj:`graph_arrays` .
+                Defaults to :obj:`graph_builder` .
 
         Returns:
             MultiDiGraph: Crystal graph for the provided crystal.
         """
-        if isinstance(structure, MultiDiGraph):
+        if isinstance(structure, (MultiDiGraph, CrystalGraphArrays)):
             g = structure
         else:
-            g = graph_builder.structure_to_empty_graph(structure, symmetrize=False)
-        g = graph_builder.add_radius_bonds(g, radius=self.radius, inplace=True)
-        g = graph_builder.add_edge_information(g, inplace=True)
+            g = builder.structure_to_empty_graph(structure, symmetrize=False)
+        g = builder.add_radius_bonds(g, radius=self.radius, inplace=True)
+        g = builder.add_edge_information(g, inplace=True)
         return g
 
 
@@ -170,21 +179,23 @@ class KNNUnitCell(CrystalPreprocessor):
         self.k = k
         self.tolerance = tolerance
 
-    def call(self, structure: Structure) -> MultiDiGraph:
+    def call(self, structure: Structure, builder=graph_builder) -> MultiDiGraph:
         """Builds the crystal graph (networkx.MultiDiGraph) for the pymatgen structure.
 
         Args:
             structure (Structure): Structure to convert to a crystal graph.
+            builder: Module with graph building functions. Either :obj:`graph_builder` or :obj:`graph_arrays` .
+                Defaults to :obj:`graph_builder` .
 
         Returns:
             MultiDiGraph: Crystal graph for the provided crystal.
         """
-        if isinstance(structure, MultiDiGraph):
+        if isinstance(structure, (MultiDiGraph, CrystalGraphArrays)):
             g = structure
         else:
-            g = graph_builder.structure_to_empty_graph(structure, symmetrize=False)
-        g = graph_builder.add_knn_bonds(g, k=self.k, tolerance=self.tolerance, inplace=True)
-        g = graph_builder.add_edge_information(g, inplace=True)
+            g = builder.structure_to_empty_graph(structure, symmetrize=False)
+        g = builder.add_knn_bonds(g, k=self.k, tolerance=self.tolerance, inplace=True)
+        g = builder.add_edge_information(g, inplace=True)
         return g
 
 
@@ -206,21 +217,23 @@ class VoronoiUnitCell(CrystalPreprocessor):
         super(VoronoiUnitCell, self).__init__(**kwargs)
         self.min_ridge_area = min_ridge_area
 
-    def call(self, structure: Structure) -> MultiDiGraph:
+    def call(self, structure: Structure, builder=graph_builder) -> MultiDiGraph:
         """Builds the crystal graph (networkx.MultiDiGraph) for the pymatgen structure.
 
         Args:
             structure (Structure): Structure to convert to a crystal graph.
+            builder: Module with graph building functions. Either :obj:`graph_builder` or :obj:`graph_arrays` .
+                Defaults to :obj:`graph_builder` .
 
         Returns:
             MultiDiGraph: Crystal graph for the provided crystal.
         """
-        if isinstance(structure, MultiDiGraph):
+        if isinstance(structure, (MultiDiGraph, CrystalGraphArrays)):
             g = structure
         else:
-            g = graph_builder.structure_to_empty_graph(structure, symmetrize=False)
-        g = graph_builder.add_voronoi_bonds(g, min_ridge_area=self.min_ridge_area, inplace=True)
-        g = graph_builder.add_edge_information(g, inplace=True)
+            g = builder.structure_to_empty_graph(structure, symmetrize=False)
+        g = builder.add_voronoi_bonds(g, min_ridge_area=self.min_ridge_area, inplace=True)
+        g = builder.add_edge_information(g, inplace=True)
         return g
 
 
@@ -245,22 +258,24 @@ class RadiusSuperCell(CrystalPreprocessor):
         self.radius = radius
         self.size = size
 
-    def call(self, structure: Structure) -> MultiDiGraph:
+    def call(self, structure: Structure, builder=graph_builder) -> MultiDiGraph:
         """Builds the crystal graph (networkx.MultiDiGraph) for the pymatgen structure.
 
         Args:
             structure (Structure): Structure to convert to a crystal graph.
+            builder: Module with graph building functions. Either :obj:`graph_builder` or :obj:`graph_arrays` .
+                Defaults to :obj:`graph_builder` .
 
         Returns:
             MultiDiGraph: Crystal graph for the provided crystal.
         """
-        if isinstance(structure, MultiDiGraph):
+        if isinstance(structure, (MultiDiGraph, CrystalGraphArrays)):
             g = structure
         else:
-            g = graph_builder.structure_to_empty_graph(structure, symmetrize=False)
-        g = graph_builder.add_radius_bonds(g, radius=self.radius, inplace=True)
-        g = graph_builder.add_edge_information(g, inplace=True)
-        g = graph_builder.to_supercell_graph(g, size=self.size)
+            g = builder.structure_to_empty_graph(structure, symmetrize=False)
+        g = builder.add_radius_bonds(g, radius=self.radius, inplace=True)
+        g = builder.add_edge_information(g, inplace=True)
+        g = builder.to_supercell_graph(g, size=self.size)
         return g
 
 
@@ -289,22 +304,24 @@ class KNNSuperCell(CrystalPreprocessor):
         self.tolerance = tolerance
         self.size = size
 
-    def call(self, structure: Structure) -> MultiDiGraph:
+    def call(self, structure: Structure, builder=graph_builder) -> MultiDiGraph:
         """Builds the crystal graph (networkx.MultiDiGraph) for the pymatgen structure.
 
         Args:
             structure (Structure): Structure to convert to a crystal graph.
+            builder: Module with graph building functions. Either :obj:`graph_builder` or :obj:`graph_arrays` .
+                Defaults to :obj:`graph_builder` .
 
         Returns:
             MultiDiGraph: Crystal graph for the provided crystal.
         """
-        if isinstance(structure, MultiDiGraph):
+        if isinstance(structure, (MultiDiGraph, CrystalGraphArrays)):
             g = structure
         else:
-            g = graph_builder.structure_to_empty_graph(structure, symmetrize=False)
-        g = graph_builder.add_knn_bonds(g, k=self.k, tolerance=self.tolerance, inplace=True)
-        g = graph_builder.add_edge_information(g, inplace=True)
-        g = graph_builder.to_supercell_graph(g, size=self.size)
+            g = builder.structure_to_empty_graph(structure, symmetrize=False)
+        g = builder.add_knn_bonds(g, k=self.k, tolerance=self.tolerance, inplace=True)
+        g = builder.add_edge_information(g, inplace=True)
+        g = builder.to_supercell_graph(g, size=self.size)
         return g
 
 
@@ -331,22 +348,24 @@ class VoronoiSuperCell(CrystalPreprocessor):
         self.size = size
         self.min_ridge_area = min_ridge_area
 
-    def call(self, structure: Structure) -> MultiDiGraph:
+    def call(self, structure: Structure, builder=graph_builder) -> MultiDiGraph:
         """Builds the crystal graph (networkx.MultiDiGraph) for the pymatgen structure.
 
         Args:
             structure (Structure): Structure to convert to a crystal graph.
+            builder: Module with graph building functions. Either :obj:`graph_builder` or :obj:`graph_arrays` .
+                Defaults to :obj:`graph_builder` .
 
         Returns:
             MultiDiGraph: Crystal graph for the provided crystal.
         """
-        if isinstance(structure, MultiDiGraph):
+        if isinstance(structure, (MultiDiGraph, CrystalGraphArrays)):
             g = structure
         else:
-            g = graph_builder.structure_to_empty_graph(structure, symmetrize=False)
-        g = graph_builder.add_voronoi_bonds(g, min_ridge_area=self.min_ridge_area, inplace=True)
-        g = graph_builder.add_edge_information(g, inplace=True)
-        g = graph_builder.to_supercell_graph(g, size=self.size)
+            g = builder.structure_to_empty_graph(structure, symmetrize=False)
+        g = builder.add_voronoi_bonds(g, min_ridge_area=self.min_ridge_area, inplace=True)
+        g = builder.add_edge_information(g, inplace=True)
+        g = builder.to_supercell_graph(g, size=self.size)
         return g
 
 
@@ -366,22 +385,24 @@ class RadiusNonPeriodicUnitCell(CrystalPreprocessor):
         super(RadiusNonPeriodicUnitCell, self).__init__(**kwargs)
         self.radius = radius
 
-    def call(self, structure: Structure) -> MultiDiGraph:
+    def call(self, structure: Structure, builder=graph_builder) -> MultiDiGraph:
         """Builds the crystal graph (networkx.MultiDiGraph) for the pymatgen structure.
 
         Args:
             structure (Structure): Structure to convert to a crystal graph.
+            builder: Module with graph building functions. Either :obj:`graph_builder` or :obj:`graph_arrays` .
+                Defaults to :obj:`graph_builder` .
 
         Returns:
             MultiDiGraph: Crystal graph for the provided crystal.
         """
-        if isinstance(structure, MultiDiGraph):
+        if isinstance(structure, (MultiDiGraph, CrystalGraphArrays)):
             g = structure
         else:
-            g = graph_builder.structure_to_empty_graph(structure, symmetrize=False)
-        g = graph_builder.add_radius_bonds(g, radius=self.radius, inplace=True)
-        g = graph_builder.to_non_periodic_unit_cell(g, add_reverse_edges=True, inplace=True)
-        g = graph_builder.add_edge_information(g, inplace=True)
+            g = builder.structure_to_empty_graph(structure, symmetrize=False)
+        g = builder.add_radius_bonds(g, radius=self.radius, inplace=True)
+        g = builder.to_non_periodic_unit_cell(g, add_reverse_edges=True, inplace=True)
+        g = builder.add_edge_information(g, inplace=True)
         return g
 
 
@@ -405,22 +426,24 @@ class KNNNonPeriodicUnitCell(CrystalPreprocessor):
         self.k = k
         self.tolerance = tolerance
 
-    def call(self, structure: Structure) -> MultiDiGraph:
+    def call(self, structure: Structure, builder=graph_builder) -> MultiDiGraph:
         """Builds the crystal graph (networkx.MultiDiGraph) for the pymatgen structure.
 
         Args:
             structure (Structure): Structure to convert to a crystal graph.
+            builder: Module with graph building functions. Either :obj:`graph_builder` or :obj:`graph_arrays` .
+                Defaults to :obj:`graph_builder` .
 
         Returns:
             MultiDiGraph: Crystal graph for the provided crystal.
         """
-        if isinstance(structure, MultiDiGraph):
+        if isinstance(structure, (MultiDiGraph, CrystalGraphArrays)):
             g = structure
         else:
-            g = graph_builder.structure_to_empty_graph(structure, symmetrize=False)
-        g = graph_builder.add_knn_bonds(g, k=self.k, tolerance=self.tolerance, inplace=True)
-        g = graph_builder.to_non_periodic_unit_cell(g, add_reverse_edges=True, inplace=True)
-        g = graph_builder.add_edge_information(g, inplace=True)
+            g = builder.structure_to_empty_graph(structure, symmetrize=False)
+        g = builder.add_knn_bonds(g, k=self.k, tolerance=self.tolerance, inplace=True)
+        g = builder.to_non_periodic_unit_cell(g, add_reverse_edges=True, inplace=True)
+        g = builder.add_edge_information(g, inplace=True)
         return g
 
 
@@ -442,22 +465,24 @@ class VoronoiNonPeriodicUnitCell(CrystalPreprocessor):
         super(VoronoiNonPeriodicUnitCell, self).__init__(**kwargs)
         self.min_ridge_area = min_ridge_area
 
-    def call(self, structure: Structure) -> MultiDiGraph:
+    def call(self, structure: Structure, builder=graph_builder) -> MultiDiGraph:
         """Builds the crystal graph (networkx.MultiDiGraph) for the pymatgen structure.
 
         Args:
             structure (Structure): Structure to convert to a crystal graph.
+            builder: Module with graph building functions. Either :obj:`graph_builder` or :obj:`graph_arrays` .
+                Defaults to :obj:`graph_builder` .
 
         Returns:
             MultiDiGraph: Crystal graph for the provided crystal.
         """
-        if isinstance(structure, MultiDiGraph):
+        if isinstance(structure, (MultiDiGraph, CrystalGraphArrays)):
             g = structure
         else:
-            g = graph_builder.structure_to_empty_graph(structure, symmetrize=False)
-        g = graph_builder.add_voronoi_bonds(g, min_ridge_area=self.min_ridge_area, inplace=True)
-        g = graph_builder.to_non_periodic_unit_cell(g, add_reverse_edges=True, inplace=True)
-        g = graph_builder.add_edge_information(g, inplace=True)
+            g = builder.structure_to_empty_graph(structure, symmetrize=False)
+        g = builder.add_voronoi_bonds(g, min_ridge_area=self.min_ridge_area, inplace=True)
+        g = builder.to_non_periodic_unit_cell(g, add_reverse_edges=True, inplace=True)
+        g = builder.add_edge_information(g, inplace=True)
         return g
 
 
@@ -468,19 +493,21 @@ class UnitCell(CrystalPreprocessor):
     edge_attributes = []
     graph_attributes = ['lattice_matrix']
 
-    def call(self, structure: Structure) -> MultiDiGraph:
+    def call(self, structure: Structure, builder=graph_builder) -> MultiDiGraph:
         """Builds the crystal graph (networkx.MultiDiGraph) for the pymatgen structure.
 
         Args:
             structure (Structure): Structure to convert to a crystal graph.
+            builder: Module with graph building functions. Either :obj:`graph_builder` or :obj:`graph_arrays` .
+                Defaults to :obj:`graph_builder` .
 
         Returns:
             MultiDiGraph: Crystal graph for the provided crystal.
         """
-        if isinstance(structure, MultiDiGraph):
+        if isinstance(structure, (MultiDiGraph, CrystalGraphArrays)):
             g = structure
         else:
-            g = graph_builder.structure_to_empty_graph(structure, symmetrize=False)
+            g = builder.structure_to_empty_graph(structure, symmetrize=False)
         return g
 
 
@@ -491,17 +518,19 @@ class AsymmetricUnitCell(CrystalPreprocessor):
     edge_attributes = []
     graph_attributes = ['lattice_matrix', 'spacegroup']
 
-    def call(self, structure: Structure) -> MultiDiGraph:
+    def call(self, structure: Structure, builder=graph_builder) -> MultiDiGraph:
         """Builds the crystal graph (networkx.MultiDiGraph) for the pymatgen structure.
 
         Args:
             structure (Structure): Structure to convert to a crystal graph.
+            builder: Module with graph building functions. Either :obj:`graph_builder` or :obj:`graph_arrays` .
+                Defaults to :obj:`graph_builder` .
 
         Returns:
             MultiDiGraph: Crystal graph for the provided crystal.
         """
-        if isinstance(structure, MultiDiGraph):
+        if isinstance(structure, (MultiDiGraph, CrystalGraphArrays)):
             g = structure
         else:
-            g = graph_builder.structure_to_empty_graph(structure, symmetrize=True)
+            g = builder.structure_to_empty_graph(structure, symmetrize=True)
         return g
@@ -2,15 +2,21 @@ import logging
 import numpy as np
 import pandas as pd
 import os
-from sklearn.model_selection import KFold
-from kgcnn.io.loader import tf_dataset_disjoint_generator
+from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
+from kgcnn.io.loader import tf_dataset_disjoint_generator, greedy_budget_batch_splits
+from kgcnn.io.graphlist import GraphListColumnarDirectory
+from kgcnn.data.cache import GraphPreprocessingCache, hash_graph_list
 # import typing as t
 from typing import Union, List, Callable, Dict, Optional
 # from collections.abc import MutableSequence
 
 from kgcnn.data.utils import (
-    save_pickle_file, load_pickle_file, ragged_tensor_from_nested_numpy, pad_np_array_list_batch_dim)
-from kgcnn.graph.base import GraphDict
+    save_pickle_file, load_pickle_file, ragged_tensor_from_nested_numpy, pad_np_array_list_batch_dim,
+    get_property_statistics, format_property_statistics)
+from kgcnn.graph.base import GraphDict, GraphPreProcessorBase
+from kgcnn.graph.serial import get_preprocessor
+from kgcnn.utils.serial import serialize
 
 # Module logger
 logging.basicConfig()
@@ -18,7 +24,291 @@ module_logger = logging.getLogger(__name__)
 module_logger.setLevel(logging.INFO)
 
 
-class MemoryGraphList(list):
+def _apply_preprocessor_on_chunk(preprocessor_config: dict, graphs: List[dict]) -> List[dict]:
+    r"""Apply a serialized preprocessor on a list of graphs. Used by worker processes in :obj:`map_list` .
+
+    Args:
+        preprocessor_config (dict): Serialization dictionary of a :obj:`GraphPreProcessorBase` .
+        graphs (list): List of graph dictionaries.
+
+    Returns:
+        list: List of dictionaries with the new properties of each graph.
+    """
+    preprocessor_config = deepcopy(preprocessor_config)
+    # Only return new properties to main process.
+    if "config" in preprocessor_config:
+        preprocessor_config["config"]["in_place"] = False
+    preprocessor = get_preprocessor(preprocessor_config)
+    return [preprocessor(GraphDict(x)).to_dict() for x in graphs]
+
+
+class GraphTensorMixin:
+    r"""Methods to make tensors and splits from the graph properties of a list or dataset.
+
+    The methods only rely on :obj:`obtain_property` , :obj:`_property_buffer` and :obj:`__len__` of the class.
+    :obj:`_property_buffer` returns the values of a property of all graphs concatenated along the first axis
+    together with row splits, or None if this is not possible.
+    """
+
+    def _property_lengths(self, key: str) -> np.ndarray:
+        """Length of the first axis of a property for each graph. Graphs without the property have length zero."""
+        return np.array([len(x) if x is not None else 0 for x in self.obtain_property(key)], dtype="int64")
+
+    def _to_tensor(self, item: dict, make_copy=True, graph_slice: slice = None):
+        is_ragged = item["ragged"] if "ragged" in item else False
+        dtype = item["dtype"] if "dtype" in item else None
+        buffer = self._property_buffer(item["name"])
+        if buffer is None or (is_ragged and buffer["rank"] == 0):
+            props: list = self.obtain_property(item["name"])
+            if graph_slice is not None and props is not None:
+                props = props[graph_slice]
+            # Could add name and shape information if available.
+            if is_ragged:
+                return ragged_tensor_from_nested_numpy(props, dtype=dtype)
+            else:
+                return pad_np_array_list_batch_dim(props, dtype=dtype)[0]
+        values, row_splits = buffer["values"], buffer["row_splits"]
+        if graph_slice is not None:
+            start, stop, _ = graph_slice.indices(len(row_splits) - 1)
+            values = values[row_splits[start]:row_splits[stop]]
+            row_splits = row_splits[start:stop + 1] - row_splits[start]
+        values = values.astype(dtype, copy=False) if dtype is not None else values
+        if is_ragged:
+            import tensorflow as tf
+            return tf.RaggedTensor.from_row_splits(values, row_splits)
+        row_lengths = np.diff(row_splits)
+        num_rows = len(row_lengths)
+        if buffer["rank"] == 0:
+            padded = values
+        elif num_rows > 0 and np.all(row_lengths == row_lengths[0]):
+            # Same number of rows for each graph requires no padding.
+            padded = values.reshape((num_rows, int(row_lengths[0])) + values.shape[1:])
+        else:
+            padded = np.zeros((num_rows, int(np.amax(row_lengths, initial=0))) + values.shape[1:], dtype=values.dtype)
+            graph_id = np.repeat(np.arange(num_rows), row_lengths)
+            padded[graph_id, np.arange(len(values)) - row_splits[graph_id]] = values
+            return padded
+        return padded.copy() if make_copy and np.may_share_memory(padded, buffer["values"]) else padded
+
+    def tensor(self, items: Union[list, Dict], make_copy=True):
+        r"""Make tensor objects from multiple graph properties in list.
+
+        It is recommended to run :obj:`clean` beforehand.
+
+        The arrays of each property are concatenated once into a buffer of values and row splits, which is reused by
+        subsequent calls until the property is changed by :obj:`set` or a graph is given a new array for it. The
+        buffer is a copy of the graph arrays and holds the property in memory a second time. Changes made in place to
+        the array of a graph are therefore not seen by the buffer. Padded tensors of properties with the same
+        length for all graphs are returned as view of the buffer, if :obj:`make_copy` is False.
+
+        Args:
+            items (list): List of dictionaries that specify graph properties in list via 'name' key.
+                The dict-items match the tensor input for :obj:`tf.keras.layers.Input` layers.
+                Required dict-keys should be 'name' and 'ragged'.
+                Optionally shape information can be included via 'shape' and 'dtype'.
+                E.g.: `[{'name': 'edge_indices', 'ragged': True}, {...}, ...]`.
+            make_copy (bool): Whether to copy the data. Default is True.
+
+        Returns:
+            list: List of Tensors.
+        """
+        return self._tensor(items, make_copy=make_copy)
+
+    def _tensor(self, items: Union[list, Dict], make_copy=True, graph_slice: slice = None):
+        if isinstance(items, dict):
+            if all([isinstance(value, dict) for value in items.values() if value is not None]) and "name" not in items:
+                return {key: self._to_tensor(value, make_copy=make_copy, graph_slice=graph_slice)
+                        for key, value in items.items() if value is not None}
+            return self._to_tensor(items, make_copy=make_copy, graph_slice=graph_slice)
+        elif isinstance(items, (tuple, list)):
+            return [self._to_tensor(x, make_copy=make_copy, graph_slice=graph_slice) for x in items]
+        else:
+            raise TypeError("Wrong type, expected e.g. [{'name': 'edge_indices', 'ragged': True}, {...}, ...]")
+
+    def tensor_batches(self, items: Union[list, Dict], max_nodes_per_batch: int = None,
+                       max_edges_per_batch: int = None, batch_size: int = None, nodes: str = None,
+                       edges: str = None, make_copy=True) -> list:
+        r"""Make tensor objects from multiple graph properties for batches of graphs in list.
+
+        The graphs are packed greedily in the order of the list into batches up to a maximum total number of nodes
+        and edges. A single graph that exceeds the budget forms its own batch.
+
+        Args:
+            items (list): List of dictionaries that specify graph properties in list via 'name' key.
+                See :obj:`tensor` for details.
+            max_nodes_per_batch (int): Maximum number of nodes in a batch. Default is None.
+            max_edges_per_batch (int): Maximum number of edges in a batch. Default is None.
+            batch_size (int): Maximum number of graphs in a batch. Default is None.
+            nodes (str): Name of the property to count nodes. Default is None, which uses the first property of
+                `items` starting with 'node_'.
+            edges (str): Name of the property to count edges. Default is None, which uses the first property of
+                `items` ending with 'indices'.
+            make_copy (bool): Whether to copy the data. Default is True.
+
+        Returns:
+            list: List of the output of :obj:`tensor` for each batch.
+        """
+        if isinstance(items, dict):
+            item_list = [items] if "name" in items else [x for x in items.values() if x is not None]
+        else:
+            item_list = list(items)
+        names = [x["name"] for x in item_list]
+        lengths, budgets = [], []
+        for budget, name, default_name in [
+                (max_nodes_per_batch, nodes, [x for x in names if x.startswith("node_")]),
+                (max_edges_per_batch, edges, [x for x in names if x.endswith("indices")])]:
+            if budget is None:
+                continue
+            if name is None:
+                if len(default_name) == 0:
+                    raise ValueError("Can not infer property to count for batches from '%s'." % names)
+                name = default_name[0]
+            lengths.append(self._property_lengths(name))
+            budgets.append(budget)
+        if len(budgets) == 0 and batch_size is None:
+            raise ValueError("Require `max_nodes_per_batch`, `max_edges_per_batch` or `batch_size` for batches.")
+        if len(budgets) == 0:
+            batch_splits = np.append(np.arange(0, len(self), batch_size), len(self))
+        else:
+            batch_splits = greedy_budget_batch_splits(np.arange(len(self)), lengths, budgets, batch_size=batch_size)
+        return [self._tensor(items, make_copy=make_copy, graph_slice=slice(int(i), int(j))) for i, j in zip(
+            batch_splits[:-1], batch_splits[1:])]
+
+    def get_train_test_indices(self,
+                               train: str = "train",
+                               test: str = "test",
+                               valid: Optional[str] = None,
+                               split_index: Union[int, list] = None,
+                               shuffle: bool = False,
+                               seed: int = None
+                               ) -> List[List[np.ndarray]]:
+        """
+        Get train and test indices from graph list.
+        The 'train' and 'test' properties must be set on the graph, and optionally an additional property
+        for the validation split may be present. All of these properties may have either of the following
+        values:
+
+        - The property is a boolean integer value indicating whether the corresponding element of the
+          dataset belongs to that part of the split (train / test)
+        - The property is a list containing integer split indices, where each split index present within
+          that list implies that the corresponding dataset element is part of that particular split.
+          In this case the `split_index` parameter may also be a list of split indices that specify
+          for which of these split indices the train test index split is to be returned by this method.
+
+        The return value of this method is a list with the same length as the `split_index` parameter,
+        which by default will be None.
+
+        Args:
+            train (str): Name of graph property that has train split assignment. Defaults to 'train'.
+            test (str): Name of graph property that has test split assignment. Defaults to 'test'.
+            valid (str): Name of graph property that has validation assignment. Defaults to None.
+            split_index (int, list): Split index to get indices for. Can also be list.
+            shuffle (bool): Whether to shuffle splits. Default is True.
+            seed (int): Random seed for shuffle. Default is None.
+
+        Returns:
+            list: List of tuples (or triples) of train, test, (validation) split indices.
+        """
+        out_indices = []
+
+        if split_index is None:
+            train_to_check = self.obtain_property(train)
+            train_to_check = [
+                np.expand_dims(x, axis=0) if len(x.shape) < 1 else x for x in train_to_check if x is not None]
+            split_index = list(np.sort(np.unique(np.concatenate(train_to_check, axis=0))))
+        if not isinstance(split_index, (list, tuple)):
+            split_index_list: List[int] = [split_index]
+        else:
+            split_index_list: List[int] = split_index
+
+        for split_index in split_index_list:
+
+            # This list will itself contain numpy arrays which are filled with graph indices of the dataset
+            # each element of this list will correspond to one property name (train, test...)
+            graph_index_split_list: List[np.ndarray] = []
+
+            for property_name in [train, test, valid]:
+
+                # It may be that we only seek train and test indices and not validation indices, in that
+                # case the property name for validation is None, in which case we want to skip
+                if property_name is None:
+                    continue
+
+                # This list will contain all the indices of the dataset elements (graphs) which are
+                # associated with the current iteration's split index for the current iteration's
+                # property name (train, test...)
+                graph_index_list: List[int] = []
+
+                # "obtain_property" returns a list which contains only the property values corresponding to
+                # the given property name for each graph inside the dataset in the same order.
+                # In this case, this is supposed to be a split list, which is a list that contains integer
+                # indices, each representing one particular dataset split. The split list of each graph
+                # only contains those split indices to which that graph is associated.
+                split_prop: List[List[int]] = self.obtain_property(property_name)
+                for index, split_list in enumerate(split_prop):
+                    if split_list is not None:
+                        if split_index in split_list:
+                            graph_index_list.append(index)
+
+                graph_index_array = np.array(graph_index_list)
+                graph_index_split_list.append(graph_index_array)
+
+            if shuffle:
+                np.random.seed(seed)
+                for graph_index_array in graph_index_split_list:
+                    np.random.shuffle(graph_index_array)
+
+            out_indices.append(graph_index_split_list)
+
+        return out_indices
+
+
+class GraphDatasetMixin:
+    r"""Methods of a dataset that rely on the information of its location on disk, i.e. :obj:`data_directory` ,
+    :obj:`file_name` and :obj:`file_directory` , and on its :obj:`logger` .
+    """
+
+    def _verify_data_directory(self) -> Union[str, None]:
+        r"""Utility function that checks if `data_directory` is set correctly."""
+        if self.data_directory is None:
+            self.warning("Data directory is not set.")
+            return None
+        if not os.path.exists(os.path.realpath(self.data_directory)):
+            self.error("Data directory does not exist.")
+        return self.data_directory
+
+    @property
+    def file_path(self):
+        r"""Construct filepath from 'file_name' given in `init`."""
+        self._verify_data_directory()
+        if self.file_name is None:
+            self.warning("Can not determine file path, missing `file_name`.")
+            return None
+        return os.path.join(self.data_directory, self.file_name)
+
+    @property
+    def file_directory_path(self):
+        r"""Construct file-directory path from 'data_directory' and 'file_directory' given in `init`."""
+        self._verify_data_directory()
+        if self.file_directory is None:
+            self.warning("Can not determine file directory, missing `file_directory`.")
+            return None
+        return os.path.join(self.data_directory, self.file_directory)
+
+    def info(self, *args, **kwargs):
+        """Pass information to class' logger instance."""
+        self.logger.info(*args, **kwargs)
+
+    def warning(self, *args, **kwargs):
+        """Pass warning to class' logger instance."""
+        self.logger.warning(*args, **kwargs)
+
+    def error(self, *args, **kwargs):
+        """Pass error to class' logger instance."""
+        self.logger.error(*args, **kwargs)
+
+
+class MemoryGraphList(GraphTensorMixin, list):
     r"""Class to store a list of graph dictionaries in memory.
 
     Inherits from a python list. The graph properties are defined by tensor-like (numpy) arrays
@@ -62,8 +352,16 @@ class MemoryGraphList(list):
         iterable = iterable if iterable is not None else []
         super(MemoryGraphList, self).__init__(iterable)
         self.logger = module_logger
+        self._property_buffers = {}
+        self._content_digest = None
         self.validate()
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_property_buffers"] = {}
+        state["_content_digest"] = None
+        return state
+
     def validate(self):
         for i, x in enumerate(self):
             if not isinstance(x, GraphDict):
@@ -88,6 +386,8 @@ class MemoryGraphList(list):
             self.empty(len(value))
         if len(self) != len(value):
             raise ValueError("Can only store graph attributes from list with same length.")
+        self._property_buffers.pop(key, None)
+        self._content_digest = None
         for i, x in enumerate(value):
             self[i].assign_property(key, x)
         return self
@@ -128,6 +428,7 @@ class MemoryGraphList(list):
     def __setitem__(self, key, value):
         if not isinstance(value, GraphDict):
             raise TypeError("Require a `GraphDict` as list item.")
+        self._content_digest = None
         super(MemoryGraphList, self).__setitem__(key, value)
 
     def __repr__(self):
@@ -135,10 +436,12 @@ class MemoryGraphList(list):
 
     def append(self, graph):
         assert isinstance(graph, GraphDict), "Must append `GraphDict` to self."
+        self._content_digest = None
         super(MemoryGraphList, self).append(graph)
 
     def insert(self, index: int, value) -> None:
         assert isinstance(value, GraphDict), "Must insert `GraphDict` to self."
+        self._content_digest = None
         super(MemoryGraphList, self).insert(index, value)
 
     def __add__(self, other):
@@ -185,45 +488,44 @@ class MemoryGraphList(list):
     def length(self, value: int):
         raise ValueError("Can not set length. Please use 'empty()' to initialize an empty list.")
 
-    def _to_tensor(self, item: dict, make_copy=True):
-        if not make_copy:
-            self.logger.warning("At the moment always a copy is made for tensor().")
-        props: list = self.obtain_property(item["name"])
-        is_ragged = item["ragged"] if "ragged" in item else False
-        dtype = item["dtype"] if "dtype" in item else None
-        # Could add name and shape information if available.
-        if is_ragged:
-            return ragged_tensor_from_nested_numpy(props, dtype=dtype)
-        else:
-            return pad_np_array_list_batch_dim(props, dtype=dtype)[0]
+    def _property_buffer(self, key: str) -> Union[dict, None]:
+        r"""Concatenated values and row splits of a graph property along the first axis.
 
-    def tensor(self, items: Union[list, Dict], make_copy=True):
-        r"""Make tensor objects from multiple graph properties in list.
-
-        It is recommended to run :obj:`clean` beforehand.
+        The buffer is cached until :obj:`set` is called for `key` or a graph of the list has been given a new array
+        for `key` , which is checked by identity of the arrays. The arrays of the graphs are not modified. Properties
+        of rank zero have row length one.
 
         Args:
-            items (list): List of dictionaries that specify graph properties in list via 'name' key.
-                The dict-items match the tensor input for :obj:`tf.keras.layers.Input` layers.
-                Required dict-keys should be 'name' and 'ragged'.
-                Optionally shape information can be included via 'shape' and 'dtype'.
-                E.g.: `[{'name': 'edge_indices', 'ragged': True}, {...}, ...]`.
-            make_copy (bool): Whether to copy the data. Default is True.
+            key (str): Name of the property.
 
         Returns:
-            list: List of Tensors.
+            dict: Dictionary of 'values', 'row_splits' and 'rank' or None, if the arrays of the property are missing
+                or do not match in dtype and inner shape.
         """
-        if isinstance(items, dict):
-            if all([isinstance(value, dict) for value in items.values() if value is not None]) and "name" not in items:
-                return {key: self._to_tensor(value, make_copy=make_copy) for key, value in items.items() if
-                        value is not None}
-            return self._to_tensor(items, make_copy=make_copy)
-        elif isinstance(items, (tuple, list)):
-            return [self._to_tensor(x, make_copy=make_copy) for x in items]
+        props = [x.get(key) for x in self]
+        buffer = self._property_buffers.get(key)
+        if buffer is not None and len(buffer["arrays"]) == len(props) and all(
+                x is y for x, y in zip(props, buffer["arrays"])):
+            return buffer
+        self._property_buffers.pop(key, None)
+        if len(props) == 0 or any(not isinstance(x, np.ndarray) for x in props):
+            return None
+        rank, dtype, inner_shape = props[0].ndim, props[0].dtype, props[0].shape[1:]
+        if dtype.hasobject or any(x.ndim != rank or x.dtype != dtype or x.shape[1:] != inner_shape for x in props):
+            return None
+        if rank == 0:
+            values = np.stack(props, axis=0)
+            row_splits = np.arange(len(props) + 1, dtype="int64")
         else:
-            raise TypeError("Wrong type, expected e.g. [{'name': 'edge_indices', 'ragged': True}, {...}, ...]")
-
-    def map_list(self, method: Union[str, Callable], **kwargs):
+            values = np.concatenate(props, axis=0)
+            row_splits = np.zeros(len(props) + 1, dtype="int64")
+            np.cumsum([len(x) for x in props], out=row_splits[1:])
+        buffer = {"values": values, "row_splits": row_splits, "rank": rank, "arrays": props}
+        self._property_buffers[key] = buffer
+        return buffer
+
+    def map_list(self, method: Union[str, Callable, dict], num_workers: int = None, chunk_size: int = None,
+                 cache: Union[str, GraphPreprocessingCache] = None, **kwargs):
         r"""Map a method over this list and apply on each :obj:`GraphDict`.
         For :obj:`method` being string, either a class-method or a preprocessor is chosen for backward compatibility.
 
@@ -232,13 +534,43 @@ class MemoryGraphList(list):
             for i, x in enumerate(self):
                 method(x, **kwargs)
 
+        Preprocessors of type :obj:`GraphPreProcessorBase` , also given by name or serialization dictionary, can be
+        run in a process pool with :obj:`num_workers` . The graphs are sent to the workers in chunks and the
+        preprocessor is rebuilt from its config in each worker. Results are assigned in the order of the list.
+
+        With :obj:`cache` the new properties of a preprocessor are stored on disk with a key from the content of this
+        list and the config of the preprocessor. Applying the same preprocessor on the same graphs again loads the
+        properties from :obj:`kgcnn.data.cache.GraphPreprocessingCache` .
+
         Args:
-            method (str): Name of the :obj:`GraphDict` method.
+            method (str, dict, Callable): Name of the :obj:`GraphDict` method or a preprocessor.
+            num_workers (int): Number of worker processes for preprocessors. Default is None, which runs serially.
+            chunk_size (int): Number of graphs sent to a worker at once. Default is None, which distributes
+                the graphs in four chunks per worker.
+            cache (str, GraphPreprocessingCache): Cache or path of cache directory for preprocessors. Default is None.
             kwargs: Kwargs for `method`.
 
         Returns:
             self
         """
+        # Preprocessor to run in parallel.
+        if isinstance(method, str) and len(self) > 0 and not hasattr(self[0], method):
+            method = get_preprocessor(method, **kwargs)
+            kwargs = {}
+        elif isinstance(method, dict):
+            method = get_preprocessor(method)
+        if isinstance(method, GraphPreProcessorBase) and cache is not None:
+            self._map_preprocessor_cached(method, cache=cache, num_workers=num_workers, chunk_size=chunk_size)
+            return self
+        if cache is not None:
+            self.logger.warning("Can only use `cache` for preprocessors. Running '%s' without cache." % method)
+        if isinstance(method, GraphPreProcessorBase) and num_workers is not None and num_workers > 1:
+            self._update_from_list(self._preprocessor_outputs(
+                serialize(method), num_workers=num_workers, chunk_size=chunk_size))
+            return self
+        if num_workers is not None and num_workers > 1:
+            self.logger.warning("Can only use `num_workers` for preprocessors. Running '%s' serially." % method)
+        self._content_digest = None
         # Can add progress info here.
         # Method by name.
         if isinstance(method, str):
@@ -249,19 +581,78 @@ class MemoryGraphList(list):
                 else:
                     # For compatibility names can refer to preprocessors.
                     x.apply_preprocessor(name=method, **kwargs)
-        elif isinstance(method, dict):
-            raise NotImplementedError("Serialization for method in `map_list` is not yet supported")
+        elif isinstance(method, GraphPreProcessorBase):
+            for i, x in enumerate(self):
+                x.apply_preprocessor(method)
         else:
             # For any callable method to map.
             for i, x in enumerate(self):
                 method(x, **kwargs)
         return self
 
+    def _preprocessor_outputs(self, preprocessor_config: dict, num_workers: int = None,
+                              chunk_size: int = None) -> List[dict]:
+        r"""New properties of a serialized preprocessor for each graph, computed in a process pool for
+        :obj:`num_workers` larger than one."""
+        if num_workers is None or num_workers <= 1:
+            return _apply_preprocessor_on_chunk(preprocessor_config, self)
+        if chunk_size is None:
+            chunk_size = max(int(np.ceil(len(self) / (4 * num_workers))), 1)
+        chunks = [[x.to_dict() for x in self[i:i + chunk_size]] for i in range(0, len(self), chunk_size)]
+        self.logger.info("Map '%s' on %s graphs with %s workers in %s chunks." % (
+            preprocessor_config["class_name"], len(self), num_workers, len(chunks)))
+        outputs = []
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            for chunk_result in executor.map(
+                    _apply_preprocessor_on_chunk, [preprocessor_config] * len(chunks), chunks):
+                outputs += chunk_result
+        return outputs
+
+    def _map_preprocessor_cached(self, preprocessor: GraphPreProcessorBase,
+                                 cache: Union[str, GraphPreprocessingCache], num_workers: int = None,
+                                 chunk_size: int = None):
+        r"""Load new properties of a preprocessor from cache or compute and store them."""
+        if isinstance(cache, str):
+            cache = GraphPreprocessingCache(cache)
+        preprocessor_config = serialize(preprocessor)
+        key = cache.key(self._content_hash(), preprocessor_config)
+        outputs = cache.load(key)
+        if outputs is not None and len(outputs) == len(self):
+            self.logger.info("Load '%s' from preprocessing cache." % preprocessor_config["class_name"])
+        else:
+            outputs = self._preprocessor_outputs(preprocessor_config, num_workers=num_workers, chunk_size=chunk_size)
+            cache.store(key, outputs, description=preprocessor_config)
+        self._update_from_list(outputs)
+
+    def _content_hash(self) -> str:
+        r"""Hash of the content of the list from :obj:`kgcnn.data.cache.hash_graph_list` .
+
+        The digest is kept until :obj:`set` , :obj:`append` or a mapped preprocessor changes the list. Graphs that have
+        been given new arrays in the meantime are detected by the identity of their items. Arrays that are modified
+        in place are not detected.
+        """
+        graphs = [dict(x) for x in self]
+        cached = self._content_digest
+        if cached is not None and len(cached["graphs"]) == len(graphs) and all(
+                x.keys() == y.keys() and all(x[k] is y[k] for k in x) for x, y in zip(graphs, cached["graphs"])):
+            return cached["digest"]
+        digest = hash_graph_list(self)
+        self._content_digest = {"digest": digest, "graphs": graphs}
+        return digest
+
+    def _update_from_list(self, graphs: List[dict]):
+        self._content_digest = None
+        for x, y in zip(self, graphs):
+            x.update(y)
+
     def clean(self, inputs: Union[list, str]):
         r"""Given a list of property names, this method removes all elements from the internal list of
         `GraphDict` items, which do not define at least one of those properties. Meaning, only those graphs remain in
         the list which definitely define all properties specified by :obj:`inputs`.
 
+        The properties are checked on arrays from :obj:`kgcnn.data.utils.get_property_statistics` and a summary is
+        logged for each property instead of each graph. Invalid graphs are removed at once.
+
         Args:
             inputs (list): A list of strings, where each string is supposed to be a property name, which the graphs
                 in this list may possess. Within :obj:`kgcnn`, this can be simpy the 'input' category in model
@@ -273,7 +664,7 @@ class MemoryGraphList(list):
         """
         if isinstance(inputs, str):
             inputs = [inputs]
-        invalid_graphs = []
+        is_invalid = np.zeros(len(self), dtype="bool")
         for item in inputs:
             # If this is a list of dict, which are the config for ks.layers.Input(), we pick 'name'.
             if isinstance(item, dict):
@@ -284,27 +675,18 @@ class MemoryGraphList(list):
             if props is None:
                 self.logger.warning("Can not clean property '%s' as it was not assigned to any graph." % item)
                 continue
-            for i, x in enumerate(props):
-                # If property is neither list nor np.array
-                if x is None or not hasattr(x, "__getitem__"):
-                    self.logger.info("Property '%s' is not defined for graph '%s'." % (item_name, i))
-                    invalid_graphs.append(i)
-                elif not isinstance(x, np.ndarray):
-                    self.logger.info("Property '%s' is not a numpy array for graph '%s'." % (item_name, i))
-                    invalid_graphs.append(i)
-                elif len(x.shape) > 0:
-                    if len(x) <= 0:
-                        self.logger.info("Property '%s' is an empty list for graph '%s'." % (item_name, i))
-                        invalid_graphs.append(i)
-        invalid_graphs = np.unique(np.array(invalid_graphs, dtype="int"))
-        invalid_graphs = np.flip(invalid_graphs)  # Need descending order for pop()
+            stats = get_property_statistics(props)
+            self.logger.info(format_property_statistics(item_name, stats))
+            is_invalid = np.logical_or(is_invalid, np.logical_not(stats["is_valid"]))
+        invalid_graphs = np.flip(np.nonzero(is_invalid)[0])  # Descending order as for removing via pop().
         if len(invalid_graphs) > 0:
-            self.logger.warning("Found invalid graphs for properties. Removing graphs '%s'." % invalid_graphs)
+            self.logger.warning("Found %s invalid graphs for properties. Removing graphs '%s'." % (
+                len(invalid_graphs), invalid_graphs))
+            valid_graphs = [x for x, y in zip(self, is_invalid.tolist()) if not y]
+            self.clear()
+            self.extend(valid_graphs)
         else:
             self.logger.info("No invalid graphs for assigned properties found.")
-        # Remove from the end via pop().
-        for i in invalid_graphs:
-            self.pop(int(i))
         return invalid_graphs
 
     def rename_property_on_graphs(self, old_property_name: str, new_property_name: str) -> list:
@@ -343,7 +725,7 @@ class MemoryGraphList(list):
         return tf_dataset_disjoint_generator(self, inputs=inputs, **kwargs)
 
 
-class MemoryGraphDataset(MemoryGraphList):
+class MemoryGraphDataset(MemoryGraphList, GraphDatasetMixin):
     r"""Dataset class for lists of graph tensor dictionaries stored on file and fit into memory.
 
     This class inherits from :obj:`MemoryGraphList` and can be used (after loading and setup) as such.
@@ -366,6 +748,7 @@ class MemoryGraphDataset(MemoryGraphList):
     """
 
     fits_in_memory = True
+    _hdf5_write_chunk_size = 10000
 
     def __init__(self,
                  data_directory: str = None,
@@ -398,74 +781,155 @@ class MemoryGraphDataset(MemoryGraphList):
         self.data_keys = None
         self.data_unit = None
 
-    def _verify_data_directory(self) -> Union[str, None]:
-        r"""Utility function that checks if `data_directory` is set correctly."""
-        if self.data_directory is None:
-            self.warning("Data directory is not set.")
-            return None
-        if not os.path.exists(os.path.realpath(self.data_directory)):
-            self.error("Data directory does not exist.")
-        return self.data_directory
-
-    @property
-    def file_path(self):
-        r"""Construct filepath from 'file_name' given in `init`."""
-        self._verify_data_directory()
-        if self.file_name is None:
-            self.warning("Can not determine file path, missing `file_name`.")
-            return None
-        return os.path.join(self.data_directory, self.file_name)
-
-    @property
-    def file_directory_path(self):
-        r"""Construct file-directory path from 'data_directory' and 'file_directory' given in `init`."""
-        self._verify_data_directory()
-        if self.file_directory is None:
-            self.warning("Can not determine file directory, missing `file_directory`.")
-            return None
-        return os.path.join(self.data_directory, self.file_directory)
-
-    def info(self, *args, **kwargs):
-        """Pass information to class' logger instance."""
-        self.logger.info(*args, **kwargs)
-
-    def warning(self, *args, **kwargs):
-        """Pass warning to class' logger instance."""
-        self.logger.warning(*args, **kwargs)
-
-    def error(self, *args, **kwargs):
-        """Pass error to class' logger instance."""
-        self.logger.error(*args, **kwargs)
-
-    def save(self, filepath: str = None):
+    def save(self, filepath: str = None, file_format: str = "pickle"):
         r"""Save all graph properties to python dictionary as pickled file. By default, saves a file named
         :obj:`dataset_name.kgcnn.pickle` in :obj:`data_directory` .
 
+        With :obj:`file_format='columnar'` each graph property is stored as concatenated values and row-splits in a
+        directory named :obj:`dataset_name.kgcnn.columnar` , which can be memory-mapped on :obj:`load` .
+        See :obj:`kgcnn.io.graphlist.GraphListColumnarDirectory` .
+
+        With :obj:`file_format='hdf5'` the graphs are written to a directory named :obj:`dataset_name.kgcnn.hdf5` of
+        :obj:`kgcnn.data.disk.DiskGraphDataset` , which can be updated incrementally with :obj:`append_to_file` and
+        :obj:`update_on_file` .
+
         Args:
             filepath (str): Full path of output file. Default is None.
+            file_format (str): Either 'pickle', 'columnar' or 'hdf5'. Default is 'pickle'.
         """
+        if file_format == "hdf5":
+            disk_dataset = self._disk_dataset(filepath)
+            self.info("Write HDF5 dataset...")
+            disk_dataset.clear()
+            for i in range(0, len(self), self._hdf5_write_chunk_size):
+                disk_dataset.append_multiple(self[i:i + self._hdf5_write_chunk_size])
+            return self
+        if file_format == "columnar":
+            if filepath is None:
+                filepath = os.path.join(self.data_directory, self.dataset_name + ".kgcnn.columnar")
+            self.info("Write columnar dataset...")
+            GraphListColumnarDirectory(filepath).write(self)
+            return self
+        if file_format != "pickle":
+            raise ValueError("Unknown file format '%s' for dataset." % file_format)
         if filepath is None:
             filepath = os.path.join(self.data_directory, self.dataset_name + ".kgcnn.pickle")
         self.info("Pickle dataset...")
         save_pickle_file([x.to_dict() for x in self], filepath)
         return self
 
-    def load(self, filepath: str = None):
+    def load(self, filepath: str = None, file_format: str = None, mmap_mode: Union[str, None] = "r"):
         r"""Load graph properties from a pickled file. By default, loads a file named
         :obj:`dataset_name.kgcnn.pickle` in :obj:`data_directory` .
 
+        For a columnar directory written by :obj:`save` , the graph properties are views into memory-mapped arrays,
+        which are also used by :obj:`tensor` without copying. Note that with default :obj:`mmap_mode='r'` the arrays
+        are read-only. Since a :obj:`GraphDict` is created for each graph, loading time still grows with the number
+        of graphs. For very large datasets use :obj:`kgcnn.data.store.GraphStore.load` , which opens the columns only.
+
         Args:
             filepath (str): Full path of input file.
+            file_format (str): Either 'pickle', 'columnar' or 'hdf5'. If None, a directory at `filepath` is loaded as
+                'columnar' or 'hdf5', otherwise 'pickle' is assumed. Default is None.
+            mmap_mode (str): Memory-map mode for columnar format. Default is 'r'.
         """
-        if filepath is None:
-            filepath = os.path.join(self.data_directory, self.dataset_name + ".kgcnn.pickle")
-        self.info("Load pickled dataset...")
-        in_list = load_pickle_file(filepath)
+        if file_format is None:
+            file_format = "pickle"
+            if filepath is not None and os.path.isdir(filepath):
+                file_format = "columnar" if GraphListColumnarDirectory(filepath).exists() else "hdf5"
+        if file_format == "hdf5":
+            self.info("Load HDF5 dataset...")
+            in_list = self._disk_dataset(filepath)[:]
+        elif file_format == "columnar":
+            if filepath is None:
+                filepath = os.path.join(self.data_directory, self.dataset_name + ".kgcnn.columnar")
+            self.info("Load columnar dataset...")
+            return self._load_columnar(GraphListColumnarDirectory(filepath, mmap_mode=mmap_mode))
+        elif file_format == "pickle":
+            if filepath is None:
+                filepath = os.path.join(self.data_directory, self.dataset_name + ".kgcnn.pickle")
+            self.info("Load pickled dataset...")
+            in_list = load_pickle_file(filepath)
+        else:
+            raise ValueError("Unknown file format '%s' for dataset." % file_format)
         self.clear()
         for x in in_list:
             self.append(GraphDict(x))
         return self
 
+    def _load_columnar(self, directory: GraphListColumnarDirectory):
+        r"""Set graphs from the memory-mapped columns of a directory. Columns that are defined for all graphs are used
+        as property buffers of :obj:`tensor` , so that the mapped data is not concatenated into memory again."""
+        columns = directory.read()
+        graphs = [GraphDict() for _ in range(len(directory))]
+        self._property_buffers = {}
+        for key, column in columns.items():
+            views = directory.column_views(column)
+            for x, value in zip(graphs, views):
+                if value is not None:
+                    x[key] = value
+            if isinstance(column, list) or column["mask"] is not None:
+                continue
+            self._property_buffers[key] = {"values": np.asarray(column["values"]),
+                                           "row_splits": column["row_splits"], "rank": column["rank"],
+                                           "arrays": views}
+        self.clear()
+        self.extend(graphs)
+        return self
+
+    def _disk_dataset(self, filepath: str = None):
+        from kgcnn.data.disk import DiskGraphDataset
+        if filepath is None:
+            filepath = os.path.join(self.data_directory, self.dataset_name + ".kgcnn.hdf5")
+        return DiskGraphDataset(hdf5_directory=filepath, verbose=self.logger.level)
+
+    def _check_disk_dataset(self, disk_dataset):
+        if len(disk_dataset) != len(self):
+            raise ValueError("Dataset on file has %s graphs but dataset has %s graphs. Please save dataset first." % (
+                len(disk_dataset), len(self)))
+
+    def append_to_file(self, graphs: list, filepath: str = None):
+        r"""Append graphs to this dataset and write only the new graphs to the HDF5 directory of :obj:`save` with
+        :obj:`file_format='hdf5'` . Uses :obj:`kgcnn.io.file.RaggedTensorHDFile.append_multiple` .
+
+        Args:
+            graphs (list): List of graph dictionaries to append.
+            filepath (str): Full path of the HDF5 directory. Default is None.
+
+        Returns:
+            self
+        """
+        disk_dataset = self._disk_dataset(filepath)
+        self._check_disk_dataset(disk_dataset)
+        graphs = [x if isinstance(x, GraphDict) else GraphDict(x) for x in graphs]
+        disk_dataset.append_multiple(graphs)
+        for x in graphs:
+            self.append(x)
+        self.info("Appended %s graphs to file." % len(graphs))
+        return self
+
+    def update_on_file(self, indices: Union[list, np.ndarray], properties: list = None, filepath: str = None):
+        r"""Write graphs of this dataset, that have been changed, to the HDF5 directory of :obj:`save` with
+        :obj:`file_format='hdf5'` . Properties of the same size are overwritten in place on file.
+
+        Args:
+            indices (list, np.ndarray): Indices of the changed graphs.
+            properties (list): Names of the changed properties. If None, all properties of the graphs are written.
+                Default is None.
+            filepath (str): Full path of the HDF5 directory. Default is None.
+
+        Returns:
+            self
+        """
+        disk_dataset = self._disk_dataset(filepath)
+        self._check_disk_dataset(disk_dataset)
+        graphs = [self[int(i)] for i in indices]
+        if properties is not None:
+            graphs = [{key: x.get(key) for key in properties} for x in graphs]
+        disk_dataset.update_multiple(indices, graphs)
+        self.info("Updated %s graphs on file." % len(graphs))
+        return self
+
     def read_in_table_file(self, file_path: str = None, **kwargs):
         r"""Read a data frame in :obj:`data_frame` from file path. By default, uses :obj:`file_name` and pandas.
         Checks for a '.csv' file and then for Excel file endings. Meaning the file extension of file_path is ignored
@@ -512,6 +976,9 @@ class MemoryGraphDataset(MemoryGraphList):
                 {"shape": [None, 2], "name": "edge_indices", "dtype": "int64", "ragged": True}
             ]
 
+        The shapes of all graphs are checked on arrays from :obj:`kgcnn.data.utils.get_property_statistics` and a
+        summary is logged for each input.
+
         Args:
             hyper_input (list): List of properties that need to be available to a model for training.
             raise_error_on_fail (bool): Whether to raise an error if assertion failed.
@@ -550,27 +1017,36 @@ class MemoryGraphDataset(MemoryGraphList):
                 continue
             if "name" not in x:
                 message_error("Can not infer name from '%s' for model input." % x)
-            data = [dataset[i].obtain_property(x["name"]) for i in range(len(dataset))]
-            prop_in_data = [y is None for y in data]
-            if all(prop_in_data):
+            data = dataset.obtain_property(x["name"])
+            if data is None:
+                message_error("Property %s is not defined for any graph in list. Please check property." % x["name"])
+                continue
+            stats = get_property_statistics(data)
+            dataset.info(format_property_statistics(x["name"], stats))
+            if not np.any(stats["is_present"]):
                 message_error("Property %s is not defined for any graph in list. Please check property." % x["name"])
-            if any(prop_in_data):
+            if not np.all(stats["is_present"]):
                 message_warning("Property %s is not defined for all graphs in list. Please run clean()." % x["name"])
 
-            # we also will check shape here but only with first element.
-            if hasattr(data[0], "shape") and "shape" in x:
-                shape_element = data[0].shape
-                shape_input = x["shape"]
-                if len(shape_input) != len(shape_element):
-                    message_error(
-                        "Mismatch in rank for model input {} vs. {}".format(shape_element, shape_input))
-                for i, dim in enumerate(shape_input):
-                    if dim is not None:
-                        if shape_element[i] != dim:
-                            message_error(
-                                "Mismatch in shape for model input {} vs. {}".format(shape_element, shape_input))
-            else:
+            # Check shape for all graphs that have an array.
+            if not np.any(stats["is_array"]) or "shape" not in x:
                 message_error("Can not check shape for '%s'." % x["name"])
+                continue
+            shape_input = x["shape"]
+            is_mismatch = np.logical_and(stats["is_array"], stats["rank"] != len(shape_input))
+            if np.any(is_mismatch):
+                message_error("Mismatch in rank for model input {} vs. {} for {} graphs".format(
+                    data[int(np.argmax(is_mismatch))].shape, shape_input, int(np.sum(is_mismatch))))
+                continue
+            if len(shape_input) > 0 and shape_input[0] is not None:
+                is_mismatch = np.logical_and(stats["is_array"], stats["length"] != shape_input[0])
+                if np.any(is_mismatch):
+                    message_error("Mismatch in shape for model input {} vs. {} for {} graphs".format(
+                        data[int(np.argmax(is_mismatch))].shape, shape_input, int(np.sum(is_mismatch))))
+            for inner_shape, count in stats["inner_shapes"].items():
+                if any(dim is not None and inner_shape[i] != dim for i, dim in enumerate(shape_input[1:])):
+                    message_error("Mismatch in shape for model input {} vs. {} for {} graphs".format(
+                        (None,) + inner_shape, shape_input, count))
         return
 
     def collect_files_in_file_directory(self, file_column_name: str = None, table_file_path: str = None,
@@ -590,6 +1066,36 @@ class MemoryGraphDataset(MemoryGraphList):
         Returns:
             list: File content loaded from single files.
         """
+        out_list = []
+        for file_loaded in self.iter_files_in_file_directory(
+                file_column_name=file_column_name, table_file_path=table_file_path, read_method_file=read_method_file,
+                update_counter=update_counter):
+            if append_file_content:
+                if read_method_return_list:
+                    out_list.append(file_loaded[0])
+                else:
+                    out_list.append(file_loaded)
+            else:
+                if read_method_return_list:
+                    out_list += file_loaded
+                else:
+                    out_list += [file_loaded]
+        return out_list
+
+    def iter_files_in_file_directory(self, file_column_name: str = None, table_file_path: str = None,
+                                     read_method_file: Callable = None, update_counter: int = 1000):
+        r"""Utility function to iterate over single files in :obj:`file_directory` by names in CSV table file.
+        Only the content of one file is held in memory at a time.
+
+        Args:
+            file_column_name (str): Name of the column in Table file that holds list of file names.
+            table_file_path (str): Path to table file. Can be None. Default is None.
+            read_method_file (Callable): Callable read-file method to return (processed) file content.
+            update_counter (int): Loop counter to show progress. Default is 1000.
+
+        Returns:
+            Iterator: Generator of file content loaded from single files.
+        """
         self.read_in_table_file(table_file_path)
         if self.data_frame is None:
             raise FileNotFoundError("Can not find '.csv' table path '%s'." % table_file_path)
@@ -608,25 +1114,12 @@ class MemoryGraphDataset(MemoryGraphList):
             raise ValueError("No file directory found at '%s'." % self.file_directory_path)
 
         self.info("Read %s single files." % num_files)
-        out_list = []
         for i, x in enumerate(name_file_list):
             # Only one file per path
-            file_loaded = read_method_file(os.path.join(self.file_directory_path, x))
-            if append_file_content:
-                if read_method_return_list:
-                    out_list.append(file_loaded[0])
-                else:
-                    out_list.append(file_loaded)
-            else:
-                if read_method_return_list:
-                    out_list += file_loaded
-                else:
-                    out_list += [file_loaded]
+            yield read_method_file(os.path.join(self.file_directory_path, x))
             if i % update_counter == 0:
                 self.info("... Read {0} file {1} from {2}".format(os.path.splitext(x)[1], i, num_files))
 
-        return out_list
-
     def set_methods(self, method_list: List[dict]) -> None:
         r"""Apply a list of serialized class-methods on the dataset.
 
@@ -653,94 +1146,6 @@ class MemoryGraphDataset(MemoryGraphList):
                 else:
                     self.error("Class does not have method '%s'." % method)
 
-    def get_train_test_indices(self,
-                               train: str = "train",
-                               test: str = "test",
-                               valid: Optional[str] = None,
-                               split_index: Union[int, list] = None,
-                               shuffle: bool = False,
-                               seed: int = None
-                               ) -> List[List[np.ndarray]]:
-        """
-        Get train and test indices from graph list.
-        The 'train' and 'test' properties must be set on the graph, and optionally an additional property
-        for the validation split may be present. All of these properties may have either of the following
-        values:
-
-        - The property is a boolean integer value indicating whether the corresponding element of the
-          dataset belongs to that part of the split (train / test)
-        - The property is a list containing integer split indices, where each split index present within
-          that list implies that the corresponding dataset element is part of that particular split.
-          In this case the `split_index` parameter may also be a list of split indices that specify
-          for which of these split indices the train test index split is to be returned by this method.
-
-        The return value of this method is a list with the same length as the `split_index` parameter,
-        which by default will be None.
-
-        Args:
-            train (str): Name of graph property that has train split assignment. Defaults to 'train'.
-            test (str): Name of graph property that has test split assignment. Defaults to 'test'.
-            valid (str): Name of graph property that has validation assignment. Defaults to None.
-            split_index (int, list): Split index to get indices for. Can also be list.
-            shuffle (bool): Whether to shuffle splits. Default is True.
-            seed (int): Random seed for shuffle. Default is None.
-
-        Returns:
-            list: List of tuples (or triples) of train, test, (validation) split indices.
-        """
-        out_indices = []
-
-        if split_index is None:
-            train_to_check = self.obtain_property(train)
-            train_to_check = [
-                np.expand_dims(x, axis=0) if len(x.shape) < 1 else x for x in train_to_check if x is not None]
-            split_index = list(np.sort(np.unique(np.concatenate(train_to_check, axis=0))))
-        if not isinstance(split_index, (list, tuple)):
-            split_index_list: List[int] = [split_index]
-        else:
-            split_index_list: List[int] = split_index
-
-        for split_index in split_index_list:
-
-            # This list will itself contain numpy arrays which are filled with graph indices of the dataset
-            # each element of this list will correspond to one property name (train, test...)
-            graph_index_split_list: List[np.ndarray] = []
-
-            for property_name in [train, test, valid]:
-
-                # It may be that we only seek train and test indices and not validation indices, in that
-                # case the property name for validation is None, in which case we want to skip
-                if property_name is None:
-                    continue
-
-                # This list will contain all the indices of the dataset elements (graphs) which are
-                # associated with the current iteration's split index for the current iteration's
-                # property name (train, test...)
-                graph_index_list: List[int] = []
-
-                # "obtain_property" returns a list which contains only the property values corresponding to
-                # the given property name for each graph inside the dataset in the same order.
-                # In this case, this is supposed to be a split list, which is a list that contains integer
-                # indices, each representing one particular dataset split. The split list of each graph
-                # only contains those split indices to which that graph is associated.
-                split_prop: List[List[int]] = self.obtain_property(property_name)
-                for index, split_list in enumerate(split_prop):
-                    if split_list is not None:
-                        if split_index in split_list:
-                            graph_index_list.append(index)
-
-                graph_index_array = np.array(graph_index_list)
-                graph_index_split_list.append(graph_index_array)
-
-            if shuffle:
-                np.random.seed(seed)
-                for graph_index_array in graph_index_split_list:
-                    np.random.shuffle(graph_index_array)
-
-            out_indices.append(graph_index_split_list)
-
-        return out_indices
-
     def relocate(self, data_directory: str = None, file_name: str = None, file_directory: str = None):
         """Change file information. Does not copy files on disk!
 
@@ -805,6 +1210,7 @@ class MemoryGraphDataset(MemoryGraphList):
         Returns:
             None.
         """
+        from sklearn.model_selection import KFold
         kf = KFold(n_splits=n_splits, shuffle=shuffle, random_state=random_state)
         for x in self:
             x.set(train, [])
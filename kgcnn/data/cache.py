@@ -0,0 +1,238 @@
+import os
+import json
+import time
+import shutil
+import pickle
+import struct
+import hashlib
+import logging
+import numpy as np
+from typing import List, Union
+from kgcnn import __kgcnn_version__
+from kgcnn.io.graphlist import GraphListColumnarDirectory
+
+# Module logger
+logging.basicConfig()
+module_logger = logging.getLogger(__name__)
+module_logger.setLevel(logging.INFO)
+
+
+def _hash_update(h, tag: bytes, data: bytes = b""):
+    # Each field is prefixed by a type tag and its length, so that concatenated fields can not collide.
+    h.update(tag)
+    h.update(struct.pack("<Q", len(data)))
+    h.update(data)
+
+
+def _hash_value(h, value):
+    if isinstance(value, np.generic):
+        value = np.asarray(value)
+    if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+        _hash_update(h, b"A", ("%s%s" % (value.dtype.str, value.shape)).encode())
+        _hash_update(h, b"B", np.ascontiguousarray(value).tobytes())
+    elif value is None:
+        _hash_update(h, b"N")
+    elif isinstance(value, (bool, int, float, complex, str)):
+        _hash_update(h, b"S", ("%s:%r" % (type(value).__name__, value)).encode())
+    elif isinstance(value, bytes):
+        _hash_update(h, b"Y", value)
+    elif isinstance(value, (list, tuple)):
+        _hash_update(h, b"L" if isinstance(value, list) else b"T", struct.pack("<Q", len(value)))
+        for x in value:
+            _hash_value(h, x)
+    elif isinstance(value, dict):
+        _hash_update(h, b"D", struct.pack("<Q", len(value)))
+        for key in sorted(value.keys(), key=repr):
+            _hash_value(h, key)
+            _hash_value(h, value[key])
+    else:
+        _hash_update(h, b"P", ("%s.%s" % (type(value).__module__, type(value).__qualname__)).encode())
+        _hash_update(h, b"B", pickle.dumps(value))
+
+
+def hash_graph_list(graphs: list) -> str:
+    r"""Hash the content of a list of graph dictionaries, i.e. names, dtype, shape and data of all properties.
+
+    Each graph is marked together with its number of properties and each name and value is prefixed by a type tag
+    and its length, so that different lists can not give the same stream of bytes.
+
+    Args:
+        graphs (list): List of graph dictionaries.
+
+    Returns:
+        str: Hexadecimal digest.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    _hash_update(h, b"M", struct.pack("<Q", len(graphs)))
+    for graph in graphs:
+        _hash_update(h, b"G", struct.pack("<Q", len(graph)))
+        for key in sorted(graph.keys()):
+            _hash_update(h, b"K", key.encode())
+            _hash_value(h, graph[key])
+    return h.hexdigest()
+
+
+def hash_file(file_path: str, chunk_size: int = 2**20) -> str:
+    r"""Hash the content of a file.
+
+    Args:
+        file_path (str): Path of the file.
+        chunk_size (int): Number of bytes to read at once. Default is 1 MiB.
+
+    Returns:
+        str: Hexadecimal digest.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class GraphPreprocessingCache:
+    r"""Directory that caches the output of preprocessors for lists of graphs on disk.
+
+    An entry is identified by a key, which is a hash of the identity of the input data, e.g. from
+    :obj:`hash_graph_list` or :obj:`hash_file` , the config of the preprocessor and the version of :obj:`kgcnn` .
+    Each entry stores the new graph properties as :obj:`kgcnn.io.graphlist.GraphListColumnarDirectory` , so that
+    loading an entry only maps the arrays into memory. If the total size of the directory exceeds :obj:`max_size` ,
+    the least recently used entries are removed.
+
+    .. code-block:: python
+
+        import numpy as np
+        from kgcnn.data.cache import GraphPreprocessingCache
+        from kgcnn.data.base import MemoryGraphList
+        cache = GraphPreprocessingCache("preprocessing_cache")
+        data = MemoryGraphList([{"node_coordinates": np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]])}])
+        data.map_list("set_range", max_distance=1.5, cache=cache)  # Computes and stores.
+        data.map_list("set_range", max_distance=1.5, cache=cache)  # Loads from cache.
+
+    """
+
+    _entry_file_name = "entry.json"
+
+    def __init__(self, cache_directory: str, max_size: int = 10 * 2**30):
+        r"""Initialize cache.
+
+        Args:
+            cache_directory (str): Path of the cache directory.
+            max_size (int): Maximum total size of the entries in bytes. Default is 10 GiB.
+        """
+        self.cache_directory = cache_directory
+        self.max_size = max_size
+
+    @staticmethod
+    def key(*args) -> str:
+        r"""Make key from the identity of input data and preprocessor configs, which must be json serializable.
+        The version of :obj:`kgcnn` is always part of the key.
+
+        Args:
+            args: Hashes of input data and preprocessor configs.
+
+        Returns:
+            str: Key of the entry.
+        """
+        identity = json.dumps([__kgcnn_version__] + list(args), sort_keys=True, default=str)
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_directory, key)
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(os.path.join(self._entry_path(key), self._entry_file_name))
+
+    def load(self, key: str) -> Union[List[dict], None]:
+        r"""Load the list of graph properties of an entry and mark it as recently used.
+
+        Args:
+            key (str): Key of the entry.
+
+        Returns:
+            list: List of graph dictionaries or None if there is no entry for key.
+        """
+        if key not in self:
+            return None
+        entry_path = self._entry_path(key)
+        try:
+            # Copy-on-write, so that loaded graph properties can be modified in place.
+            graphs = GraphListColumnarDirectory(entry_path, mmap_mode="c").read_graphs()
+            os.utime(os.path.join(entry_path, self._entry_file_name))
+        except (OSError, ValueError) as e:
+            module_logger.warning("Can not load cache entry '%s': %s" % (key, e))
+            return None
+        return graphs
+
+    def store(self, key: str, graphs: List[dict], description: dict = None):
+        r"""Store a list of graph properties for key and evict least recently used entries if required.
+
+        Args:
+            key (str): Key of the entry.
+            graphs (list): List of graph dictionaries.
+            description (dict): Optional information about the entry, which is written to the entry file.
+
+        Returns:
+            None.
+        """
+        entry_path = self._entry_path(key)
+        # Write to temporary directory first, so that incomplete entries are never loaded.
+        temp_path = entry_path + ".tmp%s" % os.getpid()
+        GraphListColumnarDirectory(temp_path).write(graphs)
+        with open(os.path.join(temp_path, self._entry_file_name), "w") as f:
+            json.dump({"kgcnn_version": __kgcnn_version__, "time": time.time(),
+                       "description": description}, f, default=str)
+        if os.path.exists(entry_path):
+            shutil.rmtree(entry_path, ignore_errors=True)
+        try:
+            os.rename(temp_path, entry_path)
+        except OSError:
+            # Entry was written concurrently by another process.
+            shutil.rmtree(temp_path, ignore_errors=True)
+        self.evict(keep=key)
+
+    def entries(self) -> list:
+        r"""List of entries in the cache directory.
+
+        Returns:
+            list: List of tuples of key, size in bytes and time of last use, sorted from least recently used.
+        """
+        if not os.path.exists(self.cache_directory):
+            return []
+        out = []
+        for key in os.listdir(self.cache_directory):
+            entry_path = self._entry_path(key)
+            entry_file = os.path.join(entry_path, self._entry_file_name)
+            if not os.path.exists(entry_file):
+                continue
+            size = sum([os.path.getsize(os.path.join(entry_path, x)) for x in os.listdir(entry_path)])
+            out.append((key, size, os.path.getmtime(entry_file)))
+        return sorted(out, key=lambda x: x[2])
+
+    def evict(self, keep: str = None):
+        r"""Remove least recently used entries until the total size is below :obj:`max_size` .
+
+        Args:
+            keep (str): Key of an entry that is not removed. Default is None.
+
+        Returns:
+            list: Keys of removed entries.
+        """
+        entries = self.entries()
+        total_size = sum([x[1] for x in entries])
+        removed = []
+        for key, size, _ in entries:
+            if total_size <= self.max_size:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(self._entry_path(key), ignore_errors=True)
+            total_size -= size
+            removed.append(key)
+        if len(removed) > 0:
+            module_logger.info("Removed %s entries from preprocessing cache." % len(removed))
+        return removed
+
+    def clear(self):
+        """Remove all entries of the cache."""
+        for key, _, _ in self.entries():
+            shutil.rmtree(self._entry_path(key), ignore_errors=True)
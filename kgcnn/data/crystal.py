@@ -1,18 +1,25 @@
 import os
 import numpy as np
 from collections import defaultdict
-from typing import Dict, Callable, List, Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Callable, List, Union, TYPE_CHECKING
 import pandas as pd
-import pymatgen
-import pymatgen.io.cif
-import pymatgen.core.structure
-import pymatgen.symmetry.structure
 from kgcnn.utils.serial import deserialize
 from kgcnn.data.base import MemoryGraphDataset
+from kgcnn.data.cache import GraphPreprocessingCache, hash_file
 from kgcnn.data.utils import save_json_file, load_json_file
 from kgcnn.crystal.base import CrystalPreprocessor
 from kgcnn.graph.base import GraphDict
 
+if TYPE_CHECKING:
+    from pymatgen.core.structure import Structure
+
+
+def _set_representation_worker(pre_processor_class, config: dict, dicts: List[dict]) -> List[dict]:
+    r"""Deserialize structures and compute their graphs with a preprocessor rebuilt from its config."""
+    pre_processor = pre_processor_class.from_config(config)
+    return [pre_processor(s).to_dict() for s in CrystalDataset._pymatgen_deserialize_dicts(dicts)]
+
 
 class CrystalDataset(MemoryGraphDataset):
     r"""Class for making graph dataset from periodic structures such as crystals.
@@ -106,10 +113,11 @@ class CrystalDataset(MemoryGraphDataset):
 
     @staticmethod
     def _pymatgen_deserialize_dicts(dicts: List[dict], to_unit_cell: bool = False) -> list:
+        from pymatgen.core.structure import Structure
         structs = []
         for x in dicts:
             # TODO: We could check symmetry or @module, @class items in dict.
-            s = pymatgen.core.structure.Structure.from_dict(x)
+            s = Structure.from_dict(x)
             structs.append(s)
             if to_unit_cell:
                 for site in s.sites:
@@ -136,6 +144,7 @@ class CrystalDataset(MemoryGraphDataset):
     @staticmethod
     def _pymatgen_parse_file_to_structure(cif_file: str):
         # TODO: We can add flexible parsing to include other than just CIF from file here.
+        import pymatgen.io.cif
         structures = pymatgen.io.cif.CifParser(cif_file).get_structures()
         return structures
 
@@ -187,7 +196,7 @@ class CrystalDataset(MemoryGraphDataset):
 
     def _map_callbacks(self, structs: list, data: pd.Series,
                        callbacks: Dict[
-                           str, Callable[[pymatgen.core.structure.Structure, pd.Series], Union[np.ndarray, None]]],
+                           str, Callable[["Structure", pd.Series], Union[np.ndarray, None]]],
                        assign_to_self: bool = True) -> dict:
         """Map callbacks on a data series object plus structure list.
 
@@ -225,7 +234,7 @@ class CrystalDataset(MemoryGraphDataset):
 
     def read_in_memory(self, label_column_name: str = None,
                        additional_callbacks: Dict[
-                           str, Callable[[pymatgen.core.structure.Structure, pd.Series], None]] = None
+                           str, Callable[["Structure", pd.Series], None]] = None
                        ):
         """Read structures from pymatgen json serialization and convert them into graph information.
 
@@ -257,32 +266,89 @@ class CrystalDataset(MemoryGraphDataset):
 
         return self
 
-    def set_representation(self, pre_processor: Union[CrystalPreprocessor, dict], reset_graphs: bool = False):
+    def _preprocess_structures(self, pre_processor: CrystalPreprocessor, num_workers: int = None,
+                               chunk_size: int = None) -> List[dict]:
+        r"""Compute graphs for all structures of the pymatgen json-file.
+
+        Args:
+            pre_processor (CrystalPreprocessor): Crystal preprocessor to use.
+            num_workers (int): Number of worker processes. Default is None, which runs in the main process.
+            chunk_size (int): Number of structures processed by a worker at once. Default is None.
+
+        Returns:
+            list: List of graph dictionaries in the order of the structures.
+        """
+        if num_workers is None or num_workers <= 1:
+            structs = self.get_structures_from_json_file()
+            graphs = []
+            for index, s in enumerate(structs):
+                graphs.append(pre_processor(s).to_dict())
+                if index % self._default_loop_update_info == 0:
+                    self.info(" ... preprocess structures {0} from {1}".format(index, len(structs)))
+            return graphs
+
+        # Workers get the serialized structures and rebuild the preprocessor from its config.
+        if not os.path.exists(self.pymatgen_json_file_path):
+            raise FileNotFoundError("Cannot find .json file for `CrystalDataset`. Please `prepare_data()`.")
+        self.info("Reading structures from .json ...")
+        dicts = load_json_file(self.pymatgen_json_file_path)
+        if chunk_size is None:
+            chunk_size = max(int(np.ceil(len(dicts) / (4 * num_workers))), 1)
+        chunks = [dicts[i:i + chunk_size] for i in range(0, len(dicts), chunk_size)]
+        self.info("Preprocess %s structures with %s workers in %s chunks." % (len(dicts), num_workers, len(chunks)))
+        config = pre_processor.get_config()
+        graphs = []
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            for chunk_graphs in executor.map(
+                    _set_representation_worker, [type(pre_processor)] * len(chunks), [config] * len(chunks), chunks):
+                graphs += chunk_graphs
+                self.info(" ... preprocess structures {0} from {1}".format(len(graphs), len(dicts)))
+        return graphs
+
+    def set_representation(self, pre_processor: Union[CrystalPreprocessor, dict], reset_graphs: bool = False,
+                           cache: Union[str, GraphPreprocessingCache] = None, num_workers: int = None,
+                           chunk_size: int = None):
         r"""Build a graph representation for this dataset using :obj:`kgcnn.crystal` .
 
+        With :obj:`cache` the graphs are stored with a key from the pymatgen json-file and :obj:`hash` of the
+        preprocessor and are loaded from :obj:`kgcnn.data.cache.GraphPreprocessingCache` if they were computed before.
+
+        With :obj:`num_workers` the structures are split into chunks, which are deserialized and preprocessed in a
+        pool of worker processes. Each worker rebuilds the preprocessor from :obj:`get_config` . The graphs are
+        merged in the order of the structures.
+
         Args:
             pre_processor (CrystalPreprocessor): Crystal preprocessor to use.
             reset_graphs (bool): Whether to reset the graph information. Default is False.
+            cache (str, GraphPreprocessingCache): Cache or path of cache directory. Default is None.
+            num_workers (int): Number of worker processes. Default is None, which runs in the main process.
+            chunk_size (int): Number of structures processed by a worker at once. Default is None, which distributes
+                the structures in four chunks per worker.
 
         Returns:
-
+            self
         """
         if reset_graphs:
             self.clear()
         if isinstance(pre_processor, dict):
             pre_processor = deserialize(pre_processor)
-        # Read pymatgen JSON file from file.
-        structs = self.get_structures_from_json_file()
-        if reset_graphs:
-            self.empty(len(structs))
-
         pre_processor.output_graph_as_dict = True
 
-        for index, s in enumerate(structs):
-            g = pre_processor(s)
-            self[index].update(g)
-
-            if index % self._default_loop_update_info == 0:
-                self.info(" ... preprocess structures {0} from {1}".format(index, len(structs)))
+        if cache is not None:
+            if isinstance(cache, str):
+                cache = GraphPreprocessingCache(cache)
+            key = cache.key(hash_file(self.pymatgen_json_file_path), pre_processor.hash())
+            graphs = cache.load(key)
+            if graphs is None:
+                graphs = self._preprocess_structures(pre_processor, num_workers=num_workers, chunk_size=chunk_size)
+                cache.store(key, graphs, description=pre_processor.get_config())
+            else:
+                self.info("Load graph representation from preprocessing cache.")
+        else:
+            graphs = self._preprocess_structures(pre_processor, num_workers=num_workers, chunk_size=chunk_size)
 
+        if reset_graphs:
+            self.empty(len(graphs))
+        for index, g in enumerate(graphs):
+            self[index].update(g)
         return self
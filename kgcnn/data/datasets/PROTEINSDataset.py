@@ -50,9 +50,12 @@ class PROTEINSDataset(GraphTUDataset2020):
         node_labels = self.obtain_property("node_labels")
         node_degree = self.obtain_property("node_degree")
         self.assign_property("graph_labels", [x - 1 for x in graph_labels])
-        self.assign_property("node_attributes", [np.array([ohe(int(y)) for y in x]) for x in node_attributes])
-        self.assign_property("node_labels", [np.array([ohe2(int(y)) for y in x]) for x in node_labels])
-        self.assign_property("node_degree", [np.array([ohe3(int(y)) for y in x]) for x in node_degree])
+        self.assign_property("node_attributes", [ohe.encode_array(np.reshape(x, (-1,)).astype("int"))
+                                                 for x in node_attributes])
+        self.assign_property("node_labels", [ohe2.encode_array(np.reshape(x, (-1,)).astype("int"))
+                                             for x in node_labels])
+        self.assign_property("node_degree", [ohe3.encode_array(np.reshape(x, (-1,)).astype("int"))
+                                             for x in node_degree])
         self.assign_property("graph_size", [len(x) if x is not None else None for x in node_attributes])
 
         return self
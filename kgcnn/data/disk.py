@@ -0,0 +1,578 @@
+import os
+import json
+import logging
+import h5py
+import numpy as np
+from typing import Union, List, Dict
+from kgcnn.graph.base import GraphDict
+from kgcnn.io.file import RaggedTensorHDFile
+from kgcnn.io.loader import DisjointBatchCollator, tf_dataset_disjoint_generator
+from kgcnn.data.base import MemoryGraphList, GraphTensorMixin, GraphDatasetMixin
+
+# Module logger
+logging.basicConfig()
+module_logger = logging.getLogger(__name__)
+module_logger.setLevel(logging.INFO)
+
+
+class DiskBatchCollator(DisjointBatchCollator):
+    r"""Collate batches of graphs of a :obj:`DiskGraphDataset` into disjoint tensors.
+
+    Only the row splits of the disjoint properties are kept in memory to plan batches. The values of a batch are
+    read from disk on each call. See :obj:`kgcnn.io.loader.DisjointBatchCollator` for the arguments.
+    """
+
+    def _load_values(self, graphs):
+        self._dataset = graphs
+        for i, x in self.inputs.items():
+            if not self.is_attributes[i]:
+                continue
+            if x["name"] not in graphs.properties:
+                raise ValueError("Property '%s' is not defined for all graphs. Please run `clean()`." % x["name"])
+            row_lengths = np.diff(graphs.row_splits(x["name"]))
+            if self.assignment_to_id[i] is not None:
+                self._row_splits[i] = graphs.row_splits(x["name"])
+            elif graphs._properties[x["name"]]["rank"] == 0:
+                if np.any(row_lengths != 1):
+                    raise ValueError(
+                        "Property '%s' is not defined for all graphs. Please run `clean()`." % x["name"])
+            elif len(row_lengths) > 0 and np.any(row_lengths != row_lengths[0]):
+                raise ValueError("Property '%s' does not have the same shape for all graphs." % x["name"])
+
+    def _empty(self, key) -> np.ndarray:
+        file = self._dataset._file(self.inputs[key]["name"])
+        return np.zeros((0, ) + file.inner_shape, dtype=self.inputs[key]["dtype"])
+
+    def _take(self, key, idx: np.ndarray):
+        if len(idx) == 0:
+            return self._empty(key)
+        return np.array(self._dataset.read_property(self.inputs[key]["name"], idx), dtype=self.inputs[key]["dtype"])
+
+    def _gather(self, key, idx: np.ndarray):
+        if len(idx) == 0:
+            return self._empty(key), np.zeros(0, dtype="int64")
+        arrays = self._dataset.read_property(self.inputs[key]["name"], idx)
+        counts = np.array([len(x) for x in arrays], dtype="int64")
+        return np.concatenate(arrays, axis=0), counts
+
+
+class DiskGraphDataset(GraphTensorMixin, GraphDatasetMixin):
+    r"""Dataset class for graphs that are stored on disk and do not fit into memory.
+
+    Each graph property is stored in a separate HDF5 file of :obj:`kgcnn.io.file.RaggedTensorHDFile` with the
+    values of all graphs concatenated along the first axis and row splits. The files are placed in a directory named
+    :obj:`dataset_name.kgcnn.hdf5` in :obj:`data_directory` together with a 'properties.json' file that holds the
+    number of graphs and the rank of each property. Properties of rank zero, e.g. graph labels, are stored with row
+    length one. Graphs that do not define a property are stored with row length zero, i.e. they are read as empty
+    arrays or as None for properties of rank zero.
+
+    Only row splits are kept in memory. Graphs can be accessed via `[]` indexing operator, which returns a
+    :obj:`GraphDict` for a single index and a :obj:`MemoryGraphList` for slices or index arrays. Indices are sorted
+    before reading and neighbouring graphs are read from file in a single read.
+    The dataset can be passed to the loaders of :obj:`kgcnn.io.loader` , which read each batch from disk.
+
+    .. code-block:: python
+
+        import numpy as np
+        from kgcnn.data.disk import DiskGraphDataset
+        dataset = DiskGraphDataset(data_directory="", dataset_name="Example")
+        dataset.append_multiple([{"node_number": np.array([6, 1]), "graph_labels": np.array(1.0)},
+                                 {"node_number": np.array([8]), "graph_labels": np.array(2.0)}])
+        print(dataset[[1, 0]])
+        dataset.clean(["node_number"])
+
+    """
+
+    fits_in_memory = False
+    _meta_file_name = "properties.json"
+    _iter_chunk_size = 1024
+
+    def __init__(self,
+                 data_directory: str = None,
+                 dataset_name: str = None,
+                 file_name: str = None,
+                 file_directory: str = None,
+                 verbose: int = 10,
+                 hdf5_directory: str = None
+                 ):
+        r"""Initialize a :obj:`DiskGraphDataset` . Existing properties in :obj:`hdf5_directory` are loaded.
+
+        Args:
+            data_directory (str): Full path to directory of the dataset. Default is None.
+            file_name (str): Generic filename for dataset to read into memory like a 'csv' file. Default is None.
+            file_directory (str): Name or relative path from :obj:`data_directory` to a directory containing sorted
+                files. Default is None.
+            dataset_name (str): Name of the dataset. Important for naming and saving files. Default is None.
+            verbose (int): Logging level. Default is 10.
+            hdf5_directory (str): Full path to the directory of the HDF5 files. If None, a directory named
+                :obj:`dataset_name.kgcnn.hdf5` in :obj:`data_directory` is used. Default is None.
+        """
+        self.logger = logging.getLogger("kgcnn.data." + dataset_name) if dataset_name is not None else module_logger
+        self.logger.setLevel(verbose)
+        self.data_directory = data_directory
+        self.file_name = file_name
+        self.file_directory = file_directory
+        self.dataset_name = dataset_name
+        self.data_frame = None
+        self.data_keys = None
+        self.data_unit = None
+        if hdf5_directory is None:
+            hdf5_directory = os.path.join(
+                data_directory if data_directory is not None else "",
+                (dataset_name if dataset_name is not None else "dataset") + ".kgcnn.hdf5")
+        self.hdf5_directory = hdf5_directory
+        self._num_graphs = 0
+        self._properties = {}
+        self._files = {}
+        self.load()
+
+    def _file(self, key: str) -> RaggedTensorHDFile:
+        if key not in self._files:
+            self._files[key] = RaggedTensorHDFile(os.path.join(self.hdf5_directory, "%s.hdf5" % key))
+        return self._files[key]
+
+    def close(self):
+        """Close all cached file handles."""
+        for file in self._files.values():
+            file.close()
+        self._files = {}
+
+    def _write_meta(self):
+        os.makedirs(self.hdf5_directory, exist_ok=True)
+        meta = {"num_graphs": self._num_graphs, "properties": self._properties}
+        with open(os.path.join(self.hdf5_directory, self._meta_file_name), "w") as f:
+            json.dump(meta, f)
+
+    def exists(self):
+        """Check if the directory of the HDF5 files exists."""
+        return os.path.exists(os.path.join(self.hdf5_directory, self._meta_file_name))
+
+    def load(self):
+        r"""Load the information of the properties stored in :obj:`hdf5_directory` . Graph properties stay on disk.
+
+        Returns:
+            self
+        """
+        self.close()
+        if not self.exists():
+            self._num_graphs = 0
+            self._properties = {}
+            return self
+        with open(os.path.join(self.hdf5_directory, self._meta_file_name), "r") as f:
+            meta = json.load(f)
+        self._num_graphs = int(meta["num_graphs"])
+        self._properties = meta["properties"]
+        return self
+
+    def save(self):
+        r"""Graph properties are always written to disk directly. Only writes the information of the properties.
+
+        Returns:
+            self
+        """
+        self._write_meta()
+        return self
+
+    @property
+    def properties(self) -> list:
+        """List of names of the graph properties on disk."""
+        return list(self._properties.keys())
+
+    def __len__(self):
+        return self._num_graphs
+
+    @property
+    def length(self):
+        """Length of dataset."""
+        return len(self)
+
+    def __repr__(self):
+        return "<{} [{} graphs with properties {}]>".format(type(self).__name__, len(self), self.properties)
+
+    def row_splits(self, key: str) -> np.ndarray:
+        r"""Row splits of a graph property, which are cached in memory.
+
+        Args:
+            key (str): Name of the property.
+
+        Returns:
+            np.ndarray: Row splits of shape `(N+1, )` .
+        """
+        return self._file(key).row_splits
+
+    def _property_lengths(self, key: str) -> np.ndarray:
+        return np.diff(self.row_splits(key))
+
+    def read_property(self, key: str, indices: Union[list, np.ndarray] = None) -> list:
+        r"""Read a graph property from disk for a set of graph indices.
+
+        Args:
+            key (str): Name of the property.
+            indices (list, np.ndarray): Indices of graphs. If None, all graphs are read. Default is None.
+
+        Returns:
+            list: List of numpy arrays in the order of `indices` . Properties of rank zero, that are not defined for a
+                graph, are None.
+        """
+        indices = np.arange(len(self)) if indices is None else np.asarray(indices, dtype="int64")
+        rows = self._file(key)[indices]
+        if self._properties[key]["rank"] == 0:
+            return [x[0] if len(x) > 0 else None for x in rows]
+        return rows
+
+    def _property_buffer(self, key: str) -> Union[dict, None]:
+        r"""Values and row splits of a graph property read from disk. Returns None, if the property is not stored or
+        not defined for all graphs of a rank zero property."""
+        if key not in self._properties:
+            return None
+        file = self._file(key)
+        row_splits = file.row_splits
+        rank = self._properties[key]["rank"]
+        if rank == 0 and np.any(np.diff(row_splits) != 1):
+            return None
+        return {"values": file.values, "row_splits": row_splits, "rank": rank}
+
+    def obtain_property(self, key: str) -> Union[List, None]:
+        r"""Returns a list with the values of all the graphs defined for the string property name `key`. If the
+        property is not stored on disk, returns None. Note that the whole property is read into memory. Use
+        :obj:`read_property` for a subset of graphs or :obj:`row_splits` for the number of elements of each graph.
+
+        Args:
+            key (str): The string name of the property to be retrieved for all the graphs.
+        """
+        if key not in self._properties:
+            self.logger.warning("Property '%s' is not set on any graph." % key)
+            return None
+        return self.read_property(key)
+
+    @staticmethod
+    def _to_rows(values: list) -> tuple:
+        """Cast list of arrays or None to rows with row length one for rank zero. Returns rows and rank."""
+        arrays = [np.asarray(x) for x in values if x is not None]
+        if len(arrays) == 0:
+            return None, None
+        rank = arrays[0].ndim
+        if any(x.ndim != rank or x.shape[1:] != arrays[0].shape[1:] for x in arrays):
+            raise ValueError("Can only store arrays of matching inner shape on disk.")
+        dtype = np.result_type(*set(x.dtype for x in arrays))
+        empty = np.zeros([0] + list(arrays[0].shape[1:] if rank > 0 else []), dtype=dtype)
+        rows = [(np.expand_dims(x, axis=0) if rank == 0 else x) if x is not None else empty for x in values]
+        return rows, rank
+
+    def assign_property(self, key: str, value: list):
+        r"""Write a list of numpy arrays of a property to disk. Overwrites an existing property.
+
+        Args:
+            key (str): Name of the property.
+            value (list): List of numpy arrays for property `key` .
+
+        Returns:
+            self
+        """
+        if value is None:
+            return self
+        if not isinstance(value, list):
+            raise TypeError("Expected type `list` to assign graph properties.")
+        if len(self) == 0 and len(self._properties) == 0:
+            self._num_graphs = len(value)
+        if len(self) != len(value):
+            raise ValueError("Can only store graph attributes from list with same length.")
+        rows, rank = self._to_rows(value)
+        if rows is None:
+            self.logger.warning("Property '%s' is not defined for any graph. Property is not stored." % key)
+            return self
+        os.makedirs(self.hdf5_directory, exist_ok=True)
+        self._file(key).write(rows)
+        self._properties[key] = {"rank": rank}
+        self._write_meta()
+        return self
+
+    def append(self, graph: dict):
+        r"""Append a single graph to the dataset on disk.
+
+        Args:
+            graph (dict): Dictionary of graph properties.
+
+        Returns:
+            self
+        """
+        return self.append_multiple([graph])
+
+    def append_multiple(self, graphs: list):
+        r"""Append a list of graphs to the dataset on disk. Properties that are new to the dataset are stored with
+        row length zero for all previous graphs.
+
+        Args:
+            graphs (list): List of dictionaries of graph properties.
+
+        Returns:
+            self
+        """
+        if len(graphs) == 0:
+            return self
+        keys = list(self._properties.keys())
+        for x in graphs:
+            keys += [k for k in x.keys() if k not in keys]
+        os.makedirs(self.hdf5_directory, exist_ok=True)
+        for key in keys:
+            values = [x[key] if key in x else None for x in graphs]
+            rows, rank = self._to_rows(values)
+            if key not in self._properties:
+                if rows is not None:
+                    self._create_property(key, rows, rank, num_empty_before=self._num_graphs)
+                continue
+            if rows is None:
+                rows = [self._empty_row(key)] * len(values)
+            elif rank != self._properties[key]["rank"]:
+                raise ValueError("Mismatch in rank for property '%s' to append." % key)
+            self._file(key).append_multiple(rows)
+        self._num_graphs += len(graphs)
+        self._write_meta()
+        return self
+
+    def update_multiple(self, indices: Union[list, np.ndarray], graphs: list):
+        r"""Overwrite properties of graphs on disk. Only the properties that are defined in `graphs` are written,
+        other properties of the graphs on disk are not changed. A property set to None is removed for the graph.
+        Properties of the same size are overwritten in place.
+        See :obj:`kgcnn.io.file.RaggedTensorHDFile.update_multiple` .
+
+        Args:
+            indices (list, np.ndarray): Indices of the graphs to update.
+            graphs (list): List of dictionaries of graph properties.
+
+        Returns:
+            self
+        """
+        indices = np.asarray(indices, dtype="int64")
+        if len(indices) != len(graphs):
+            raise ValueError("Number of indices '%s' does not match number of graphs '%s'." % (
+                len(indices), len(graphs)))
+        if np.any(indices < 0) or np.any(indices >= len(self)):
+            raise IndexError("Indices out of range for dataset of length %s." % len(self))
+        keys = []
+        for x in graphs:
+            keys += [k for k in x.keys() if k not in keys]
+        for key in keys:
+            selected = [i for i, x in enumerate(graphs) if key in x]
+            rows, rank = self._to_rows([graphs[i][key] for i in selected])
+            if key not in self._properties:
+                if rows is None:
+                    continue
+                self._create_property(key, [rows[0][:0]], rank, num_empty_before=self._num_graphs - 1)
+            elif rows is None:
+                rows = [self._empty_row(key)] * len(selected)
+            elif rank != self._properties[key]["rank"]:
+                raise ValueError("Mismatch in rank for property '%s' to update." % key)
+            self._file(key).update_multiple(indices[selected], rows)
+        self._write_meta()
+        return self
+
+    def _empty_row(self, key: str) -> np.ndarray:
+        file = self._file(key)
+        file.close()
+        with h5py.File(file.file_path, "r") as f:
+            dtype, inner_shape = f["values"].dtype, f["values"].shape[1:]
+        return np.zeros([0] + list(inner_shape), dtype=dtype)
+
+    def _create_property(self, key: str, rows: list, rank: int, num_empty_before: int = 0):
+        """Write a new property file with rows after a number of empty rows."""
+        file = self._file(key)
+        file.write(rows)
+        if num_empty_before > 0:
+            file.close()
+            with h5py.File(file.file_path, "r+") as f:
+                row_splits = np.array(f["row_splits"])
+                f["row_splits"].resize(len(row_splits) + num_empty_before, axis=0)
+                f["row_splits"][:] = np.concatenate([np.zeros(num_empty_before, dtype=row_splits.dtype), row_splits])
+        self._properties[key] = {"rank": rank}
+
+    def clear(self):
+        r"""Remove all graphs and properties from disk.
+
+        Returns:
+            self
+        """
+        self.close()
+        for key in self.properties:
+            if os.path.exists(self._file(key).file_path):
+                os.remove(self._file(key).file_path)
+        self.close()
+        if self.exists():
+            os.remove(os.path.join(self.hdf5_directory, self._meta_file_name))
+        self._num_graphs = 0
+        self._properties = {}
+        return self
+
+    def read_graphs(self, indices: Union[list, np.ndarray]) -> MemoryGraphList:
+        r"""Read graphs from disk into a :obj:`MemoryGraphList` .
+
+        Args:
+            indices (list, np.ndarray): Indices of graphs.
+
+        Returns:
+            MemoryGraphList: List of graphs in the order of `indices` .
+        """
+        indices = np.asarray(indices, dtype="int64")
+        out = [GraphDict() for _ in range(len(indices))]
+        for key in self._properties.keys():
+            for i, x in enumerate(self.read_property(key, indices)):
+                if x is not None:
+                    out[i].assign_property(key, x)
+        return MemoryGraphList(out)
+
+    def __getitem__(self, item) -> Union[GraphDict, MemoryGraphList]:
+        if isinstance(item, (int, np.integer)):
+            if item < -len(self) or item >= len(self):
+                raise IndexError("Index '%s' out of range for dataset of length %s." % (item, len(self)))
+            return self.read_graphs([int(item) % len(self)])[0]
+        if isinstance(item, slice):
+            return self.read_graphs(np.arange(len(self))[item])
+        if isinstance(item, (list, tuple, np.ndarray)):
+            return self.read_graphs(item)
+        raise TypeError("Unsupported type '%s' for `DiskGraphDataset` items." % type(item))
+
+    def __iter__(self):
+        chunk_size = self._iter_chunk_size
+        for start in range(0, len(self), chunk_size):
+            for graph in self.read_graphs(np.arange(start, min(start + chunk_size, len(self)))):
+                yield graph
+
+    def clean(self, inputs: Union[list, str], chunk_size: int = 100000):
+        r"""Remove all graphs from disk, which do not define at least one of the properties in :obj:`inputs` or for
+        which the property is empty. Only the row splits are checked to find invalid graphs.
+
+        Args:
+            inputs (list): A list of property names or a list of dicts that specify the name with 'name' key.
+            chunk_size (int): Number of graphs to copy at once while rewriting the files. Default is 100000.
+
+        Returns:
+            invalid_graphs (np.ndarray): A list of graph indices that do not have the required properties and which
+                have been removed.
+        """
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        is_invalid = np.zeros(len(self), dtype="bool")
+        for item in inputs:
+            item_name = item["name"] if isinstance(item, dict) else item
+            if item_name not in self._properties:
+                self.logger.warning("Can not clean property '%s' as it was not assigned to any graph." % item)
+                continue
+            is_invalid = np.logical_or(is_invalid, np.diff(self.row_splits(item_name)) <= 0)
+        invalid_graphs = np.flip(np.nonzero(is_invalid)[0])
+        if len(invalid_graphs) > 0:
+            self.logger.warning("Found invalid graphs for properties. Removing graphs '%s'." % invalid_graphs)
+            self._remove_graphs(is_invalid, chunk_size=chunk_size)
+        else:
+            self.logger.info("No invalid graphs for assigned properties found.")
+        return invalid_graphs
+
+    def _remove_graphs(self, is_removed: np.ndarray, chunk_size: int = 100000):
+        """Rewrite all property files without removed graphs in chunks."""
+        kept = np.nonzero(np.logical_not(is_removed))[0]
+        for key in list(self._properties.keys()):
+            file = self._file(key)
+            if len(kept) == 0:
+                file.close()
+                os.remove(file.file_path)
+                continue
+            new_file = RaggedTensorHDFile(file.file_path + ".tmp")
+            for start in range(0, len(kept), chunk_size):
+                rows = file[kept[start:start + chunk_size]]
+                if start == 0:
+                    new_file.write(rows)
+                else:
+                    new_file.append_multiple(rows)
+            file.close()
+            os.replace(new_file.file_path, file.file_path)
+        if len(kept) == 0:
+            self._properties = {}
+        self._num_graphs = len(kept)
+        self.close()
+        self._write_meta()
+
+    # Alias of internal assign and obtain property.
+    set = assign_property
+    get = obtain_property
+
+    def assert_valid_model_input(self, hyper_input: Union[list, dict], raise_error_on_fail: bool = True):
+        r"""Check whether dataset has graph properties requested by model input. See
+        :obj:`MemoryGraphDataset.assert_valid_model_input` for the format of :obj:`hyper_input` .
+
+        Rank, inner shape and dtype are taken from the metadata of the HDF5 files and the length of each graph from
+        the row splits, so that no property is read into memory.
+
+        Args:
+            hyper_input (list): List of properties that need to be available to a model for training.
+            raise_error_on_fail (bool): Whether to raise an error if assertion failed.
+        """
+        def message_error(msg):
+            if raise_error_on_fail:
+                raise ValueError(msg)
+            else:
+                self.error(msg)
+
+        if isinstance(hyper_input, dict):
+            hyper_input = [hyper_input] if "name" in hyper_input and "shape" in hyper_input else list(
+                hyper_input.values())
+
+        for x in hyper_input:
+            if x is None:
+                self.warning("Found 'None' in place of model input. Skipping this input.")
+                continue
+            if not isinstance(x, dict) or "name" not in x:
+                message_error("Can not infer name from '%s' for model input." % x)
+                continue
+            if x["name"] not in self._properties:
+                message_error("Property %s is not defined for any graph in list. Please check property." % x["name"])
+                continue
+            file = self._file(x["name"])
+            rank = self._properties[x["name"]]["rank"]
+            row_lengths = np.diff(file.row_splits)
+            self.info("Property '%s' of rank %s with inner shape %s and dtype '%s' on disk." % (
+                x["name"], rank, file.inner_shape, file.dtype))
+            if rank == 0 and np.any(row_lengths != 1):
+                self.warning("Property %s is not defined for all graphs in list. Please run clean()." % x["name"])
+            if "shape" not in x:
+                message_error("Can not check shape for '%s'." % x["name"])
+                continue
+            shape_input = x["shape"]
+            shape_file = (None, ) + file.inner_shape if rank > 0 else ()
+            if rank != len(shape_input):
+                message_error("Mismatch in rank for model input {} vs. {}".format(shape_file, shape_input))
+                continue
+            if len(shape_input) > 0 and shape_input[0] is not None:
+                is_mismatch = row_lengths != shape_input[0]
+                if np.any(is_mismatch):
+                    message_error("Mismatch in shape for model input {} vs. {} for {} graphs".format(
+                        (int(row_lengths[int(np.argmax(is_mismatch))]), ) + file.inner_shape, shape_input,
+                        int(np.sum(is_mismatch))))
+            if any(dim is not None and file.inner_shape[i] != dim for i, dim in enumerate(shape_input[1:])):
+                message_error("Mismatch in shape for model input {} vs. {}".format(shape_file, shape_input))
+            if "dtype" in x and np.dtype(x["dtype"]).kind != file.dtype.kind:
+                self.warning("Property %s of dtype '%s' is cast to '%s' of model input." % (
+                    x["name"], file.dtype, x["dtype"]))
+
+    def batch_collator(self, inputs: Union[list, dict], **kwargs) -> DiskBatchCollator:
+        r"""Make a collator that reads batches from disk. Used by the loaders of :obj:`kgcnn.io.loader` .
+
+        Args:
+            inputs: List or dict of keras input layer configs.
+            kwargs: Kwargs for :obj:`DiskBatchCollator` .
+
+        Returns:
+            DiskBatchCollator: Collator for this dataset.
+        """
+        return DiskBatchCollator(self, inputs=inputs, **kwargs)
+
+    def tf_dataset_disjoint(self, inputs, **kwargs):
+        r"""Return generator via :obj:`tf.data.Dataset` from this dataset, which reads batches from disk.
+        Uses :obj:`kgcnn.io.loader.tf_dataset_disjoint_generator`
+
+        Args:
+            inputs: List or dict of keras input layer configs.
+            kwargs: Kwargs for :obj:`tf_dataset_disjoint_generator`
+
+        Returns:
+            tf.data.Dataset: Dataset from generator.
+        """
+        return tf_dataset_disjoint_generator(self, inputs=inputs, **kwargs)
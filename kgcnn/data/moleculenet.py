@@ -1,13 +1,15 @@
 import os
+import multiprocessing
 import numpy as np
 import pandas as pd
 
 from typing import Dict, Callable, Union, List
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from kgcnn.molecule.serial import deserialize_encoder
 from kgcnn.data.base import MemoryGraphDataset
 from kgcnn.molecule.base import MolGraphInterface
-from kgcnn.molecule.encoder import OneHotEncoder
+from kgcnn.molecule.encoder import OneHotEncoder, FeatureCache
 from kgcnn.molecule.io import write_mol_block_list_to_sdf, read_mol_list_from_sdf_file, write_smiles_file
 from kgcnn.molecule.convert import MolConverter
 
@@ -16,6 +18,60 @@ try:
 except ModuleNotFoundError:
     MolecularGraphRDKit = None
 
+# Arguments of `map_molecule_callbacks` for worker processes. Callbacks are often lambdas that can not be pickled,
+# but are inherited by forked worker processes.
+_callback_worker_kwargs = None
+
+
+def _map_molecule_callbacks_range(start: int, stop: int, mol_list: List[str],
+                                  data: Union[pd.Series, pd.DataFrame],
+                                  callbacks: Dict[str, Callable[[MolGraphInterface, pd.Series], None]],
+                                  custom_transform: Callable[[MolGraphInterface], MolGraphInterface] = None,
+                                  add_hydrogen: bool = False,
+                                  make_directed: bool = False,
+                                  sanitize: bool = True,
+                                  compute_partial_charges: str = None,
+                                  mol_interface_class=None,
+                                  logger=None,
+                                  loop_update_info: int = None) -> dict:
+    r"""Run callbacks for molecules of index `start` to `stop` of :obj:`mol_list` ."""
+    value_lists = defaultdict(list)
+    for index in range(start, stop):
+        sm = mol_list[index]
+
+        mg = mol_interface_class(make_directed=make_directed).from_mol_block(
+            sm, keep_hs=add_hydrogen, sanitize=sanitize)
+
+        if custom_transform is not None:
+            mg = custom_transform(mg)
+
+        if compute_partial_charges:
+            mg.compute_partial_charges(method=compute_partial_charges)
+
+        for name, callback in callbacks.items():
+            if mg.mol is None:
+                value_lists[name].append(None)
+            else:
+                if data is not None:
+                    data_dict = data.loc[index]
+                else:
+                    data_dict = None
+                value = callback(mg, data_dict)
+                value_lists[name].append(value)
+        if loop_update_info is not None and index % loop_update_info == 0:
+            if logger is not None:
+                logger.info(" ... process molecules {0} from {1}".format(index, len(mol_list)))
+    return value_lists
+
+
+def _map_molecule_callbacks_worker(start: int, stop: int) -> dict:
+    return dict(_map_molecule_callbacks_range(start, stop, **_callback_worker_kwargs))
+
+
+def _has_worker_processes(num_workers: Union[int, None]) -> bool:
+    """Whether :obj:`map_molecule_callbacks` runs the callbacks in forked worker processes."""
+    return num_workers is not None and num_workers > 1 and "fork" in multiprocessing.get_all_start_methods()
+
 
 def map_molecule_callbacks(mol_list: List[str],
                            data: Union[pd.Series, pd.DataFrame],
@@ -27,7 +83,9 @@ def map_molecule_callbacks(mol_list: List[str],
                            compute_partial_charges: str = None,
                            mol_interface_class=None,
                            logger=None,
-                           loop_update_info: int = 5000
+                           loop_update_info: int = 5000,
+                           num_workers: int = None,
+                           chunk_size: int = None
                            ) -> dict:
     r"""This method receive the list of molecules, as well as the data from a pandas data series.
     It then iterates over all the molecules / data rows and invokes the callbacks for each.
@@ -48,6 +106,13 @@ def map_molecule_callbacks(mol_list: List[str],
         If a molecule cannot be properly loaded by :obj:`MolGraphInterface`, then for all attributes
         "None" is added without invoking the callback!
 
+    With :obj:`num_workers` the list of molecules is split into chunks, which are processed by a pool of forked
+    processes. The callbacks are inherited by the worker processes and do not need to be picklable, but their
+    return values must be. The results are merged in the order of :obj:`mol_list` . Note that changes to the state
+    of callbacks or encoders in the worker processes are not returned to the main process. The arguments are handed
+    to the workers by the module-global :obj:`_callback_worker_kwargs` , so that concurrent calls with
+    :obj:`num_workers` from different threads are not safe.
+
     Example:
 
     .. code-block:: python
@@ -86,6 +151,9 @@ def map_molecule_callbacks(mol_list: List[str],
         mol_interface_class: Interface for molecular graphs. Must be a :obj:`MolGraphInterface`.
         logger: Logger to report error and progress.
         loop_update_info (int): Updates for processed molecules.
+        num_workers (int): Number of worker processes. Default is None, which runs in the main process.
+        chunk_size (int): Number of molecules processed by a worker at once. Default is None, which distributes the
+            molecules in four chunks per worker.
 
     Returns:
         dict: Values of callbacks.
@@ -98,32 +166,36 @@ def map_molecule_callbacks(mol_list: List[str],
     if mol_list is None:
         raise ValueError("Expected list of mol-string. But got '%s'." % mol_list)
 
-    value_lists = defaultdict(list)
-    for index, sm in enumerate(mol_list):
-
-        mg = mol_interface_class(make_directed=make_directed).from_mol_block(
-            sm, keep_hs=add_hydrogen, sanitize=sanitize)
-
-        if custom_transform is not None:
-            mg = custom_transform(mg)
-
-        if compute_partial_charges:
-            mg.compute_partial_charges(method=compute_partial_charges)
-
-        for name, callback in callbacks.items():
-            if mg.mol is None:
-                value_lists[name].append(None)
-            else:
-                if data is not None:
-                    data_dict = data.loc[index]
-                else:
-                    data_dict = None
-                value = callback(mg, data_dict)
-                value_lists[name].append(value)
-        if index % loop_update_info == 0:
-            if logger is not None:
-                logger.info(" ... process molecules {0} from {1}".format(index, len(mol_list)))
+    kwargs = dict(mol_list=mol_list, data=data, callbacks=callbacks, custom_transform=custom_transform,
+                  add_hydrogen=add_hydrogen, make_directed=make_directed, sanitize=sanitize,
+                  compute_partial_charges=compute_partial_charges, mol_interface_class=mol_interface_class)
 
+    if num_workers is not None and num_workers > 1 and not _has_worker_processes(num_workers):
+        if logger is not None:
+            logger.warning("Require 'fork' to start worker processes for callbacks. Running in main process.")
+    if not _has_worker_processes(num_workers):
+        return _map_molecule_callbacks_range(
+            0, len(mol_list), logger=logger, loop_update_info=loop_update_info, **kwargs)
+
+    if chunk_size is None:
+        chunk_size = max(int(np.ceil(len(mol_list) / (4 * num_workers))), 1)
+    starts = list(range(0, len(mol_list), chunk_size))
+    stops = [min(i + chunk_size, len(mol_list)) for i in starts]
+    if logger is not None:
+        logger.info("Process %s molecules with %s workers in %s chunks." % (len(mol_list), num_workers, len(starts)))
+
+    global _callback_worker_kwargs
+    _callback_worker_kwargs = kwargs
+    value_lists = defaultdict(list)
+    try:
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=multiprocessing.get_context("fork")) as executor:
+            for stop, chunk_values in zip(stops, executor.map(_map_molecule_callbacks_worker, starts, stops)):
+                for name, values in chunk_values.items():
+                    value_lists[name] += values
+                if logger is not None:
+                    logger.info(" ... process molecules {0} from {1}".format(stop, len(mol_list)))
+    finally:
+        _callback_worker_kwargs = None
     return value_lists
 
 
@@ -229,7 +301,8 @@ class MoleculeNetDataset(MemoryGraphDataset):
     def prepare_data(self, overwrite: bool = False, smiles_column_name: str = "smiles",
                      add_hydrogen: bool = True, sanitize: bool = True,
                      make_conformers: bool = True, optimize_conformer: bool = True,
-                     external_program: dict = None, num_workers: int = None):
+                     external_program: dict = None, num_workers: int = None, random_seed: int = 42,
+                     conversion_backend: str = "thread", conversion_timeout: float = None):
         r"""Computation of molecular structure information and optionally conformers from smiles.
 
         This function reads smiles from the csv-file given by :obj:`file_name` and creates a single SDF File of
@@ -252,6 +325,11 @@ class MoleculeNetDataset(MemoryGraphDataset):
                 Note that usually the parameters like :obj:`add_hydrogen` are ignored. And you need to control the
                 SDF file generation within `config` of the :obj:`external_program`.
             num_workers (int): Parallel execution for translating smiles.
+            random_seed (int): Random seed for embedding conformers. Default is 42.
+            conversion_backend (str): Parallel backend for translating smiles, either 'thread' or 'process'.
+                Default is 'thread'.
+            conversion_timeout (float): Timeout in seconds for a single smile. Molecules that exceed the timeout
+                result in an empty mol-block. Requires :obj:`conversion_backend='process'` . Default is None.
 
         Returns:
             self
@@ -273,7 +351,8 @@ class MoleculeNetDataset(MemoryGraphDataset):
             self.file_path_smiles, self.file_path_mol, add_hydrogen=add_hydrogen, sanitize=sanitize,
             make_conformers=make_conformers, optimize_conformer=optimize_conformer,
             external_program=external_program, num_workers=num_workers,
-            logger=self.logger, batch_size=self._default_loop_update_info
+            logger=self.logger, batch_size=self._default_loop_update_info, random_seed=random_seed,
+            backend=conversion_backend, timeout=conversion_timeout, return_mol_list=False
         )
         return self
 
@@ -299,7 +378,8 @@ class MoleculeNetDataset(MemoryGraphDataset):
                        sanitize: bool = True,
                        compute_partial_charges: str = None,
                        additional_callbacks: Dict[str, Callable[[MolGraphInterface, dict], None]] = None,
-                       custom_transform: Callable[[MolGraphInterface], MolGraphInterface] = None):
+                       custom_transform: Callable[[MolGraphInterface], MolGraphInterface] = None,
+                       num_workers: int = None):
         """Load list of molecules from cached SDF-file in into memory. File name must be given in :obj:`file_name` and
         path information in the constructor of this class.
 
@@ -369,6 +449,8 @@ class MoleculeNetDataset(MemoryGraphDataset):
             custom_transform (Callable): Custom transformation function to modify the generated
                 :obj:`MolecularGraphRDKit` before callbacks are carried out. The function must take a single
                 :obj:`MolecularGraphRDKit` instance as argument and return a (new) :obj:`MolecularGraphRDKit` instance.
+            num_workers (int): Number of worker processes to compute attributes. See :obj:`map_molecule_callbacks` .
+                Found values of the encoders are then not reported. Default is None.
 
         Returns:
             self
@@ -400,10 +482,13 @@ class MoleculeNetDataset(MemoryGraphDataset):
         if label_column_name:
             callbacks.update({'graph_labels': lambda mg, ds: ds[label_column_name]})
 
-        # Attributes callbacks.
+        # Attributes callbacks. Feature vectors of atoms and bonds with identical descriptors are reused.
+        node_cache, edge_cache = FeatureCache(), FeatureCache()
         callbacks.update({
-            'node_attributes': lambda mg, ds: np.array(mg.node_attributes(nodes, encoder_nodes), dtype='float32'),
-            'edge_attributes': lambda mg, ds: np.array(mg.edge_attributes(edges, encoder_edges)[1], dtype='float32'),
+            'node_attributes': lambda mg, ds: np.array(
+                mg.node_attributes(nodes, encoder_nodes, cache=node_cache), dtype='float32'),
+            'edge_attributes': lambda mg, ds: np.array(
+                mg.edge_attributes(edges, encoder_edges, cache=edge_cache)[1], dtype='float32'),
             'graph_attributes': lambda mg, ds: np.array(mg.graph_attributes(graph, encoder_graph), dtype='float32')
         })
 
@@ -421,13 +506,17 @@ class MoleculeNetDataset(MemoryGraphDataset):
             mol_interface_class=self._mol_graph_interface,
             logger=self.logger,
             loop_update_info=self._default_loop_update_info,
-            compute_partial_charges=compute_partial_charges
+            compute_partial_charges=compute_partial_charges,
+            num_workers=num_workers
         )
 
         for name, values in value_lists.items():
             self.assign_property(name, values)
 
-        if self.logger.getEffectiveLevel() < 20:
+        if self.logger.getEffectiveLevel() < 20 and _has_worker_processes(num_workers):
+            # Found values of encoders are only updated in the worker processes.
+            self.logger.warning("Can not report encoders, which were used in worker processes.")
+        elif self.logger.getEffectiveLevel() < 20:
             for encoder in [encoder_nodes, encoder_edges, encoder_graph]:
                 for key, value in encoder.items():
                     if hasattr(value, "report"):
@@ -3,12 +3,11 @@ import numpy as np
 import pandas as pd
 from typing import Union, Callable, List, Dict
 from kgcnn.molecule.base import MolGraphInterface
-from kgcnn.data.transform.scaler.molecule import QMGraphLabelScaler
-from sklearn.preprocessing import StandardScaler
 from kgcnn.molecule.serial import deserialize_encoder
+from kgcnn.molecule.encoder import FeatureCache
 from kgcnn.data.base import MemoryGraphDataset
 from kgcnn.molecule.io import parse_list_to_xyz_str, read_xyz_file, \
-    write_mol_block_list_to_sdf, read_mol_list_from_sdf_file, write_list_to_xyz_file
+    write_mol_block_list_to_sdf, read_mol_list_from_sdf_file, write_list_to_xyz_file, XYZFileWriter
 from kgcnn.molecule.methods import global_proton_dict, inverse_global_proton_dict
 from kgcnn.molecule.convert import MolConverter
 from kgcnn.data.moleculenet import map_molecule_callbacks
@@ -156,18 +155,19 @@ class QMDataset(MemoryGraphDataset):
 
         # Try collect single xyz files in directory
         if not os.path.exists(self.file_path_xyz):
-            xyz_list = self.collect_files_in_file_directory(
-                file_column_name=file_column_name, table_file_path=None,
-                read_method_file=self.get_geom_from_xyz_file, update_counter=self._default_loop_update_info,
-                append_file_content=True, read_method_return_list=True
-            )
-            write_list_to_xyz_file(self.file_path_xyz, xyz_list)
+            # Write to temporary file first, so that an incomplete xyz-file is never found.
+            with XYZFileWriter(self.file_path_xyz + ".tmp") as file:
+                for xyz_list in self.iter_files_in_file_directory(
+                        file_column_name=file_column_name, table_file_path=None,
+                        read_method_file=self.get_geom_from_xyz_file, update_counter=self._default_loop_update_info):
+                    file.write(xyz_list[0])
+            os.replace(self.file_path_xyz + ".tmp", self.file_path_xyz)
 
         # Additionally, try to make SDF file. Requires openbabel.
         if make_sdf:
             self.info("Converting xyz to mol information.")
             converter = MolConverter()
-            converter.xyz_to_mol(self.file_path_xyz, self.file_path_mol)
+            converter.xyz_to_mol(self.file_path_xyz, self.file_path_mol, return_mol_list=False)
         return self
 
     def read_in_memory_xyz(self, file_path: str = None,
@@ -208,7 +208,8 @@ class QMDataset(MemoryGraphDataset):
                        sanitize: bool = False,
                        compute_partial_charges: str = None,
                        additional_callbacks: Dict[str, Callable[[MolGraphInterface, dict], None]] = None,
-                       custom_transform: Callable[[MolGraphInterface], MolGraphInterface] = None
+                       custom_transform: Callable[[MolGraphInterface], MolGraphInterface] = None,
+                       num_workers: int = None
                        ):
         """Read SDF-file with chemical structure information into memory.
 
@@ -231,6 +232,8 @@ class QMDataset(MemoryGraphDataset):
             custom_transform (Callable): Custom transformation function to modify the generated
                 :obj:`MolecularGraphRDKit` before callbacks are carried out. The function must take a single
                 :obj:`MolecularGraphRDKit` instance as argument and return a (new) :obj:`MolecularGraphRDKit` instance.
+            num_workers (int): Number of worker processes to compute attributes. See
+                :obj:`kgcnn.data.moleculenet.map_molecule_callbacks` . Default is None.
 
         Returns:
             self
@@ -255,14 +258,17 @@ class QMDataset(MemoryGraphDataset):
         if label_column_name:
             callbacks.update({'graph_labels': lambda mg, ds: ds[label_column_name]})
 
-        # Attributes callbacks.
+        # Attributes callbacks. Feature vectors of atoms and bonds with identical descriptors are reused.
+        node_cache, edge_cache = FeatureCache(), FeatureCache()
         if nodes:
             callbacks.update({
-                'node_attributes': lambda mg, ds: np.array(mg.node_attributes(nodes, encoder_nodes), dtype='float32')
+                'node_attributes': lambda mg, ds: np.array(
+                    mg.node_attributes(nodes, encoder_nodes, cache=node_cache), dtype='float32')
             })
         if edges:
             callbacks.update({
-                'edge_attributes': lambda mg, ds: np.array(mg.edge_attributes(edges, encoder_edges)[1], dtype='float32')
+                'edge_attributes': lambda mg, ds: np.array(
+                    mg.edge_attributes(edges, encoder_edges, cache=edge_cache)[1], dtype='float32')
             })
         if graph:
             callbacks.update({
@@ -280,7 +286,8 @@ class QMDataset(MemoryGraphDataset):
             mol_interface_class=self._mol_graph_interface,
             logger=self.logger,
             loop_update_info=self._default_loop_update_info,
-            compute_partial_charges=compute_partial_charges
+            compute_partial_charges=compute_partial_charges,
+            num_workers=num_workers
         )
 
         for name, values in value_list.items():
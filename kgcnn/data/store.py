@@ -0,0 +1,534 @@
+import logging
+import numpy as np
+from typing import Union, List, Dict, Callable
+from kgcnn.graph.base import GraphDict
+from kgcnn.io.graphlist import GraphListColumnarDirectory
+from kgcnn.io.loader import DisjointBatchCollator, tf_dataset_disjoint_generator
+from kgcnn.data.base import MemoryGraphList, GraphTensorMixin
+
+# Module logger
+logging.basicConfig()
+module_logger = logging.getLogger(__name__)
+module_logger.setLevel(logging.INFO)
+
+
+def _take_rows(values: np.ndarray, row_splits: np.ndarray, indices: np.ndarray) -> tuple:
+    """Gather rows of concatenated values for graph indices. Returns new values and row splits."""
+    starts = row_splits[indices]
+    counts = row_splits[indices + 1] - starts
+    new_row_splits = np.zeros(len(indices) + 1, dtype="int64")
+    np.cumsum(counts, out=new_row_splits[1:])
+    offsets = np.repeat(starts - new_row_splits[:-1], counts)
+    return values[offsets + np.arange(len(offsets))], new_row_splits
+
+
+class GraphStoreBatchCollator(DisjointBatchCollator):
+    r"""Collate batches of graphs of a :obj:`GraphStore` into disjoint tensors.
+
+    The values and row splits are taken from the columns of the store without copying the data of the graphs.
+    See :obj:`kgcnn.io.loader.DisjointBatchCollator` for the arguments.
+    """
+
+    def _load_values(self, graphs):
+        for i, x in self.inputs.items():
+            if not self.is_attributes[i]:
+                continue
+            if self.assignment_to_id[i] is None:
+                self._values[i] = np.asarray(graphs.dense_property(x["name"]), dtype=x["dtype"])
+                continue
+            buffer = graphs._property_buffer(x["name"])
+            if buffer is None:
+                raise ValueError("Property '%s' is not defined for all graphs. Please run `clean()`." % x["name"])
+            self._values[i], self._row_splits[i] = buffer["values"], buffer["row_splits"]
+
+
+class GraphStore(GraphTensorMixin):
+    r"""Compact container for a list of graphs, which stores each graph property as struct of arrays.
+
+    The arrays of a property for all graphs are concatenated along the first axis into one `values` array with
+    `row_splits` , as in :obj:`kgcnn.io.graphlist.GraphListColumnarDirectory` . Properties of rank zero, e.g. graph
+    labels, have row length one. Graphs that do not define a property have row length zero and are flagged by a
+    boolean `mask` . Properties that can not be concatenated, i.e. object arrays or mismatching inner shape, are
+    kept as python list.
+
+    Indexing with `[]` returns a :obj:`GraphDict` of views into the values for a single index and a new
+    :obj:`GraphStore` for slices, index arrays or boolean masks. Modifying the arrays of a view in place changes the
+    store, but properties that are added to the :obj:`GraphDict` are not stored. Use :obj:`set` to change properties.
+    The methods :obj:`get` , :obj:`clean` , :obj:`set_multi_target_labels` and indexing operate on the arrays without
+    looping over single graphs. The store can be passed to the loaders of :obj:`kgcnn.io.loader` .
+
+    .. code-block:: python
+
+        import numpy as np
+        from kgcnn.data.store import GraphStore
+        data = GraphStore([{"node_number": np.array([6, 1]), "graph_labels": np.array(1.0)},
+                           {"node_number": np.array([8])}])
+        data.clean(["node_number", "graph_labels"])
+        print(data[0], data.get("node_number"))
+
+    """
+
+    def __init__(self, graphs: list = None):
+        r"""Initialize a :obj:`GraphStore` from a list of graph dictionaries.
+
+        Args:
+            graphs (list, MemoryGraphList): A list of graph dictionaries. Default is None.
+        """
+        self.logger = module_logger
+        self._num_graphs = 0
+        self._columns = {}
+        if graphs is not None:
+            self._set_graphs(graphs)
+
+    def _set_graphs(self, graphs: list):
+        self._num_graphs = len(graphs)
+        self._columns = {}
+        keys = []
+        for x in graphs:
+            keys += [k for k in x.keys() if k not in keys]
+        for key in keys:
+            self._columns[key] = self._make_column(key, [x[key] if key in x else None for x in graphs])
+
+    def _make_column(self, key: str, values: list) -> Union[dict, None]:
+        """Make column from a list of arrays or None. Returns None, if no graph defines the property."""
+        column = GraphListColumnarDirectory._make_column(values)
+        if column is None and not all(x is None for x in values):
+            self.logger.warning("Can not store property '%s' in array. Store python list instead." % key)
+            column = {"objects": list(values)}
+        return column
+
+    @classmethod
+    def _from_columns(cls, num_graphs: int, columns: dict):
+        store = cls()
+        store._num_graphs = num_graphs
+        store._columns = columns
+        return store
+
+    @classmethod
+    def load(cls, filepath: str, mmap_mode: Union[str, None] = "r"):
+        r"""Open a columnar directory written by :obj:`save` or :obj:`MemoryGraphDataset.save` with
+        :obj:`file_format='columnar'` . The columns are memory-mapped and no graph is touched, so that loading time does
+        not depend on the number of graphs. See :obj:`kgcnn.io.graphlist.GraphListColumnarDirectory` .
+
+        Args:
+            filepath (str): Full path of the columnar directory.
+            mmap_mode (str): Memory-map mode passed to :obj:`np.load` . Default is 'r'.
+
+        Returns:
+            GraphStore: Store of the memory-mapped columns.
+        """
+        directory = GraphListColumnarDirectory(filepath, mmap_mode=mmap_mode)
+        num_graphs = len(directory)
+        columns = {}
+        for key, column in directory.read().items():
+            if isinstance(column, list):
+                columns[key] = {"objects": column}
+                continue
+            mask = column["mask"] if column["mask"] is not None else np.ones(num_graphs, dtype="bool")
+            columns[key] = {"values": np.asarray(column["values"]), "row_splits": column["row_splits"],
+                            "mask": mask, "rank": column["rank"]}
+        return cls._from_columns(num_graphs, columns)
+
+    def save(self, filepath: str):
+        r"""Write the columns of the store to a columnar directory, which can be opened with :obj:`load` .
+
+        Args:
+            filepath (str): Full path of the columnar directory.
+
+        Returns:
+            self
+        """
+        GraphListColumnarDirectory(filepath).write_columns(len(self), {
+            key: column["objects"] if "objects" in column else column for key, column in self._columns.items()})
+        return self
+
+    @property
+    def properties(self) -> list:
+        """List of names of the graph properties in the store."""
+        return list(self._columns.keys())
+
+    def __len__(self):
+        return self._num_graphs
+
+    @property
+    def length(self):
+        """Length of the store."""
+        return len(self)
+
+    def __repr__(self):
+        return "<{} [{} graphs with properties {}]>".format(type(self).__name__, len(self), self.properties)
+
+    def row_splits(self, key: str) -> np.ndarray:
+        r"""Row splits of a graph property along the first axis.
+
+        Args:
+            key (str): Name of the property.
+
+        Returns:
+            np.ndarray: Row splits of shape `(N+1, )` .
+        """
+        return self._columns[key]["row_splits"]
+
+    def _property_lengths(self, key: str) -> np.ndarray:
+        column = self._columns.get(key)
+        if column is None or "row_splits" not in column:
+            return super(GraphStore, self)._property_lengths(key)
+        return np.diff(column["row_splits"])
+
+    def has_property(self, key: str) -> np.ndarray:
+        r"""Boolean mask of the graphs that define a property.
+
+        Args:
+            key (str): Name of the property.
+
+        Returns:
+            np.ndarray: Mask of shape `(N, )` .
+        """
+        if key not in self._columns:
+            return np.zeros(len(self), dtype="bool")
+        column = self._columns[key]
+        if "objects" in column:
+            return np.array([x is not None for x in column["objects"]], dtype="bool")
+        return column["mask"].copy()
+
+    def _graph(self, index: int) -> GraphDict:
+        graph = {}
+        for key, column in self._columns.items():
+            if "objects" in column:
+                if column["objects"][index] is not None:
+                    graph[key] = column["objects"][index]
+                continue
+            if not column["mask"][index]:
+                continue
+            start, stop = column["row_splits"][index], column["row_splits"][index + 1]
+            graph[key] = column["values"][start, ...] if column["rank"] == 0 else column["values"][start:stop]
+        return GraphDict(graph)
+
+    def _take(self, indices: np.ndarray):
+        """New store for an array of graph indices."""
+        columns = {}
+        for key, column in self._columns.items():
+            if "objects" in column:
+                columns[key] = {"objects": [column["objects"][i] for i in indices]}
+                continue
+            values, row_splits = _take_rows(column["values"], column["row_splits"], indices)
+            columns[key] = {"values": values, "row_splits": row_splits, "mask": column["mask"][indices],
+                            "rank": column["rank"]}
+        return self._from_columns(len(indices), columns)
+
+    def _slice(self, start: int, stop: int):
+        """New store for a contiguous range of graphs, whose arrays are views of this store."""
+        columns = {}
+        for key, column in self._columns.items():
+            if "objects" in column:
+                columns[key] = {"objects": column["objects"][start:stop]}
+                continue
+            row_splits = column["row_splits"][start:stop + 1]
+            columns[key] = {"values": column["values"][row_splits[0]:row_splits[-1]],
+                            "row_splits": row_splits - row_splits[0], "mask": column["mask"][start:stop],
+                            "rank": column["rank"]}
+        return self._from_columns(stop - start, columns)
+
+    def __getitem__(self, item) -> Union[GraphDict, "GraphStore"]:
+        if isinstance(item, (int, np.integer)):
+            if item < -len(self) or item >= len(self):
+                raise IndexError("Index '%s' out of range for store of length %s." % (item, len(self)))
+            return self._graph(int(item) % len(self))
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step == 1:
+                return self._slice(start, max(start, stop))
+            return self._take(np.arange(start, stop, step, dtype="int64"))
+        if isinstance(item, (list, tuple, np.ndarray)):
+            item = np.asarray(item)
+            if item.dtype == bool:
+                if len(item) != len(self):
+                    raise IndexError("Boolean mask of length %s does not match store of length %s." % (
+                        len(item), len(self)))
+                return self._take(np.nonzero(item)[0])
+            indices = item.astype("int64")
+            if np.any(indices < -len(self)) or np.any(indices >= len(self)):
+                raise IndexError("Index out of range for store of length %s." % len(self))
+            return self._take(indices % max(len(self), 1))
+        raise TypeError("Unsupported type '%s' for `GraphStore` items." % type(item))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._graph(i)
+
+    def obtain_property(self, key: str) -> Union[List, None]:
+        r"""Returns a list with the values of all the graphs for the property `key` . The arrays are views into the
+        store. If none of the graphs have this property, returns None.
+
+        Args:
+            key (str): The string name of the property to be retrieved for all the graphs.
+        """
+        if key not in self._columns:
+            self.logger.warning("Property '%s' is not set on any graph." % key)
+            return None
+        column = self._columns[key]
+        if "objects" in column:
+            return list(column["objects"])
+        values, row_splits, mask = column["values"], column["row_splits"], column["mask"].tolist()
+        if column["rank"] == 0:
+            return [values[i, ...] if m else None for i, m in zip(row_splits[:-1].tolist(), mask)]
+        return [x if m else None for x, m in zip(np.split(values, row_splits[1:-1]), mask)]
+
+    def dense_property(self, key: str) -> np.ndarray:
+        r"""Property of all graphs stacked along the first axis, i.e. of shape `(N, ...)` . This requires that all
+        graphs define the property with the same shape. The returned array is a view of the store, if possible.
+
+        Args:
+            key (str): Name of the property.
+
+        Returns:
+            np.ndarray: Stacked property.
+        """
+        buffer = self._property_buffer(key)
+        if buffer is None:
+            values = self.obtain_property(key)
+            if values is None or any(x is None for x in values):
+                raise ValueError("Property '%s' is not defined for all graphs." % key)
+            return np.array(values)
+        values, row_lengths = buffer["values"], np.diff(buffer["row_splits"])
+        if buffer["rank"] == 0:
+            return values
+        if len(row_lengths) > 0 and np.any(row_lengths != row_lengths[0]):
+            raise ValueError("Property '%s' does not have the same shape for all graphs." % key)
+        return values.reshape((len(self), int(row_lengths[0]) if len(row_lengths) > 0 else 0) + values.shape[1:])
+
+    def _property_buffer(self, key: str) -> Union[dict, None]:
+        """Values and row splits of a property, if defined for all graphs. Used by :obj:`tensor` ."""
+        column = self._columns.get(key)
+        if column is None or "objects" in column or not np.all(column["mask"]):
+            return None
+        return {"values": column["values"], "row_splits": column["row_splits"], "rank": column["rank"]}
+
+    def assign_property(self, key: str, value: Union[list, np.ndarray]):
+        r"""Assign a property to all graphs in the store. Overwrites an existing property.
+
+        Args:
+            key (str): Name of the property.
+            value (list, np.ndarray): List of numpy arrays or None for property `key` . Or an array with the property
+                of all graphs stacked along the first axis.
+
+        Returns:
+            self
+        """
+        if value is None:
+            return self
+        if not isinstance(value, (list, np.ndarray)):
+            raise TypeError("Expected type `list` to assign graph properties.")
+        if len(self) == 0 and len(self._columns) == 0:
+            self._num_graphs = len(value)
+        if len(self) != len(value):
+            raise ValueError("Can only store graph attributes from list with same length.")
+        if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+            # Stacked array of rank zero or fixed shape properties.
+            num_rows = value.shape[1] if value.ndim > 1 else 1
+            self._columns[key] = {
+                "values": value.reshape((-1,) + value.shape[2:]) if value.ndim > 1 else value,
+                "row_splits": np.arange(len(value) + 1, dtype="int64") * num_rows,
+                "mask": np.ones(len(value), dtype="bool"), "rank": value.ndim - 1}
+            return self
+        column = self._make_column(key, [np.asarray(x) if x is not None else None for x in value])
+        if column is None:
+            self._columns.pop(key, None)
+        else:
+            self._columns[key] = column
+        return self
+
+    def remove_property(self, key: str):
+        r"""Remove a property from all graphs.
+
+        Args:
+            key (str): Name of the property.
+
+        Returns:
+            self
+        """
+        self._columns.pop(key, None)
+        return self
+
+    def clean(self, inputs: Union[list, str]):
+        r"""Remove all graphs, which do not define at least one of the properties in :obj:`inputs` or for which the
+        property is empty.
+
+        Args:
+            inputs (list): A list of property names or a list of dicts that specify the name with 'name' key.
+
+        Returns:
+            invalid_graphs (np.ndarray): A list of graph indices that do not have the required properties and which
+                have been removed.
+        """
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        is_invalid = np.zeros(len(self), dtype="bool")
+        for item in inputs:
+            item_name = item["name"] if isinstance(item, dict) else item
+            if item_name not in self._columns:
+                self.logger.warning("Can not clean property '%s' as it was not assigned to any graph." % item)
+                continue
+            column = self._columns[item_name]
+            if "objects" in column:
+                is_valid = np.array([isinstance(x, np.ndarray) and (x.ndim == 0 or len(x) > 0)
+                                     for x in column["objects"]], dtype="bool")
+            else:
+                is_valid = np.logical_and(column["mask"], np.diff(column["row_splits"]) > 0)
+            is_invalid = np.logical_or(is_invalid, np.logical_not(is_valid))
+        invalid_graphs = np.flip(np.nonzero(is_invalid)[0])
+        if len(invalid_graphs) > 0:
+            self.logger.warning("Found %s invalid graphs for properties. Removing graphs '%s'." % (
+                len(invalid_graphs), invalid_graphs))
+            other = self._take(np.nonzero(np.logical_not(is_invalid))[0])
+            self._num_graphs, self._columns = other._num_graphs, other._columns
+        else:
+            self.logger.info("No invalid graphs for assigned properties found.")
+        return invalid_graphs
+
+    def set_multi_target_labels(self, graph_labels: str = "graph_labels", multi_target_indices: list = None,
+                                data_unit: Union[str, list] = None):
+        r"""Select multiple targets in labels. See :obj:`MemoryGraphDataset.set_multi_target_labels` .
+
+        Args:
+            graph_labels (str): Name of the property that holds multiple targets.
+            multi_target_indices (list): List of indices of targets to select.
+            data_unit (str, list): Optional list of data units for all labels in `graph_labels` .
+
+        Returns:
+            tuple: List of label names and label units for each target.
+        """
+        labels = self.dense_property(graph_labels)
+        label_names = self.label_names if hasattr(self, "label_names") else None
+        label_units = self.label_units if hasattr(self, "label_units") else None
+        if data_unit is not None:
+            label_units = data_unit
+        if len(labels.shape) <= 1:
+            labels = np.expand_dims(labels, axis=-1)
+        if multi_target_indices is not None:
+            labels = labels[:, multi_target_indices]
+            if label_names is not None:
+                label_names = [label_names[i] for i in multi_target_indices]
+            if label_units is not None:
+                label_units = [label_units[i] for i in multi_target_indices]
+        self.logger.info("Labels '%s' in '%s' have shape '%s'." % (label_names, label_units, labels.shape))
+        self.assign_property(graph_labels, labels)
+        return label_names, label_units
+
+    def append_multiple(self, graphs: list):
+        r"""Append a list of graphs to the store. The arrays of all properties are reallocated once, so that single
+        graphs should not be appended one by one.
+
+        Args:
+            graphs (list): List of graph dictionaries.
+
+        Returns:
+            self
+        """
+        if len(graphs) == 0:
+            return self
+        other = graphs if isinstance(graphs, GraphStore) else GraphStore(graphs)
+        columns = {}
+        for key in self.properties + [x for x in other.properties if x not in self._columns]:
+            a, b = self._columns.get(key), other._columns.get(key)
+            if a is not None and b is not None and "objects" not in a and "objects" not in b and (
+                    a["rank"] == b["rank"] and a["values"].shape[1:] == b["values"].shape[1:]):
+                columns[key] = {
+                    "values": np.concatenate([a["values"], b["values"]], axis=0),
+                    "row_splits": np.concatenate([a["row_splits"], b["row_splits"][1:] + a["row_splits"][-1]]),
+                    "mask": np.concatenate([a["mask"], b["mask"]]), "rank": a["rank"]}
+                continue
+            if a is not None and b is None and "objects" not in a:
+                columns[key] = {
+                    "values": a["values"],
+                    "row_splits": np.pad(a["row_splits"], (0, len(other)), mode="edge"),
+                    "mask": np.pad(a["mask"], (0, len(other))), "rank": a["rank"]}
+                continue
+            if a is None and b is not None and "objects" not in b:
+                columns[key] = {
+                    "values": b["values"],
+                    "row_splits": np.pad(b["row_splits"], (len(self), 0)),
+                    "mask": np.pad(b["mask"], (len(self), 0)), "rank": b["rank"]}
+                continue
+            values_a = self.obtain_property(key) if a is not None else [None] * len(self)
+            values_b = other.obtain_property(key) if b is not None else [None] * len(other)
+            columns[key] = self._make_column(key, values_a + values_b)
+        self._num_graphs += len(other)
+        self._columns = columns
+        return self
+
+    def append(self, graph: dict):
+        r"""Append a single graph to the store. Prefer :obj:`append_multiple` for many graphs.
+
+        Args:
+            graph (dict): Graph dictionary.
+
+        Returns:
+            self
+        """
+        return self.append_multiple([graph])
+
+    def copy(self):
+        """Copy the arrays of the store."""
+        return self._from_columns(len(self), {
+            key: {k: (list(v) if k == "objects" else (v.copy() if isinstance(v, np.ndarray) else v))
+                  for k, v in column.items()} for key, column in self._columns.items()})
+
+    def to_graph_list(self) -> MemoryGraphList:
+        r"""Make a :obj:`MemoryGraphList` of the graphs, whose arrays are views into the store.
+
+        Returns:
+            MemoryGraphList: List of graphs.
+        """
+        graphs = [{} for _ in range(len(self))]
+        for key in self.properties:
+            for x, value in zip(graphs, self.obtain_property(key)):
+                if value is not None:
+                    x[key] = value
+        return MemoryGraphList(graphs)
+
+    def map_list(self, method: Union[str, Callable, dict], **kwargs):
+        r"""Map a method over the graphs of the store. The graphs are modified as :obj:`MemoryGraphList` , which is
+        stored again afterwards. See :obj:`MemoryGraphList.map_list` for arguments.
+
+        Args:
+            method (str, dict, Callable): Name of the :obj:`GraphDict` method or a preprocessor.
+            kwargs: Kwargs for :obj:`MemoryGraphList.map_list` .
+
+        Returns:
+            self
+        """
+        graphs = self.to_graph_list()
+        graphs.map_list(method, **kwargs)
+        self._set_graphs(graphs)
+        return self
+
+    # Alias of internal assign and obtain property.
+    set = assign_property
+    get = obtain_property
+
+    def batch_collator(self, inputs: Union[list, dict], **kwargs) -> GraphStoreBatchCollator:
+        r"""Make a collator that takes batches from the arrays of the store. Used by the loaders of
+        :obj:`kgcnn.io.loader` .
+
+        Args:
+            inputs: List or dict of keras input layer configs.
+            kwargs: Kwargs for :obj:`GraphStoreBatchCollator` .
+
+        Returns:
+            GraphStoreBatchCollator: Collator for this store.
+        """
+        return GraphStoreBatchCollator(self, inputs=inputs, **kwargs)
+
+    def tf_dataset_disjoint(self, inputs, **kwargs):
+        r"""Return generator via :obj:`tf.data.Dataset` from this store.
+        Uses :obj:`kgcnn.io.loader.tf_dataset_disjoint_generator`
+
+        Args:
+            inputs: List or dict of keras input layer configs.
+            kwargs: Kwargs for :obj:`tf_dataset_disjoint_generator`
+
+        Returns:
+            tf.data.Dataset: Dataset from generator.
+        """
+        return tf_dataset_disjoint_generator(self, inputs=inputs, **kwargs)
@@ -1,10 +1,10 @@
 import pickle
 import logging
-import tensorflow as tf
 import numpy as np
 import yaml
 import json
 import os
+from collections import Counter
 from importlib.machinery import SourceFileLoader
 
 
@@ -153,6 +153,7 @@ def ragged_tensor_from_nested_numpy(numpy_list: list, dtype: str = None, row_spl
     Returns:
         tf.RaggedTensor: Ragged tensor of former nested list of numpy arrays.
     """
+    import tensorflow as tf
     return tf.RaggedTensor.from_row_lengths(
         np.concatenate(numpy_list, axis=0, dtype=dtype), np.array([len(x) for x in numpy_list], dtype=row_splits_dtype))
 
@@ -179,3 +180,53 @@ def pad_np_array_list_batch_dim(values: list, dtype: str = None):
     if dtype is not None:
         padded = padded.astype(dtype=dtype)
     return padded, mask
+
+
+def get_property_statistics(values: list) -> dict:
+    r"""Compute presence, length and shape of a graph property for a list of graphs. The shapes are collected in a
+    single pass over the list, all further checks are done on arrays.
+
+    .. code-block:: python
+
+        import numpy as np
+        stats = get_property_statistics([np.array([[0, 1]]), None, np.zeros((0, 2))])
+        print(stats["is_valid"])
+        # [ True False False]
+
+    Args:
+        values (list): List of numpy arrays or None of a property for each graph.
+
+    Returns:
+        dict: Dictionary with boolean arrays 'is_present', 'is_array' and 'is_valid' of shape `(N, )` , where valid
+            means a numpy array that is not empty along the first axis. Further 'rank' and 'length' of the first axis
+            with -1 for graphs without array or of rank zero, and 'inner_shapes' that counts the graphs for each shape
+            without first axis.
+    """
+    shapes = [x.shape if isinstance(x, np.ndarray) else (None if x is None else False) for x in values]
+    num_graphs = len(shapes)
+    is_present = np.fromiter((s is not None for s in shapes), dtype="bool", count=num_graphs)
+    rank = np.fromiter((len(s) if s else (0 if s == () else -1) for s in shapes), dtype="int64", count=num_graphs)
+    length = np.fromiter((s[0] if s else -1 for s in shapes), dtype="int64", count=num_graphs)
+    is_array = rank >= 0
+    is_valid = np.logical_and(is_array, np.logical_or(rank == 0, length > 0))
+    inner_shapes = dict(Counter([s[1:] for s in shapes if s]))
+    return {"is_present": is_present, "is_array": is_array, "is_valid": is_valid, "rank": rank, "length": length,
+            "inner_shapes": inner_shapes}
+
+
+def format_property_statistics(name: str, stats: dict) -> str:
+    r"""Summary of :obj:`get_property_statistics` for logging.
+
+    Args:
+        name (str): Name of the property.
+        stats (dict): Output of :obj:`get_property_statistics` .
+
+    Returns:
+        str: Summary of the property.
+    """
+    num_missing = int(np.sum(np.logical_not(stats["is_present"])))
+    num_no_array = int(np.sum(np.logical_and(stats["is_present"], np.logical_not(stats["is_array"]))))
+    num_empty = int(np.sum(np.logical_and(stats["is_array"], np.logical_not(stats["is_valid"]))))
+    ranks = np.unique(stats["rank"][stats["is_array"]]).tolist()
+    return "Property '%s' of %s graphs: %s missing, %s not numpy array, %s empty, rank %s, inner shapes %s." % (
+        name, len(stats["is_present"]), num_missing, num_no_array, num_empty, ranks, list(stats["inner_shapes"]))
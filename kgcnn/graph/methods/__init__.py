@@ -1,5 +1,5 @@
 from ._adj import (
-    get_angle_indices, coordinates_to_distancematrix, invert_distance,
+    get_angle_indices, get_angle_indices_batch, coordinates_to_distancematrix, invert_distance,
     define_adjacency_from_distance, sort_edge_indices, get_angle, add_edges_reverse_indices,
     rescale_edge_weights_degree_sym, add_self_loops_to_edge_indices, compute_reverse_edges_index_map,
     distance_to_gauss_basis, get_angle_between_edges, convert_scaled_adjacency_to_list
@@ -7,22 +7,22 @@ from ._adj import (
 from ._geom import (
     get_principal_moments_of_inertia,
     shift_coordinates_to_unit_cell, distance_for_range_indices, distance_for_range_indices_periodic,
-    coulomb_matrix_to_inverse_distance_proton, coordinates_from_distance_matrix
+    coulomb_matrix_to_inverse_distance_proton, coordinates_from_distance_matrix, range_neighbour_kdtree
 )
 from ._periodic import (
-    range_neighbour_lattice
+    range_neighbour_lattice, range_neighbour_lattice_batch
 )
 
 __all__ = [
     # adj
-    "get_angle_indices", "coordinates_to_distancematrix", "invert_distance",
+    "get_angle_indices", "get_angle_indices_batch", "coordinates_to_distancematrix", "invert_distance",
     "define_adjacency_from_distance", "sort_edge_indices", "get_angle", "add_edges_reverse_indices",
     "rescale_edge_weights_degree_sym", "add_self_loops_to_edge_indices", "compute_reverse_edges_index_map",
     "distance_to_gauss_basis", "get_angle_between_edges", "convert_scaled_adjacency_to_list",
     # geom
     "get_principal_moments_of_inertia",
     "shift_coordinates_to_unit_cell", "distance_for_range_indices", "distance_for_range_indices_periodic",
-    "coulomb_matrix_to_inverse_distance_proton", "coordinates_from_distance_matrix",
+    "coulomb_matrix_to_inverse_distance_proton", "coordinates_from_distance_matrix", "range_neighbour_kdtree",
     # periodic
-    "range_neighbour_lattice"
+    "range_neighbour_lattice", "range_neighbour_lattice_batch"
 ]
@@ -297,11 +297,67 @@ def make_adjacency_from_edge_indices(edge_indices, edge_values=None, shape=None)
     return out_adj
 
 
+def _check_edge_pairing(edge_pairing: str):
+    """Check edge pairing string and return positions of variable index 'k', fixed index and fixed edge index."""
+    if "k" not in edge_pairing:
+        raise ValueError("Edge pairing must have index 'k'.")
+    if "i" not in edge_pairing and "j" not in edge_pairing:
+        raise ValueError("Edge pairing must have at least one fix index 'i' or 'j'.")
+    pos_k = 0 if edge_pairing[0] == "k" else 1
+    pos_fix = 0 if edge_pairing[0] != "k" else 1
+    pos_ij = 0 if "i" in edge_pairing else 1
+    return pos_k, pos_fix, pos_ij
+
+
+def _get_angle_edge_pairs(idx: np.ndarray, allow_multi_edges: bool, allow_self_edges: bool,
+                          allow_reverse_edges: bool, pos_fix: int, pos_ij: int):
+    r"""Find all edge pairs `(n, m)` forming an angle by sorting edges by their fixed index and segmenting the sorted
+    edges for each query edge, similar to a CSR matrix. Pairs are ordered by `n` and then by `m` .
+
+    Args:
+        idx (np.ndarray): Edge indices of shape `(N, 2)` .
+        allow_multi_edges (bool): Whether to keep pairs with same node indices.
+        allow_self_edges (bool): Whether to pair each edge with itself.
+        allow_reverse_edges (bool): Whether to keep pairs with reverse node indices.
+        pos_fix (int): Position of the index in edge `m` that must match.
+        pos_ij (int): Position of the index in edge `n` that must match.
+
+    Returns:
+        tuple: Edge labels `n` and `m` of shape `(M, )` .
+    """
+    num_edges = len(idx)
+    keys = idx[:, pos_fix]
+    order = np.argsort(keys, kind="stable")
+    keys_sorted = keys[order]
+    queries = idx[:, pos_ij]
+    starts = np.searchsorted(keys_sorted, queries, side="left")
+    counts = np.searchsorted(keys_sorted, queries, side="right") - starts
+    n = np.repeat(np.arange(num_edges), counts)
+    offsets = np.arange(len(n)) - np.repeat(np.cumsum(counts) - counts, counts)
+    m = order[np.repeat(starts, counts) + offsets]
+    mask = n != m
+    if not allow_multi_edges:
+        mask = np.logical_and(mask, np.logical_or(idx[m, 0] != idx[n, 0], idx[m, 1] != idx[n, 1]))
+    if not allow_reverse_edges:
+        mask = np.logical_and(mask, np.logical_or(idx[m, 0] != idx[n, 1], idx[m, 1] != idx[n, 0]))
+    n, m = n[mask], m[mask]
+    if allow_self_edges:
+        # Self pairing overrides all conditions and is added for every edge.
+        n = np.concatenate([n, np.arange(num_edges)])
+        m = np.concatenate([m, np.arange(num_edges)])
+        order_nm = np.lexsort((m, n))
+        n, m = n[order_nm], m[order_nm]
+    return n, m
+
+
 def get_angle_indices(idx, check_sorted: bool = True, allow_multi_edges: bool = False,
                       allow_self_edges: bool = False, allow_reverse_edges: bool = False,
                       edge_pairing: str = "jk"):
     r"""Compute index list for edge-pairs forming an angle. Not for batches, only for single instance.
 
+    Edge pairs are found by sorting edges by their fixed index, which requires :math:`O(E \cdot d)` operations
+    with :math:`d` being the node degree.
+
     Args:
         idx (np.ndarray): List of edge indices referring to nodes of shape `(N, 2)`
         check_sorted (bool): Whether to sort for new angle indices. Default is True.
@@ -325,54 +381,15 @@ def get_angle_indices(idx, check_sorted: bool = True, allow_multi_edges: bool =
         return None, None, None
     if len(idx) == 0:
         return np.array([]), np.array([]), np.array([])
-    # Labeling edges.
-    label_ij = np.expand_dims(np.arange(len(idx)), axis=-1)
-    # Find edge pairing indices.
-    if "k" not in edge_pairing:
-        raise ValueError("Edge pairing must have index 'k'.")
-    if "i" not in edge_pairing and "j" not in edge_pairing:
-        raise ValueError("Edge pairing must have at least one fix index 'i' or 'j'.")
-    pos_k = 0 if edge_pairing[0] == "k" else 1
-    pos_fix = 0 if edge_pairing[0] != "k" else 1
-    pos_ij = 0 if "i" in edge_pairing else 1
-
-    idx_ijk = []  # index triples that form an angle as (i, j, k)
-    idx_ij_k = []  # New indices that refer to edges to form an angle as ij, `edge_pairing`
-    for n, ij in enumerate(idx):
-        matching_edges = idx
-        matching_labels = label_ij
+    pos_k, pos_fix, pos_ij = _check_edge_pairing(edge_pairing)
+    n, m = _get_angle_edge_pairs(
+        idx, allow_multi_edges=allow_multi_edges, allow_self_edges=allow_self_edges,
+        allow_reverse_edges=allow_reverse_edges, pos_fix=pos_fix, pos_ij=pos_ij)
 
-        # Condition to find matching xk or kx.
-        mask = matching_edges[:, pos_fix] == ij[pos_ij]
-
-        if not allow_multi_edges:
-            mask = np.logical_and(mask, np.logical_or(matching_edges[:, 0] != ij[0], matching_edges[:, 1] != ij[1]))
-
-        if not allow_reverse_edges:
-            mask = np.logical_and(mask, np.logical_or(matching_edges[:, 0] != ij[1], matching_edges[:, 1] != ij[0]))
-
-        if allow_self_edges:
-            mask[n] = True
-        else:
-            mask[n] = False
-
-        matching_edges, matching_labels = matching_edges[mask], matching_labels[mask]  # apply mask
-
-        if len(matching_edges) == 0:
-            idx_ijk.append(np.empty((0, 3), dtype=idx.dtype))
-            idx_ij_k.append(np.empty((0, 2), dtype=idx.dtype))
-            continue
-
-        # All combos for edge ij
-        combos_ik = np.concatenate(
-            [np.repeat([ij], len(matching_edges), axis=0), np.expand_dims(matching_edges[:, pos_k], axis=-1)], axis=-1)
-        combos_label = np.concatenate(
-            [np.repeat([[n]], len(matching_labels), axis=0), matching_labels], axis=-1)
-        idx_ijk.append(combos_ik)
-        idx_ij_k.append(combos_label)
-
-    idx_ijk = np.concatenate(idx_ijk, axis=0)
-    idx_ij_k = np.concatenate(idx_ij_k, axis=0)
+    # index triples that form an angle as (i, j, k) and indices that refer to edges as ij, `edge_pairing`.
+    idx_ijk = np.concatenate([idx[n], np.expand_dims(idx[m, pos_k], axis=-1)], axis=-1)
+    label_dtype = np.result_type(idx.dtype, np.int64) if len(n) > 0 else idx.dtype
+    idx_ij_k = np.stack([n, m], axis=-1).astype(label_dtype)
 
     if check_sorted:
         order1 = np.argsort(idx_ij_k[:, 1], axis=0, kind='mergesort')  # stable!
@@ -385,6 +402,73 @@ def get_angle_indices(idx, check_sorted: bool = True, allow_multi_edges: bool =
     return idx, idx_ijk, idx_ij_k
 
 
+def get_angle_indices_batch(idx_list: list, check_sorted: bool = True, allow_multi_edges: bool = False,
+                            allow_self_edges: bool = False, allow_reverse_edges: bool = False,
+                            edge_pairing: str = "jk"):
+    r"""Compute index list for edge-pairs forming an angle for a list of graphs, e.g. from a :obj:`MemoryGraphList` .
+    The edge indices of all graphs are concatenated with disjoint node indices and processed in one call, which gives
+    the same output as :obj:`get_angle_indices` for each graph.
+
+    .. code-block:: python
+
+        from kgcnn.graph.methods import get_angle_indices_batch
+        _, angle_nodes, angle_indices = get_angle_indices_batch(graphs.get("range_indices"))
+        graphs.set("angle_indices", angle_indices)
+
+    Args:
+        idx_list (list): List of edge indices referring to nodes of shape `(N, 2)` for each graph. Can contain None.
+        check_sorted (bool): Whether to sort for new angle indices. Default is True.
+        allow_self_edges (bool): Whether to allow the exact same edge in an angle pairing. Overrides multi and reverse
+            edge checking.
+        allow_multi_edges (bool): Whether to keep angle pairs with same node indices,
+            such as angle pairings of sort `ij`, `ij`.
+        allow_reverse_edges (bool): Whether to keep angle pairs with reverse node indices,
+            such as angle pairings of sort `ij`, `ji`.
+        edge_pairing (str): Determines which edge pairs for angle computation are chosen. Default is 'jk'.
+
+    Returns:
+        tuple: Lists of idx, idx_ijk, idx_ijk_ij for each graph as in :obj:`get_angle_indices` .
+    """
+    out_idx, out_ijk, out_ij_k = [], [], []
+    batch = [i for i, x in enumerate(idx_list) if x is not None and len(x) > 0]
+    for x in idx_list:
+        out = get_angle_indices(x) if x is None or len(x) == 0 else (x, None, None)
+        out_idx.append(out[0])
+        out_ijk.append(out[1])
+        out_ij_k.append(out[2])
+    if len(batch) == 0:
+        return out_idx, out_ijk, out_ij_k
+
+    pos_k, pos_fix, pos_ij = _check_edge_pairing(edge_pairing)
+    edges = [np.asarray(idx_list[i]) for i in batch]
+    num_edges = np.array([len(x) for x in edges], dtype="int64")
+    num_nodes = np.array([np.amax(x) + 1 for x in edges], dtype="int64")
+    edge_offsets = np.cumsum(num_edges) - num_edges
+    node_offsets = np.cumsum(num_nodes) - num_nodes
+    idx = np.concatenate(edges, axis=0).astype("int64") + np.expand_dims(np.repeat(node_offsets, num_edges), axis=-1)
+    n, m = _get_angle_edge_pairs(
+        idx, allow_multi_edges=allow_multi_edges, allow_self_edges=allow_self_edges,
+        allow_reverse_edges=allow_reverse_edges, pos_fix=pos_fix, pos_ij=pos_ij)
+
+    # Graph of each pair. Pairs are sorted by `n` and therefore by graph.
+    graph_id = np.repeat(np.arange(len(batch)), num_edges)[n]
+    idx_ijk = np.concatenate([idx[n], np.expand_dims(idx[m, pos_k], axis=-1)], axis=-1)
+    idx_ijk = idx_ijk - np.expand_dims(node_offsets[graph_id], axis=-1)
+    idx_ij_k = np.stack([n, m], axis=-1) - np.expand_dims(edge_offsets[graph_id], axis=-1)
+    splits = np.searchsorted(graph_id, np.arange(1, len(batch)))
+    for j, (i, ijk, ij_k) in enumerate(zip(batch, np.split(idx_ijk, splits), np.split(idx_ij_k, splits))):
+        ijk = ijk.astype(edges[j].dtype)
+        ij_k = ij_k.astype(np.result_type(edges[j].dtype, np.int64) if len(ij_k) > 0 else edges[j].dtype)
+        if check_sorted:
+            order1 = np.argsort(ij_k[:, 1], axis=0, kind='mergesort')
+            ij_k, ijk = ij_k[order1], ijk[order1]
+            order2 = np.argsort(ij_k[:, 0], axis=0, kind='mergesort')
+            ij_k, ijk = ij_k[order2], ijk[order2]
+        out_ijk[i] = ijk
+        out_ij_k[i] = ij_k
+    return out_idx, out_ijk, out_ij_k
+
+
 def get_angle(coord, indices):
     r"""Compute angle between three points defined by the indices for points i, j, k. Requires mode coordinates.
     With the definition of vector directions :math:`\vec{x}_{ij} = \vec{x}_{i}-\vec{x}_{j}` and
@@ -1,4 +1,5 @@
 import numpy as np
+from scipy.spatial import cKDTree
 from typing import Union
 
 
@@ -276,3 +277,84 @@ def distance_for_range_indices_periodic(coordinates: np.ndarray,
             dist = np.expand_dims(dist, axis=-1)
     return dist
 
+
+def range_neighbour_kdtree(coordinates: np.ndarray, max_distance: Union[float, None] = 4.0,
+                           max_neighbours: Union[int, None] = None, exclusive: bool = True,
+                           self_loops: bool = False) -> list:
+    r"""Neighbour list from coordinates by distance and number of neighbours using a :obj:`scipy.spatial.cKDTree` .
+    Gives the same indices and distances as :obj:`define_adjacency_from_distance` on the full distance matrix
+    but does not require memory of shape `(N, N)` . Neighbours with equal distance at the border of
+    :obj:`max_neighbours` can be chosen differently.
+
+    Args:
+        coordinates (np.ndarray): Coordinates of shape `(N, 3)` .
+        max_distance (float, optional): Maximum distance to allow connections, can also be None. Defaults to 4.0.
+        max_neighbours (int, optional): Maximum number of neighbours, can also be None. Default is None.
+        exclusive (bool, optional): Whether both max distance and neighbours must be fulfilled. Defaults to True.
+        self_loops (bool, optional): Allow self-loops. Defaults to False.
+
+    Returns:
+        list: [indices, distances]
+
+            - indices (np.ndarray): Indices of shape `(M, 2)` sorted by first and then second index.
+            - distances (np.ndarray): Distances of shape `(M, )` .
+    """
+    coordinates = np.asarray(coordinates)
+    num_nodes = len(coordinates)
+    # Conditions that are either not set or do not restrict connections are 'all' or 'none' in non-exclusive mode.
+    all_by_distance = max_distance is None or not np.isfinite(max_distance)
+    all_by_neighbours = max_neighbours is None or max_neighbours >= num_nodes
+    none_by_distance = max_distance is None and not exclusive
+    none_by_neighbours = max_neighbours is None and not exclusive
+    tree = cKDTree(coordinates) if num_nodes > 0 else None
+
+    def _exact_distance(ind):
+        return np.sqrt(np.sum(np.square(coordinates[ind[:, 0]] - coordinates[ind[:, 1]]), axis=-1))
+
+    def _all_pairs():
+        return np.indices((num_nodes, num_nodes)).transpose((1, 2, 0)).reshape((-1, 2))
+
+    def _radius_pairs():
+        # Small tolerance for tree query. Condition is checked with exact distance.
+        pairs = tree.sparse_distance_matrix(tree, max_distance * (1.0 + 1e-8) + 1e-12, output_type="ndarray")
+        ind = np.stack([pairs["i"], pairs["j"]], axis=-1).astype("int64")
+        return ind[_exact_distance(ind) < max_distance]
+
+    def _knn_pairs(ind=None):
+        num_k = min(max_neighbours + 1, num_nodes)
+        if ind is None:
+            _, j = tree.query(coordinates, k=num_k)
+            j = np.reshape(j, (num_nodes, -1))
+            ind = np.stack([np.repeat(np.arange(num_nodes), j.shape[1]), j.flatten()], axis=-1).astype("int64")
+        # Order in each row by distance and keep the first `num_k` .
+        order = np.lexsort((ind[:, 1], _exact_distance(ind), ind[:, 0]))
+        ind = ind[order]
+        row_start = np.searchsorted(ind[:, 0], ind[:, 0], side="left")
+        return ind[(np.arange(len(ind)) - row_start) < num_k]
+
+    if num_nodes == 0:
+        indices = np.zeros((0, 2), dtype="int64")
+    elif exclusive:
+        if all_by_distance and all_by_neighbours:
+            indices = _all_pairs()
+        elif all_by_distance:
+            indices = _knn_pairs()
+        elif all_by_neighbours:
+            indices = _radius_pairs()
+        else:
+            indices = _knn_pairs(_radius_pairs())
+    else:
+        if (all_by_distance and not none_by_distance) or (all_by_neighbours and not none_by_neighbours):
+            indices = _all_pairs()
+        else:
+            indices = [np.zeros((0, 2), dtype="int64")]
+            if not none_by_distance:
+                indices.append(_radius_pairs())
+            if not none_by_neighbours:
+                indices.append(_knn_pairs())
+            indices = np.unique(np.concatenate(indices, axis=0), axis=0)
+
+    if not self_loops:
+        indices = indices[indices[:, 0] != indices[:, 1]]
+    indices = indices[np.lexsort((indices[:, 1], indices[:, 0]))]
+    return [indices, _exact_distance(indices)]
@@ -182,6 +182,233 @@ def range_neighbour_lattice(coordinates: np.ndarray, lattice: np.ndarray,
     return [out_indices, offset_vectors, distances]
 
 
+def range_neighbour_lattice_batch(coordinates: np.ndarray, lattices: np.ndarray, row_lengths: np.ndarray,
+                                  max_distance: Union[float, None] = 4.0,
+                                  max_neighbours: Union[int, None] = None,
+                                  self_loops: bool = False,
+                                  exclusive: bool = True,
+                                  numerical_tol: float = 1e-8,
+                                  super_cell_tol_factor: float = 0.25,
+                                  max_pairs_per_chunk: int = 2**20
+                                  ) -> list:
+    r"""Generate range connections for many primitive unit cells in periodic lattices at once.
+
+    Takes the concatenated coordinates of all structures and gives the same connections as
+    :obj:`range_neighbour_lattice` for each structure, but without calling it for every structure.
+    All atom pairs and lattice images within the search radius are computed in vectorized chunks of structures.
+    The search radius and its extension for :obj:`max_neighbours` follow :obj:`range_neighbour_lattice` per structure.
+    Connections are sorted by central atom and distance. Neighbours with equal distance can be in a different order
+    than from :obj:`range_neighbour_lattice` and distances can differ by numerical round-off.
+
+    .. code-block:: python
+
+        import numpy as np
+        from kgcnn.graph.methods import range_neighbour_lattice_batch
+
+        coordinates = [np.array([[0.1, 0.0, 0.0], [0.5, 0.5, 0.5]]), np.array([[0.0, 0.0, 0.0]])]
+        lattices = [np.array([[1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 0.0, 1.0]]), 2.0 * np.eye(3)]
+        indices, images, dist, row_splits = range_neighbour_lattice_batch(
+            np.concatenate(coordinates), np.array(lattices), np.array([len(x) for x in coordinates]))
+        indices_of_second = indices[row_splits[1]:row_splits[2]]
+
+    Args:
+        coordinates (np.ndarray): Concatenated coordinates of nodes of all structures of shape `(N, 3)` .
+        lattices (np.ndarray): Lattice matrices of real space lattice vectors of shape `(B, 3, 3)` .
+            The lattice vectors must be given in rows of the matrix!
+        row_lengths (np.ndarray): Number of nodes of each structure of shape `(B, )` .
+        max_distance (float, optional): Maximum distance to allow connections, can also be None. Defaults to 4.0.
+        max_neighbours (int, optional): Maximum number of allowed neighbours for each central atom. Default is None.
+        self_loops (bool, optional): Allow self-loops between the same central node. Defaults to False.
+        exclusive (bool): Whether both distance and maximum neighbours must be fulfilled. Default is True.
+        numerical_tol  (float): Numerical tolerance for distance cut-off. Default is 1e-8.
+        super_cell_tol_factor (float): Tolerance to increase for search for neighbours. Default is 0.25.
+        max_pairs_per_chunk (int): Maximum number of candidate atom pairs and images to compute at once.
+            Limits the memory. Default is 2**20.
+
+    Returns:
+        list: [indices, images, dist, row_splits] , where indices of shape `(M, 2)` refer to the nodes of each
+            structure and `row_splits` of shape `(B+1, )` gives the connections of each structure.
+    """
+    # Require either max_distance or max_neighbours to be specified.
+    if max_distance is None and max_neighbours is None:
+        raise ValueError("Need to specify either `max_distance` or `max_neighbours` or both.")
+
+    coordinates = np.asarray(coordinates, dtype="float").reshape((-1, 3))
+    lattices = np.asarray(lattices, dtype="float").reshape((-1, 3, 3))
+    row_lengths = np.asarray(row_lengths, dtype="int64").reshape(-1)
+    if len(lattices) != len(row_lengths) or np.sum(row_lengths) != len(coordinates):
+        raise ValueError("Got %s lattices and %s row lengths for %s coordinates." % (
+            len(lattices), len(row_lengths), len(coordinates)))
+    num_structs = len(row_lengths)
+    node_splits = np.concatenate([np.zeros(1, dtype="int64"), np.cumsum(row_lengths)])
+
+    # Search radius per structure as in `range_neighbour_lattice` .
+    with np.errstate(divide="ignore"):
+        volume_unit_cell = np.sum(np.abs(np.cross(lattices[:, 0], lattices[:, 1]) * lattices[:, 2]), axis=-1)
+        density_unit_cell = row_lengths / volume_unit_cell
+        if max_neighbours is not None:
+            estimated_nn_radius = np.abs(np.cbrt(max_neighbours / density_unit_cell / np.pi * 3 / 4))
+        else:
+            estimated_nn_radius = None
+    if max_distance is None:
+        radius = estimated_nn_radius
+    elif max_neighbours is None:
+        radius = np.full(num_structs, float(max_distance))
+    elif exclusive:
+        radius = np.minimum(max_distance, estimated_nn_radius)
+    else:
+        radius = np.maximum(max_distance, estimated_nn_radius)
+
+    _max_iter_nn_test = 100
+    found = []
+    pending = np.arange(num_structs)[row_lengths > 0]
+    for _ in range(0, _max_iter_nn_test):
+        if len(pending) == 0:
+            break
+        struct_id, index1, index2, images, distances = _find_points_in_spheres_batch(
+            coordinates, lattices, node_splits, pending, radius[pending], numerical_tol, max_pairs_per_chunk)
+        # Remove self_loops:
+        if not self_loops:
+            no_self_loops = ~np.isclose(distances, 0)
+            struct_id, index1, index2, images, distances = [
+                x[no_self_loops] for x in [struct_id, index1, index2, images, distances]]
+        # Candidates are generated in order of structure, atom pair and image. Equal distances keep this order.
+        node_id = node_splits[struct_id] + index1
+        order = _argsort_segments(distances, node_id, len(coordinates))
+        struct_id, index1, index2, images, distances = [
+            x[order] for x in [struct_id, index1, index2, images, distances]]
+
+        # Case: radius cutoff. Only consider radius here.
+        if max_neighbours is None:
+            found.append((struct_id, index1, index2, images, distances))
+            pending = pending[:0]
+            break
+
+        # Like `range_neighbour_lattice` , only nodes with any neighbours are checked.
+        node_id = node_id[order]
+        counts = np.bincount(node_id, minlength=len(coordinates)).astype("float")
+        counts[counts == 0] = np.inf
+        min_counts = np.full(num_structs, np.inf)
+        np.minimum.at(min_counts, np.repeat(np.arange(num_structs), row_lengths), counts)
+        enough_nn = np.where(np.isfinite(min_counts), min_counts >= max_neighbours, max_neighbours <= 0)[pending]
+        enough_distance = radius[pending] >= max_distance if max_distance is not None else None
+        if max_distance is None:
+            is_done = enough_nn
+        elif exclusive:
+            is_done = np.logical_or(enough_nn, enough_distance)
+        else:
+            is_done = np.logical_and(enough_nn, enough_distance)
+
+        # Limit neighbours of finished structures.
+        rank = np.arange(len(node_id)) - np.searchsorted(node_id, node_id, side="left")
+        mask = rank < max_neighbours
+        if max_distance is not None:
+            mask_distance = distances <= max_distance + abs(numerical_tol)
+            mask = np.logical_and(mask, mask_distance) if exclusive else np.logical_or(mask, mask_distance)
+        is_struct_done = np.zeros(num_structs, dtype="bool")
+        is_struct_done[pending[is_done]] = True
+        mask = np.logical_and(mask, is_struct_done[struct_id])
+        found.append(tuple(x[mask] for x in [struct_id, index1, index2, images, distances]))
+        pending = pending[~is_done]
+        radius[pending] = radius[pending] * (1.0 + super_cell_tol_factor)
+
+    if len(pending) > 0:
+        raise ValueError("Exceeded maximum number of allowed range extensions for neighbour calculation.")
+
+    if len(found) > 0:
+        struct_id, index1, index2, images, distances = [np.concatenate(x, axis=0) for x in zip(*found)]
+    else:
+        struct_id, index1, index2 = [np.zeros(0, dtype="int64")] * 3
+        images, distances = np.zeros((0, 3), dtype="i2"), np.zeros(0)
+    order = np.argsort(struct_id, kind="stable")
+    out_indices = np.concatenate([np.expand_dims(index1[order], axis=-1), np.expand_dims(index2[order], axis=-1)],
+                                 axis=-1)
+    row_splits = np.concatenate([np.zeros(1, dtype="int64"), np.cumsum(np.bincount(struct_id, minlength=num_structs))])
+    return [out_indices, images[order], distances[order], row_splits]
+
+
+def _argsort_segments(values: np.ndarray, segment_ids: np.ndarray, num_segments: int) -> np.ndarray:
+    r"""Stable argsort of values within segments given by sorted segment ids."""
+    counts = np.bincount(segment_ids, minlength=num_segments)
+    max_count = int(np.amax(counts)) if len(counts) > 0 else 0
+    if num_segments * max_count > 4 * len(values) + 1024:
+        return np.lexsort((values, segment_ids))
+    # Sorting rows of a padded matrix is faster than sorting all values.
+    starts = np.cumsum(counts) - counts
+    padded = np.full((num_segments, max_count), np.inf)
+    padded[segment_ids, np.arange(len(values)) - starts[segment_ids]] = values
+    order = np.argsort(padded, axis=1, kind="stable") + np.expand_dims(starts, axis=-1)
+    return order[np.arange(max_count) < np.expand_dims(counts, axis=-1)]
+
+
+def _find_points_in_spheres_batch(coordinates: np.ndarray, lattices: np.ndarray, node_splits: np.ndarray,
+                                  structs: np.ndarray, radius: np.ndarray, numerical_tol: float,
+                                  max_pairs_per_chunk: int) -> tuple:
+    r"""Find all atom pairs and images within radius for the selected structures."""
+    row_lengths = node_splits[structs + 1] - node_splits[structs]
+    lattice = lattices[structs]
+    inv_lattice = np.linalg.inv(lattice)
+    cutoff = radius + abs(numerical_tol)
+
+    # All atom pairs of each structure.
+    num_pairs = row_lengths * row_lengths
+    pair_struct = np.repeat(np.arange(len(structs)), num_pairs)
+    pair_local = np.arange(len(pair_struct)) - np.repeat(np.cumsum(num_pairs) - num_pairs, num_pairs)
+    atom_offset = node_splits[structs][pair_struct]
+    index1, index2 = pair_local // row_lengths[pair_struct], pair_local % row_lengths[pair_struct]
+    coord1, coord2 = coordinates[atom_offset + index1], coordinates[atom_offset + index2]
+
+    # Range of images for each pair from the fractional offset between the atoms.
+    # Maximum fractional extent of a sphere of radius is given by the column norms of the inverse lattice.
+    frac_offset = np.einsum("ni,nij->nj", coord2 - coord1, inv_lattice[pair_struct])
+    frac_radius = (np.expand_dims(cutoff, axis=-1) * np.linalg.norm(inv_lattice, axis=1))[pair_struct]
+    image_min = np.ceil(-frac_radius - frac_offset - abs(numerical_tol)).astype("int64")
+    image_dims = np.maximum(
+        np.floor(frac_radius - frac_offset + abs(numerical_tol)).astype("int64") - image_min + 1, 0)
+    num_images = np.prod(image_dims, axis=-1)
+
+    # Chunks of consecutive pairs with about `max_pairs_per_chunk` candidate images in their bounding box.
+    chunk_id = (np.cumsum(num_images) - num_images) // max(int(max_pairs_per_chunk), 1)
+    chunk_splits = np.concatenate([[0], np.nonzero(np.diff(chunk_id))[0] + 1, [len(pair_struct)]])
+
+    out = []
+    for start, stop in zip(chunk_splits[:-1], chunk_splits[1:]):
+        # Images of the first two lattice vectors within the bounding box of each pair.
+        pairs = np.arange(start, stop)
+        num_plane = image_dims[pairs, 0] * image_dims[pairs, 1]
+        p = np.repeat(pairs, num_plane)
+        image = np.arange(len(p)) - np.repeat(np.cumsum(num_plane) - num_plane, num_plane)
+        image0 = image // image_dims[p, 1] + image_min[p, 0]
+        image1 = image % image_dims[p, 1] + image_min[p, 1]
+        lattice_p = lattice[pair_struct[p]]
+        diff = coord2[p] - coord1[p] + np.expand_dims(image0, axis=-1) * lattice_p[:, 0] + np.expand_dims(
+            image1, axis=-1) * lattice_p[:, 1]
+        # Images of the third lattice vector within the sphere, from |diff + n * a3|^2 <= cutoff^2 .
+        a3 = lattice_p[:, 2]
+        a = np.sum(np.square(a3), axis=-1)
+        b = np.sum(diff * a3, axis=-1)
+        discriminant = np.square(b) - a * (np.sum(np.square(diff), axis=-1) - np.square(cutoff[pair_struct[p]]))
+        sqrt_discriminant = np.sqrt(np.maximum(discriminant, 0.0))
+        image2_min = np.ceil((-b - sqrt_discriminant) / a - abs(numerical_tol)).astype("int64")
+        num_line = np.where(
+            discriminant >= 0,
+            np.floor((-b + sqrt_discriminant) / a + abs(numerical_tol)).astype("int64") - image2_min + 1, 0)
+        num_line = np.maximum(num_line, 0)
+        q = np.repeat(np.arange(len(p)), num_line)
+        image2 = np.arange(len(q)) - np.repeat(np.cumsum(num_line) - num_line, num_line) + image2_min[q]
+        diff = diff[q] + np.expand_dims(image2, axis=-1) * a3[q]
+        distances = np.sqrt(np.sum(np.square(diff), axis=-1))
+        keep = distances <= cutoff[pair_struct[p[q]]]
+        q = q[keep]
+        images = np.stack([image0[q], image1[q], image2[keep]], axis=-1)
+        out.append((structs[pair_struct[p[q]]], index1[p[q]], index2[p[q]], images.astype("i2"), distances[keep]))
+
+    if len(out) == 0:
+        return np.zeros(0, dtype="int64"), np.zeros(0, dtype="int64"), np.zeros(0, dtype="int64"), np.zeros(
+            (0, 3), dtype="i2"), np.zeros(0)
+    return tuple(np.concatenate(x, axis=0) for x in zip(*out))
+
+
 # This is a python/numpy function to find neighbours in a periodic lattice.
 # The pymatgen version is preferred, since this version can get slow for very skew lattice matrices.
 def range_neighbour_lattice_python_vectorized(
@@ -262,19 +262,22 @@ class SetRange(GraphPreProcessorBase):
         self_loops (bool): If also self-interactions with distance 0 should be considered. Default is False.
         exclusive (bool): Whether both max_neighbours and max_distance must be fulfilled. Default is True.
         overwrite (bool): Whether to overwrite existing range indices. Default is True.
+        neighbour_list_threshold (int): Number of nodes above which a neighbour list via KD-tree is used instead of
+            the full distance matrix. Set to None to always use the distance matrix. Default is 256.
     """
 
     def __init__(self, *, range_indices: str = "range_indices", node_coordinates: str = "node_coordinates",
                  range_attributes: str = "range_attributes", max_distance: float = 4.0, max_neighbours: int = 15,
                  do_invert_distance: bool = False, self_loops: bool = False, exclusive: bool = True, name="set_range",
-                 overwrite: bool = True,
+                 overwrite: bool = True, neighbour_list_threshold: int = 256,
                  **kwargs):
         super().__init__(name=name, **kwargs)
         self._to_obtain.update({"node_coordinates": node_coordinates, "range_indices": range_indices})
         self._silent = ["range_indices"]
         self._call_kwargs = {
             "max_distance": max_distance, "max_neighbours": max_neighbours, "do_invert_distance": do_invert_distance,
-            "self_loops": self_loops, "exclusive": exclusive, "overwrite": overwrite}
+            "self_loops": self_loops, "exclusive": exclusive, "overwrite": overwrite,
+            "neighbour_list_threshold": neighbour_list_threshold}
         self._to_assign = [range_indices, range_attributes]
         self._config_kwargs.update({
             "node_coordinates": node_coordinates, "range_indices": range_indices, "range_attributes": range_attributes,
@@ -282,7 +285,7 @@ class SetRange(GraphPreProcessorBase):
 
     def call(self, *, node_coordinates: np.ndarray, range_indices: np.ndarray,
              max_distance: float, max_neighbours: int, do_invert_distance: bool,
-             self_loops: bool, exclusive: bool, overwrite: bool):
+             self_loops: bool, exclusive: bool, overwrite: bool, neighbour_list_threshold: int):
 
         if range_indices is not None and not overwrite:
             # only need to recompute range_attributes.
@@ -293,12 +296,19 @@ class SetRange(GraphPreProcessorBase):
 
         if node_coordinates is None:
             return None, None
-        # Compute distance matrix here. May be problematic for too large graphs.
-        dist = coordinates_to_distancematrix(node_coordinates)
-        cons, indices = define_adjacency_from_distance(
-            dist, max_distance=max_distance, max_neighbours=max_neighbours, exclusive=exclusive, self_loops=self_loops)
-        mask = np.array(cons, dtype="bool")
-        dist_masked = dist[mask]
+        if neighbour_list_threshold is not None and len(node_coordinates) > neighbour_list_threshold:
+            # Neighbour list without distance matrix for large graphs.
+            indices, dist_masked = range_neighbour_kdtree(
+                node_coordinates, max_distance=max_distance, max_neighbours=max_neighbours, exclusive=exclusive,
+                self_loops=self_loops)
+        else:
+            # Compute distance matrix here. May be problematic for too large graphs.
+            dist = coordinates_to_distancematrix(node_coordinates)
+            cons, indices = define_adjacency_from_distance(
+                dist, max_distance=max_distance, max_neighbours=max_neighbours, exclusive=exclusive,
+                self_loops=self_loops)
+            mask = np.array(cons, dtype="bool")
+            dist_masked = dist[mask]
         if do_invert_distance:
             dist_masked = invert_distance(dist_masked)
         # Need one feature dimension.
@@ -1,6 +1,5 @@
 import os.path
 import numpy as np
-import tensorflow as tf
 import h5py
 from typing import List, Union
 
@@ -28,11 +27,83 @@ def _check_for_inner_shape(array_list: List[np.ndarray]) -> Union[None, tuple, l
         return shapes[0][1:]
 
 
+def _to_values_and_row_splits(ragged_array: Union[List[np.ndarray], list]) -> tuple:
+    """Convert a ragged array of ragged rank one to values, row splits and shape, where ragged dimensions are zero.
+
+    A list of numpy arrays with matching inner shape is concatenated directly. Otherwise, tensorflow is used to
+    generate an eager ragged tensor.
+    """
+    inner_shape = _check_for_inner_shape(ragged_array) if isinstance(ragged_array, list) else None
+    if inner_shape is not None and len(ragged_array) > 0:
+        dtype = np.result_type(*set(x.dtype for x in ragged_array))
+        values = np.concatenate([np.asarray(x, dtype=dtype) for x in ragged_array], axis=0)
+        row_lengths = np.array([len(x) for x in ragged_array], dtype="int64")
+        row_splits = np.concatenate([np.zeros(1, dtype="int64"), np.cumsum(row_lengths)])
+        shape = np.array([len(ragged_array), 0] + list(inner_shape), dtype="uint64")
+        return values, row_splits, shape
+    import tensorflow as tf
+    if not isinstance(ragged_array, tf.RaggedTensor):
+        with tf.device('/cpu:0'):
+            ragged_array = tf.ragged.constant(ragged_array, inner_shape=_check_for_inner_shape(ragged_array))
+    assert ragged_array.ragged_rank == 1, "Only support for ragged_rank=1 at the moment."
+    values = np.array(ragged_array.values)
+    row_splits = np.array(ragged_array.row_splits)
+    # Since the shape array can not have nones, we convert nones to 0.
+    # Not ideal, but could make an extra shape array to indicate ragged dimensions.
+    shape = np.array([x if x is not None else 0 for x in ragged_array.shape], dtype="uint64")
+    return values, row_splits, shape
+
+
+def _to_index(item, length: int) -> tuple:
+    """Convert an int, slice, index array or boolean mask to an array of indices and whether the item is a scalar."""
+    if isinstance(item, (int, np.integer)):
+        if item < -length or item >= length:
+            raise IndexError("Index '%s' out of range for ragged tensor of length %s." % (item, length))
+        return np.array([int(item) % length], dtype="int64"), True
+    if isinstance(item, slice):
+        return np.arange(length, dtype="int64")[item], False
+    if isinstance(item, (list, tuple, np.ndarray)):
+        item = np.asarray(item)
+        if item.dtype == "bool":
+            if item.shape != (length,):
+                raise IndexError("Boolean mask of shape %s does not match length %s." % (item.shape, length))
+            return np.nonzero(item)[0], False
+        if len(item) == 0:
+            return np.zeros(0, dtype="int64"), False
+        if not np.issubdtype(item.dtype, np.integer):
+            raise IndexError("Index array must be of integer or boolean type but got '%s'." % item.dtype)
+        if np.any(item < -length) or np.any(item >= length):
+            raise IndexError("Indices out of range for ragged tensor of length %s." % length)
+        return np.where(item < 0, item + length, item).astype("int64"), False
+    raise TypeError("Unsupported type '%s' to index ragged tensor." % type(item))
+
+
+def _read_rows(values, row_splits: np.ndarray, indices: np.ndarray) -> list:
+    """Read rows of a ragged tensor from values and row splits. Rows that are neighbours in values are read in a
+    single contiguous read, which is important for values on disk like :obj:`h5py.Dataset` ."""
+    order = np.argsort(indices, kind="stable")
+    sorted_indices = indices[order]
+    starts, ends = row_splits[sorted_indices], row_splits[sorted_indices + 1]
+    is_new_block = np.concatenate([np.ones(min(len(starts), 1), dtype="bool"), starts[1:] != ends[:-1]])
+    block_bounds = np.append(np.nonzero(is_new_block)[0], len(starts))
+    out = [None] * len(indices)
+    for lo, hi in zip(block_bounds[:-1], block_bounds[1:]):
+        block_start = starts[lo]
+        block = values[block_start:ends[hi - 1]]
+        for k in range(lo, hi):
+            out[order[k]] = block[starts[k] - block_start:ends[k] - block_start]
+    return out
+
+
 class RaggedTensorNumpyFile:
     """Class representing a NumPy '.npz' file to store a ragged tensor on disk.
 
     For the moment only ragged tensors of ragged rank of one are supported. However, arbitrary ragged tensors can be
     supported in principle.
+
+    Items can be indexed by an int, a slice, an index array or a boolean mask. Since arrays in a '.npz' file can not
+    be memory-mapped, the values are loaded once on first access and kept with the row splits until the file is
+    written or :obj:`close` is called. Use :obj:`RaggedTensorNumpyDirectory` for memory-mapped access.
     """
 
     _device = '/cpu:0'
@@ -46,8 +117,10 @@ class RaggedTensorNumpyFile:
         """
         self.file_path = file_path
         self.compressed = compressed
+        self._values = None
+        self._row_splits = None
 
-    def write(self, ragged_array: Union[tf.RaggedTensor, List[np.ndarray], list]):
+    def write(self, ragged_array: Union[List[np.ndarray], list]):
         """Write ragged array to file.
 
         .. code-block:: python
@@ -58,6 +131,7 @@ class RaggedTensorNumpyFile:
             f = RaggedTensorNumpyFile("test.npz")
             f.write(data)
             print(f.read())
+            print(f[[2, 0]])
 
         Args:
             ragged_array (list, tf.RaggedTensor): List or list of numpy arrays.
@@ -65,17 +139,9 @@ class RaggedTensorNumpyFile:
         Returns:
             None.
         """
-        # We use tensorflow functions to ensure an eager ragged tensor.
-        if not isinstance(ragged_array, tf.RaggedTensor):
-            with tf.device(self._device):
-                ragged_array = tf.ragged.constant(ragged_array, inner_shape=_check_for_inner_shape(ragged_array))
-        assert ragged_array.ragged_rank == 1, "Only support for ragged_rank=1 at the moment."
-        values = np.array(ragged_array.values)
-        row_splits = np.array(ragged_array.row_splits)
-        # Since the shape array can not have nones, we convert nones to 0.
-        # Not ideal, but could make an extra shape array to indicate ragged dimensions.
-        shape = np.array([x if x is not None else 0 for x in ragged_array.shape], dtype="uint64")
-        ragged_rank = np.array(ragged_array.ragged_rank)
+        self.close()
+        values, row_splits, shape = _to_values_and_row_splits(ragged_array)
+        ragged_rank = np.array(1)
         rank = np.array(len(shape))
         out = {"values": values,
                "row_splits": row_splits,
@@ -87,6 +153,28 @@ class RaggedTensorNumpyFile:
         else:
             np.savez(self.file_path, **out)
 
+    def _load(self):
+        if self._row_splits is None:
+            with np.load(self.file_path) as data:
+                self._values = data["values"]
+                self._row_splits = np.array(data["row_splits"], dtype="int64")
+
+    @property
+    def row_splits(self) -> np.ndarray:
+        """Row splits of the ragged tensor on file."""
+        self._load()
+        return self._row_splits
+
+    def close(self):
+        """Release the cached values and row splits."""
+        self._values = None
+        self._row_splits = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_values"], state["_row_splits"] = None, None
+        return state
+
     def read(self, return_as_tensor: bool = False):
         """Read the file into memory.
 
@@ -97,27 +185,28 @@ class RaggedTensorNumpyFile:
             tf.RaggedTensor: Ragged tensor form file.
         """
         # Here only ragged rank one loading is supported.
-        data = np.load(self.file_path)
-        values = data.get("values")
-        row_splits = data.get("row_splits")
+        self._load()
+        values, row_splits = self._values, self._row_splits
         if return_as_tensor:
+            import tensorflow as tf
             with tf.device(self._device):
                 out = tf.RaggedTensor.from_row_splits(values, row_splits)
             return out
         return np.split(values, row_splits[1:-1])
 
     def __getitem__(self, item):
-        """Get single item from the ragged tensor on file.
+        """Get items from the ragged tensor on file.
 
         Args:
-            item (int): Index of the item to get.
+            item (int, slice, np.ndarray): Index, slice, index array or boolean mask of the items to get.
+
+        Returns:
+            np.ndarray, list: Array for a single index or list of arrays otherwise.
         """
-        assert isinstance(item, int), "Only single index is supported, no slicing."
-        # NOTE: At the moment mmap is not supported for NPZ files.
-        with np.load(self.file_path, mmap_mode="r") as data:
-            row_splits = np.array(data.get("row_splits"))
-            out_data = np.array(data["values"][row_splits[item]:row_splits[item + 1]])
-        return out_data
+        self._load()
+        indices, is_scalar = _to_index(item, len(self._row_splits) - 1)
+        out = _read_rows(self._values, self._row_splits, indices)
+        return out[0] if is_scalar else out
 
     def exists(self):
         """Check if file for path information of this class exists."""
@@ -125,11 +214,118 @@ class RaggedTensorNumpyFile:
 
     def __len__(self):
         """Length of the tensor on file."""
-        data = np.load(self.file_path)
-        row_splits = data.get("row_splits")
-        num_row_splits = int(row_splits.shape[0])
         # length is num_row_splits - 1
-        return num_row_splits-1
+        return len(self.row_splits) - 1
+
+
+class RaggedTensorNumpyDirectory:
+    """Class representing a directory of uncompressed NumPy '.npy' files to store a ragged tensor on disk.
+
+    The values and row splits are stored in 'values.npy' and 'row_splits.npy' . Values are memory-mapped on read, so
+    that items can be accessed without loading the file into memory. Only ragged tensors of ragged rank of one are
+    supported.
+    """
+
+    _device = '/cpu:0'
+
+    def __init__(self, directory_path: str, mmap_mode: Union[str, None] = "r"):
+        """Make class for a directory of NPY files.
+
+        Args:
+            directory_path (str): Path to directory on disk.
+            mmap_mode (str): Memory-map mode passed to :obj:`np.load` . Default is 'r'.
+        """
+        self.directory_path = directory_path
+        self.mmap_mode = mmap_mode
+        self._values = None
+        self._row_splits = None
+
+    def _file_path(self, name: str) -> str:
+        return os.path.join(self.directory_path, "%s.npy" % name)
+
+    def write(self, ragged_array: Union[List[np.ndarray], list]):
+        """Write ragged array to directory.
+
+        .. code-block:: python
+
+            from kgcnn.io.file import RaggedTensorNumpyDirectory
+            import numpy as np
+            data = [np.array([[0, 1],[0, 2]]), np.array([[1, 1]]), np.array([[0, 1],[2, 2], [0, 3]])]
+            f = RaggedTensorNumpyDirectory("test_ragged")
+            f.write(data)
+            print(f[1:])
+
+        Args:
+            ragged_array (list, tf.RaggedTensor): List or list of numpy arrays.
+
+        Returns:
+            None.
+        """
+        self.close()
+        values, row_splits, _ = _to_values_and_row_splits(ragged_array)
+        os.makedirs(self.directory_path, exist_ok=True)
+        np.save(self._file_path("values"), values)
+        np.save(self._file_path("row_splits"), row_splits)
+
+    def _load(self):
+        if self._row_splits is None:
+            self._values = np.load(self._file_path("values"), mmap_mode=self.mmap_mode)
+            self._row_splits = np.array(np.load(self._file_path("row_splits")), dtype="int64")
+
+    @property
+    def row_splits(self) -> np.ndarray:
+        """Row splits of the ragged tensor on file."""
+        self._load()
+        return self._row_splits
+
+    def close(self):
+        """Release the memory-mapped values and cached row splits."""
+        self._values = None
+        self._row_splits = None
+
+    def read(self, return_as_tensor: bool = False):
+        """Read the ragged tensor. Items are views of the memory-mapped values.
+
+        Args:
+            return_as_tensor: Whether to return tf.RaggedTensor.
+
+        Returns:
+            tf.RaggedTensor: Ragged tensor form file.
+        """
+        self._load()
+        if return_as_tensor:
+            import tensorflow as tf
+            with tf.device(self._device):
+                out = tf.RaggedTensor.from_row_splits(np.array(self._values), self._row_splits)
+            return out
+        return np.split(self._values, self._row_splits[1:-1])
+
+    def __getitem__(self, item):
+        """Get items from the ragged tensor on file.
+
+        Args:
+            item (int, slice, np.ndarray): Index, slice, index array or boolean mask of the items to get.
+
+        Returns:
+            np.ndarray, list: Array for a single index or list of arrays otherwise.
+        """
+        self._load()
+        indices, is_scalar = _to_index(item, len(self._row_splits) - 1)
+        out = _read_rows(self._values, self._row_splits, indices)
+        return out[0] if is_scalar else out
+
+    def exists(self):
+        """Check if directory for path information of this class exists."""
+        return os.path.exists(self._file_path("row_splits"))
+
+    def __len__(self):
+        """Length of the tensor on file."""
+        return len(self.row_splits) - 1
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_values"], state["_row_splits"] = None, None
+        return state
 
 
 class RaggedTensorHDFile:
@@ -137,6 +333,10 @@ class RaggedTensorHDFile:
 
     For the moment only ragged tensors of ragged rank of one are supported. However, arbitrary ragged tensors can be
     supported in principle.
+
+    Items can be indexed by an int, a slice, an index array or a boolean mask. Neighbouring items are read from file
+    in a single read. The file handle for reading and the row splits are kept open until the file is written or
+    :obj:`close` is called.
     """
 
     _device = '/cpu:0'
@@ -150,6 +350,29 @@ class RaggedTensorHDFile:
         """
         self.file_path = file_path
         self.compressed = compressed
+        self._file = None
+        self._file_pid = None
+        self._row_splits = None
+
+    def _open(self) -> h5py.File:
+        # Handles of h5py can not be shared with forked processes.
+        if self._file is None or self._file_pid != os.getpid():
+            self._file = h5py.File(self.file_path, "r")
+            self._file_pid = os.getpid()
+        return self._file
+
+    def close(self):
+        """Close the cached file handle and release row splits. Required before the file is modified elsewhere."""
+        if self._file is not None and self._file_pid == os.getpid():
+            self._file.close()
+        self._file = None
+        self._file_pid = None
+        self._row_splits = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_file"], state["_file_pid"], state["_row_splits"] = None, None, None
+        return state
 
     def write(self, ragged_array: List[np.ndarray]):
         """Write ragged array to file.
@@ -162,6 +385,7 @@ class RaggedTensorHDFile:
             f = RaggedTensorHDFile("test.hdf5")
             f.write(data)
             print(f.read())
+            print(f[np.array([True, False, True])])
 
         Args:
             ragged_array (list, tf.RaggedTensor): List or list of numpy arrays.
@@ -169,17 +393,9 @@ class RaggedTensorHDFile:
         Returns:
             None.
         """
-        # We use tensorflow functions to ensure an eager ragged tensor.
-        if not isinstance(ragged_array, tf.RaggedTensor):
-            with tf.device(self._device):
-                ragged_array = tf.ragged.constant(ragged_array, inner_shape=_check_for_inner_shape(ragged_array))
-        assert ragged_array.ragged_rank == 1, "Only support for ragged_rank=1 at the moment."
-        values = np.array(ragged_array.values)
-        row_splits = np.array(ragged_array.row_splits)
-        # Since the shape array can not have nones, we convert nones to 0.
-        # Not ideal, but could make an extra shape array to indicate ragged dimensions.
-        shape = np.array([x if x is not None else 0 for x in ragged_array.shape], dtype="uint64")
-        ragged_rank = np.array(ragged_array.ragged_rank)
+        self.close()
+        values, row_splits, shape = _to_values_and_row_splits(ragged_array)
+        ragged_rank = np.array(1)
         rank = np.array(len(shape))
         with h5py.File(self.file_path, "w") as file:
             file.create_dataset("values", data=values,
@@ -189,6 +405,28 @@ class RaggedTensorHDFile:
             file.create_dataset("rank", data=rank)
             file.create_dataset("ragged_rank", data=ragged_rank)
 
+    @property
+    def row_splits(self) -> np.ndarray:
+        """Row splits of the ragged tensor on file."""
+        if self._row_splits is None:
+            self._row_splits = np.array(self._open()["row_splits"], dtype="int64")
+        return self._row_splits
+
+    @property
+    def values(self) -> np.ndarray:
+        """Concatenated values of the ragged tensor on file, which are read into memory."""
+        return np.array(self._open()["values"])
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type of the values on file, which is taken from the metadata without reading the values."""
+        return self._open()["values"].dtype
+
+    @property
+    def inner_shape(self) -> tuple:
+        """Shape of the values on file without the first axis, which is taken from the metadata."""
+        return tuple(self._open()["values"].shape[1:])
+
     def read(self, return_as_tensor: bool = False):
         """Read the file into memory.
 
@@ -198,27 +436,29 @@ class RaggedTensorHDFile:
         Returns:
             tf.RaggedTensor: Ragged tensor form file.
         """
-        with h5py.File(self.file_path, "r") as file:
-            values = file["values"]
-            row_splits = file["row_splits"]
-            if return_as_tensor:
-                with tf.device(self._device):
-                    out = tf.RaggedTensor.from_row_splits(np.array(values), np.array(row_splits))
-            else:
-                out = np.split(values, row_splits[1:-1])
+        values = self.values
+        row_splits = self.row_splits
+        if return_as_tensor:
+            import tensorflow as tf
+            with tf.device(self._device):
+                out = tf.RaggedTensor.from_row_splits(values, row_splits)
+        else:
+            out = np.split(values, row_splits[1:-1])
         return out
 
-    def __getitem__(self, item: int):
-        """Get single item from the ragged tensor on file.
+    def __getitem__(self, item):
+        """Get items from the ragged tensor on file.
 
         Args:
-            item (int): Index of the item to get.
+            item (int, slice, np.ndarray): Index, slice, index array or boolean mask of the items to get.
+
+        Returns:
+            np.ndarray, list: Array for a single index or list of arrays otherwise.
         """
-        assert isinstance(item, int), "Only single index is supported, no slicing."
-        with h5py.File(self.file_path, "r") as file:
-            row_splits = file["row_splits"]
-            out_data = np.array(file["values"][row_splits[item]:row_splits[item+1]])
-        return out_data
+        row_splits = self.row_splits
+        indices, is_scalar = _to_index(item, len(row_splits) - 1)
+        out = _read_rows(self._open()["values"], row_splits, indices)
+        return out[0] if is_scalar else out
 
     def append(self, item):
         """Append single item to ragged tensor.
@@ -229,17 +469,355 @@ class RaggedTensorHDFile:
         Returns:
             None.
         """
+        self.append_multiple([item])
+
+    def append_multiple(self, items: list):
+        """Append multiple items to ragged tensor.
+
+        Args:
+            items (list): List of items to append. Must match in shape.
+
+        Returns:
+            None.
+        """
+        if len(items) == 0:
+            return
+        self.close()
+        new_values = np.concatenate(items, axis=0)
+        new_len = len(items)
+        new_splits = np.cumsum([len(x) for x in items])
         with h5py.File(self.file_path, "r+") as file:
             file["values"].resize(
-                file["values"].shape[0] + len(item), axis=0
+                file["values"].shape[0] + new_values.shape[0], axis=0
             )
             split_last = file["row_splits"][-1]
             file["row_splits"].resize(
-                file["row_splits"].shape[0] + 1, axis=0
+                file["row_splits"].shape[0] + new_len, axis=0
             )
-            len_last = len(item)
-            file["row_splits"][-1] = split_last + len_last
-            file["values"][split_last:split_last+len_last] = item
+            file["row_splits"][-new_len:] = split_last + new_splits
+            file["values"][split_last:split_last+new_splits[-1]] = new_values
+
+    def update_multiple(self, indices: Union[list, np.ndarray], items: list, chunk_size: int = 100000):
+        """Replace multiple items of the ragged tensor.
+
+        Items of the same length as on file are overwritten in place, which keeps values and row splits consistent but
+        may leave only part of the items replaced if writing is interrupted. If the length of an item changes, a new
+        file is written next to the old one in chunks and replaces it at the end, so that values and row splits are
+        never out of sync on disk.
+
+        Args:
+            indices (list, np.ndarray): Indices of the items to replace.
+            items (list): List of new items. Must match in inner shape.
+            chunk_size (int): Number of items to rewrite at once, if lengths change. Default is 100000.
+
+        Returns:
+            None.
+        """
+        if len(items) == 0:
+            return
+        indices, _ = _to_index(indices, len(self))
+        self.close()
+        replace = {int(i): x for i, x in zip(indices, items)}
+        with h5py.File(self.file_path, "r+") as file:
+            row_splits = np.array(file["row_splits"], dtype="int64")
+            old_lengths = np.diff(row_splits)
+            new_lengths = np.array(old_lengths)
+            new_lengths[list(replace.keys())] = [len(x) for x in replace.values()]
+            changed = np.nonzero(new_lengths != old_lengths)[0]
+            first = int(changed[0]) if len(changed) > 0 else len(old_lengths)
+            if first >= len(old_lengths):
+                for i, x in replace.items():
+                    file["values"][row_splits[i]:row_splits[i + 1]] = x
+                return
+            new_row_splits = np.concatenate([np.zeros(1, dtype="int64"), np.cumsum(new_lengths)])
+            values = file["values"]
+            temp_path = self.file_path + ".tmp"
+            try:
+                with h5py.File(temp_path, "w") as temp:
+                    new_values = temp.create_dataset(
+                        "values", shape=(int(new_row_splits[-1]),) + values.shape[1:], dtype=values.dtype,
+                        maxshape=(None,) + values.shape[1:])
+                    temp.create_dataset("row_splits", data=new_row_splits, maxshape=(None, ))
+                    for key in ["shape", "rank", "ragged_rank"]:
+                        temp.create_dataset(key, data=np.array(file[key]))
+                    # Rows before the first changed length keep their position and are copied in blocks.
+                    for start in range(0, int(row_splits[first]), chunk_size):
+                        stop = min(start + chunk_size, int(row_splits[first]))
+                        new_values[start:stop] = values[start:stop]
+                    for i, x in replace.items():
+                        if i < first:
+                            new_values[row_splits[i]:row_splits[i + 1]] = x
+                    for start in range(first, len(old_lengths), chunk_size):
+                        chunk = np.arange(start, min(start + chunk_size, len(old_lengths)))
+                        rows = _read_rows(values, row_splits, chunk)
+                        rows = [replace[int(i)] if int(i) in replace else x for i, x in zip(chunk, rows)]
+                        block_start, block_end = new_row_splits[chunk[0]], new_row_splits[chunk[-1] + 1]
+                        new_values[block_start:block_end] = np.concatenate(rows, axis=0)
+            except BaseException:
+                # Leave the file on disk unchanged.
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+        os.replace(temp_path, self.file_path)
+
+    def __len__(self):
+        """Length of the tensor on file."""
+        # length is num_row_splits - 1
+        return len(self.row_splits) - 1
+
+
+class RaggedTensorNumpyDirectory:
+    """Class representing a directory of uncompressed NumPy '.npy' files to store a ragged tensor on disk.
+
+    The values and row splits are stored in 'values.npy' and 'row_splits.npy' . Values are memory-mapped on read, so
+    that items can be accessed without loading the file into memory. Only ragged tensors of ragged rank of one are
+    supported.
+    """
+
+    _device = '/cpu:0'
+
+    def __init__(self, directory_path: str, mmap_mode: Union[str, None] = "r"):
+        """Make class for a directory of NPY files.
+
+        Args:
+            directory_path (str): Path to directory on disk.
+            mmap_mode (str): Memory-map mode passed to :obj:`np.load` . Default is 'r'.
+        """
+        self.directory_path = directory_path
+        self.mmap_mode = mmap_mode
+        self._values = None
+        self._row_splits = None
+
+    def _file_path(self, name: str) -> str:
+        return os.path.join(self.directory_path, "%s.npy" % name)
+
+    def write(self, ragged_array: Union[List[np.ndarray], list]):
+        """Write ragged array to directory.
+
+        .. code-block:: python
+
+            from kgcnn.io.file import RaggedTensorNumpyDirectory
+            import numpy as np
+            data = [np.array([[0, 1],[0, 2]]), np.array([[1, 1]]), np.array([[0, 1],[2, 2], [0, 3]])]
+            f = RaggedTensorNumpyDirectory("test_ragged")
+            f.write(data)
+            print(f[1:])
+
+        Args:
+            ragged_array (list, tf.RaggedTensor): List or list of numpy arrays.
+
+        Returns:
+            None.
+        """
+        self.close()
+        values, row_splits, _ = _to_values_and_row_splits(ragged_array)
+        os.makedirs(self.directory_path, exist_ok=True)
+        np.save(self._file_path("values"), values)
+        np.save(self._file_path("row_splits"), row_splits)
+
+    def _load(self):
+        if self._row_splits is None:
+            self._values = np.load(self._file_path("values"), mmap_mode=self.mmap_mode)
+            self._row_splits = np.array(np.load(self._file_path("row_splits")), dtype="int64")
+
+    @property
+    def row_splits(self) -> np.ndarray:
+        """Row splits of the ragged tensor on file."""
+        self._load()
+        return self._row_splits
+
+    def close(self):
+        """Release the memory-mapped values and cached row splits."""
+        self._values = None
+        self._row_splits = None
+
+    def read(self, return_as_tensor: bool = False):
+        """Read the ragged tensor. Items are views of the memory-mapped values.
+
+        Args:
+            return_as_tensor: Whether to return tf.RaggedTensor.
+
+        Returns:
+            tf.RaggedTensor: Ragged tensor form file.
+        """
+        self._load()
+        if return_as_tensor:
+            import tensorflow as tf
+            with tf.device(self._device):
+                out = tf.RaggedTensor.from_row_splits(np.array(self._values), self._row_splits)
+            return out
+        return np.split(self._values, self._row_splits[1:-1])
+
+    def __getitem__(self, item):
+        """Get items from the ragged tensor on file.
+
+        Args:
+            item (int, slice, np.ndarray): Index, slice, index array or boolean mask of the items to get.
+
+        Returns:
+            np.ndarray, list: Array for a single index or list of arrays otherwise.
+        """
+        self._load()
+        indices, is_scalar = _to_index(item, len(self._row_splits) - 1)
+        out = _read_rows(self._values, self._row_splits, indices)
+        return out[0] if is_scalar else out
+
+    def exists(self):
+        """Check if directory for path information of this class exists."""
+        return os.path.exists(self._file_path("row_splits"))
+
+    def __len__(self):
+        """Length of the tensor on file."""
+        return len(self.row_splits) - 1
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_values"], state["_row_splits"] = None, None
+        return state
+
+
+class RaggedTensorHDFile:
+    """Class representing an HDF '.hdf5' file to store a ragged tensor on disk.
+
+    For the moment only ragged tensors of ragged rank of one are supported. However, arbitrary ragged tensors can be
+    supported in principle.
+
+    Items can be indexed by an int, a slice, an index array or a boolean mask. Neighbouring items are read from file
+    in a single read. The file handle for reading and the row splits are kept open until the file is written or
+    :obj:`close` is called.
+    """
+
+    _device = '/cpu:0'
+
+    def __init__(self, file_path: str, compressed: bool = None):
+        """Make class for a HDF5 file.
+
+        Args:
+            file_path (str): Path to file on disk.
+            compressed: Compression to use. Not used at the moment.
+        """
+        self.file_path = file_path
+        self.compressed = compressed
+        self._file = None
+        self._file_pid = None
+        self._row_splits = None
+
+    def _open(self) -> h5py.File:
+        # Handles of h5py can not be shared with forked processes.
+        if self._file is None or self._file_pid != os.getpid():
+            self._file = h5py.File(self.file_path, "r")
+            self._file_pid = os.getpid()
+        return self._file
+
+    def close(self):
+        """Close the cached file handle and release row splits. Required before the file is modified elsewhere."""
+        if self._file is not None and self._file_pid == os.getpid():
+            self._file.close()
+        self._file = None
+        self._file_pid = None
+        self._row_splits = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_file"], state["_file_pid"], state["_row_splits"] = None, None, None
+        return state
+
+    def write(self, ragged_array: List[np.ndarray]):
+        """Write ragged array to file.
+
+        .. code-block:: python
+
+            from kgcnn.io.file import RaggedTensorHDFile
+            import numpy as np
+            data = [np.array([[0, 1],[0, 2]]), np.array([[1, 1]]), np.array([[0, 1],[2, 2], [0, 3]])]
+            f = RaggedTensorHDFile("test.hdf5")
+            f.write(data)
+            print(f.read())
+            print(f[np.array([True, False, True])])
+
+        Args:
+            ragged_array (list, tf.RaggedTensor): List or list of numpy arrays.
+
+        Returns:
+            None.
+        """
+        self.close()
+        values, row_splits, shape = _to_values_and_row_splits(ragged_array)
+        ragged_rank = np.array(1)
+        rank = np.array(len(shape))
+        with h5py.File(self.file_path, "w") as file:
+            file.create_dataset("values", data=values,
+                                maxshape=[x if i > 0 else None for i, x in enumerate(values.shape)])
+            file.create_dataset("row_splits", data=row_splits, maxshape=(None, ))
+            file.create_dataset("shape", data=shape)
+            file.create_dataset("rank", data=rank)
+            file.create_dataset("ragged_rank", data=ragged_rank)
+
+    @property
+    def row_splits(self) -> np.ndarray:
+        """Row splits of the ragged tensor on file."""
+        if self._row_splits is None:
+            self._row_splits = np.array(self._open()["row_splits"], dtype="int64")
+        return self._row_splits
+
+    @property
+    def values(self) -> np.ndarray:
+        """Concatenated values of the ragged tensor on file, which are read into memory."""
+        return np.array(self._open()["values"])
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type of the values on file, which is taken from the metadata without reading the values."""
+        return self._open()["values"].dtype
+
+    @property
+    def inner_shape(self) -> tuple:
+        """Shape of the values on file without the first axis, which is taken from the metadata."""
+        return tuple(self._open()["values"].shape[1:])
+
+    def read(self, return_as_tensor: bool = False):
+        """Read the file into memory.
+
+        Args:
+            return_as_tensor: Whether to return tf.RaggedTensor.
+
+        Returns:
+            tf.RaggedTensor: Ragged tensor form file.
+        """
+        values = self.values
+        row_splits = self.row_splits
+        if return_as_tensor:
+            import tensorflow as tf
+            with tf.device(self._device):
+                out = tf.RaggedTensor.from_row_splits(values, row_splits)
+        else:
+            out = np.split(values, row_splits[1:-1])
+        return out
+
+    def __getitem__(self, item):
+        """Get items from the ragged tensor on file.
+
+        Args:
+            item (int, slice, np.ndarray): Index, slice, index array or boolean mask of the items to get.
+
+        Returns:
+            np.ndarray, list: Array for a single index or list of arrays otherwise.
+        """
+        row_splits = self.row_splits
+        indices, is_scalar = _to_index(item, len(row_splits) - 1)
+        out = _read_rows(self._open()["values"], row_splits, indices)
+        return out[0] if is_scalar else out
+
+    def append(self, item):
+        """Append single item to ragged tensor.
+
+        Args:
+            item (np.ndarray, tf.Tensor): Item to append.
+
+        Returns:
+            None.
+        """
+        self.append_multiple([item])
 
     def append_multiple(self, items: list):
         """Append multiple items to ragged tensor.
@@ -250,6 +828,9 @@ class RaggedTensorHDFile:
         Returns:
             None.
         """
+        if len(items) == 0:
+            return
+        self.close()
         new_values = np.concatenate(items, axis=0)
         new_len = len(items)
         new_splits = np.cumsum([len(x) for x in items])
@@ -262,14 +843,64 @@ class RaggedTensorHDFile:
                 file["row_splits"].shape[0] + new_len, axis=0
             )
             file["row_splits"][-new_len:] = split_last + new_splits
-            file["values"][split_last:+split_last+new_splits[-1]] = new_values
+            file["values"][split_last:split_last+new_splits[-1]] = new_values
+
+    def update_multiple(self, indices: Union[list, np.ndarray], items: list, chunk_size: int = 100000):
+        """Replace multiple items of the ragged tensor.
+
+        Items of the same length as on file are overwritten in place. If the length of an item changes, the values
+        after the first changed item are rewritten in chunks via a temporary file.
+
+        Args:
+            indices (list, np.ndarray): Indices of the items to replace.
+            items (list): List of new items. Must match in inner shape.
+            chunk_size (int): Number of items to rewrite at once, if lengths change. Default is 100000.
+
+        Returns:
+            None.
+        """
+        if len(items) == 0:
+            return
+        indices, _ = _to_index(indices, len(self))
+        self.close()
+        replace = {int(i): x for i, x in zip(indices, items)}
+        with h5py.File(self.file_path, "r+") as file:
+            row_splits = np.array(file["row_splits"], dtype="int64")
+            old_lengths = np.diff(row_splits)
+            new_lengths = np.array(old_lengths)
+            new_lengths[list(replace.keys())] = [len(x) for x in replace.values()]
+            changed = np.nonzero(new_lengths != old_lengths)[0]
+            first = int(changed[0]) if len(changed) > 0 else len(old_lengths)
+            for i, x in replace.items():
+                if i < first:
+                    file["values"][row_splits[i]:row_splits[i + 1]] = x
+            if first >= len(old_lengths):
+                return
+            new_row_splits = np.concatenate([np.zeros(1, dtype="int64"), np.cumsum(new_lengths)])
+            values = file["values"]
+            tail_file = RaggedTensorHDFile(self.file_path + ".tail")
+            for start in range(first, len(old_lengths), chunk_size):
+                chunk = np.arange(start, min(start + chunk_size, len(old_lengths)))
+                rows = _read_rows(values, row_splits, chunk)
+                rows = [replace[int(i)] if int(i) in replace else x for i, x in zip(chunk, rows)]
+                if start == first:
+                    tail_file.write(rows)
+                else:
+                    tail_file.append_multiple(rows)
+            values.resize(new_row_splits[-1], axis=0)
+            offset = new_row_splits[first]
+            with h5py.File(tail_file.file_path, "r") as tail:
+                tail_values = tail["values"]
+                for start in range(0, len(tail_values), chunk_size):
+                    block = tail_values[start:start + chunk_size]
+                    values[offset + start:offset + start + len(block)] = block
+            os.remove(tail_file.file_path)
+            file["row_splits"][:] = new_row_splits
 
     def __len__(self):
         """Length of the tensor on file."""
-        with h5py.File(self.file_path, "r") as file:
-            num_row_splits = int(file["row_splits"].shape[0])
         # length is num_row_splits - 1
-        return num_row_splits-1
+        return len(self.row_splits) - 1
 
     def exists(self):
         """Check if file for path information of this class exists."""
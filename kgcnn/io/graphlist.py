@@ -0,0 +1,202 @@
+import os
+import json
+import logging
+import pickle
+import numpy as np
+from typing import List, Union
+
+# Module logger
+logging.basicConfig()
+module_logger = logging.getLogger(__name__)
+module_logger.setLevel(logging.INFO)
+
+
+class GraphListColumnarDirectory:
+    r"""Class representing a directory of NumPy '.npy' files that stores a list of graph dictionaries column-wise.
+
+    Each graph property is stored as one concatenated `values` array and a `row_splits` array along the first axis,
+    which are opened via :obj:`np.memmap` on load. Properties of rank zero, e.g. graph labels, are stored with row
+    length one. Graphs that do not define a property have a row length of zero and are flagged by a boolean `mask`.
+    Properties that can not be stored as a single array, i.e. object arrays or mismatching inner shape, are pickled
+    into a separate file.
+
+    Since the arrays are memory-mapped, loading time does not depend on the size of the arrays and multiple processes
+    share the same page cache.
+
+    .. code-block:: python
+
+        import numpy as np
+        from kgcnn.io.graphlist import GraphListColumnarDirectory
+        data = [{"node_number": np.array([6, 1]), "graph_labels": np.array(1.0)}, {"node_number": np.array([8])}]
+        f = GraphListColumnarDirectory("test.kgcnn.columnar")
+        f.write(data)
+        print(f.read_graphs())
+
+    """
+
+    _meta_file_name = "columns.json"
+    _object_file_name = "objects.pickle"
+    _format_version = 1
+
+    def __init__(self, directory_path: str, mmap_mode: Union[str, None] = "r"):
+        r"""Make class for a columnar directory.
+
+        Args:
+            directory_path (str): Path to directory on disk.
+            mmap_mode (str): Memory-map mode passed to :obj:`np.load` . Use 'c' for copy-on-write, if arrays are
+                modified in place, or None to load arrays into memory. Default is 'r'.
+        """
+        self.directory_path = directory_path
+        self.mmap_mode = mmap_mode
+
+    def _file_path(self, key: str, name: str) -> str:
+        return os.path.join(self.directory_path, "%s.%s.npy" % (key, name))
+
+    @staticmethod
+    def _make_column(values: list):
+        """Try to stack a list of arrays or None into values, row_splits and mask. Returns None on failure."""
+        present = np.array([x is not None for x in values], dtype="bool")
+        arrays = [np.asarray(x) for x in values if x is not None]
+        if len(arrays) == 0:
+            return None
+        rank = arrays[0].ndim
+        inner_shape = arrays[0].shape[1:]
+        if any(x.ndim != rank or x.shape[1:] != inner_shape for x in arrays):
+            return None
+        if any(x.dtype.hasobject for x in arrays):
+            return None
+        if rank == 0:
+            arrays = [np.expand_dims(x, axis=0) for x in arrays]
+        row_lengths = np.zeros(len(values), dtype="int64")
+        row_lengths[present] = [len(x) for x in arrays]
+        row_splits = np.concatenate([np.zeros(1, dtype="int64"), np.cumsum(row_lengths)])
+        return {"values": np.concatenate(arrays, axis=0), "row_splits": row_splits, "mask": present, "rank": rank}
+
+    def write(self, graph_list: List[dict]):
+        r"""Write list of graph dictionaries to directory. Existing columns in the directory are overwritten.
+
+        Args:
+            graph_list (list): List of dictionaries with (numpy) array values.
+
+        Returns:
+            None.
+        """
+        keys = []
+        for x in graph_list:
+            keys += [k for k in x.keys() if k not in keys]
+        columns = {}
+        for key in keys:
+            values = [x[key] if key in x else None for x in graph_list]
+            column = self._make_column(values)
+            if column is None:
+                module_logger.warning("Can not store property '%s' in columns. Pickle property instead." % key)
+                column = values
+            columns[key] = column
+        self.write_columns(len(graph_list), columns)
+
+    def write_columns(self, num_graphs: int, columns: dict):
+        r"""Write columns of graph properties to directory. Existing columns in the directory are overwritten.
+
+        Args:
+            num_graphs (int): Number of graphs.
+            columns (dict): Dictionary of columns. Each column is a dictionary with 'values', 'row_splits', 'mask'
+                and 'rank' or a list of python objects, which is pickled.
+
+        Returns:
+            None.
+        """
+        os.makedirs(self.directory_path, exist_ok=True)
+        meta_columns, objects = {}, {}
+        for key, column in columns.items():
+            if isinstance(column, list):
+                objects[key] = column
+                continue
+            values = np.asarray(column["values"])
+            np.save(self._file_path(key, "values"), values)
+            np.save(self._file_path(key, "row_splits"), column["row_splits"])
+            has_mask = column["mask"] is not None and not bool(np.all(column["mask"]))
+            if has_mask:
+                np.save(self._file_path(key, "mask"), column["mask"])
+            meta_columns[key] = {"rank": column["rank"], "dtype": str(values.dtype), "has_mask": has_mask}
+        with open(os.path.join(self.directory_path, self._object_file_name), "wb") as f:
+            pickle.dump(objects, f)
+        meta = {"format_version": self._format_version, "num_graphs": num_graphs, "columns": meta_columns,
+                "object_columns": list(objects.keys())}
+        with open(os.path.join(self.directory_path, self._meta_file_name), "w") as f:
+            json.dump(meta, f)
+
+    def read_meta(self) -> dict:
+        """Read the meta information of the columns in directory."""
+        with open(os.path.join(self.directory_path, self._meta_file_name), "r") as f:
+            meta = json.load(f)
+        return meta
+
+    def read(self) -> dict:
+        r"""Open all columns of the directory.
+
+        Returns:
+            dict: Dictionary of columns. Each column is a dictionary with 'values', 'row_splits', 'mask' and 'rank'
+                or a list of python objects for pickled properties.
+        """
+        meta = self.read_meta()
+        out = {}
+        for key, info in meta["columns"].items():
+            out[key] = {
+                "values": np.load(self._file_path(key, "values"), mmap_mode=self.mmap_mode),
+                "row_splits": np.load(self._file_path(key, "row_splits")),
+                "mask": np.load(self._file_path(key, "mask")) if info["has_mask"] else None,
+                "rank": info["rank"]
+            }
+        if len(meta["object_columns"]) > 0:
+            with open(os.path.join(self.directory_path, self._object_file_name), "rb") as f:
+                out.update(pickle.load(f))
+        return out
+
+    @staticmethod
+    def column_views(column: Union[dict, list]) -> list:
+        r"""List of the arrays of each graph in a column, which are views into the values of the column. Graphs that
+        do not define the property are None.
+
+        Args:
+            column (dict, list): Column as returned by :obj:`read` .
+
+        Returns:
+            list: List of arrays or None.
+        """
+        if isinstance(column, list):
+            return column
+        # Base class view to avoid memmap subclass overhead on slicing. Data is still mapped.
+        values = np.asarray(column["values"])
+        row_splits = column["row_splits"]
+        if column["rank"] == 0:
+            views = [values[i, ...] if j > i else None for i, j in zip(
+                row_splits[:-1].tolist(), row_splits[1:].tolist())]
+        else:
+            views = [values[i:j] for i, j in zip(row_splits[:-1].tolist(), row_splits[1:].tolist())]
+        if column["mask"] is not None:
+            views = [x if m else None for x, m in zip(views, column["mask"].tolist())]
+        return views
+
+    def read_graphs(self) -> List[dict]:
+        r"""Read the list of graph dictionaries. The arrays of each graph are views into the memory-mapped columns,
+        no data is copied. Note that this still creates a dictionary and a view for each graph and property. Use
+        :obj:`read` or :obj:`kgcnn.data.store.GraphStore.load` to open the columns without touching single graphs.
+
+        Returns:
+            list: List of graph dictionaries.
+        """
+        num_graphs = len(self)
+        out = [{} for _ in range(num_graphs)]
+        for key, column in self.read().items():
+            for graph, x in zip(out, self.column_views(column)):
+                if x is not None:
+                    graph[key] = x
+        return out
+
+    def exists(self):
+        """Check if directory for path information of this class exists."""
+        return os.path.exists(os.path.join(self.directory_path, self._meta_file_name))
+
+    def __len__(self):
+        """Number of graphs in directory."""
+        return int(self.read_meta()["num_graphs"])
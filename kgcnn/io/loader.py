@@ -1,9 +1,9 @@
-import keras as ks
 import logging
 from typing import Union
 import numpy as np
 from numpy.random import Generator, PCG64
-import tensorflow as tf
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 
 # Module logger
@@ -18,6 +18,492 @@ def pad_at_axis(x, pad_width, axis=0, **kwargs):
     return np.pad(x, pad_width=pads, **kwargs)
 
 
+def _convert_to_dict(container_to_check):
+    """We use a dict for both list and dict input."""
+    if container_to_check is None:
+        return {}
+    if isinstance(container_to_check, (list, tuple)):
+        return {i: x for i, x in enumerate(container_to_check)}
+    if not isinstance(container_to_check, dict):
+        raise ValueError("Must be dict or list for mapping and containers.")
+    return container_to_check
+
+
+def _batch_totals(lengths: np.ndarray, data_index: np.ndarray, batch_splits: np.ndarray) -> np.ndarray:
+    """Sum of lengths for each batch of `data_index` that start at `batch_splits` ."""
+    if len(data_index) == 0:
+        return np.zeros(0, dtype=lengths.dtype)
+    return np.add.reduceat(lengths[data_index], batch_splits)
+
+
+class DisjointBatchCollator:
+    r"""Collate batches of graphs into disjoint tensors with NumPy.
+
+    All graph properties required by the inputs are stored once as one contiguous values array plus row splits.
+    A batch is gathered from these arrays for a list of graph indices without looping over single graphs.
+    The output matches the keras input layer configs of the model and contains the batch IDs, subgraph IDs, counts
+    and offset indices as specified by the assignments. See :obj:`tf_dataset_disjoint_generator` for the definition
+    of the arguments.
+
+    .. code-block:: python
+
+        from kgcnn.io.loader import DisjointBatchCollator
+        collator = DisjointBatchCollator(
+            graphs, inputs=[{"name": "node_number", "shape": (), "dtype": "int64"},
+                            {"name": "edge_indices", "shape": (None, 2), "dtype": "int64"},
+                            {"name": "graph_id_node", "shape": (), "dtype": "int64"},
+                            {"name": "count_nodes", "shape": (), "dtype": "int64"}],
+            assignment_to_id=[0, 1], assignment_of_indices=[None, 0],
+            pos_batch_id=[2], pos_count=[3])
+        batch = collator([0, 1, 2])
+
+    """
+
+    def __init__(self,
+                 graphs,
+                 inputs: Union[list, dict],
+                 assignment_to_id: Union[list, dict] = None,
+                 assignment_of_indices: Union[list, dict] = None,
+                 pos_batch_id: Union[list, dict] = None,
+                 pos_subgraph_id: Union[list, dict] = None,
+                 pos_count: Union[list, dict] = None):
+        r"""Initialize collator and copy the graph properties into contiguous arrays.
+
+        Args:
+            graphs: List of dictionaries with named graph properties.
+            inputs: List or dict of keras input layer configs.
+            assignment_to_id: Assignment of if inputs to disjoint properties to IDs.
+            assignment_of_indices: Assignment of inputs (if they are indices) to their reference.
+            pos_batch_id: Position or name of batch IDs.
+            pos_subgraph_id: Position or name of batch IDs.
+            pos_count: Position or name of batch IDs.
+        """
+        self.num_graphs = len(graphs)
+        self._is_single_input = False
+        self._is_list_input = False
+        if isinstance(inputs, list):
+            self._is_list_input = True
+        elif isinstance(inputs, dict):
+            if "shape" in inputs and "dtype" in inputs:
+                inputs = {0: inputs}
+                self._is_single_input = True
+        else:
+            raise ValueError("Inputs must be list or dict of keras input layer kwargs.")
+
+        self.inputs = _convert_to_dict(inputs)
+        self.assignment_to_id = _convert_to_dict(assignment_to_id)
+        self.assignment_of_indices = _convert_to_dict(assignment_of_indices)
+        self.pos_batch_id = _convert_to_dict(pos_batch_id)
+        self.pos_subgraph_id = _convert_to_dict(pos_subgraph_id)
+        self.pos_count = _convert_to_dict(pos_count)
+
+        # Fill assignments with Nones if they are not used for input.
+        for key in self.inputs.keys():
+            if key not in self.assignment_to_id:
+                self.assignment_to_id[key] = None
+            if key not in self.assignment_of_indices:
+                self.assignment_of_indices[key] = None
+
+        flagged = set(self.pos_batch_id.values()) | set(self.pos_count.values()) | set(
+            self.pos_subgraph_id.values())
+        self.is_attributes = {i: i not in flagged for i in self.inputs.keys()}
+
+        # Contiguous values and row splits for disjoint properties or stacked values for graph properties.
+        self._values = {}
+        self._row_splits = {}
+        self._load_values(graphs)
+
+    def _load_values(self, graphs):
+        """Fill values and row splits from the graphs. Can be overwritten to gather from another source.
+
+        Lists that provide a buffer of concatenated values and row splits of a property via `_property_buffer` ,
+        e.g. :obj:`kgcnn.data.base.MemoryGraphList` , are used without copying the values. For memory-mapped datasets
+        this keeps the values in the shared page cache."""
+        for i, x in self.inputs.items():
+            if not self.is_attributes[i]:
+                continue
+            if self._load_buffer(i, graphs):
+                continue
+            array_list = [g[x["name"]] for g in graphs]
+            if self.assignment_to_id[i] is None:
+                self._values[i] = np.array(array_list, dtype=x["dtype"]) if len(array_list) > 0 else np.zeros(
+                    (0, ) + self._inner_shape(x), dtype=x["dtype"])
+            else:
+                self._values[i], self._row_splits[i] = self._values_and_row_splits(array_list, x)
+
+    def _load_buffer(self, key, graphs) -> bool:
+        """Take values and row splits of an input from the property buffer of the graphs, if possible."""
+        if not hasattr(graphs, "_property_buffer") or len(graphs) == 0:
+            return False
+        buffer = graphs._property_buffer(self.inputs[key]["name"])
+        if buffer is None:
+            return False
+        values, row_splits = buffer["values"], buffer["row_splits"]
+        if self.assignment_to_id[key] is not None:
+            self._values[key], self._row_splits[key] = values, row_splits
+            return True
+        if buffer["rank"] == 0:
+            self._values[key] = values
+            return True
+        # Graph properties of rank one or higher must have the same shape for all graphs to be stacked.
+        row_lengths = np.diff(row_splits)
+        if np.any(row_lengths != row_lengths[0]):
+            return False
+        self._values[key] = values.reshape((len(row_lengths), int(row_lengths[0])) + values.shape[1:])
+        return True
+
+    @staticmethod
+    def _inner_shape(input_config: dict) -> tuple:
+        """Static shape of a single element of an input with unknown dimensions set to zero."""
+        return tuple([d if d is not None else 0 for d in input_config.get("shape", ())])
+
+    @classmethod
+    def _values_and_row_splits(cls, array_list: list, input_config: dict = None):
+        row_lengths = np.array([len(x) for x in array_list], dtype="int64")
+        row_splits = np.concatenate([np.zeros(1, dtype="int64"), np.cumsum(row_lengths)])
+        if len(array_list) == 0:
+            input_config = input_config if input_config is not None else {}
+            return np.zeros((0, ) + cls._inner_shape(input_config), dtype=input_config.get("dtype")), row_splits
+        return np.concatenate(array_list, axis=0), row_splits
+
+    @property
+    def disjoint_keys(self) -> list:
+        """Keys of inputs that are disjoint properties, i.e. that have an ID assigned."""
+        return [i for i in self.inputs.keys() if self.is_attributes[i] and self.assignment_to_id[i] is not None]
+
+    def lengths(self, key) -> np.ndarray:
+        r"""Number of elements, i.e. the length of the first axis, of a disjoint property for each graph.
+
+        Args:
+            key: Key or position of the input.
+
+        Returns:
+            np.ndarray: Lengths of shape `(N, )` .
+        """
+        return np.diff(self._row_splits[key])
+
+    def max_batch_size(self, data_index: np.ndarray, batch_splits: np.ndarray) -> dict:
+        r"""Maximum total number of elements of disjoint properties for batches of a batch plan.
+
+        Args:
+            data_index (np.ndarray): Order of graph indices.
+            batch_splits (np.ndarray): Start positions of the batches in `data_index` .
+
+        Returns:
+            dict: Maximum size for each key of disjoint properties.
+        """
+        out = {}
+        for i in self.disjoint_keys:
+            totals = _batch_totals(self.lengths(i), data_index, batch_splits)
+            out[i] = int(np.amax(totals)) if len(totals) > 0 else 0
+        return out
+
+    def get_budgets(self, max_nodes_per_batch: int = None, max_edges_per_batch: int = None,
+                    max_elements_per_batch: dict = None) -> dict:
+        r"""Assign a maximum number of nodes and edges per batch to disjoint inputs. Each input that is assigned as
+        indices in :obj:`assignment_of_indices` gets the edge budget, e.g. edge and angle indices, and each input
+        they refer to gets the node budget. Without index inputs, the node budget is assigned to the first disjoint
+        input. Other inputs can be given their own budget by key or name in :obj:`max_elements_per_batch` .
+
+        Args:
+            max_nodes_per_batch (int): Maximum number of nodes in a batch. Default is None.
+            max_edges_per_batch (int): Maximum number of edges in a batch. Default is None.
+            max_elements_per_batch (dict): Maximum number of elements in a batch for keys or names of disjoint
+                inputs, which take precedence over node and edge budgets. Default is None.
+
+        Returns:
+            dict: Budget for keys of disjoint inputs.
+        """
+        budgets = {}
+        edge_keys = [i for i, x in self.assignment_of_indices.items() if x is not None and self.is_attributes[i]]
+        node_keys = []
+        for i in edge_keys:
+            if self.assignment_of_indices[i] not in node_keys:
+                node_keys.append(self.assignment_of_indices[i])
+        if len(node_keys) == 0:
+            node_keys = self.disjoint_keys[:1]
+        if max_nodes_per_batch is not None:
+            if len(node_keys) == 0:
+                raise ValueError("Can not find disjoint node input for `max_nodes_per_batch` .")
+            budgets.update({i: max_nodes_per_batch for i in node_keys})
+        if max_edges_per_batch is not None:
+            if len(edge_keys) == 0:
+                raise ValueError("Can not find disjoint index input for `max_edges_per_batch` .")
+            budgets.update({i: max_edges_per_batch for i in edge_keys})
+        if max_elements_per_batch is not None:
+            names = {x["name"]: i for i, x in self.inputs.items()}
+            for key, budget in max_elements_per_batch.items():
+                i = key if key in self.inputs else names.get(key)
+                if i not in self.disjoint_keys:
+                    raise ValueError("Can not find disjoint input '%s' for `max_elements_per_batch` ." % key)
+                budgets[i] = budget
+        return budgets
+
+    def batch_splits(self, data_index: np.ndarray, batch_size: int = None, budgets: dict = None) -> np.ndarray:
+        r"""Batch boundaries in :obj:`data_index` for fixed batch size or greedy packing up to budgets.
+
+        Args:
+            data_index (np.ndarray): Order of graph indices.
+            batch_size (int): Batch size or maximum number of graphs in a batch for budgets.
+            budgets (dict): Budgets from :obj:`get_budgets` . Default is None.
+
+        Returns:
+            np.ndarray: Batch boundaries of shape `(num_batches + 1, )` .
+        """
+        if budgets is not None and len(budgets) > 0:
+            return greedy_budget_batch_splits(data_index, [self.lengths(i) for i in budgets.keys()],
+                                              list(budgets.values()), batch_size=batch_size)
+        return np.append(np.arange(0, len(data_index), batch_size), len(data_index))
+
+    def _take(self, key, idx: np.ndarray):
+        return self._values[key][idx]
+
+    def _gather(self, key, idx: np.ndarray):
+        row_splits = self._row_splits[key]
+        starts = row_splits[idx]
+        counts = row_splits[idx + 1] - starts
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        return self._values[key][offsets + np.arange(len(offsets))], counts
+
+    def __call__(self, idx: Union[np.ndarray, list], padded_size: dict = None):
+        r"""Collate a batch of graphs.
+
+        Args:
+            idx (np.ndarray, list): Indices of the graphs in the batch.
+            padded_size (dict): Size to pad each disjoint property to. If given, a dummy graph is added at the
+                beginning of the batch, which holds the padded elements. Graph properties are also padded by one.
+                Default is None.
+
+        Returns:
+            tuple, dict, np.ndarray: Numpy arrays in the container of the inputs.
+        """
+        idx = np.asarray(idx, dtype="int64")
+        padded_disjoint = padded_size is not None
+        out = {i: None for i in self.inputs.keys()}
+        out_counts = {i: None for i in self.inputs.keys()}
+
+        for i in self.inputs.keys():
+            if not self.is_attributes[i]:
+                continue
+
+            if self.assignment_to_id[i] is None:
+                values = self._take(i, idx)
+                if padded_disjoint:
+                    values = pad_at_axis(values, (1, 0), axis=0)
+                out[i] = values
+                continue
+
+            values, counts = self._gather(i, idx)
+            ids = self.assignment_to_id[i]
+            if padded_disjoint:
+                num_pad_required = padded_size[i] - len(values) + 1
+                values = pad_at_axis(values, (num_pad_required, 0), axis=0)
+                counts = np.concatenate([np.array([num_pad_required], dtype=counts.dtype), counts], axis=0)
+            out[i] = values
+            out_counts[i] = counts
+
+            if ids in self.pos_count:
+                if out[self.pos_count[ids]] is None:
+                    out[self.pos_count[ids]] = counts
+            if ids in self.pos_batch_id:
+                if out[self.pos_batch_id[ids]] is None:
+                    out[self.pos_batch_id[ids]] = np.repeat(np.arange(len(counts), dtype="int64"), repeats=counts)
+            if ids in self.pos_subgraph_id:
+                if out[self.pos_subgraph_id[ids]] is None:
+                    out[self.pos_subgraph_id[ids]] = np.arange(np.sum(counts), dtype="int64") - np.repeat(
+                        np.cumsum(counts) - counts, repeats=counts)
+
+        # Indices
+        for i in self.inputs.keys():
+            if self.assignment_of_indices[i] is not None:
+                count_nodes = out_counts[self.assignment_of_indices[i]]
+                count_edges = out_counts[i]
+                node_splits = np.pad(np.cumsum(count_nodes), [[1, 0]])
+                offset_edge_indices = np.expand_dims(np.repeat(node_splits[:-1], count_edges), axis=-1)
+                out[i] = np.transpose(out[i] + offset_edge_indices)
+
+        # Cast to dtype of inputs.
+        out = {i: np.asarray(x, dtype=self.inputs[i]["dtype"]) if x is not None else x for i, x in out.items()}
+
+        # Match output container
+        if self._is_list_input:
+            out = tuple([out[i] for i in range(len(self.inputs))])
+        if self._is_single_input:
+            out = out[0]
+        return out
+
+
+def make_batch_collator(graphs, inputs: Union[list, dict], **kwargs) -> DisjointBatchCollator:
+    r"""Make a batch collator for a list of graphs. Datasets that are not held in memory can provide their own
+    collator by a `batch_collator` method, e.g. :obj:`kgcnn.data.disk.DiskGraphDataset` .
+
+    Args:
+        graphs: List of dictionaries with named graph properties or dataset.
+        inputs: List or dict of keras input layer configs.
+        kwargs: Kwargs for :obj:`DisjointBatchCollator` .
+
+    Returns:
+        DisjointBatchCollator: Collator for the graphs.
+    """
+    if hasattr(graphs, "batch_collator"):
+        return graphs.batch_collator(inputs=inputs, **kwargs)
+    return DisjointBatchCollator(graphs, inputs=inputs, **kwargs)
+
+
+def greedy_budget_batch_splits(data_index: np.ndarray, lengths: list, budgets: list,
+                               batch_size: int = None) -> np.ndarray:
+    r"""Pack graphs greedily in the order of :obj:`data_index` into batches with a maximum total number of elements,
+    e.g. number of nodes and edges. A graph that exceeds a budget on its own forms a single batch.
+
+    Args:
+        data_index (np.ndarray): Order of graph indices.
+        lengths (list): List of number of elements of each graph of shape `(N, )` for each budget.
+        budgets (list): List of maximum number of elements of a batch.
+        batch_size (int): Optional maximum number of graphs in a batch. Default is None.
+
+    Returns:
+        np.ndarray: Batch boundaries in :obj:`data_index` of shape `(num_batches + 1, )` .
+    """
+    num_graphs = len(data_index)
+    cumulative = [np.concatenate([np.zeros(1, dtype="int64"), np.cumsum(x[data_index])]) for x in lengths]
+    splits = [0]
+    start = 0
+    while start < num_graphs:
+        end = num_graphs if batch_size is None else min(num_graphs, start + batch_size)
+        for c, b in zip(cumulative, budgets):
+            end = min(end, int(np.searchsorted(c, c[start] + b, side="right")) - 1)
+        end = max(end, start + 1)
+        splits.append(end)
+        start = end
+    return np.array(splits, dtype="int64")
+
+
+class BucketBatchSampler:
+    r"""Batch sampler that groups graphs of similar size into buckets with static padded sizes.
+
+    Graphs are sorted by their number of elements, e.g. nodes and then edges, and split into :obj:`num_buckets`
+    buckets of equal number of graphs. Batches are only drawn within a bucket and each bucket has a fixed padded
+    size for each disjoint property, which is the sum of the :obj:`batch_size` largest graphs in the bucket.
+    This gives a small number of static shapes, e.g. for jit compilation, but much less padding than padding to the
+    largest batch of the dataset for long-tailed size distributions.
+
+    The last batch of a bucket is usually smaller than :obj:`batch_size` , which would change the number of graphs
+    in the batch. With :obj:`partial_batches='fill'` it is filled with other graphs of the same bucket and with
+    :obj:`partial_batches='drop'` it is dropped, so that all batches have :obj:`batch_size` graphs.
+
+    .. code-block:: python
+
+        import numpy as np
+        from kgcnn.io.loader import BucketBatchSampler
+        sampler = BucketBatchSampler({"nodes": np.array([3, 4, 20, 21]), "edges": np.array([4, 6, 40, 44])},
+                                     batch_size=2, num_buckets=2)
+        print(sampler.padding_efficiency())
+        for bucket, idx in sampler.sample():
+            print(bucket, idx, sampler.padded_size[bucket])
+
+    """
+
+    _partial_batches_options = ["fill", "drop", "keep"]
+
+    def __init__(self, lengths: Union[dict, list, np.ndarray], batch_size: int = 32, num_buckets: int = 4,
+                 shuffle: bool = True, seed: int = 42, partial_batches: str = "fill"):
+        r"""Initialize sampler with the sizes of the graphs.
+
+        Args:
+            lengths (dict, list, np.ndarray): Number of elements of each graph of shape `(N, )` for one or more
+                disjoint properties. The first property is used first for sorting.
+            batch_size (int): Batch size. Default is 32.
+            num_buckets (int): Number of buckets, i.e. static shapes. Default is 4.
+            shuffle (bool): Whether to shuffle graphs within buckets and the order of batches. Default is True.
+            seed (int): Seed for shuffle. Default is 42.
+            partial_batches (str): Whether to 'fill' the last batch of a bucket with other graphs of the bucket,
+                'drop' it or 'keep' it with less graphs. Default is 'fill'.
+        """
+        if partial_batches not in self._partial_batches_options:
+            raise ValueError("Unknown option '%s' for `partial_batches`, expected one of %s." % (
+                partial_batches, self._partial_batches_options))
+        if isinstance(lengths, np.ndarray):
+            lengths = [lengths]
+        self.lengths = {i: np.asarray(x, dtype="int64") for i, x in _convert_to_dict(lengths).items()}
+        self.batch_size = batch_size
+        self.num_buckets = num_buckets
+        self.shuffle = shuffle
+        self.partial_batches = partial_batches
+        self._rng = Generator(PCG64(seed=seed))
+        num_graphs = len(list(self.lengths.values())[0]) if len(self.lengths) > 0 else 0
+        if len(self.lengths) > 0:
+            order = np.lexsort(tuple(reversed(list(self.lengths.values()))))
+        else:
+            order = np.arange(num_graphs)
+        self.buckets = [x for x in np.array_split(order, min(num_buckets, max(num_graphs, 1))) if len(x) > 0]
+        self.padded_size = [{i: self._bucket_padded_size(x[b]) for i, x in self.lengths.items()} for b in self.buckets]
+
+    def _bucket_padded_size(self, lengths: np.ndarray) -> int:
+        """Sum of the largest graphs of a bucket for one batch. A bucket with less graphs than the batch size is
+        filled by repeating graphs."""
+        largest = np.sort(lengths)[-self.batch_size:]
+        num_missing = self.batch_size - len(largest) if self.partial_batches == "fill" else 0
+        return int(np.sum(largest)) + num_missing * int(np.amax(largest, initial=0))
+
+    def _num_batches(self, bucket: np.ndarray) -> int:
+        if self.partial_batches == "drop":
+            return len(bucket) // self.batch_size
+        return int(np.ceil(len(bucket) / self.batch_size))
+
+    def __len__(self):
+        """Number of batches per epoch."""
+        return int(sum([self._num_batches(b) for b in self.buckets]))
+
+    def _fill(self, bucket: np.ndarray, num_missing: int) -> np.ndarray:
+        """Graphs to fill the last batch of a bucket, which are taken from the graphs of the other batches."""
+        others = bucket[:len(bucket) - (self.batch_size - num_missing)]
+        replace = len(others) < num_missing
+        if replace:
+            others = bucket
+        if not self.shuffle:
+            return np.resize(others, num_missing)
+        return self._rng.choice(others, size=num_missing, replace=replace)
+
+    def sample(self) -> list:
+        r"""Make the batches for one epoch.
+
+        Returns:
+            list: List of tuples `(bucket, idx)` of the bucket index and the graph indices for each batch.
+        """
+        batches = []
+        for j, b in enumerate(self.buckets):
+            if self.shuffle:
+                b = self._rng.permutation(b)
+            for k in range(0, len(b), self.batch_size):
+                idx = b[k:k + self.batch_size]
+                num_missing = self.batch_size - len(idx)
+                if num_missing > 0 and self.partial_batches == "drop":
+                    continue
+                if num_missing > 0 and self.partial_batches == "fill":
+                    idx = np.concatenate([idx, self._fill(b, num_missing)])
+                batches.append((j, idx))
+        if self.shuffle:
+            batches = [batches[k] for k in self._rng.permutation(len(batches))]
+        return batches
+
+    def padding_efficiency(self) -> dict:
+        r"""Ratio of the number of elements of the graphs and the padded number of elements for one epoch.
+        Graphs that fill partial batches are counted as padding. For dropped batches, the expected number of elements
+        is used.
+
+        Returns:
+            dict: Padding efficiency for each disjoint property.
+        """
+        num_batches = [self._num_batches(b) for b in self.buckets]
+        fraction = [min(n * self.batch_size / len(b), 1.0) for n, b in zip(num_batches, self.buckets)]
+        out = {}
+        for i, x in self.lengths.items():
+            padded = sum([n * p[i] for n, p in zip(num_batches, self.padded_size)])
+            used = sum([f * np.sum(x[b]) for f, b in zip(fraction, self.buckets)])
+            out[i] = float(used / padded) if padded > 0 else 1.0
+        return out
+
+
 def tf_dataset_disjoint_generator(
         graphs,
         inputs: Union[list, dict],
@@ -30,7 +516,12 @@ def tf_dataset_disjoint_generator(
         epochs=None,
         padded_disjoint=False,
         shuffle=True,
-        seed=42
+        seed=42,
+        num_buckets=None,
+        max_nodes_per_batch=None,
+        max_edges_per_batch=None,
+        max_elements_per_batch=None,
+        partial_batches="fill"
 ):
     r"""Make a tensorflow dataset for disjoint graph loading.
 
@@ -46,6 +537,15 @@ def tf_dataset_disjoint_generator(
     Therefore, one batch ID for edges is enough. One could however assign as many as IDs as there are disjoint
     graph properties in `graph` .
 
+    Batches are collated by :obj:`DisjointBatchCollator` from contiguous arrays of the graph properties.
+    With :obj:`num_buckets` , batches are drawn by :obj:`BucketBatchSampler` from graphs of similar size and padded
+    disjoint tensors have one static shape per bucket. The last batch of each bucket is filled or dropped according
+    to :obj:`partial_batches` , so that also the number of graphs is static.
+    With :obj:`max_nodes_per_batch` or :obj:`max_edges_per_batch` , graphs are packed greedily into batches up to
+    a total number of nodes or edges, where :obj:`batch_size` is the maximum number of graphs in a batch.
+    Nodes and edges refer to the inputs that are assigned as reference and as indices in
+    :obj:`assignment_of_indices` , see :obj:`DisjointBatchCollator.get_budgets` .
+
     Args:
         graphs: List of dictionaries with named graph properties.
         inputs: List or dict of keras input layer configs.
@@ -55,189 +555,105 @@ def tf_dataset_disjoint_generator(
         pos_subgraph_id: Position or name of batch IDs.
         pos_count: Position or name of batch IDs.
         batch_size: Batch size.
-        epochs: Expected number of epochs. Only required for padded disjoint.
+        epochs: Expected number of epochs for padded disjoint. The batch plans of all epochs are replayed to pad to
+            the largest batch, so that the shapes are the same for all epochs. If None or for further epochs, each
+            epoch is padded to the largest batch of its own plan.
         padded_disjoint: If padded disjoint tensors should be generated.
         shuffle: Whether to shuffle each epoch.
         seed: Seed for shuffle.
+        num_buckets: Number of buckets for batches of graphs with similar size. Default is None.
+        max_nodes_per_batch: Maximum number of nodes in a batch. Default is None.
+        max_edges_per_batch: Maximum number of edges in a batch. Default is None.
+        max_elements_per_batch: Dict of maximum number of elements in a batch for keys or names of inputs.
+            Default is None.
+        partial_batches: Option of :obj:`BucketBatchSampler` for the last batch of a bucket. Default is 'fill'.
 
     Returns:
         tf.data.Dataset: Tensorflow dataset to load disjoint graphs.
     """
-    # Stats on the required dataset.
-    dataset_size = len(graphs)
-    data_index = np.arange(dataset_size)
-    num_inputs = len(inputs)
+    # Import tensorflow only if a dataset is actually requested, to keep `import kgcnn.data` light.
+    import tensorflow as tf
 
     # Check input information for outputspec.
-    is_single_input = False
-    is_list_input = False
     if isinstance(inputs, list):
-        is_list_input = True
         output_spec = tuple([tf.TensorSpec(shape=tuple([None] + list(x["shape"])), dtype=x["dtype"]) for x in inputs])
     elif isinstance(inputs, dict):
         if "shape" in inputs and "dtype" in inputs:
             output_spec = tf.TensorSpec(shape=tuple([None] + list(inputs["shape"])), dtype=inputs["dtype"])
-            inputs = {0: inputs}
-            is_single_input = True
-            num_inputs = 1
         else:
             output_spec = dict(
                 {i: tf.TensorSpec(shape=tuple([None] + list(x["shape"])), dtype=x["dtype"]) for i, x in inputs.items()})
     else:
         raise ValueError("Inputs must be list or dict of keras input layer kwargs.")
 
-    # We use a dict for both list and dict input.
-    def _convert_to_dict(container_to_check):
-        if container_to_check is None:
-            return {}
-        if isinstance(container_to_check, (list, tuple)):
-            return {i: x for i, x in enumerate(container_to_check)}
-        if not isinstance(container_to_check, dict):
-            raise ValueError("Must be dict or list for mapping and containers.")
-        return container_to_check
-
-    inputs = _convert_to_dict(inputs)
-    assignment_to_id = _convert_to_dict(assignment_to_id)
-    assignment_of_indices = _convert_to_dict(assignment_of_indices)
-    pos_batch_id = _convert_to_dict(pos_batch_id)
-    pos_subgraph_id = _convert_to_dict(pos_subgraph_id)
-    pos_count = _convert_to_dict(pos_count)
-
-    # Fill assignments with Nones if they are not used for input.
-    if len(assignment_to_id) < num_inputs:
-        for key, values in inputs.items():
-            if key not in assignment_to_id.keys():
-                assignment_to_id[key] = None
-    if len(assignment_of_indices) < num_inputs:
-        for key, values in inputs.items():
-            if key not in assignment_of_indices.keys():
-                assignment_of_indices[key] = None
-
-    flag_batch_id = {i: None for i in inputs.keys()}
-    for i, x in pos_batch_id.items():
-        flag_batch_id[x] = i
-
-    flag_count = {i: None for i in inputs.keys()}
-    for i, x in pos_count.items():
-        flag_count[x] = i
-
-    flag_subgraph_id = {i: None for i in inputs.keys()}
-    for i, x in pos_subgraph_id.items():
-        flag_subgraph_id[x] = i
-
-    all_flags = [flag_batch_id, flag_count, flag_subgraph_id]
-    is_attributes = {i: True if all([x[i] is None for x in all_flags]) else False for i in inputs.keys()}
-
-    max_size = {i: [] if assignment_to_id[i] is not None else None for i in inputs.keys()}
-    total_max = {i: [] if assignment_to_id[i] is not None else None for i in inputs.keys()}
-
-    # We can check the maximum batch size at the beginning or just have a maximum batch size for each epoch.
-    if padded_disjoint:
-        if epochs is None:
-            raise ValueError("Requires number of epochs if `padded_disjoint=True` .")
-
-        for i in inputs.keys():
-            if assignment_to_id[i] is None:
-                continue
-            len_list = [len(x[inputs[i]["name"]]) for x in graphs]
-            total_max[i] = max(len_list)
-
-        rng = Generator(PCG64(seed=seed))
-
-        for epoch in range(epochs):
-            max_size_epoch = {i: [] if assignment_to_id[i] is not None else None for i in inputs.keys()}
-            if shuffle:
-                rng.shuffle(data_index)
-            for batch_index in range(0, dataset_size, batch_size):
-                idx = data_index[batch_index:batch_index + batch_size]
-                graphs_batch = [graphs[i] for i in idx]
-                for i in inputs.keys():
-                    if assignment_to_id[i] is None:
-                        continue
-                    len_list = [len(x[inputs[i]["name"]]) for x in graphs_batch]
-                    max_length = sum(len_list)
-                    max_size_epoch[i].append(max_length)
-            for i, x in max_size_epoch.items():
-                if x is not None:
-                    max_size[i].append(max(x))
-        max_size = {i: max(x) if x is not None else None for i, x in max_size.items()}
+    collator = make_batch_collator(
+        graphs, inputs=inputs, assignment_to_id=assignment_to_id, assignment_of_indices=assignment_of_indices,
+        pos_batch_id=pos_batch_id, pos_subgraph_id=pos_subgraph_id, pos_count=pos_count)
 
+    # Stats on the required dataset.
+    dataset_size = len(graphs)
+    max_size = None
+
+    # Budget of nodes and edges for each batch.
+    budgets = collator.get_budgets(max_nodes_per_batch=max_nodes_per_batch, max_edges_per_batch=max_edges_per_batch,
+                                   max_elements_per_batch=max_elements_per_batch)
+
+    def epoch_batch_splits(index: np.ndarray):
+        return collator.batch_splits(index, batch_size=batch_size, budgets=budgets)
+
+    if num_buckets is not None:
+        if len(budgets) > 0:
+            raise ValueError("Can not use `num_buckets` together with budgets of elements per batch.")
+        sampler = BucketBatchSampler({i: collator.lengths(i) for i in collator.disjoint_keys}, batch_size=batch_size,
+                                     num_buckets=num_buckets, shuffle=shuffle, seed=seed,
+                                     partial_batches=partial_batches)
+        module_logger.info("Padded max of disjoint for buckets: %s." % sampler.padded_size)
+        module_logger.info("Padding efficiency of buckets: %s." % sampler.padding_efficiency())
+
+        def bucket_generator():
+            for bucket, idx in sampler.sample():
+                yield collator(idx, padded_size=sampler.padded_size[bucket] if padded_disjoint else None)
+
+        return tf.data.Dataset.from_generator(bucket_generator, output_signature=output_spec)
+
+    def epoch_plan(plan_rng: Generator):
+        index = plan_rng.permutation(dataset_size) if shuffle else np.arange(dataset_size)
+        return index, epoch_batch_splits(index)
+
+    # The plans of all epochs are replayed with the same seed to find the largest batch over all epochs.
+    if padded_disjoint and epochs is not None:
+        replay_rng = Generator(PCG64(seed=seed))
+        max_size = {i: 0 for i in collator.disjoint_keys}
+        num_batches = 0
+        for _ in range(epochs):
+            index, batch_splits = epoch_plan(replay_rng)
+            num_batches += len(batch_splits) - 1
+            max_size_epoch = collator.max_batch_size(index, batch_splits[:-1])
+            max_size = {i: max(x, max_size_epoch[i]) for i, x in max_size.items()}
+        total_max = {i: int(np.amax(collator.lengths(i), initial=0)) for i in collator.disjoint_keys}
         module_logger.info("Max of graph: %s." % total_max)
         module_logger.info("Padded max of disjoint: %s." % [
-            x/batch_size if x is not None else None for x in max_size.values()])
+            x/batch_size if batch_size is not None else x for x in max_size.values()])
+        module_logger.info("Padding efficiency: %s." % {
+            i: float(epochs * np.sum(collator.lengths(i)) / (x * num_batches)) if x > 0 else 1.0
+            for i, x in max_size.items()})
+    elif padded_disjoint:
+        module_logger.info("Padded size of disjoint is set for each epoch, since `epochs` is not given.")
 
-    data_index = np.arange(dataset_size)
     rng = Generator(PCG64(seed=seed))
+    epoch_count = [0]
 
     def generator():
-
-        if shuffle:
-            rng.shuffle(data_index)
-
-        for batch_index in range(0, dataset_size, batch_size):
-            idx = data_index[batch_index:batch_index + batch_size]
-            graphs_batch = [graphs[i] for i in idx]
-
-            out = {i: None for i in inputs.keys()}
-            out_counts = {i: None for i in inputs.keys()}
-
-            for i in inputs.keys():
-                if not is_attributes[i]:
-                    continue
-
-                array_list = [x[inputs[i]["name"]] for x in graphs_batch]
-                if assignment_to_id[i] is None:
-                    values = np.array(array_list, dtype=inputs[i]["dtype"])
-                    if padded_disjoint:
-                        values = pad_at_axis(values, (1, 0), axis=0)
-                    out[i] = values
-                else:
-                    values = np.concatenate(array_list, axis=0)
-                    counts = np.array([len(x) for x in array_list], dtype="int64")
-                    ids = assignment_to_id[i]
-
-                    if not padded_disjoint:
-                        out[i] = values
-                        out_counts[i] = counts
-                    else:
-                        len_values = len(values)
-                        num_pad_required = max_size[i] - len_values + 1
-                        values = pad_at_axis(values, (num_pad_required, 0), axis=0)
-                        out[i] = values
-                        counts = np.concatenate([np.array([num_pad_required], dtype=counts.dtype), counts], axis=0)
-                        out_counts[i] = counts
-
-                    if ids in pos_count:
-                        if out[pos_count[ids]] is None:
-                            out[pos_count[ids]] = counts
-                    if ids in pos_batch_id:
-                        if out[pos_batch_id[ids]] is None:
-                            out[pos_batch_id[ids]] = np.repeat(
-                                np.arange(len(counts), dtype="int64"), repeats=counts)
-                    if ids in pos_subgraph_id:
-                        if out[pos_subgraph_id[ids]] is None:
-                            out[pos_subgraph_id[ids]] = np.concatenate(
-                                [np.arange(x, dtype="int64") for x in counts], axis=0)
-
-            # Indices
-            for i in inputs.keys():
-                if assignment_of_indices[i] is not None:
-                    edge_indices_flatten = out[i]
-                    count_nodes = out_counts[assignment_of_indices[i]]
-                    count_edges = out_counts[i]
-                    node_splits = np.pad(np.cumsum(count_nodes), [[1, 0]])
-                    offset_edge_indices = np.expand_dims(np.repeat(node_splits[:-1], count_edges), axis=-1)
-                    disjoint_indices = edge_indices_flatten + offset_edge_indices
-                    disjoint_indices = np.transpose(disjoint_indices)
-                    out[i] = disjoint_indices
-
-            # Match output container
-            if is_list_input:
-                out = tuple([out[i] for i in range(num_inputs)])
-            if is_single_input:
-                out = out[0]
-
-            yield out
+        data_index, batch_splits = epoch_plan(rng)
+        padded_size = None
+        if padded_disjoint:
+            if max_size is not None and epoch_count[0] < epochs:
+                padded_size = max_size
+            else:
+                padded_size = collator.max_batch_size(data_index, batch_splits[:-1])
+        epoch_count[0] += 1
+        for batch_start, batch_end in zip(batch_splits[:-1], batch_splits[1:]):
+            yield collator(data_index[batch_start:batch_end], padded_size=padded_size)
 
     data_loader = tf.data.Dataset.from_generator(
         generator,
@@ -245,3 +661,176 @@ def tf_dataset_disjoint_generator(
     )
 
     return data_loader
+
+
+class BudgetBatchSampler:
+    r"""Iterable of batches of graph indices that packs graphs greedily up to budgets of elements per batch,
+    e.g. for :obj:`kgcnn.io.loader_torch.DisjointGraphTorchDataset` .
+
+    With shuffle, the number of batches depends on the order of the graphs. The plan of the next epoch is therefore
+    made once and used for both :obj:`__len__` and :obj:`__iter__` , so that the length is exact for each epoch.
+    """
+
+    def __init__(self, collator: DisjointBatchCollator, batch_size: int = None, budgets: dict = None,
+                 shuffle: bool = True, seed: int = 42):
+        r"""Initialize sampler.
+
+        Args:
+            collator (DisjointBatchCollator): Collator of the graphs that provides the lengths for budgets.
+            batch_size (int): Maximum number of graphs in a batch. Default is None.
+            budgets (dict): Budgets from :obj:`DisjointBatchCollator.get_budgets` . Default is None.
+            shuffle (bool): Whether to shuffle each epoch. Default is True.
+            seed (int): Seed for shuffle. Default is 42.
+        """
+        self.collator = collator
+        self.batch_size = batch_size
+        self.budgets = budgets
+        self.shuffle = shuffle
+        self._rng = Generator(PCG64(seed=seed))
+        self._next_batches = None
+        self._current_batches = None
+
+    def _make_batches(self) -> list:
+        data_index = np.arange(self.collator.num_graphs)
+        if self.shuffle:
+            self._rng.shuffle(data_index)
+        batch_splits = self.collator.batch_splits(data_index, batch_size=self.batch_size, budgets=self.budgets)
+        return [data_index[i:j].tolist() for i, j in zip(batch_splits[:-1], batch_splits[1:])]
+
+    def __iter__(self):
+        if self._next_batches is None:
+            self._next_batches = self._make_batches()
+        self._current_batches, self._next_batches = self._next_batches, None
+        try:
+            for idx in self._current_batches:
+                yield idx
+        finally:
+            self._current_batches = None
+
+    def __len__(self):
+        """Number of batches of the epoch that is running or of the next epoch."""
+        if self._current_batches is not None:
+            return len(self._current_batches)
+        if self._next_batches is None:
+            self._next_batches = self._make_batches()
+        return len(self._next_batches)
+
+
+_worker_collator = None
+
+
+def _init_worker_collator(collator: DisjointBatchCollator):
+    global _worker_collator
+    _worker_collator = collator
+
+
+def _collate_in_worker(idx: np.ndarray, padded_size: dict = None):
+    return _worker_collator(idx, padded_size=padded_size)
+
+
+class DisjointGraphNumpyLoader:
+    r"""Iterator over disjoint batches of numpy arrays, e.g. for the jax backend, which prefetches batches in a
+    background thread or collates them in worker processes.
+
+    The output is the same as for :obj:`tf_dataset_disjoint_generator` and batches are made by
+    :obj:`DisjointBatchCollator` . Each iteration over the loader is one epoch. The worker processes are started once
+    and reused for all epochs, unless :obj:`persistent_workers=False` . Call :obj:`close` to shut them down.
+
+    .. code-block:: python
+
+        from kgcnn.io.loader import DisjointGraphNumpyLoader
+        loader = DisjointGraphNumpyLoader(graphs, inputs=inputs, assignment_to_id=[0, 1],
+                                          assignment_of_indices=[None, 0], pos_batch_id=[2, 3], pos_count=[4, 5],
+                                          batch_size=32, num_workers=2)
+        for epoch in range(10):
+            for batch in loader:
+                pass
+        loader.close()
+
+    """
+
+    def __init__(self, graphs, inputs: Union[list, dict], batch_size: int = 32, shuffle: bool = True,
+                 seed: int = 42, max_nodes_per_batch: int = None, max_edges_per_batch: int = None,
+                 padded_size: dict = None, prefetch: int = 2, num_workers: int = 0,
+                 max_elements_per_batch: dict = None, persistent_workers: bool = True, **kwargs):
+        r"""Initialize loader.
+
+        Args:
+            graphs: List of dictionaries with named graph properties.
+            inputs: List or dict of keras input layer configs.
+            batch_size (int): Batch size or maximum number of graphs in a batch for budgets. Default is 32.
+            shuffle (bool): Whether to shuffle each epoch. Default is True.
+            seed (int): Seed for shuffle. Default is 42.
+            max_nodes_per_batch (int): Maximum number of nodes in a batch. Default is None.
+            max_edges_per_batch (int): Maximum number of edges in a batch. Default is None.
+            padded_size (dict): Size to pad each disjoint property to. See :obj:`DisjointBatchCollator` .
+                Default is None.
+            prefetch (int): Number of batches to prepare in advance. Default is 2.
+            num_workers (int): Number of worker processes for collation. Default is 0, which uses a thread.
+            max_elements_per_batch (dict): Maximum number of elements in a batch for keys or names of inputs.
+                Default is None.
+            persistent_workers (bool): Whether to keep the workers between epochs. Default is True.
+            kwargs: Kwargs for assignments of :obj:`DisjointBatchCollator` .
+        """
+        self.collator = make_batch_collator(graphs, inputs=inputs, **kwargs)
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.budgets = self.collator.get_budgets(
+            max_nodes_per_batch=max_nodes_per_batch, max_edges_per_batch=max_edges_per_batch,
+            max_elements_per_batch=max_elements_per_batch)
+        self.padded_size = padded_size
+        self.prefetch = prefetch
+        self.num_workers = num_workers
+        self.persistent_workers = persistent_workers
+        self._rng = Generator(PCG64(seed=seed))
+        self._data_index = np.arange(self.collator.num_graphs)
+        self._executor = None
+
+    def __len__(self):
+        return len(self.collator.batch_splits(self._data_index, batch_size=self.batch_size, budgets=self.budgets)) - 1
+
+    def _get_executor(self):
+        if self._executor is None:
+            if self.num_workers > 0:
+                self._executor = ProcessPoolExecutor(max_workers=self.num_workers, initializer=_init_worker_collator,
+                                                     initargs=(self.collator,))
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+        return self._executor
+
+    def close(self):
+        """Shut down the worker processes or thread."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __del__(self):
+        if getattr(self, "_executor", None) is not None:
+            self.close()
+
+    def __iter__(self):
+        if self.shuffle:
+            self._rng.shuffle(self._data_index)
+        batch_splits = self.collator.batch_splits(self._data_index, batch_size=self.batch_size, budgets=self.budgets)
+        batches = [self._data_index[i:j].copy() for i, j in zip(batch_splits[:-1], batch_splits[1:])]
+        executor = self._get_executor()
+        if self.num_workers > 0:
+            collate = _collate_in_worker
+            num_in_flight = self.num_workers + self.prefetch
+        else:
+            collate = self.collator
+            num_in_flight = max(self.prefetch, 1)
+        futures = deque()
+        try:
+            for idx in batches:
+                futures.append(executor.submit(collate, idx, padded_size=self.padded_size))
+                if len(futures) >= num_in_flight:
+                    yield futures.popleft().result()
+            while len(futures) > 0:
+                yield futures.popleft().result()
+        finally:
+            # Batches of an epoch that was not finished are not needed anymore.
+            for future in futures:
+                future.cancel()
+            if not self.persistent_workers:
+                self.close()
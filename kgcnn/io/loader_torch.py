@@ -0,0 +1,83 @@
+import numpy as np
+import torch
+from typing import Union
+from torch.utils.data import Dataset
+from kgcnn.io.loader import make_batch_collator, BudgetBatchSampler
+
+
+class DisjointGraphTorchDataset(Dataset):
+    r"""Map-style dataset of graph indices for :obj:`torch.utils.data.DataLoader` with :obj:`collate` function to
+    make disjoint batches of :obj:`torch.Tensor` via :obj:`kgcnn.io.loader.DisjointBatchCollator` .
+
+    The output is the same as for :obj:`kgcnn.io.loader.tf_dataset_disjoint_generator` . Collation runs in the worker
+    processes of the data loader and the tensors can be pinned with :obj:`pin_memory` .
+
+    .. code-block:: python
+
+        from torch.utils.data import DataLoader
+        from kgcnn.io.loader_torch import DisjointGraphTorchDataset
+        dataset = DisjointGraphTorchDataset(graphs, inputs=inputs, assignment_to_id=[0, 1],
+                                            assignment_of_indices=[None, 0], pos_batch_id=[2, 3], pos_count=[4, 5])
+        loader = DataLoader(dataset, batch_size=32, shuffle=True, collate_fn=dataset.collate,
+                            num_workers=4, pin_memory=True)
+
+    A batch sampler, e.g. from :obj:`batch_sampler` for node and edge budgets, can be passed to the data loader.
+    """
+
+    def __init__(self, graphs, inputs: Union[list, dict], padded_size: dict = None, **kwargs):
+        r"""Initialize dataset.
+
+        Args:
+            graphs: List of dictionaries with named graph properties.
+            inputs: List or dict of keras input layer configs.
+            padded_size (dict): Size to pad each disjoint property to. See :obj:`DisjointBatchCollator` .
+                Default is None.
+            kwargs: Kwargs for assignments of :obj:`DisjointBatchCollator` .
+        """
+        self.collator = make_batch_collator(graphs, inputs=inputs, **kwargs)
+        self.padded_size = padded_size
+
+    def __len__(self):
+        return self.collator.num_graphs
+
+    def __getitem__(self, item):
+        return int(item)
+
+    def batch_sampler(self, batch_size: int = None, max_nodes_per_batch: int = None,
+                      max_edges_per_batch: int = None, shuffle: bool = True, seed: int = 42,
+                      max_elements_per_batch: dict = None) -> BudgetBatchSampler:
+        r"""Make a batch sampler for the data loader that packs graphs greedily up to node and edge budgets.
+
+        Args:
+            batch_size (int): Maximum number of graphs in a batch. Default is None.
+            max_nodes_per_batch (int): Maximum number of nodes in a batch. Default is None.
+            max_edges_per_batch (int): Maximum number of edges in a batch. Default is None.
+            shuffle (bool): Whether to shuffle each epoch.
+            seed (int): Seed for shuffle.
+            max_elements_per_batch (dict): Maximum number of elements in a batch for keys or names of inputs.
+                Default is None.
+
+        Returns:
+            BudgetBatchSampler: Iterable of lists of graph indices.
+        """
+        return BudgetBatchSampler(
+            self.collator, batch_size=batch_size, budgets=self.collator.get_budgets(
+                max_nodes_per_batch=max_nodes_per_batch, max_edges_per_batch=max_edges_per_batch,
+                max_elements_per_batch=max_elements_per_batch),
+            shuffle=shuffle, seed=seed)
+
+    def collate(self, batch: list):
+        r"""Collate list of graph indices into disjoint tensors.
+
+        Args:
+            batch (list): List of graph indices.
+
+        Returns:
+            tuple, dict, torch.Tensor: Tensors in the container of the inputs.
+        """
+        out = self.collator(np.array(batch, dtype="int64"), padded_size=self.padded_size)
+        if isinstance(out, tuple):
+            return tuple([torch.from_numpy(np.ascontiguousarray(x)) for x in out])
+        if isinstance(out, dict):
+            return {key: torch.from_numpy(np.ascontiguousarray(x)) for key, x in out.items()}
+        return torch.from_numpy(np.ascontiguousarray(out))
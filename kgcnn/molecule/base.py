@@ -113,24 +113,26 @@ class MolGraphInterface:
         """Return a list of edge number that represents the bond order."""
         raise NotImplementedError("Method for `MolGraphInterface` must be implemented in sub-class.")
 
-    def edge_attributes(self, properties: list, encoder: dict):
+    def edge_attributes(self, properties: list, encoder: dict, cache=None):
         """Make edge attributes.
 
         Args:
             properties (list): List of string identifier for a molecular property. Must match backend features.
             encoder (dict): A dictionary of callable encoder function or class for each string identifier.
+            cache (FeatureCache): Optional cache of feature vectors for raw descriptors. Default is None.
 
         Returns:
             list: List of attributes after processed by the encoder.
         """
         raise NotImplementedError("Method for `MolGraphInterface` must be implemented in sub-class.")
 
-    def node_attributes(self, properties: list, encoder: dict):
+    def node_attributes(self, properties: list, encoder: dict, cache=None):
         """Make node attributes.
 
         Args:
             properties (list): List of string identifier for a molecular property. Must match backend features.
             encoder (dict): A dictionary of callable encoder function or class for each string identifier.
+            cache (FeatureCache): Optional cache of feature vectors for raw descriptors. Default is None.
 
         Returns:
             list: List of attributes after processed by the encoder.
@@ -149,6 +151,56 @@ class MolGraphInterface:
         """
         raise NotImplementedError("Method for `MolGraphInterface` must be implemented in sub-class.")
 
+    @staticmethod
+    def _encode_attributes(item, properties: list, fun_dict: dict, encoder: dict, cache=None) -> list:
+        """Compute the flat list of (encoded) attributes for an atom, bond or molecule.
+
+        If a :obj:`FeatureCache` is given and all properties are string identifiers, the raw descriptors of the item
+        together with the properties and encoders are used as key to reuse the encoded feature vector. Encoders must
+        therefore not depend on the item itself.
+
+        Args:
+            item: Atom, bond or molecule of the backend.
+            properties (list): List of checked string identifiers or callable objects that receive the item.
+            fun_dict (dict): Dictionary of functions to compute raw descriptors for string identifiers.
+            encoder (dict): Dictionary of checked encoders for string identifiers.
+            cache (FeatureCache): Optional cache of feature vectors for raw descriptors. Default is None.
+
+        Returns:
+            list: List of attributes.
+        """
+        if cache is not None and all([isinstance(k, str) for k in properties]):
+            descriptors = tuple([fun_dict[k](item) for k in properties])
+            key = cache.make_key(properties, [encoder.get(k) for k in properties], descriptors)
+            if key is None:
+                return MolGraphInterface._flatten_attributes(
+                    [encoder[k](x) if k in encoder else x for k, x in zip(properties, descriptors)])
+            attr = cache.get(key)
+            if attr is None:
+                attr = MolGraphInterface._flatten_attributes(
+                    [encoder[k](x) if k in encoder else x for k, x in zip(properties, descriptors)])
+                cache.put(key, attr)
+            return list(attr)
+        values = []
+        for k in properties:
+            if isinstance(k, str):
+                values.append(encoder[k](fun_dict[k](item)) if k in encoder else fun_dict[k](item))
+            else:
+                values.append(k(item))
+        return MolGraphInterface._flatten_attributes(values)
+
+    @staticmethod
+    def _flatten_attributes(values: list) -> list:
+        attr = []
+        for temp in values:
+            if isinstance(temp, np.ndarray):
+                temp = temp.tolist()
+            if isinstance(temp, (list, tuple)):
+                attr += list(temp)
+            else:
+                attr.append(temp)
+        return attr
+
     @staticmethod
     def _check_encoder(encoder: dict, possible_keys: list, raise_error: bool = False):
         """Verify and check if encoder dictionary inputs is within possible properties. If a key has to be removed,
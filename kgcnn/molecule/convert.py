@@ -1,9 +1,12 @@
 import os
+import time
 import logging
-from typing import Callable
-from kgcnn.molecule.io import read_mol_list_from_sdf_file, read_xyz_file, read_smiles_file, write_mol_block_list_to_sdf, \
-    parse_list_to_xyz_str
-from concurrent.futures import ThreadPoolExecutor  # , ProcessPoolExecutor
+import multiprocessing
+import multiprocessing.connection
+from typing import Callable, Iterator
+from kgcnn.molecule.io import read_mol_list_from_sdf_file, iter_xyz_file, read_smiles_file, parse_list_to_xyz_str, \
+    SDFFileWriter, IndexedSDFFile
+from concurrent.futures import ThreadPoolExecutor
 from kgcnn.molecule.external.ballloon import BalloonInterface
 from typing import Union
 
@@ -184,6 +187,93 @@ except ImportError:
     openbabel_smile_to_mol, openbabel_xyz_to_mol = None, None
 
 
+def _conversion_worker(connection, conversion_method: Callable, args: tuple):
+    """Convert items received from connection one at a time until None is received."""
+    while True:
+        item = connection.recv()
+        if item is None:
+            break
+        connection.send(conversion_method(item, *args))
+
+
+def _convert_in_processes(conversion_method: Callable, item_list: list, num_workers: int, args: tuple = (),
+                          timeout: float = None, max_pending: int = None) -> Iterator:
+    r"""Convert items with a pool of worker processes and yield results in the order of :obj:`item_list` .
+
+    Each worker converts one item at a time. A worker that exceeds :obj:`timeout` for an item or that crashes is
+    replaced by a new process and None is returned for the item.
+
+    Args:
+        conversion_method (Callable): Picklable function that converts a single item with `args` .
+        item_list (list): List of items, e.g. smiles.
+        num_workers (int): Number of worker processes.
+        args (tuple): Additional arguments for `conversion_method` .
+        timeout (float): Timeout in seconds for a single item. Default is None.
+        max_pending (int): Maximum number of results to keep for ordering. Default is None, which is 100 times
+            `num_workers` .
+
+    Returns:
+        Iterator: Converted items.
+    """
+    context = multiprocessing.get_context()
+    max_pending = max_pending if max_pending is not None else 100 * num_workers
+
+    def start_worker():
+        parent_connection, child_connection = context.Pipe()
+        process = context.Process(target=_conversion_worker, args=(child_connection, conversion_method, args),
+                                  daemon=True)
+        process.start()
+        child_connection.close()
+        return parent_connection, process
+
+    idle = [start_worker() for _ in range(min(num_workers, len(item_list)))]
+    busy = {}
+    results = {}
+    next_item, next_result = 0, 0
+    try:
+        while next_result < len(item_list):
+            while len(idle) > 0 and next_item < len(item_list) and next_item - next_result < max_pending:
+                connection, process = idle.pop()
+                connection.send(item_list[next_item])
+                busy[connection] = (process, next_item, time.monotonic())
+                next_item += 1
+            wait_time = None
+            if timeout is not None:
+                wait_time = max(min([x[2] for x in busy.values()]) + timeout - time.monotonic(), 0.0)
+            for connection in multiprocessing.connection.wait(list(busy.keys()), timeout=wait_time):
+                process, index, _ = busy.pop(connection)
+                try:
+                    results[index] = connection.recv()
+                    idle.append((connection, process))
+                except EOFError:
+                    module_logger.warning("Worker process failed for item %s." % index)
+                    results[index] = None
+                    process.join()
+                    connection.close()
+                    idle.append(start_worker())
+            if timeout is not None:
+                now = time.monotonic()
+                for connection in [c for c, x in busy.items() if now - x[2] >= timeout]:
+                    process, index, _ = busy.pop(connection)
+                    module_logger.warning("Timeout of %s s for item %s." % (timeout, index))
+                    results[index] = None
+                    process.kill()
+                    process.join()
+                    connection.close()
+                    idle.append(start_worker())
+            while next_result in results:
+                yield results.pop(next_result)
+                next_result += 1
+    finally:
+        for connection, process in idle:
+            connection.send(None)
+        for connection, process in idle:
+            process.join()
+        for connection, (process, _, _) in busy.items():
+            process.kill()
+            process.join()
+
+
 class MolConverter:
 
     def __init__(self, base_path: str = None):
@@ -221,21 +311,39 @@ class MolConverter:
             mol_list = list(result)
             return mol_list
 
+    def _convert_iter(self, conversion_method: Callable, smile_list: list, num_workers: int, args: tuple,
+                      backend: str = "thread", timeout: float = None, batch_size: int = 5000) -> Iterator:
+        if backend == "process":
+            if rdkit_smile_to_mol is None and openbabel_smile_to_mol is None:
+                raise ModuleNotFoundError("Can not convert smiles. Missing `RDkit` or `OpenBabel` packages.")
+            num_workers = num_workers if num_workers is not None else os.cpu_count()
+            yield from _convert_in_processes(conversion_method, smile_list, num_workers, args, timeout=timeout)
+            return
+        if backend != "thread":
+            raise ValueError("Unknown backend '%s' for conversion. Use 'thread' or 'process'." % backend)
+        if timeout is not None:
+            module_logger.warning("Timeout is only supported for backend 'process'.")
+        for i in range(0, len(smile_list), batch_size):
+            yield from self._convert_parallel(conversion_method, smile_list[i:i + batch_size], num_workers, *args)
+
     @staticmethod
     def _single_smile_to_mol(smile: str,
                              sanitize: bool = True,
                              add_hydrogen: bool = True,
                              make_conformers: bool = True,
-                             optimize_conformer: bool = True):
+                             optimize_conformer: bool = True,
+                             random_seed: int = 42):
         if rdkit_smile_to_mol is not None:
             mol = rdkit_smile_to_mol(smile=smile, sanitize=sanitize, add_hydrogen=add_hydrogen,
-                                     make_conformers=make_conformers, optimize_conformer=optimize_conformer)
+                                     make_conformers=make_conformers, optimize_conformer=optimize_conformer,
+                                     random_seed=random_seed)
             if mol is not None:
                 return mol
 
         if openbabel_smile_to_mol is not None:
             mol = openbabel_smile_to_mol(smile=smile, sanitize=sanitize, add_hydrogen=add_hydrogen,
-                                         make_conformers=make_conformers, optimize_conformer=optimize_conformer)
+                                         make_conformers=make_conformers, optimize_conformer=optimize_conformer,
+                                         random_seed=random_seed)
             if mol is not None:
                 return mol
 
@@ -244,20 +352,32 @@ class MolConverter:
 
     def smile_to_mol(self, smiles_path: str, sdf_path: str, external_program: dict = None, num_workers: int = None,
                      sanitize: bool = True, add_hydrogen: bool = True, make_conformers: bool = True,
-                     optimize_conformer: bool = True, logger=None, batch_size: int = 5000):
+                     optimize_conformer: bool = True, logger=None, batch_size: int = 5000, random_seed: int = 42,
+                     backend: str = "thread", timeout: float = None, return_mol_list: bool = True):
         """Convert a smiles file to SDF structure file.
 
+        The mol blocks are written to the SDF file in the order of the smiles as soon as they are converted.
+        With :obj:`backend='process'` the smiles are converted in a pool of worker processes, which is not limited by
+        the GIL. A worker that exceeds :obj:`timeout` for a single smile is restarted and the molecule is written as
+        failed mol block.
+
         Args:
-            smiles_path:
-            sdf_path:
-            external_program:
-            num_workers:
-            sanitize:
-            add_hydrogen:
-            make_conformers:
-            optimize_conformer:
-            logger:
-            batch_size:
+            smiles_path (str): File path of smiles file.
+            sdf_path (str): File path of SDF file to write.
+            external_program (dict): External program for conversion. Default is None.
+            num_workers (int): Number of threads or processes. Default is None, which uses the number of CPUs.
+            sanitize (bool): Whether to sanitize molecule. Default is True.
+            add_hydrogen (bool): Whether to add hydrogen. Default is True.
+            make_conformers (bool): Whether to embed a conformer. Default is True.
+            optimize_conformer (bool): Whether to optimize conformer with force field. Default is True.
+            logger: Logger to report progress. Default is None.
+            batch_size (int): Number of molecules per batch for threads and progress updates. Default is 5000.
+            random_seed (int): Seed for embedding conformers. Default is 42.
+            backend (str): Either 'thread' or 'process'. Default is 'thread'.
+            timeout (float): Timeout in seconds for the conversion of a single smile. Only for 'process' backend.
+                Default is None.
+            return_mol_list (bool): Whether to return the list of mol-strings. If False, mol-strings are not kept in
+                memory and None is returned. Default is True.
 
         Returns:
             list: List of mol-strings.
@@ -265,20 +385,28 @@ class MolConverter:
         # Default via python packages RDkit and OpenBabel.
         if external_program is None:
             smiles_list = read_smiles_file(smiles_path)
-            mol_list = []
-            for i in range(0, len(smiles_list), batch_size):
-                mg = self._convert_parallel(
-                    self._single_smile_to_mol, smiles_list[i:i + batch_size], num_workers,
-                    # All args for _single_smile_to_mol.
-                    sanitize, add_hydrogen, make_conformers, optimize_conformer
-                )
-                mol_list = mol_list + mg
-                if logger is not None:
-                    logger.info(" ... converted molecules {0} from {1}".format(i + len(mg), len(smiles_list)))
+            mol_list = [] if return_mol_list else None
+            num_converted = 0
+            file = SDFFileWriter(sdf_path) if sdf_path is not None else None
+            try:
+                for mol in self._convert_iter(
+                        self._single_smile_to_mol, smiles_list, num_workers,
+                        # All args for _single_smile_to_mol.
+                        (sanitize, add_hydrogen, make_conformers, optimize_conformer, random_seed),
+                        backend=backend, timeout=timeout, batch_size=batch_size):
+                    if file is not None:
+                        file.write(mol)
+                    if mol_list is not None:
+                        mol_list.append(mol)
+                    num_converted += 1
+                    if logger is not None and (num_converted % batch_size == 0 or num_converted == len(smiles_list)):
+                        logger.info(" ... converted molecules {0} from {1}".format(num_converted, len(smiles_list)))
+            finally:
+                if file is not None:
+                    file.close()
             # Check success
-            self._check_is_same_length(smiles_list, mol_list)
-            if sdf_path is not None:
-                write_mol_block_list_to_sdf(mol_list, sdf_path)
+            if num_converted != len(smiles_list):
+                self._check_is_same_length(smiles_list, [None] * num_converted)
             return mol_list
 
         # External programs
@@ -290,6 +418,9 @@ class MolConverter:
         else:
             raise ValueError("Unknown program for conversion of smiles '%s'" % external_program)
 
+        if not return_mol_list:
+            self._check_is_same_length(smiles_list, IndexedSDFFile(sdf_path))
+            return None
         mol_list = read_mol_list_from_sdf_file(sdf_path)
         self._check_is_same_length(smiles_list, mol_list)
         return mol_list
@@ -309,13 +440,16 @@ class MolConverter:
         module_logger.warning("Failed conversion for xyz '%s'... ." % xyz_string[:20])
         return None
 
-    def xyz_to_mol(self, xyz_path: str, sdf_path: str, charge: Union[list, int, None] = None):
-        """Convert xyz info to structure file.
+    def xyz_to_mol(self, xyz_path: str, sdf_path: str, charge: Union[list, int, None] = None,
+                   return_mol_list: bool = True):
+        """Convert xyz info to structure file. The xyz-file is read and the SDF file is written one molecule at a time.
 
         Args:
-            xyz_path:
-            sdf_path:
-            charge:
+            xyz_path (str): File path of xyz-file.
+            sdf_path (str): File path of SDF file to write.
+            charge (int): Charge of the molecules. Default is None.
+            return_mol_list (bool): Whether to return the list of mol blocks. If False, mol blocks are not kept in
+                memory and None is returned. Default is True.
 
         Returns:
             list: List of mol blocks as string.
@@ -323,14 +457,18 @@ class MolConverter:
         if openbabel_xyz_to_mol is None and rdkit_xyz_to_mol is None:
             raise ModuleNotFoundError("Can not convert XYZ to SDF format, missing package `OpenBabel` or `RDkit`.")
 
-        xyz_list = read_xyz_file(xyz_path)
-        mol_list = []
-        for x in xyz_list:
-            xyz_str = parse_list_to_xyz_str(x, number_coordinates=3)
-            # No parallel conversion here, not necessary.
-            mol_str = self._single_xyz_to_mol(xyz_str, charge=charge)
-            mol_list.append(mol_str)
-        self._check_is_same_length(xyz_list, mol_list)
-        if sdf_path is not None:
-            write_mol_block_list_to_sdf(mol_list, sdf_path)
+        mol_list = [] if return_mol_list else None
+        file = SDFFileWriter(sdf_path) if sdf_path is not None else None
+        try:
+            for x in iter_xyz_file(xyz_path):
+                xyz_str = parse_list_to_xyz_str(x, number_coordinates=3)
+                # No parallel conversion here, not necessary.
+                mol_str = self._single_xyz_to_mol(xyz_str, charge=charge)
+                if file is not None:
+                    file.write(mol_str)
+                if mol_list is not None:
+                    mol_list.append(mol_str)
+        finally:
+            if file is not None:
+                file.close()
         return mol_list
@@ -1,4 +1,6 @@
 import logging
+import numpy as np
+from collections import OrderedDict
 
 # Module logger
 logging.basicConfig()
@@ -13,10 +15,12 @@ class OneHotEncoder:
     The translated values must support :obj:`__eq__` operator.
     The list of possible values must be set beforehand. Is used as a basic encoder example for
     :obj:`MolecularGraphRDKit`. There can not be different dtypes in categories.
+    Encodings of hashable values are memoized and :obj:`encode_array` encodes a whole array of values at once.
 
     """
 
     _dtype_translate = {"int": int, "float": float, "str": str, "bool": bool}
+    _max_memoized = 10000
 
     def __init__(self, categories: list, add_unknown: bool = True, dtype: str = "int"):
         """Initialize the encoder beforehand with a set of all possible values to encounter.
@@ -34,6 +38,18 @@ class OneHotEncoder:
         self.categories = [self.dtype(x) for x in categories]
         self.found_values = []
         self.add_unknown = add_unknown
+        self._encoded = {}
+
+    def _encode(self, value) -> list:
+        encoded_list = [1 if x == self.dtype(value) else 0 for x in self.categories]
+        if self.add_unknown:
+            if value not in self.categories:
+                encoded_list += [1]
+            else:
+                encoded_list += [0]
+        if value not in self.found_values:
+            self.found_values += [value]
+        return encoded_list
 
     def __call__(self, value):
         r"""Encode a single feature or value, mapping it to a one-hot python list. E.g. `[0, 0, 1, 0]`
@@ -44,15 +60,45 @@ class OneHotEncoder:
         Returns:
             list: Python List with 1 at value match. E.g. `[0, 0, 1, 0]`
         """
-        encoded_list = [1 if x == self.dtype(value) else 0 for x in self.categories]
+        try:
+            # Type is part of the key, since e.g. `1` and `True` are equal but can have different encodings.
+            key = (type(value), value)
+            encoded_list = self._encoded.get(key)
+        except TypeError:
+            # Not hashable.
+            return self._encode(value)
+        if encoded_list is None:
+            encoded_list = self._encode(value)
+            if len(self._encoded) < self._max_memoized:
+                self._encoded[key] = encoded_list
+        return list(encoded_list)
+
+    def encode_array(self, values) -> np.ndarray:
+        r"""Encode an array of values at once. Numeric arrays (or string arrays for `dtype='str'` ) are compared to
+        all categories in a single vectorized operation, other arrays fall back to encoding each value.
+
+        Args:
+            values (np.ndarray, list): Array of values of shape `(N, )` .
+
+        Returns:
+            np.ndarray: One-hot encoding of shape `(N, C)` with `C` categories and unknown bit.
+        """
+        values = np.asarray(values)
+        if len(values.shape) != 1:
+            raise ValueError("Expected array of values of shape `(N, )` but got %s." % str(values.shape))
+        num_bits = len(self.categories) + int(self.add_unknown)
+        is_numeric = values.dtype.kind in "biuf" and self.dtype in (int, float, bool)
+        is_string = values.dtype.kind == "U" and self.dtype is str
+        if not is_numeric and not is_string:
+            return np.array([self(x) for x in values], dtype="int64").reshape((len(values), num_bits))
+        categories = np.array(self.categories)
+        encoded = values.astype(self.dtype)[:, None] == categories[None, :]
         if self.add_unknown:
-            if value not in self.categories:
-                encoded_list += [1]
-            else:
-                encoded_list += [0]
-        if value not in self.found_values:
-            self.found_values += [value]
-        return encoded_list
+            encoded = np.concatenate([encoded, np.logical_not(np.isin(values, categories))[:, None]], axis=-1)
+        for value in np.unique(values).tolist():
+            if value not in self.found_values:
+                self.found_values += [value]
+        return encoded.astype("int64")
 
     def get_config(self):
         config = {"categories": self.categories, "add_unknown": self.add_unknown, "dtype": self.dtype_identifier}
@@ -63,4 +109,109 @@ class OneHotEncoder:
         return cls(**config)
 
     def report(self, name=""):
-        module_logger.info("OneHotEncoder %s found %s" % (name, self.found_values))
\ No newline at end of file
+        module_logger.info("OneHotEncoder %s found %s" % (name, self.found_values))
+
+
+class FeatureCache:
+    r"""Least recently used cache of feature vectors, which are identified by a tuple of raw descriptors of an atom or
+    bond together with the properties and encoders they were made with, see :obj:`make_key` . Most atoms and bonds in
+    a dataset share a small number of distinct environments, so that the encoders only have to be called for the first
+    occurrence. Used by :obj:`MolecularGraphRDKit` .
+
+    .. code-block:: python
+
+        from kgcnn.molecule.encoder import FeatureCache
+        from kgcnn.molecule.graph_rdkit import MolecularGraphRDKit
+        cache = FeatureCache()
+        mg = MolecularGraphRDKit().from_smiles("CCCO")
+        print(mg.node_attributes(["Symbol", "TotalDegree"], encoder={}, cache=cache), cache.hits)
+
+    """
+
+    def __init__(self, max_size: int = 10000):
+        """Initialize an empty cache.
+
+        Args:
+            max_size (int): Maximum number of feature vectors to keep. Default is 10000.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    @staticmethod
+    def is_valid_key(descriptors: tuple) -> bool:
+        """Whether a tuple of descriptors can be used as key. Only int, float, str, bool and None are accepted,
+        since other objects like atoms or arrays are not compared by value. NaN is not equal to itself and is not
+        accepted either."""
+        return all([x is None or (isinstance(x, (int, float, str)) and x == x) for x in descriptors])
+
+    @classmethod
+    def make_key(cls, properties: list, encoders: list, descriptors: tuple):
+        """Make a key from the raw descriptors of an item and the properties and encoders of the descriptors, so that
+        a cache can be shared between different features.
+
+        Args:
+            properties (list): String identifier of the properties.
+            encoders (list): Encoder for each property or None.
+            descriptors (tuple): Raw descriptors.
+
+        Returns:
+            tuple: Key or None, if the descriptors or encoders can not be used as key.
+        """
+        if not cls.is_valid_key(descriptors):
+            return None
+        key = (tuple(properties), tuple(encoders), descriptors)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, descriptors: tuple):
+        """Get the feature vector for a tuple of descriptors and mark it as recently used.
+
+        Args:
+            descriptors (tuple): Raw descriptors.
+
+        Returns:
+            list: Feature vector or None, if not in cache.
+        """
+        value = self._data.get(descriptors)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._data.move_to_end(descriptors)
+        return value
+
+    def put(self, descriptors: tuple, value: list):
+        """Store feature vector for a tuple of descriptors and remove the least recently used entry if required.
+
+        Args:
+            descriptors (tuple): Raw descriptors.
+            value (list): Feature vector.
+
+        Returns:
+            None.
+        """
+        self._data[descriptors] = value
+        self._data.move_to_end(descriptors)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, descriptors: tuple):
+        return descriptors in self._data
+
+    def clear(self):
+        """Remove all entries of the cache."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def report(self, name=""):
+        module_logger.info("FeatureCache %s has %s entries with %s hits and %s misses." % (
+            name, len(self), self.hits, self.misses))
\ No newline at end of file
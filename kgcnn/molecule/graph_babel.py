@@ -339,12 +339,13 @@ class MolecularGraphOpenBabel(MolGraphInterface):
         bond_idx, bond_number = self._sort_bonds(bond_idx, bond_number)
         return bond_idx, bond_number
 
-    def edge_attributes(self, properties: list, encoder: dict):
+    def edge_attributes(self, properties: list, encoder: dict, cache=None):
         """Make edge attributes.
 
         Args:
             properties (list): List of string identifier for a molecular property. Must match backend features.
             encoder (dict): A dictionary of callable encoder function or class for each string identifier.
+            cache (FeatureCache): Optional cache of feature vectors for raw descriptors. Default is None.
 
         Returns:
             list: List of attributes after processed by the encoder.
@@ -358,18 +359,7 @@ class MolecularGraphOpenBabel(MolGraphInterface):
         bond_idx = []
         for i in range(m.NumBonds()):
             x = m.GetBondById(i)
-            attr = []
-            for k in edges:
-                if isinstance(k, str):
-                    temp = encoder[k](self.bond_fun_dict[k](x)) if k in encoder else self.bond_fun_dict[k](x)
-                else:
-                    temp = k(x)
-                if isinstance(temp, np.ndarray):
-                    temp = temp.tolist()
-                if isinstance(temp, (list, tuple)):
-                    attr += list(temp)
-                else:
-                    attr.append(temp)
+            attr = self._encode_attributes(x, edges, self.bond_fun_dict, encoder, cache=cache)
             bond_info.append(attr)
             bond_idx.append([x.GetBeginAtomIdx() - 1, x.GetEndAtomIdx() - 1])
             # Add a bond with opposite direction but same properties
@@ -381,12 +371,13 @@ class MolecularGraphOpenBabel(MolGraphInterface):
         bond_idx, bond_info = self._sort_bonds(bond_idx, bond_info)
         return bond_idx, bond_info
 
-    def node_attributes(self, properties: list, encoder: dict):
+    def node_attributes(self, properties: list, encoder: dict, cache=None):
         """Make node attributes.
 
         Args:
             properties (list): List of string identifier for a molecular property. Must match backend features.
             encoder (dict): A dictionary of callable encoder function or class for each string identifier.
+            cache (FeatureCache): Optional cache of feature vectors for raw descriptors. Default is None.
 
         Returns:
             list: List of attributes after processed by the encoder.
@@ -398,18 +389,7 @@ class MolecularGraphOpenBabel(MolGraphInterface):
         atom_info = []
         for i in range(m.NumAtoms()):
             atm = m.GetAtomById(i)
-            attr = []
-            for k in nodes:
-                if isinstance(k, str):
-                    temp = encoder[k](self.atom_fun_dict[k](atm)) if k in encoder else self.atom_fun_dict[k](atm)
-                else:
-                    temp = k(atm)
-                if isinstance(temp, np.ndarray):
-                    temp = temp.tolist()
-                if isinstance(temp, (list, tuple)):
-                    attr += list(temp)
-                else:
-                    attr.append(temp)
+            attr = self._encode_attributes(atm, nodes, self.atom_fun_dict, encoder, cache=cache)
             atom_info.append(attr)
         return atom_info
 
@@ -480,7 +480,7 @@ class MolecularGraphRDKit(MolGraphInterface):
         bond_idx, _ = self._sort_bonds(bond_idx)
         return bond_idx
 
-    def edge_attributes(self, properties: list, encoder: dict):
+    def edge_attributes(self, properties: list, encoder: dict, cache=None):
         r"""Return edge or bond attributes together with bond indices of the molecule.
         If flag :obj:`_make_directed` is set to true, then only the bonds as defined by `RDkit` are returned,
         otherwise a table of sorted undirected bond indices is returned.
@@ -489,6 +489,7 @@ class MolecularGraphRDKit(MolGraphInterface):
             properties (list): List of identifiers for properties to retrieve from bonds, or
                 a callable object that receives `RDkit` bond class and returns list or value.
             encoder (dict): A dictionary of optional encoders for each string identifier.
+            cache (FeatureCache): Optional cache of feature vectors for raw descriptors. Default is None.
 
         Returns:
             tuple: Indices, Attributes.
@@ -501,18 +502,7 @@ class MolecularGraphRDKit(MolGraphInterface):
         bond_info = []
         bond_idx = []
         for i, x in enumerate(m.GetBonds()):
-            attr = []
-            for k in edges:
-                if isinstance(k, str):
-                    temp = encoder[k](self.bond_fun_dict[k](x)) if k in encoder else self.bond_fun_dict[k](x)
-                else:
-                    temp = k(x)
-                if isinstance(temp, np.ndarray):
-                    temp = temp.tolist()
-                if isinstance(temp, (list, tuple)):
-                    attr += list(temp)
-                else:
-                    attr.append(temp)
+            attr = self._encode_attributes(x, edges, self.bond_fun_dict, encoder, cache=cache)
             bond_info.append(attr)
             bond_idx.append([x.GetEndAtomIdx(), x.GetBeginAtomIdx()])
             # Add a bond with opposite direction but same properties
@@ -524,13 +514,14 @@ class MolecularGraphRDKit(MolGraphInterface):
         bond_idx, bond_info = self._sort_bonds(bond_idx, bond_info)
         return bond_idx, bond_info
 
-    def node_attributes(self, properties: list, encoder: dict):
+    def node_attributes(self, properties: list, encoder: dict, cache=None):
         r"""Return node or atom attributes.
 
         Args:
             properties (list): List of string identifiers for properties to retrieve from atoms, or
                 a callable object that receives `RDkit` atom class and returns list or value.
             encoder (dict): A dictionary of optional encoders for each string identifier.
+            cache (FeatureCache): Optional cache of feature vectors for raw descriptors. Default is None.
 
         Returns:
             list: List of atomic properties.
@@ -541,18 +532,7 @@ class MolecularGraphRDKit(MolGraphInterface):
         # Collect info about atoms
         atom_info = []
         for i, atm in enumerate(m.GetAtoms()):
-            attr = []
-            for k in nodes:
-                if isinstance(k, str):
-                    temp = encoder[k](self.atom_fun_dict[k](atm)) if k in encoder else self.atom_fun_dict[k](atm)
-                else:
-                    temp = k(atm)
-                if isinstance(temp, np.ndarray):
-                    temp = temp.tolist()
-                if isinstance(temp, (list, tuple)):
-                    attr += list(temp)
-                else:
-                    attr.append(temp)
+            attr = self._encode_attributes(atm, nodes, self.atom_fun_dict, encoder, cache=cache)
             atom_info.append(attr)
         return atom_info
 
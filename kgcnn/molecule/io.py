@@ -1,4 +1,6 @@
 import logging
+import numpy as np
+from typing import Union, Iterator
 
 
 def parse_list_to_xyz_str(mol: list, comment: str = "", number_coordinates: int = None):
@@ -37,10 +39,8 @@ def write_list_to_xyz_file(filepath: str, mol_list: list):
         mol_list (list): List of molecules, which is a list of pairs of atoms and coordinates of
             `[[['C', 'H', ... ], [[0.0, 0.0, 0.0], [1.0, 1.0, 1.0], ... ]], ... ]`.
     """
-    with open(filepath, "w+") as file:
-        for x in mol_list:
-            xyz_str = parse_list_to_xyz_str(x)
-            file.write(xyz_str)
+    with XYZFileWriter(filepath) as file:
+        file.write_multiple(mol_list)
 
 
 def parse_mol_str(mol_str: str):
@@ -102,27 +102,8 @@ def parse_mol_str(mol_str: str):
     return [title, program, comment, counts, atoms, bonds, properties]
 
 
-def read_xyz_file(file_path, delimiter: str = None, line_by_line=False):
-    """Simple python script to read xyz-file and parse into a nested python list. Always returns a list with
-    the geometries in xyz file.
-
-    Args:
-        file_path (str): Full path to xyz-file.
-        delimiter (str): Delimiter for xyz separation. Default is ' '.
-        line_by_line (bool): Whether to read XYZ file line by line.
-
-    Returns:
-        list: Nested coordinates from xyz-file.
-    """
-    mol_list = []
-    comment_list = []
-    # open file
-    infile = open(file_path, "r")
-    if line_by_line:
-        lines = infile  # File object
-    else:
-        lines = infile.readlines()  # list of lines
-
+def _parse_xyz_lines(lines, delimiter: str = None) -> Iterator[list]:
+    """Parse lines of a xyz-file into pairs of atoms and coordinates."""
     num = 0
     comment = 0
     atoms = []
@@ -136,7 +117,6 @@ def read_xyz_file(file_path, delimiter: str = None, line_by_line=False):
             comment = 1
         elif comment > 0:
             # Comment comes before atom block and must always be read.
-            comment_list.append(str(line))
             comment = 0
         elif num > 0:
             if len(line_list) <= 1:
@@ -144,8 +124,8 @@ def read_xyz_file(file_path, delimiter: str = None, line_by_line=False):
             atoms.append(str(line_list[0]).lower().capitalize())
             coordinates.append([float(x) for x in line_list[1:]])
             if num == 1:
-                # This was last line for this conformer. Append result and reset current list.
-                mol_list.append([atoms, coordinates])
+                # This was last line for this conformer. Yield result and reset current list.
+                yield [atoms, coordinates]
                 num = 0
                 atoms = []
                 coordinates = []
@@ -154,9 +134,57 @@ def read_xyz_file(file_path, delimiter: str = None, line_by_line=False):
                 num = num - 1
         else:
             logging.warning("Empty line in xyz file for mismatch in atom count found.")
-    # close file
-    infile.close()
-    return mol_list
+
+
+def iter_xyz_file(file_path: str, delimiter: str = None) -> Iterator[list]:
+    """Read xyz-file line by line and yield the geometries in xyz file one at a time.
+
+    Args:
+        file_path (str): Full path to xyz-file.
+        delimiter (str): Delimiter for xyz separation. Default is ' '.
+
+    Returns:
+        Iterator: Generator of pairs of atoms and coordinates `[['C', 'H', ...], [[0.0, 0.0, 0.0], ... ]]`.
+    """
+    with open(file_path, "r") as infile:
+        yield from _parse_xyz_lines(infile, delimiter=delimiter)
+
+
+def read_xyz_file(file_path, delimiter: str = None, line_by_line=False):
+    """Simple python script to read xyz-file and parse into a nested python list. Always returns a list with
+    the geometries in xyz file.
+
+    Args:
+        file_path (str): Full path to xyz-file.
+        delimiter (str): Delimiter for xyz separation. Default is ' '.
+        line_by_line (bool): Whether to read XYZ file line by line.
+
+    Returns:
+        list: Nested coordinates from xyz-file.
+    """
+    if line_by_line:
+        return list(iter_xyz_file(file_path, delimiter=delimiter))
+    with open(file_path, "r") as infile:
+        lines = infile.readlines()
+    return list(_parse_xyz_lines(lines, delimiter=delimiter))
+
+
+def mol_block_to_sdf_record(mol_block: Union[str, None]) -> str:
+    """Mol block for SDF file. Failed molecules, i.e. None, are written as empty mol block with title 'FAIL'.
+
+    Args:
+        mol_block (str): Mol block as string or None.
+
+    Returns:
+        str: Mol block for SDF file without '$$$$' separator.
+    """
+    if mol_block is not None:
+        return mol_block
+    return "".join(["\n",
+                    "     FAIL\n",
+                    "\n",
+                    "  0  0  0  0  0  0  0  0  0  0 V2000\n",
+                    "M  END\n"])
 
 
 def write_mol_block_list_to_sdf(mol_block_list, filepath):
@@ -169,20 +197,8 @@ def write_mol_block_list_to_sdf(mol_block_list, filepath):
     Returns:
         None.
     """
-    with open(filepath, "w+") as file:
-        for i, mol_block in enumerate(mol_block_list):
-            if mol_block is not None:
-                file.write(mol_block)
-                if i < len(mol_block_list) - 1:
-                    file.write("$$$$\n")
-            else:
-                file.write("".join(["\n",
-                                    "     FAIL\n",
-                                    "\n",
-                                    "  0  0  0  0  0  0  0  0  0  0 V2000\n",
-                                    "M  END\n"]))
-                if i < len(mol_block_list) - 1:
-                    file.write("$$$$\n")
+    with SDFFileWriter(filepath) as file:
+        file.write_multiple(mol_block_list)
 
 
 def read_mol_list_from_sdf_file(filepath, line_by_line=False):
@@ -195,21 +211,11 @@ def read_mol_list_from_sdf_file(filepath, line_by_line=False):
     Returns:
         list: List of mol blocks as string.
     """
-    mol_list = []
+    if line_by_line:
+        return list(iter_mol_blocks_from_sdf_file(filepath))
     with open(filepath, "r") as f:
-        if not line_by_line:
-            all_sting = f.read()
-            mol_list = all_sting.split("$$$$\n")
-        else:
-            iter_mol = ""
-            for line in f:
-                if line == "$$$$\n":
-                    mol_list.append(iter_mol)
-                    iter_mol = ""
-                else:
-                    iter_mol = iter_mol + line
-            if iter_mol != "":
-                mol_list.append(iter_mol)
+        all_sting = f.read()
+        mol_list = all_sting.split("$$$$\n")
     # Check if there was tailing $$$$ with nothing to follow.
     # Split will make empty string at the end, which does not match actual number of mol blocks.
     if len(mol_list[-1]) == 0:
@@ -217,6 +223,298 @@ def read_mol_list_from_sdf_file(filepath, line_by_line=False):
     return mol_list
 
 
+def iter_mol_blocks_from_sdf_file(filepath: str) -> Iterator[str]:
+    """Read SDF file line by line and yield the mol blocks one at a time.
+
+    Args:
+        filepath (str): File path for SDF file.
+
+    Returns:
+        Iterator: Generator of mol blocks as string.
+    """
+    with open(filepath, "r") as f:
+        lines = []
+        for line in f:
+            if line == "$$$$\n":
+                yield "".join(lines)
+                lines = []
+            else:
+                lines.append(line)
+        if len(lines) > 0:
+            yield "".join(lines)
+
+
+def index_sdf_file(filepath: str) -> np.ndarray:
+    """Find the byte offsets of the mol blocks in a SDF file.
+
+    Args:
+        filepath (str): File path for SDF file.
+
+    Returns:
+        np.ndarray: Array of shape `(N, 2)` with start and stop byte offset of each of the `N` mol blocks. The stop
+            offset excludes the '$$$$' separator.
+    """
+    offsets = []
+    start = position = 0
+    with open(filepath, "rb") as f:
+        for line in f:
+            if line.rstrip(b"\r\n") == b"$$$$" and line.endswith(b"\n"):
+                offsets.append((start, position))
+                start = position + len(line)
+            position += len(line)
+    if position > start:
+        offsets.append((start, position))
+    return np.array(offsets, dtype="int64").reshape((-1, 2))
+
+
+def index_xyz_file(file_path: str, delimiter: str = None) -> np.ndarray:
+    """Find the byte offsets of the geometries in a xyz-file.
+
+    Args:
+        file_path (str): Full path to xyz-file.
+        delimiter (str): Delimiter for xyz separation. Default is ' '.
+
+    Returns:
+        np.ndarray: Array of shape `(N, 2)` with start and stop byte offset of each of the `N` geometries.
+    """
+    offsets = []
+    num, comment, start, position = 0, 0, 0, 0
+    with open(file_path, "rb") as f:
+        for line in f:
+            if num == 0 and comment == 0:
+                line_list = [x for x in line.decode().strip().split(delimiter) if x.strip() != ""]
+                if len(line_list) == 1:
+                    num, comment, start = int(line_list[0]), 1, position
+            elif comment > 0:
+                comment = 0
+            else:
+                num -= 1
+                if num == 0:
+                    offsets.append((start, position + len(line)))
+            position += len(line)
+    return np.array(offsets, dtype="int64").reshape((-1, 2))
+
+
+class _IndexedFile:
+
+    def __init__(self, file_path: str, offsets: np.ndarray = None):
+        self.file_path = file_path
+        self._offsets = offsets
+
+    def _make_offsets(self) -> np.ndarray:
+        raise NotImplementedError("Must be implemented in sub-class.")
+
+    def _parse_record(self, record: str):
+        raise NotImplementedError("Must be implemented in sub-class.")
+
+    def _iter_records(self) -> Iterator:
+        raise NotImplementedError("Must be implemented in sub-class.")
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """Byte offsets of the records in the file, which are computed on first access."""
+        if self._offsets is None:
+            self._offsets = self._make_offsets()
+        return self._offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __iter__(self):
+        return self._iter_records()
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.read(np.arange(len(self))[item])
+        if isinstance(item, (list, tuple, np.ndarray)):
+            return self.read(item)
+        return self.read([item])[0]
+
+    def read(self, indices: Union[list, np.ndarray]) -> list:
+        """Read records by index with random access.
+
+        Args:
+            indices (list, np.ndarray): Indices of the records.
+
+        Returns:
+            list: List of records.
+        """
+        offsets = self.offsets
+        out = []
+        with open(self.file_path, "rb") as f:
+            for i in indices:
+                start, stop = offsets[i]
+                f.seek(int(start))
+                record = f.read(int(stop - start)).decode()
+                out.append(self._parse_record(record.replace("\r\n", "\n")))
+        return out
+
+
+class IndexedSDFFile(_IndexedFile):
+    r"""Random access to the mol blocks of a SDF file via byte offsets, without loading the file into memory.
+
+    .. code-block:: python
+
+        from kgcnn.molecule.io import IndexedSDFFile
+        sdf = IndexedSDFFile("molecules.sdf")
+        print(len(sdf), sdf[10])
+        for mol_block in sdf:  # Streaming.
+            pass
+
+    """
+
+    def __init__(self, filepath: str, offsets: np.ndarray = None):
+        """Initialize with file path.
+
+        Args:
+            filepath (str): File path for SDF file.
+            offsets (np.ndarray): Byte offsets from :obj:`index_sdf_file` . Default is None.
+        """
+        super(IndexedSDFFile, self).__init__(filepath, offsets=offsets)
+
+    def _make_offsets(self) -> np.ndarray:
+        return index_sdf_file(self.file_path)
+
+    def _parse_record(self, record: str) -> str:
+        return record
+
+    def _iter_records(self) -> Iterator[str]:
+        return iter_mol_blocks_from_sdf_file(self.file_path)
+
+
+class IndexedXYZFile(_IndexedFile):
+    r"""Random access to the geometries of a xyz-file via byte offsets, without loading the file into memory.
+    Records are pairs of atoms and coordinates as returned by :obj:`read_xyz_file` ."""
+
+    def __init__(self, file_path: str, delimiter: str = None, offsets: np.ndarray = None):
+        """Initialize with file path.
+
+        Args:
+            file_path (str): Full path to xyz-file.
+            delimiter (str): Delimiter for xyz separation. Default is ' '.
+            offsets (np.ndarray): Byte offsets from :obj:`index_xyz_file` . Default is None.
+        """
+        super(IndexedXYZFile, self).__init__(file_path, offsets=offsets)
+        self.delimiter = delimiter
+
+    def _make_offsets(self) -> np.ndarray:
+        return index_xyz_file(self.file_path, delimiter=self.delimiter)
+
+    def _parse_record(self, record: str) -> list:
+        return next(_parse_xyz_lines(record.splitlines(), delimiter=self.delimiter))
+
+    def _iter_records(self) -> Iterator[list]:
+        return iter_xyz_file(self.file_path, delimiter=self.delimiter)
+
+
+class SDFFileWriter:
+    r"""Write mol blocks incrementally to a SDF file. Failed molecules, i.e. None, are written as empty mol block.
+
+    .. code-block:: python
+
+        from kgcnn.molecule.io import SDFFileWriter
+        with SDFFileWriter("molecules.sdf") as writer:
+            for mol_block in mol_block_generator:
+                writer.write(mol_block)
+
+    """
+
+    def __init__(self, filepath: str):
+        """Open file for writing.
+
+        Args:
+            filepath (str): File path for SDF file.
+        """
+        self.filepath = filepath
+        self.num_records = 0
+        self._file = open(filepath, "w+")
+
+    def write(self, mol_block: Union[str, None]):
+        """Append a single mol block to the file.
+
+        Args:
+            mol_block (str): Mol block as string or None.
+
+        Returns:
+            None.
+        """
+        if self.num_records > 0:
+            self._file.write("$$$$\n")
+        self._file.write(mol_block_to_sdf_record(mol_block))
+        self.num_records += 1
+
+    def write_multiple(self, mol_block_list):
+        """Append mol blocks to the file.
+
+        Args:
+            mol_block_list (list, Iterator): Mol blocks as string.
+
+        Returns:
+            None.
+        """
+        for mol_block in mol_block_list:
+            self.write(mol_block)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class XYZFileWriter:
+    r"""Write geometries incrementally to a xyz-file. Uses :obj:`parse_list_to_xyz_str` ."""
+
+    def __init__(self, filepath: str, number_coordinates: int = None):
+        """Open file for writing.
+
+        Args:
+            filepath (str): Full path to file including name.
+            number_coordinates (int): Number of allowed coordinates. Default is None.
+        """
+        self.filepath = filepath
+        self.number_coordinates = number_coordinates
+        self.num_records = 0
+        self._file = open(filepath, "w+")
+
+    def write(self, mol: list, comment: str = ""):
+        """Append a single geometry to the file.
+
+        Args:
+            mol (list): Pair of atoms and coordinates `[['C', 'H', ...], [[0.0, 0.0, 0.0], ... ]]`.
+            comment (str): Comment for comment line in xyz string. Default is "".
+
+        Returns:
+            None.
+        """
+        self._file.write(parse_list_to_xyz_str(mol, comment=comment, number_coordinates=self.number_coordinates))
+        self.num_records += 1
+
+    def write_multiple(self, mol_list):
+        """Append geometries to the file.
+
+        Args:
+            mol_list (list, Iterator): Pairs of atoms and coordinates.
+
+        Returns:
+            None.
+        """
+        for mol in mol_list:
+            self.write(mol)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
 def read_smiles_file(file_path):
     """Simply python function to read smiles from file.
 
@@ -3,7 +3,7 @@ from kgcnn.molecule.graph_rdkit import MolecularGraphRDKit
 from kgcnn.graph.base import GraphPreProcessorBase
 from kgcnn.molecule.methods import inverse_global_proton_dict
 from kgcnn.molecule.io import parse_list_to_xyz_str
-from kgcnn.molecule.encoder import OneHotEncoder
+from kgcnn.molecule.encoder import OneHotEncoder, FeatureCache
 from kgcnn.utils.serial import serialize
 from kgcnn.molecule.serial import deserialize_encoder
 
@@ -131,6 +131,7 @@ class SetMolAttributes(GraphPreProcessorBase):
             "encoder_edges": {key: deserialize_encoder(value) for key, value in encoder_edges.items()},
             "encoder_graph": {key: deserialize_encoder(value) for key, value in encoder_graph.items()}
         }
+        self._node_cache, self._edge_cache = FeatureCache(), FeatureCache()
         self._config_kwargs.update({
             "edge_indices": edge_indices, "node_coordinates": node_coordinates, "node_number": node_number,
             "node_symbol": node_symbol, "edge_number": edge_number,
@@ -157,8 +158,8 @@ class SetMolAttributes(GraphPreProcessorBase):
             node_symbol = [str(x) for x in node_symbol]
         mol = _mol_graph_interface()
         mol.from_list(node_symbol, edge_indices, edge_number, conformer=node_coordinates)
-        n_att = mol.node_attributes(nodes, encoder=encoder_nodes)
-        _, e_att = mol.edge_attributes(edges, encoder=encoder_edges)
+        n_att = mol.node_attributes(nodes, encoder=encoder_nodes, cache=self._node_cache)
+        _, e_att = mol.edge_attributes(edges, encoder=encoder_edges, cache=self._edge_cache)
         g_att = mol.graph_attributes(graph, encoder=encoder_graph)
         idx, en = mol.edge_number
         return n_att, e_att, g_att, idx, en
@@ -0,0 +1,38 @@
+import numpy as np
+from pymatgen.core import Structure, Lattice
+from kgcnn.utils.tests import TestCase
+from kgcnn.graph.base import GraphDict
+from kgcnn.crystal import preprocessor
+
+
+class CrystalGraphArraysTest(TestCase):
+
+    structures = [
+        Structure(Lattice.cubic(5.64), ["Na", "Na", "Na", "Na", "Cl", "Cl", "Cl", "Cl"],
+                  [[0, 0, 0], [0, 0.5, 0.5], [0.5, 0, 0.5], [0.5, 0.5, 0], [0.5, 0.5, 0.5], [0.5, 0, 0],
+                   [0, 0.5, 0], [0, 0, 0.5]]),
+        Structure(Lattice.from_parameters(3.1, 4.2, 5.3, 80, 95, 110), ["Li", "O", "O"],
+                  [[0.1, 0.2, 0.3], [0.6, 0.4, 0.9], [0.35, 0.85, 0.5]])
+    ]
+
+    def test_same_as_networkx(self):
+        for cls, kwargs in [(preprocessor.RadiusUnitCell, {"radius": 4.0}), (preprocessor.KNNUnitCell, {"k": 6}),
+                            (preprocessor.VoronoiUnitCell, {}), (preprocessor.KNNAsymmetricUnitCell, {}),
+                            (preprocessor.RadiusSuperCell, {"radius": 3.5, "size": [2, 1, 2]}),
+                            (preprocessor.VoronoiNonPeriodicUnitCell, {})]:
+            prep = cls(output_graph_as_dict=True, **kwargs)
+            for structure in self.structures:
+                graph = prep(structure)
+                nx_graph = GraphDict().from_networkx(
+                    prep.call(structure), node_attributes=prep.node_attributes, edge_attributes=prep.edge_attributes,
+                    graph_attributes=prep.graph_attributes, reverse_edge_indices=True)
+                self.assertEqual(list(graph.keys()), list(nx_graph.keys()))
+                for key, value in nx_graph.items():
+                    self.assertEqual(graph[key].dtype, value.dtype)
+                    self.assertTrue(np.array_equal(graph[key], value))
+
+
+if __name__ == "__main__":
+
+    CrystalGraphArraysTest().test_same_as_networkx()
+    print("Tests passed.")
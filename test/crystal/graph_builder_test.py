@@ -0,0 +1,47 @@
+import numpy as np
+from kgcnn.utils.tests import TestCase
+from kgcnn.crystal.graph_builder import get_ridge_area, get_ridge_areas, _get_knn_neighbours
+
+
+class RidgeAreaTest(TestCase):
+
+    def test_get_ridge_areas(self):
+        rng = np.random.default_rng(0)
+        ridges = [np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype="float")]
+        for num in [3, 5, 8]:
+            # Convex polygon in a random plane with shuffled vertices.
+            angles = rng.permutation(np.sort(rng.uniform(0, 2 * np.pi, size=num)))
+            rotation = np.linalg.qr(rng.normal(size=(3, 3)))[0]
+            ridges.append(np.stack([np.cos(angles), np.sin(angles), np.zeros(num)], axis=-1) @ rotation + 1.0)
+        areas = get_ridge_areas(ridges)
+        self.assertAllClose(areas[0], 1.0)
+        self.assertAllClose(areas, np.array([get_ridge_area(x) for x in ridges]), rtol=1e-6)
+
+
+class KnnNeighboursTest(TestCase):
+
+    def test_max_radius(self):
+        # Low symmetry cell without ties in the distances of the k-th neighbours.
+        rng = np.random.default_rng(0)
+        lattice = np.array([[4.0, 0.2, 0.1], [0.3, 5.0, 0.0], [0.1, 0.4, 6.0]])
+        coords = rng.uniform(0.0, 1.0, size=(7, 3)) @ lattice
+
+        def get_edges(max_radius, tolerance):
+            index1, index2, offsets, distances = _get_knn_neighbours(
+                coords, lattice, k=12, max_radius=max_radius, tolerance=tolerance)
+            return sorted(zip(index1.tolist(), index2.tolist(), [tuple(x) for x in offsets.tolist()],
+                              np.round(distances, 8).tolist()))
+
+        for tolerance in [None, 0.5, 2.0]:
+            # A small radius requires several restarts of the search.
+            expected = get_edges(20.0, tolerance)
+            self.assertEqual(get_edges(1.0, tolerance), expected)
+            self.assertEqual(get_edges(3.0, tolerance), expected)
+        self.assertEqual(len(get_edges(1.0, None)), 7 * 12)
+
+
+if __name__ == "__main__":
+
+    RidgeAreaTest().test_get_ridge_areas()
+    KnnNeighboursTest().test_max_radius()
+    print("Tests passed.")
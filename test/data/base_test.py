@@ -0,0 +1,153 @@
+import os
+import tempfile
+import numpy as np
+from kgcnn.utils.tests import TestCase
+from kgcnn.data.base import MemoryGraphList, MemoryGraphDataset
+from kgcnn.data.utils import pad_np_array_list_batch_dim, get_property_statistics
+from kgcnn.io.loader import DisjointBatchCollator, make_batch_collator
+
+
+class MemoryGraphListTensorTest(TestCase):
+
+    node_number = [np.array([6, 1, 1]), np.array([8]), np.array([7, 1])]
+    graph_labels = [np.array(1.0), np.array(2.0), np.array(3.0)]
+
+    def _make_list(self):
+        data = MemoryGraphList()
+        data.set("node_number", [x.copy() for x in self.node_number])
+        data.set("graph_labels", [x.copy() for x in self.graph_labels])
+        return data
+
+    def test_padded(self):
+        data = self._make_list()
+        result = data.tensor([{"name": "node_number"}, {"name": "graph_labels", "dtype": "float32"}])
+        self.assertAllClose(result[0], pad_np_array_list_batch_dim(self.node_number)[0])
+        self.assertEqual(result[1].dtype, np.float32)
+        batches = data.tensor_batches({"name": "node_number"}, batch_size=2)
+        self.assertAllClose(batches[1], np.array([[7, 1]]))
+
+    def test_buffer(self):
+        data = self._make_list()
+        arrays = [x["graph_labels"] for x in data]
+        labels = data.tensor({"name": "graph_labels"}, make_copy=False)
+        self.assertTrue(labels is data.tensor({"name": "graph_labels"}, make_copy=False))
+        self.assertTrue(all(x["graph_labels"] is y for x, y in zip(data, arrays)))
+        self.assertFalse(np.shares_memory(labels, data[1]["graph_labels"]))
+        data[1]["graph_labels"] = np.array(5.0)
+        self.assertAllClose(data.tensor({"name": "graph_labels"}), np.array([1.0, 5.0, 3.0]))
+        data.set("graph_labels", [np.array(0.0)] * 3)
+        self.assertAllClose(data.tensor({"name": "graph_labels"}), np.zeros(3))
+        data[0]["node_number"] = np.array([1])
+        self.assertAllClose(data.tensor({"name": "node_number"}), np.array([[1, 0], [8, 0], [7, 1]]))
+
+
+class MemoryGraphListCleanTest(TestCase):
+
+    def test_statistics(self):
+        stats = get_property_statistics([np.array([[0, 1]]), None, np.zeros((0, 2)), [1, 2], np.array(1.0)])
+        self.assertAllClose(stats["is_valid"], np.array([True, False, False, False, True]))
+        self.assertAllClose(stats["rank"], np.array([2, -1, 2, -1, 0]))
+        self.assertEqual(stats["inner_shapes"], {(2,): 2})
+
+    def test_clean(self):
+        data = MemoryGraphDataset()
+        data.set("edge_indices", [np.array([[0, 1]]), np.zeros((0, 2)), np.array([[1, 0]]), np.array([[1, 1]])])
+        data.set("graph_labels", [np.array(1.0), np.array(2.0), None, np.array(4.0)])
+        invalid = data.clean(["edge_indices", {"name": "graph_labels"}])
+        self.assertAllClose(invalid, np.array([2, 1]))
+        self.assertEqual(len(data), 2)
+        data.assert_valid_model_input([{"name": "edge_indices", "shape": (None, 2)}])
+        with self.assertRaises(ValueError):
+            data.assert_valid_model_input([{"name": "edge_indices", "shape": (None, 3)}])
+
+
+class MemoryGraphListMapTest(TestCase):
+
+    @staticmethod
+    def _make_list():
+        # Graphs without coordinates can not be processed and are skipped by the preprocessor.
+        return MemoryGraphList([
+            {"node_coordinates": np.arange(3 * n).reshape((n, 3)) / 3.0} if n != 3 else {"node_number": np.array([1])}
+            for n in [4, 2, 3, 5, 1, 6, 3]])
+
+    def test_parallel(self):
+        serial = self._make_list().map_list("set_range", max_distance=3.0)
+        parallel = self._make_list().map_list("set_range", max_distance=3.0, num_workers=2, chunk_size=2)
+        self.assertEqual(len(serial), len(parallel))
+        for x, y in zip(serial, parallel):
+            self.assertEqual(sorted(x.keys()), sorted(y.keys()))
+            for key in x.keys():
+                self.assertAllClose(x[key], y[key])
+        self.assertFalse("range_indices" in parallel[2])
+        self.assertEqual(len(parallel[5]["node_coordinates"]), 6)
+
+
+def _is_memory_mapped(x):
+    while x is not None and not isinstance(x, np.memmap):
+        x = getattr(x, "base", None)
+    return x is not None
+
+
+class MemoryGraphDatasetColumnarTest(TestCase):
+
+    def test_save_load(self):
+        data = MemoryGraphDataset()
+        data.set("node_number", [np.array([6, 1, 1]), np.array([8]), np.array([7, 1])])
+        data.set("node_coordinates", [np.zeros((3, 3)), np.ones((1, 3)), np.ones((2, 3))])
+        data.set("graph_labels", [np.array(1.0), None, np.array(3.0)])
+        data.set("node_symbol", [np.array(["C", "H", "H"], dtype=object), np.array(["O"], dtype=object),
+                                 np.array(["N", "H"], dtype=object)])
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "data.kgcnn.columnar")
+            data.save(filepath, file_format="columnar")
+            loaded = MemoryGraphDataset().load(filepath)
+            self.assertEqual(len(loaded), 3)
+            for x, y in zip(data, loaded):
+                self.assertEqual(sorted(x.keys()), sorted(y.keys()))
+                for key in x.keys():
+                    if key == "node_symbol":
+                        self.assertEqual(list(x[key]), list(y[key]))
+                    else:
+                        self.assertAllClose(x[key], y[key])
+            self.assertTrue(_is_memory_mapped(loaded[1]["node_coordinates"]))
+            self.assertFalse(loaded[1]["node_coordinates"].flags.writeable)
+            # Tensor uses memory-mapped column without copy.
+            numbers = loaded.tensor({"name": "node_number", "ragged": False}, make_copy=False)
+            self.assertAllClose(numbers, np.array([[6, 1, 1], [8, 0, 0], [7, 1, 0]]))
+            self.assertTrue(_is_memory_mapped(loaded._property_buffer("node_coordinates")["values"]))
+            self.assertTrue(loaded[2]["node_coordinates"] is loaded._property_buffer("node_coordinates")["arrays"][2])
+
+    def test_batch_collator(self):
+        data = MemoryGraphDataset()
+        data.set("node_coordinates", [np.zeros((3, 3)), np.ones((1, 3)), np.ones((2, 3))])
+        data.set("edge_indices", [np.array([[0, 1], [1, 2]]), np.zeros((0, 2), dtype="int64"), np.array([[0, 1]])])
+        data.set("graph_labels", [np.array(1.0), np.array(2.0), np.array(3.0)])
+        inputs = [{"name": "node_coordinates", "shape": (3, ), "dtype": "float64"},
+                  {"name": "edge_indices", "shape": (None, ), "dtype": "int64"},
+                  {"name": "graph_labels", "shape": (), "dtype": "float64"}]
+        kwargs = dict(assignment_to_id=[0, 1], assignment_of_indices=[None, 0])
+        expected = DisjointBatchCollator([x.to_dict() for x in data], inputs, **kwargs)([2, 0])
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "data.kgcnn.columnar")
+            data.save(filepath, file_format="columnar")
+            loaded = MemoryGraphDataset().load(filepath)
+            collator = make_batch_collator(loaded, inputs, **kwargs)
+            # The loader gathers from the memory-mapped columns instead of a private copy.
+            for i, x in enumerate(inputs):
+                self.assertTrue(_is_memory_mapped(collator._values[i]))
+                self.assertTrue(np.shares_memory(collator._values[i], loaded._property_buffer(x["name"])["values"]))
+            for x, y in zip(collator([2, 0]), expected):
+                self.assertAllClose(x, y)
+            del collator, loaded
+
+
+if __name__ == "__main__":
+
+    MemoryGraphListTensorTest().test_padded()
+    MemoryGraphListTensorTest().test_buffer()
+    MemoryGraphListCleanTest().test_statistics()
+    MemoryGraphListCleanTest().test_clean()
+    MemoryGraphListMapTest().test_parallel()
+    MemoryGraphDatasetColumnarTest().test_save_load()
+    MemoryGraphDatasetColumnarTest().test_batch_collator()
+    print("Tests passed.")
@@ -0,0 +1,70 @@
+import tempfile
+import numpy as np
+from kgcnn.utils.tests import TestCase
+from kgcnn.data.base import MemoryGraphList
+from kgcnn.data.cache import GraphPreprocessingCache, hash_graph_list
+
+
+class GraphPreprocessingCacheTest(TestCase):
+
+    @staticmethod
+    def _make_graphs():
+        return MemoryGraphList([
+            {"node_coordinates": np.random.default_rng(i).uniform(0.0, 3.0, size=(8, 3))} for i in range(10)])
+
+    def test_map_list(self):
+        cache = GraphPreprocessingCache(tempfile.mkdtemp())
+        expected = self._make_graphs().map_list("set_range", max_distance=2.0)
+        for _ in range(2):
+            result = self._make_graphs().map_list("set_range", max_distance=2.0, cache=cache)
+            for x, y in zip(result, expected):
+                self.assertAllClose(x["range_indices"], y["range_indices"])
+                self.assertAllClose(x["range_attributes"], y["range_attributes"])
+        self.assertEqual(len(cache.entries()), 1)
+
+    def test_evict(self):
+        cache = GraphPreprocessingCache(tempfile.mkdtemp())
+        graphs = self._make_graphs()
+        for max_distance in [1.0, 2.0, 3.0]:
+            cache.store(cache.key("data", max_distance), graphs.map_list("set_range", max_distance=max_distance))
+        cache.load(cache.key("data", 1.0))
+        cache.max_size = sum([x[1] for x in cache.entries()[1:]])
+        cache.evict()
+        self.assertIn(cache.key("data", 1.0), cache)
+        self.assertFalse(cache.key("data", 2.0) in cache)
+
+
+class HashGraphListTest(TestCase):
+
+    def test_no_collision(self):
+        x, y = np.arange(4.0), np.arange(3)
+        self.assertNotEqual(hash_graph_list([{"a": x, "b": y}, {}]), hash_graph_list([{"a": x}, {"b": y}]))
+        self.assertNotEqual(hash_graph_list([{"a": x[:2]}, {"a": x[2:]}]), hash_graph_list([{"a": x}, {"a": x[:0]}]))
+        self.assertNotEqual(hash_graph_list([{"ab": "c"}]), hash_graph_list([{"a": "bc"}]))
+        self.assertNotEqual(hash_graph_list([{"a": 1}]), hash_graph_list([{"a": 1.0}]))
+        self.assertNotEqual(hash_graph_list([{"a": 1}]), hash_graph_list([{"a": "1"}]))
+        self.assertEqual(hash_graph_list([{"a": x, "b": [1, "c"]}]), hash_graph_list([{"b": [1, "c"], "a": x.copy()}]))
+
+    def test_cached_digest(self):
+        graphs = GraphPreprocessingCacheTest._make_graphs()
+        digest = graphs._content_hash()
+        self.assertEqual(digest, hash_graph_list(graphs))
+        self.assertEqual(graphs._content_hash(), digest)
+        graphs.set("graph_labels", [np.array(1.0)] * len(graphs))
+        self.assertNotEqual(graphs._content_hash(), digest)
+        self.assertEqual(graphs._content_hash(), hash_graph_list(graphs))
+        digest = graphs._content_hash()
+        graphs[0]["node_coordinates"] = np.zeros((8, 3))
+        self.assertNotEqual(graphs._content_hash(), digest)
+        digest = graphs._content_hash()
+        graphs.append(graphs[0].copy())
+        self.assertNotEqual(graphs._content_hash(), digest)
+
+
+if __name__ == "__main__":
+
+    GraphPreprocessingCacheTest().test_map_list()
+    GraphPreprocessingCacheTest().test_evict()
+    HashGraphListTest().test_no_collision()
+    HashGraphListTest().test_cached_digest()
+    print("Tests passed.")
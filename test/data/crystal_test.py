@@ -0,0 +1,35 @@
+import tempfile
+import numpy as np
+from pymatgen.core import Structure, Lattice
+from kgcnn.utils.tests import TestCase
+from kgcnn.data.crystal import CrystalDataset
+from kgcnn.crystal.preprocessor import KNNUnitCell
+
+
+class CrystalDatasetTest(TestCase):
+
+    @staticmethod
+    def _make_dataset():
+        dataset = CrystalDataset(data_directory=tempfile.mkdtemp(), dataset_name="Test", file_name="data.csv")
+        rng = np.random.default_rng(0)
+        dataset.save_structures_to_json_file([
+            Structure(Lattice.cubic(3.0 + i), ["Na", "Cl", "O"][:i % 3 + 1], rng.uniform(size=(i % 3 + 1, 3)))
+            for i in range(7)])
+        return dataset
+
+    def test_set_representation_workers(self):
+        dataset = self._make_dataset()
+        expected = dataset.set_representation(KNNUnitCell(k=6), reset_graphs=True)
+        result = self._make_dataset().set_representation(
+            KNNUnitCell(k=6), reset_graphs=True, num_workers=2, chunk_size=3)
+        self.assertEqual(len(result), len(expected))
+        for x, y in zip(result, expected):
+            self.assertEqual(list(x.keys()), list(y.keys()))
+            for key in x.keys():
+                self.assertAllClose(x[key], y[key])
+
+
+if __name__ == "__main__":
+
+    CrystalDatasetTest().test_set_representation_workers()
+    print("Tests passed.")
@@ -0,0 +1,106 @@
+import os
+import tempfile
+import numpy as np
+from kgcnn.utils.tests import TestCase
+from kgcnn.data.base import MemoryGraphList, GraphTensorMixin, GraphDatasetMixin
+from kgcnn.data.disk import DiskGraphDataset
+from kgcnn.io.loader import DisjointBatchCollator
+
+
+class DiskGraphDatasetTest(TestCase):
+
+    graphs = [
+        {"node_number": np.array([6, 1, 1]), "edge_indices": np.array([[0, 1], [1, 0], [0, 2]]),
+         "graph_labels": np.array(1.0)},
+        {"node_number": np.array([8]), "edge_indices": np.zeros((0, 2), dtype="int64")},
+        {"node_number": np.array([7, 1]), "edge_indices": np.array([[0, 1], [1, 0]]), "graph_labels": np.array(3.0)},
+    ]
+
+    def _make_dataset(self):
+        dataset = DiskGraphDataset(hdf5_directory=os.path.join(tempfile.mkdtemp(), "test.kgcnn.hdf5"))
+        dataset.append(self.graphs[0])
+        dataset.append_multiple(self.graphs[1:])
+        return dataset
+
+    def test_read(self):
+        dataset = self._make_dataset()
+        self.assertEqual(len(dataset), 3)
+        self.assertAllClose(dataset[2]["edge_indices"], self.graphs[2]["edge_indices"])
+        graphs = dataset[[2, 0]]
+        self.assertAllClose(graphs[1]["node_number"], self.graphs[0]["node_number"])
+        self.assertEqual(dataset.get("graph_labels")[1], None)
+
+    def test_clean_and_collate(self):
+        dataset = self._make_dataset()
+        invalid = dataset.clean(["edge_indices", "graph_labels"])
+        self.assertAllClose(invalid, np.array([1]))
+        self.assertEqual(len(DiskGraphDataset(hdf5_directory=dataset.hdf5_directory)), 2)
+        inputs = [{"name": "node_number", "shape": (), "dtype": "int64"},
+                  {"name": "edge_indices", "shape": (None,), "dtype": "int64"},
+                  {"name": "graph_labels", "shape": (), "dtype": "float32"},
+                  {"name": "graph_id", "shape": (), "dtype": "int64"}]
+        kwargs = dict(assignment_to_id=[0, 1], assignment_of_indices=[None, 0], pos_batch_id=[3])
+        expected = DisjointBatchCollator(MemoryGraphList([self.graphs[0], self.graphs[2]]), inputs, **kwargs)([1, 0])
+        result = dataset.batch_collator(inputs, **kwargs)([1, 0])
+        for x, y in zip(result, expected):
+            self.assertAllClose(x, y)
+
+    def test_collate_undefined(self):
+        dataset = self._make_dataset()
+        self.assertIsInstance(dataset, GraphTensorMixin)
+        self.assertIsInstance(dataset, GraphDatasetMixin)
+        inputs = [{"name": "node_number", "shape": (), "dtype": "int64"},
+                  {"name": "graph_labels", "shape": (), "dtype": "float32"}]
+        with self.assertRaisesRegex(ValueError, "graph_labels"):
+            dataset.batch_collator(inputs, assignment_to_id=[0, None])
+        with self.assertRaisesRegex(ValueError, "node_coordinates"):
+            dataset.batch_collator([{"name": "node_coordinates", "shape": (3,), "dtype": "float32"}])
+
+    def test_collate_empty(self):
+        dataset = self._make_dataset()
+        dataset.clean(["edge_indices", "graph_labels"])
+        inputs = [{"name": "node_number", "shape": (), "dtype": "int64"},
+                  {"name": "edge_indices", "shape": (None,), "dtype": "int64"},
+                  {"name": "graph_labels", "shape": (), "dtype": "float32"}]
+        result = dataset.batch_collator(inputs, assignment_to_id=[0, 1], assignment_of_indices=[None, 0])([])
+        self.assertEqual(result[0].shape, (0, ))
+        self.assertEqual(result[1].shape, (2, 0))
+        self.assertEqual(result[2].shape, (0, ))
+
+    def test_assert_valid_model_input(self):
+        dataset = self._make_dataset()
+
+        def read_property(*args, **kwargs):
+            raise AssertionError("Property must not be read from disk.")
+
+        dataset.read_property = read_property
+        dataset.assert_valid_model_input([{"name": "node_number", "shape": (None, ), "dtype": "int64"},
+                                          {"name": "edge_indices", "shape": (None, 2), "dtype": "int64"},
+                                          {"name": "graph_labels", "shape": (), "dtype": "float32"}])
+        for x in [{"name": "edge_indices", "shape": (None, 3)}, {"name": "node_number", "shape": (None, 1)},
+                  {"name": "node_number", "shape": (3, )}, {"name": "node_coordinates", "shape": (None, 3)}]:
+            with self.assertRaises(ValueError):
+                dataset.assert_valid_model_input([x])
+
+    def test_update(self):
+        dataset = self._make_dataset()
+        dataset.update_multiple([0, 2], [{"graph_labels": np.array(5.0)},
+                                         {"node_number": np.array([7, 1, 1, 1]), "graph_labels": None}])
+        dataset.update_multiple([1], [{"node_coordinates": np.zeros((1, 3))}])
+        self.assertAllClose(dataset[0]["graph_labels"], np.array(5.0))
+        self.assertAllClose(dataset[0]["node_number"], self.graphs[0]["node_number"])
+        self.assertAllClose(dataset[2]["node_number"], np.array([7, 1, 1, 1]))
+        self.assertEqual(dataset.get("graph_labels")[2], None)
+        self.assertEqual(dataset[0]["node_coordinates"].shape, (0, 3))
+        self.assertEqual(dataset[1]["node_coordinates"].shape, (1, 3))
+
+
+if __name__ == "__main__":
+
+    DiskGraphDatasetTest().test_read()
+    DiskGraphDatasetTest().test_clean_and_collate()
+    DiskGraphDatasetTest().test_collate_undefined()
+    DiskGraphDatasetTest().test_collate_empty()
+    DiskGraphDatasetTest().test_assert_valid_model_input()
+    DiskGraphDatasetTest().test_update()
+    print("Tests passed.")
@@ -0,0 +1,54 @@
+import os
+import sys
+import json
+import subprocess
+from kgcnn.utils.tests import TestCase
+
+
+_import_script = """
+import sys
+import time
+start = time.perf_counter()
+import %s
+duration = time.perf_counter() - start
+import json
+print(json.dumps({"time": duration, "modules": [x for x in %s if x in sys.modules]}))
+"""
+
+_heavy_modules = ["tensorflow", "keras", "torch", "jax", "sklearn", "pymatgen", "rdkit", "matplotlib"]
+
+
+class ImportDataTest(TestCase):
+
+    # Generous bound. Importing tensorflow alone takes several seconds.
+    max_import_time = 2.5
+
+    def _run_import(self, module: str = "kgcnn.data"):
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))] +
+            ([env["PYTHONPATH"]] if "PYTHONPATH" in env else []))
+        result = subprocess.run([sys.executable, "-c", _import_script % (module, _heavy_modules)],
+                                capture_output=True, text=True, env=env, check=True)
+        return json.loads(result.stdout.strip().split("\n")[-1])
+
+    def test_no_heavy_imports(self):
+        result = self._run_import()
+        self.assertEqual(result["modules"], [])
+
+    def test_no_heavy_imports_crystal(self):
+        result = self._run_import("kgcnn.data.crystal")
+        self.assertEqual(result["modules"], [])
+
+    def test_import_time(self):
+        # Take the best of a few runs to be robust against a cold file cache.
+        duration = min([self._run_import()["time"] for _ in range(3)])
+        self.assertLess(duration, self.max_import_time)
+
+
+if __name__ == "__main__":
+
+    ImportDataTest().test_no_heavy_imports()
+    ImportDataTest().test_no_heavy_imports_crystal()
+    ImportDataTest().test_import_time()
+    print("Tests passed.")
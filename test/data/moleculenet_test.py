@@ -0,0 +1,56 @@
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from kgcnn.utils.tests import TestCase
+from kgcnn.data.moleculenet import map_molecule_callbacks, MoleculeNetDataset
+from kgcnn.molecule.graph_rdkit import MolecularGraphRDKit
+from rdkit import Chem
+
+
+class MapMoleculeCallbacksTest(TestCase):
+
+    smiles = ["CCO", "C1=CC=CC=C1", "O", "CC(=O)O", "CN", "CCCC", "C#N"]
+    broken = [2, 5]
+
+    def _make_mol_list(self):
+        mol_list = [Chem.MolToMolBlock(Chem.MolFromSmiles(x)) for x in self.smiles]
+        mol_list[2] = "no mol block"
+        mol_list[5] = mol_list[5].replace("V2000", "V9999")
+        return mol_list
+
+    def test_num_workers(self):
+        mol_list = self._make_mol_list()
+        data = pd.DataFrame({"index": np.arange(len(mol_list))})
+        # Lambdas can not be pickled and are inherited by the forked workers.
+        callbacks = {"num_atoms": lambda mg, dd: len(mg.node_number), "index": lambda mg, dd: int(dd["index"])}
+        expected = map_molecule_callbacks(mol_list, data, callbacks, mol_interface_class=MolecularGraphRDKit)
+        result = map_molecule_callbacks(mol_list, data, callbacks, mol_interface_class=MolecularGraphRDKit,
+                                        num_workers=2, chunk_size=2)
+        self.assertEqual(dict(result), dict(expected))
+        self.assertEqual(result["index"], [None if i in self.broken else i for i in range(len(mol_list))])
+        self.assertEqual(result["num_atoms"], [3, 6, None, 4, 2, None, 2])
+
+
+class MoleculeNetDatasetTest(TestCase):
+
+    def test_report_num_workers(self):
+        directory = tempfile.mkdtemp()
+        pd.DataFrame({"smiles": ["CCO", "C1=CC=CC=C1", "CN"], "label": [1.0, 2.0, 3.0]}).to_csv(
+            os.path.join(directory, "data.csv"))
+        dataset = MoleculeNetDataset(data_directory=directory, file_name="data.csv", dataset_name="test", verbose=0)
+        dataset.prepare_data(smiles_column_name="smiles", make_conformers=False)
+        # Encoders of the main process did not see any values and are not reported.
+        with self.assertLogs(dataset.logger, level="DEBUG") as logs:
+            dataset.read_in_memory(label_column_name="label", has_conformers=False, num_workers=2)
+        self.assertIn("WARNING:kgcnn.data.test:Can not report encoders, which were used in worker processes.",
+                      logs.output)
+        self.assertEqual(len(dataset), 3)
+        self.assertEqual(dataset[1]["node_attributes"].shape[0], 6)
+
+
+if __name__ == "__main__":
+
+    MapMoleculeCallbacksTest().test_num_workers()
+    MoleculeNetDatasetTest().test_report_num_workers()
+    print("Tests passed.")
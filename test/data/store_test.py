@@ -0,0 +1,76 @@
+import os
+import tempfile
+import numpy as np
+from kgcnn.utils.tests import TestCase
+from kgcnn.data.base import MemoryGraphList
+from kgcnn.data.store import GraphStore
+from kgcnn.io.loader import DisjointBatchCollator
+
+
+class GraphStoreTest(TestCase):
+
+    graphs = [
+        {"node_number": np.array([6, 1, 1]), "edge_indices": np.array([[0, 1], [1, 0], [0, 2]]),
+         "graph_labels": np.array([1.0, 2.0])},
+        {"node_number": np.array([8]), "edge_indices": np.zeros((0, 2), dtype="int64")},
+        {"node_number": np.array([7, 1]), "edge_indices": np.array([[0, 1], [1, 0]]),
+         "graph_labels": np.array([3.0, 4.0])},
+    ]
+
+    def test_indexing(self):
+        store = GraphStore(self.graphs)
+        self.assertEqual(len(store), 3)
+        self.assertAllClose(store[2]["edge_indices"], self.graphs[2]["edge_indices"])
+        self.assertEqual(store.get("graph_labels")[1], None)
+        sub = store[[2, 0]]
+        self.assertAllClose(sub[1]["node_number"], self.graphs[0]["node_number"])
+        self.assertAllClose(sub.row_splits("node_number"), np.array([0, 2, 5]))
+        sub = store[np.array([False, True, True])]
+        self.assertAllClose(sub[0]["node_number"], self.graphs[1]["node_number"])
+
+    def test_clean_and_labels(self):
+        store = GraphStore(self.graphs)
+        invalid = store.clean(["edge_indices", "graph_labels"])
+        self.assertAllClose(invalid, np.array([1]))
+        store.set_multi_target_labels("graph_labels", multi_target_indices=[1])
+        self.assertAllClose(store.dense_property("graph_labels"), np.array([[2.0], [4.0]]))
+        inputs = [{"name": "node_number", "shape": (), "dtype": "int64"},
+                  {"name": "edge_indices", "shape": (None,), "dtype": "int64"},
+                  {"name": "graph_labels", "shape": (1,), "dtype": "float32"},
+                  {"name": "graph_id", "shape": (), "dtype": "int64"}]
+        kwargs = dict(assignment_to_id=[0, 1], assignment_of_indices=[None, 0], pos_batch_id=[3])
+        expected = DisjointBatchCollator(store.to_graph_list(), inputs, **kwargs)([1, 0])
+        result = store.batch_collator(inputs, **kwargs)([1, 0])
+        for x, y in zip(result, expected):
+            self.assertAllClose(x, y)
+
+    def test_append(self):
+        store = GraphStore(self.graphs[:1])
+        store.append_multiple(self.graphs[1:])
+        store.append({"node_number": np.array([1]), "node_coordinates": np.zeros((1, 3))})
+        self.assertEqual(len(store), 4)
+        self.assertAllClose(store[2]["node_number"], self.graphs[2]["node_number"])
+        self.assertEqual(store.get("node_coordinates")[0], None)
+        self.assertAllClose(store[3]["node_coordinates"], np.zeros((1, 3)))
+        self.assertTrue(isinstance(store.to_graph_list(), MemoryGraphList))
+
+    def test_save_load(self):
+        store = GraphStore(self.graphs)
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "data.kgcnn.columnar")
+            store.save(filepath)
+            loaded = GraphStore.load(filepath)
+            self.assertEqual(len(loaded), 3)
+            self.assertTrue(isinstance(loaded._columns["edge_indices"]["values"].base, np.memmap))
+            self.assertAllClose(loaded.has_property("graph_labels"), np.array([True, False, True]))
+            self.assertAllClose(loaded[2]["edge_indices"], self.graphs[2]["edge_indices"])
+            self.assertAllClose(loaded.row_splits("node_number"), np.array([0, 3, 4, 6]))
+
+
+if __name__ == "__main__":
+
+    GraphStoreTest().test_indexing()
+    GraphStoreTest().test_clean_and_labels()
+    GraphStoreTest().test_append()
+    GraphStoreTest().test_save_load()
+    print("Tests passed.")
@@ -0,0 +1,77 @@
+import numpy as np
+from kgcnn.utils.tests import TestCase
+from kgcnn.graph.methods import get_angle_indices, get_angle_indices_batch
+from kgcnn.graph.methods import range_neighbour_kdtree, coordinates_to_distancematrix, define_adjacency_from_distance
+from kgcnn.graph.methods import range_neighbour_lattice, range_neighbour_lattice_batch
+
+
+class GetAngleIndicesTest(TestCase):
+
+    edge_indices = np.array([[0, 1], [1, 0], [1, 2], [2, 1], [2, 0], [0, 2]])
+
+    def test_correctness(self):
+
+        _, idx_ijk, idx_ij_jk = get_angle_indices(self.edge_indices, edge_pairing="jk")
+        expected_ijk = np.array([[0, 1, 2], [1, 0, 2], [1, 2, 0], [2, 1, 0], [2, 0, 1], [0, 2, 1]])
+        expected_ij_jk = np.array([[0, 2], [1, 5], [2, 4], [3, 1], [4, 0], [5, 3]])
+        self.assertAllClose(idx_ijk, expected_ijk)
+        self.assertAllClose(idx_ij_jk, expected_ij_jk)
+
+    def test_batch(self):
+
+        edge_indices_list = [self.edge_indices, np.array([[0, 1], [1, 0]]), None, self.edge_indices[:4]]
+        _, batch_ijk, batch_ij_jk = get_angle_indices_batch(
+            edge_indices_list, edge_pairing="kj", allow_reverse_edges=True)
+        for x, ijk, ij_jk in zip(edge_indices_list, batch_ijk, batch_ij_jk):
+            _, expected_ijk, expected_ij_jk = get_angle_indices(x, edge_pairing="kj", allow_reverse_edges=True)
+            if x is None:
+                self.assertTrue(ijk is None and ij_jk is None)
+                continue
+            self.assertAllClose(ijk, expected_ijk)
+            self.assertAllClose(ij_jk, expected_ij_jk)
+
+
+class RangeNeighbourKDTreeTest(TestCase):
+
+    coordinates = np.random.default_rng(0).uniform(0.0, 5.0, size=(50, 3))
+
+    def test_correctness(self):
+
+        for max_distance, max_neighbours, exclusive in [(2.0, 4, True), (2.0, None, True), (None, 4, True),
+                                                        (1.0, 4, False)]:
+            distance_matrix = coordinates_to_distancematrix(self.coordinates)
+            adjacency, expected_indices = define_adjacency_from_distance(
+                distance_matrix, max_distance=max_distance, max_neighbours=max_neighbours, exclusive=exclusive)
+            indices, distances = range_neighbour_kdtree(
+                self.coordinates, max_distance=max_distance, max_neighbours=max_neighbours, exclusive=exclusive)
+            self.assertAllClose(indices, expected_indices)
+            self.assertAllClose(distances, distance_matrix[adjacency])
+
+
+class RangeNeighbourLatticeBatchTest(TestCase):
+
+    rng = np.random.default_rng(0)
+    lattices = [np.eye(3) * 3.9, np.array([[3.1, 0.2, 0.0], [0.5, 3.3, 0.1], [0.0, 0.4, 2.9]]), np.eye(3) * 5.0]
+    coordinates = [rng.uniform(size=(5, 3)) @ lattices[0], rng.uniform(-0.2, 1.2, size=(3, 3)) @ lattices[1],
+                   rng.uniform(size=(1, 3)) @ lattices[2]]
+
+    def test_same_as_lattice(self):
+
+        for kwargs in [{"max_distance": 4.0}, {"max_distance": None, "max_neighbours": 12},
+                       {"max_distance": 4.0, "max_neighbours": 8}]:
+            indices, images, distances, row_splits = range_neighbour_lattice_batch(
+                np.concatenate(self.coordinates), np.array(self.lattices), [len(x) for x in self.coordinates],
+                **kwargs)
+            for i, (x, lattice) in enumerate(zip(self.coordinates, self.lattices)):
+                expected_indices, expected_images, expected_distances = range_neighbour_lattice(x, lattice, **kwargs)
+                self.assertAllClose(indices[row_splits[i]:row_splits[i + 1]][:, 0], expected_indices[:, 0])
+                self.assertAllClose(distances[row_splits[i]:row_splits[i + 1]], expected_distances)
+
+
+if __name__ == "__main__":
+
+    GetAngleIndicesTest().test_correctness()
+    GetAngleIndicesTest().test_batch()
+    RangeNeighbourKDTreeTest().test_correctness()
+    RangeNeighbourLatticeBatchTest().test_same_as_lattice()
+    print("Tests passed.")
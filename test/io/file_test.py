@@ -0,0 +1,59 @@
+import os
+import tempfile
+import numpy as np
+from kgcnn.utils.tests import TestCase
+from kgcnn.io.file import RaggedTensorHDFile, RaggedTensorNumpyFile, RaggedTensorNumpyDirectory
+
+
+class RaggedTensorFileTest(TestCase):
+
+    data = [np.array([[0, 1], [0, 2]]), np.array([[1, 1]]), np.zeros((0, 2), dtype="int64"),
+            np.array([[0, 1], [2, 2], [0, 3]])]
+
+    def test_indexing(self):
+        directory = tempfile.mkdtemp()
+        for file in [RaggedTensorHDFile(os.path.join(directory, "test.hdf5")),
+                     RaggedTensorNumpyFile(os.path.join(directory, "test.npz")),
+                     RaggedTensorNumpyDirectory(os.path.join(directory, "test"))]:
+            file.write(self.data)
+            self.assertEqual(len(file), 4)
+            self.assertAllClose(file[-1], self.data[-1])
+            for item, expected in [(slice(1, None, 2), [1, 3]), ([3, 0, 0], [3, 0, 0]),
+                                   (np.array([True, False, True, True]), [0, 2, 3])]:
+                result = file[item]
+                self.assertEqual(len(result), len(expected))
+                for x, i in zip(result, expected):
+                    self.assertAllClose(x, self.data[i])
+
+    def test_append(self):
+        file = RaggedTensorHDFile(os.path.join(tempfile.mkdtemp(), "test.hdf5"))
+        file.write(self.data)
+        self.assertAllClose(file[0], self.data[0])
+        file.append_multiple([np.array([[5, 5]]), np.array([[6, 6], [7, 7]])])
+        self.assertEqual(len(file), 6)
+        self.assertAllClose(file[5], np.array([[6, 6], [7, 7]]))
+
+    def test_update(self):
+        file = RaggedTensorHDFile(os.path.join(tempfile.mkdtemp(), "test.hdf5"))
+        file.write(self.data)
+        file.update_multiple([1], [np.array([[4, 4]])])
+        file.update_multiple([0, 2], [np.array([[5, 5]]), np.array([[6, 6], [7, 7]])], chunk_size=1)
+        expected = [np.array([[5, 5]]), np.array([[4, 4]]), np.array([[6, 6], [7, 7]]), self.data[3]]
+        self.assertEqual(len(file), 4)
+        for x, y in zip(file[np.arange(4)], expected):
+            self.assertAllClose(x, y)
+        self.assertFalse(os.path.exists(file.file_path + ".tmp"))
+        # A failed update with changed lengths leaves the file untouched.
+        with self.assertRaises(Exception):
+            file.update_multiple([3, 1], [np.zeros((1, 3)), np.zeros((3, 2))])
+        self.assertFalse(os.path.exists(file.file_path + ".tmp"))
+        for x, y in zip(file[np.arange(4)], expected):
+            self.assertAllClose(x, y)
+
+
+if __name__ == "__main__":
+
+    RaggedTensorFileTest().test_indexing()
+    RaggedTensorFileTest().test_append()
+    RaggedTensorFileTest().test_update()
+    print("Tests passed.")
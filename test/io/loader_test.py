@@ -0,0 +1,250 @@
+import numpy as np
+from numpy.random import Generator, PCG64
+from kgcnn.utils.tests import TestCase
+from kgcnn.io.loader import DisjointBatchCollator, BucketBatchSampler, pad_at_axis, tf_dataset_disjoint_generator
+from kgcnn.io.loader import greedy_budget_batch_splits, DisjointGraphNumpyLoader, BudgetBatchSampler
+
+
+def _reference_batch(graphs, idx, inputs, assignment_to_id, assignment_of_indices, pos_batch_id, pos_subgraph_id,
+                     pos_count, padded_size=None):
+    # Collation of a batch by looping over single graphs, as done before `DisjointBatchCollator` .
+    graphs_batch = [graphs[i] for i in idx]
+    flagged = set(pos_batch_id.values()) | set(pos_count.values()) | set(pos_subgraph_id.values())
+    out = {i: None for i in inputs.keys()}
+    out_counts = {i: None for i in inputs.keys()}
+    for i in inputs.keys():
+        if i in flagged:
+            continue
+        array_list = [x[inputs[i]["name"]] for x in graphs_batch]
+        if assignment_to_id.get(i) is None:
+            values = np.array(array_list, dtype=inputs[i]["dtype"])
+            out[i] = pad_at_axis(values, (1, 0), axis=0) if padded_size is not None else values
+            continue
+        values = np.concatenate(array_list, axis=0)
+        counts = np.array([len(x) for x in array_list], dtype="int64")
+        if padded_size is not None:
+            num_pad_required = padded_size[i] - len(values) + 1
+            values = pad_at_axis(values, (num_pad_required, 0), axis=0)
+            counts = np.concatenate([np.array([num_pad_required], dtype=counts.dtype), counts], axis=0)
+        out[i], out_counts[i] = values, counts
+        ids = assignment_to_id[i]
+        if ids in pos_count and out[pos_count[ids]] is None:
+            out[pos_count[ids]] = counts
+        if ids in pos_batch_id and out[pos_batch_id[ids]] is None:
+            out[pos_batch_id[ids]] = np.repeat(np.arange(len(counts), dtype="int64"), repeats=counts)
+        if ids in pos_subgraph_id and out[pos_subgraph_id[ids]] is None:
+            out[pos_subgraph_id[ids]] = np.concatenate([np.arange(x, dtype="int64") for x in counts], axis=0)
+    for i in inputs.keys():
+        if assignment_of_indices.get(i) is not None:
+            node_splits = np.pad(np.cumsum(out_counts[assignment_of_indices[i]]), [[1, 0]])
+            offset = np.expand_dims(np.repeat(node_splits[:-1], out_counts[i]), axis=-1)
+            out[i] = np.transpose(out[i] + offset)
+    return tuple([out[i] for i in range(len(inputs))])
+
+
+def _make_graphs(num_graphs: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return [{"node_attributes": rng.normal(size=(n, 3)), "edge_indices": rng.integers(0, n, size=(2 * n, 2)),
+             "graph_labels": np.array(float(n))} for n in rng.integers(1, 8, size=num_graphs)]
+
+
+class DisjointBatchCollatorTest(TestCase):
+
+    graphs = _make_graphs(20)
+    inputs = [{"name": "node_attributes", "shape": (3, ), "dtype": "float32"},
+              {"name": "edge_indices", "shape": (None, ), "dtype": "int64"},
+              {"name": "graph_labels", "shape": (), "dtype": "float32"},
+              {"name": "graph_id_node", "shape": (), "dtype": "int64"},
+              {"name": "graph_id_edge", "shape": (), "dtype": "int64"},
+              {"name": "node_id", "shape": (), "dtype": "int64"},
+              {"name": "count_nodes", "shape": (), "dtype": "int64"}]
+    kwargs = dict(assignment_to_id=[0, 1], assignment_of_indices=[None, 0], pos_batch_id=[3, 4],
+                  pos_subgraph_id=[5], pos_count=[6])
+
+    def _assert_same(self, result, expected):
+        self.assertEqual(len(result), len(expected))
+        for x, y in zip(result, expected):
+            self.assertEqual(x.shape, y.shape)
+            self.assertAllClose(x, y)
+
+    def test_same_as_reference(self):
+        collator = DisjointBatchCollator(self.graphs, self.inputs, **self.kwargs)
+        reference_kwargs = {key: dict(enumerate(value)) for key, value in self.kwargs.items()}
+        reference_kwargs["pos_subgraph_id"] = {0: 5}
+        padded_size = {i: 5 * int(np.amax(collator.lengths(i))) for i in collator.disjoint_keys}
+        for idx in [[0, 1, 2], [19, 3, 3, 7, 11], [4]]:
+            self._assert_same(collator(idx), _reference_batch(
+                self.graphs, idx, dict(enumerate(self.inputs)), **reference_kwargs))
+            self._assert_same(collator(idx, padded_size=padded_size), _reference_batch(
+                self.graphs, idx, dict(enumerate(self.inputs)), **reference_kwargs, padded_size=padded_size))
+
+    def test_padded_epochs(self):
+        collator = DisjointBatchCollator(self.graphs, self.inputs, **self.kwargs)
+        rng = Generator(PCG64(seed=1))
+        max_sizes = []
+        for _ in range(4):
+            data_index = rng.permutation(len(self.graphs))
+            batch_splits = collator.batch_splits(data_index, batch_size=3)
+            max_sizes.append(collator.max_batch_size(data_index, batch_splits[:-1]))
+        for epochs in [3, None]:
+            dataset = tf_dataset_disjoint_generator(self.graphs, self.inputs, batch_size=3, epochs=epochs, seed=1,
+                                                    padded_disjoint=True, **self.kwargs)
+            for epoch in range(4):
+                shapes = set([(x[0].shape[0], x[1].shape[1]) for x in dataset])
+                if epochs is not None and epoch < epochs:
+                    # Largest batch of all replayed epochs.
+                    expected = tuple([max([x[i] for x in max_sizes[:epochs]]) + 1 for i in [0, 1]])
+                else:
+                    expected = tuple([max_sizes[epoch][i] + 1 for i in [0, 1]])
+                self.assertEqual(shapes, {expected})
+
+    def test_empty(self):
+        collator = DisjointBatchCollator([], self.inputs, **self.kwargs)
+        result = collator(np.zeros(0, dtype="int64"))
+        self.assertEqual(result[0].shape, (0, 3))
+        self.assertEqual(result[1].shape[-1], 0)
+        self.assertEqual(result[2].shape, (0, ))
+        collator = DisjointBatchCollator(self.graphs, self.inputs, **self.kwargs)
+        result = collator([], padded_size={0: 4, 1: 6})
+        self.assertEqual(result[0].shape, (5, 3))
+        self.assertAllClose(result[6], np.array([5]))
+
+
+class BucketBatchSamplerTest(TestCase):
+
+    graphs = _make_graphs(23, seed=1)
+
+    def test_static_shapes(self):
+        collator = DisjointBatchCollator(
+            self.graphs, DisjointBatchCollatorTest.inputs, **DisjointBatchCollatorTest.kwargs)
+        lengths = {i: collator.lengths(i) for i in collator.disjoint_keys}
+        sampler = BucketBatchSampler(lengths, batch_size=5, num_buckets=3)
+        shapes = set()
+        for epoch in range(3):
+            batches = sampler.sample()
+            self.assertEqual(len(batches), len(sampler))
+            self.assertEqual(set(np.concatenate([idx for _, idx in batches]).tolist()), set(range(23)))
+            for bucket, idx in batches:
+                self.assertEqual(len(idx), 5)
+                self.assertEqual(len(set(idx.tolist())), 5)
+                self.assertTrue(set(idx.tolist()).issubset(sampler.buckets[bucket].tolist()))
+                shapes.add(tuple([x.shape for x in collator(idx, padded_size=sampler.padded_size[bucket])]))
+        self.assertEqual(len(shapes), 3)
+
+    def test_partial_batches(self):
+        lengths = np.array([1, 2, 3, 4, 5, 6, 7])
+        sampler = BucketBatchSampler(lengths, batch_size=2, num_buckets=2, partial_batches="drop")
+        self.assertEqual(len(sampler), 3)
+        self.assertTrue(all([len(idx) == 2 for _, idx in sampler.sample()]))
+        sampler = BucketBatchSampler(lengths, batch_size=5, num_buckets=2, shuffle=False)
+        self.assertAllClose(sampler.sample()[0][1], np.array([0, 1, 2, 3, 0]))
+        self.assertEqual(sampler.padded_size[0][0], 14)
+        sampler = BucketBatchSampler(lengths, batch_size=2, num_buckets=2, shuffle=False, partial_batches="keep")
+        self.assertAllClose(np.concatenate([idx for _, idx in sampler.sample()]), np.arange(7))
+        self.assertAllClose(sampler.padding_efficiency()[0], 28 / (2 * 7 + 2 * 13))
+        with self.assertRaises(ValueError):
+            tf_dataset_disjoint_generator(self.graphs, DisjointBatchCollatorTest.inputs, num_buckets=2,
+                                          max_nodes_per_batch=20, **DisjointBatchCollatorTest.kwargs)
+
+
+class BudgetBatchTest(TestCase):
+
+    def test_greedy_budget_batch_splits(self):
+        nodes, edges = np.array([3, 5, 2, 6, 1, 12]), np.array([2, 2, 9, 2, 2, 2])
+        data_index = np.arange(6)
+        self.assertAllClose(greedy_budget_batch_splits(data_index, [nodes], [8]), np.array([0, 2, 4, 5, 6]))
+        self.assertAllClose(greedy_budget_batch_splits(data_index, [nodes, edges], [8, 10]),
+                            np.array([0, 2, 3, 5, 6]))
+        self.assertAllClose(greedy_budget_batch_splits(data_index, [nodes], [100], batch_size=4), np.array([0, 4, 6]))
+        self.assertAllClose(greedy_budget_batch_splits(np.array([5, 4, 0]), [nodes], [8]), np.array([0, 1, 3]))
+
+    def test_budgets_for_all_indices(self):
+        graphs = [{"node_number": np.ones(n), "edge_indices": np.zeros((2 * n, 2), dtype="int64"),
+                   "angle_indices": np.zeros((4 * n, 2), dtype="int64")} for n in [2, 3, 4, 5]]
+        inputs = [{"name": "node_number", "shape": (), "dtype": "int64"},
+                  {"name": "edge_indices", "shape": (None, ), "dtype": "int64"},
+                  {"name": "angle_indices", "shape": (None, ), "dtype": "int64"}]
+        collator = DisjointBatchCollator(graphs, inputs, assignment_to_id=[0, 1, 2],
+                                         assignment_of_indices=[None, 0, 1])
+        self.assertEqual(collator.get_budgets(max_nodes_per_batch=8, max_edges_per_batch=16), {0: 8, 1: 16, 2: 16})
+        budgets = collator.get_budgets(max_edges_per_batch=20, max_elements_per_batch={"angle_indices": 16})
+        self.assertEqual(budgets, {1: 20, 2: 16})
+        batch_splits = collator.batch_splits(np.arange(4), budgets=budgets)
+        self.assertAllClose(batch_splits, np.array([0, 1, 2, 3, 4]))
+        with self.assertRaises(ValueError):
+            collator.get_budgets(max_elements_per_batch={"graph_labels": 2})
+
+
+class DisjointGraphLoaderTest(TestCase):
+
+    graphs = _make_graphs(17, seed=2)
+
+    def _assert_epoch(self, loader, collator):
+        data_index = loader._data_index.copy()
+        batch_splits = collator.batch_splits(data_index, batch_size=loader.batch_size, budgets=loader.budgets)
+        batches = list(loader)
+        self.assertEqual(len(batches), len(batch_splits) - 1)
+        for batch, i, j in zip(batches, batch_splits[:-1], batch_splits[1:]):
+            for x, y in zip(batch, collator(data_index[i:j])):
+                self.assertAllClose(x, y)
+
+    def test_numpy_loader(self):
+        collator = DisjointBatchCollator(self.graphs, DisjointBatchCollatorTest.inputs,
+                                         **DisjointBatchCollatorTest.kwargs)
+        for num_workers in [0, 2]:
+            loader = DisjointGraphNumpyLoader(self.graphs, DisjointBatchCollatorTest.inputs, batch_size=4,
+                                              shuffle=False, num_workers=num_workers,
+                                              **DisjointBatchCollatorTest.kwargs)
+            self._assert_epoch(loader, collator)
+            executor = loader._executor
+            self._assert_epoch(loader, collator)
+            self.assertTrue(loader._executor is executor)
+            loader.close()
+            self.assertTrue(loader._executor is None)
+        loader = DisjointGraphNumpyLoader(self.graphs, DisjointBatchCollatorTest.inputs, max_nodes_per_batch=12,
+                                          persistent_workers=False, **DisjointBatchCollatorTest.kwargs)
+        self.assertEqual(len(list(loader)), len(loader))
+        self.assertTrue(loader._executor is None)
+
+    def test_budget_batch_sampler(self):
+        collator = DisjointBatchCollator(self.graphs, DisjointBatchCollatorTest.inputs,
+                                         **DisjointBatchCollatorTest.kwargs)
+        sampler = BudgetBatchSampler(collator, budgets=collator.get_budgets(max_nodes_per_batch=12), seed=3)
+        for epoch in range(5):
+            num_batches = len(sampler)
+            batches = []
+            for idx in sampler:
+                self.assertEqual(len(sampler), num_batches)
+                batches.append(idx)
+            self.assertEqual(len(batches), num_batches)
+            self.assertEqual(sorted([i for idx in batches for i in idx]), list(range(len(self.graphs))))
+
+    def test_torch_dataset(self):
+        try:
+            import torch
+        except ModuleNotFoundError:
+            return
+        from kgcnn.io.loader_torch import DisjointGraphTorchDataset
+        dataset = DisjointGraphTorchDataset(
+            self.graphs, DisjointBatchCollatorTest.inputs, **DisjointBatchCollatorTest.kwargs)
+        self.assertTrue(isinstance(dataset, torch.utils.data.Dataset))
+        loader = torch.utils.data.DataLoader(dataset, batch_size=4, shuffle=False, collate_fn=dataset.collate)
+        for x, y in zip(next(iter(loader)), dataset.collator(np.arange(4))):
+            self.assertAllClose(x.numpy(), y)
+        loader = torch.utils.data.DataLoader(dataset, batch_sampler=dataset.batch_sampler(max_nodes_per_batch=12),
+                                             collate_fn=dataset.collate)
+        self.assertEqual(len(list(loader)), len(loader))
+
+if __name__ == "__main__":
+
+    DisjointBatchCollatorTest().test_same_as_reference()
+    DisjointBatchCollatorTest().test_padded_epochs()
+    DisjointBatchCollatorTest().test_empty()
+    BucketBatchSamplerTest().test_static_shapes()
+    BucketBatchSamplerTest().test_partial_batches()
+    BudgetBatchTest().test_greedy_budget_batch_splits()
+    BudgetBatchTest().test_budgets_for_all_indices()
+    DisjointGraphLoaderTest().test_numpy_loader()
+    DisjointGraphLoaderTest().test_budget_batch_sampler()
+    DisjointGraphLoaderTest().test_torch_dataset()
+    print("Tests passed.")
@@ -0,0 +1,36 @@
+import os
+import time
+from kgcnn.utils.tests import TestCase
+from kgcnn.molecule.convert import _convert_in_processes
+
+
+def _convert_item(item: str, suffix: str):
+    # Picklable conversion that sleeps for items 'sleep<seconds>' and exits the process for 'crash'.
+    if item == "crash":
+        os._exit(1)
+    if item.startswith("sleep"):
+        time.sleep(float(item[5:]))
+    return item + suffix
+
+
+class ConvertInProcessesTest(TestCase):
+
+    def test_ordered(self):
+        items = ["sleep0.3", "a", "sleep0.1", "b", "c", "sleep0.2", "d"]
+        result = _convert_in_processes(_convert_item, items, num_workers=3, args=("_x",), max_pending=2)
+        self.assertEqual(next(result), "sleep0.3_x")
+        self.assertEqual(list(result), [x + "_x" for x in items[1:]])
+
+    def test_timeout_and_crash(self):
+        items = ["a", "sleep30", "b", "crash", "c", "crash", "d", "e"]
+        start = time.monotonic()
+        result = list(_convert_in_processes(_convert_item, items, num_workers=2, args=("_x",), timeout=1.0))
+        self.assertLess(time.monotonic() - start, 20.0)
+        self.assertEqual(result, ["a_x", None, "b_x", None, "c_x", None, "d_x", "e_x"])
+
+
+if __name__ == "__main__":
+
+    ConvertInProcessesTest().test_ordered()
+    ConvertInProcessesTest().test_timeout_and_crash()
+    print("Tests passed.")
@@ -0,0 +1,49 @@
+import numpy as np
+from kgcnn.utils.tests import TestCase
+from kgcnn.molecule.encoder import OneHotEncoder, FeatureCache
+
+
+class OneHotEncoderTest(TestCase):
+
+    def test_encode_array(self):
+        for categories, dtype, values in [([0, 1, 2, 5], "int", [0, 1, 3, 5, 2, 7, 1]),
+                                          (["C", "O"], "str", ["C", "N", "O", "O"])]:
+            for add_unknown in [True, False]:
+                encoder = OneHotEncoder(categories, dtype=dtype, add_unknown=add_unknown)
+                expected = np.array([encoder(x) for x in values])
+                self.assertAllClose(encoder.encode_array(np.array(values)), expected)
+                # Memoized values.
+                self.assertAllClose(np.array([encoder(x) for x in values]), expected)
+
+
+class FeatureCacheTest(TestCase):
+
+    def test_eviction(self):
+        cache = FeatureCache(max_size=2)
+        cache.put(("C", 1), [1, 0])
+        cache.put(("O", 2), [0, 1])
+        self.assertEqual(cache.get(("C", 1)), [1, 0])
+        cache.put(("N", 3), [0, 0])
+        self.assertEqual(len(cache), 2)
+        self.assertFalse(("O", 2) in cache)
+        self.assertEqual(cache.get(("O", 2)), None)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_shared_between_features(self):
+        from kgcnn.molecule.graph_rdkit import MolecularGraphRDKit
+        cache = FeatureCache()
+        mg = MolecularGraphRDKit().from_smiles("CCO")
+        encoder = {"Symbol": OneHotEncoder(["C", "O"], dtype="str")}
+        for properties, enc in [(["Symbol"], {}), (["Symbol"], encoder), (["AtomicNum"], {}), (["Symbol"], {})]:
+            self.assertEqual(mg.node_attributes(properties, encoder=enc, cache=cache),
+                             mg.node_attributes(properties, encoder=enc))
+        self.assertEqual(len(cache), 6)
+        self.assertEqual(FeatureCache.make_key(["GasteigerCharge"], [None], (float("nan"),)), None)
+
+
+if __name__ == "__main__":
+
+    OneHotEncoderTest().test_encode_array()
+    FeatureCacheTest().test_eviction()
+    FeatureCacheTest().test_shared_between_features()
+    print("Tests passed.")
@@ -0,0 +1,39 @@
+import os
+import tempfile
+from kgcnn.utils.tests import TestCase
+from kgcnn.molecule.io import read_xyz_file, write_list_to_xyz_file, read_mol_list_from_sdf_file, \
+    IndexedXYZFile, IndexedSDFFile, SDFFileWriter
+
+
+class MoleculeFileTest(TestCase):
+
+    mols = [[["O", "H", "H"], [[0.0, 0.0, 0.0], [0.96, 0.0, 0.0], [-0.24, 0.93, 0.0]]],
+            [["C"], [[1.0, 2.0, 3.0]]],
+            [["H", "H"], [[0.0, 0.0, 0.0], [0.74, 0.0, 0.0]]]]
+
+    def test_xyz(self):
+        file_path = os.path.join(tempfile.mkdtemp(), "test.xyz")
+        write_list_to_xyz_file(file_path, self.mols)
+        file = IndexedXYZFile(file_path)
+        self.assertEqual(len(file), 3)
+        self.assertEqual(list(file), read_xyz_file(file_path))
+        self.assertEqual(file[-1], self.mols[-1])
+        self.assertEqual(file[[2, 0]], [self.mols[2], self.mols[0]])
+
+    def test_sdf(self):
+        file_path = os.path.join(tempfile.mkdtemp(), "test.sdf")
+        with SDFFileWriter(file_path) as writer:
+            writer.write_multiple(["A\nM  END\n", None, "B\nM  END\n"])
+        mol_list = read_mol_list_from_sdf_file(file_path)
+        file = IndexedSDFFile(file_path)
+        self.assertEqual(len(file), 3)
+        self.assertEqual(list(file), mol_list)
+        self.assertEqual(file[2], "B\nM  END\n")
+        self.assertEqual(file[1:], mol_list[1:])
+
+
+if __name__ == "__main__":
+
+    MoleculeFileTest().test_xyz()
+    MoleculeFileTest().test_sdf()
+    print("Tests passed.")